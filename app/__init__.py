@@ -1,6 +1,9 @@
 import os
 from flask import Flask
 from dotenv import load_dotenv
+from app.utils import RequestMetrics
+from db.cache import ReadCache
+from db.database import Database
 
 load_dotenv()
 
@@ -21,6 +24,8 @@ def create_app():
     from app.routes import program_bp
     from app.routes import student_bp
     from app.routes import term_bp
+    from app.routes import report_bp
+    from app.routes import search_bp
 
     blueprints = [
         home_bp,
@@ -33,8 +38,17 @@ def create_app():
         program_bp,
         student_bp,
         term_bp,
+        report_bp,
+        search_bp,
     ]
     for blueprint in blueprints:
         app.register_blueprint(blueprint)
 
+    # Time requests and their SQL; registered first so it sees the commit
+    RequestMetrics.init_app(app)
+    # Share one connection and transaction per request
+    Database.init_app(app)
+    # Drop cached rows written during the request once it has finished
+    ReadCache.init_app(app)
+
     return app
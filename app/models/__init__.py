@@ -1,76 +1,142 @@
 from .course import (
     course_db_read_all,
+    course_db_read_version,
     course_db_read_by_id,
     course_db_read_by_ids,
+    course_db_read_roster,
     course_db_insert,
+    course_db_insert_many,
     course_db_update,
+    course_db_update_many,
     course_db_archive,
+    course_db_archive_many,
+    course_db_take_seat,
+    course_db_release_seats,
+    course_db_recount_enrolled,
 )
 from .department import (
     department_db_read_all,
+    department_db_read_version,
     department_db_read_by_id,
     department_db_read_by_ids,
     department_db_insert,
+    department_db_insert_many,
     department_db_update,
+    department_db_update_many,
     department_db_archive,
+    department_db_archive_many,
 )
 
 from .instructor import (
     instructor_db_read_all,
+    instructor_db_read_version,
     instructor_db_read_by_id,
     instructor_db_read_by_ids,
     instructor_db_insert,
+    instructor_db_insert_many,
     instructor_db_update,
+    instructor_db_update_many,
     instructor_db_archive,
+    instructor_db_archive_many,
 )
 from .program import (
     program_db_read_all,
+    program_db_read_version,
     program_db_read_by_id,
     program_db_read_by_ids,
     program_db_insert,
+    program_db_insert_many,
     program_db_update,
+    program_db_update_many,
     program_db_archive,
+    program_db_archive_many,
 )
 from .student import (
     student_db_read_all,
+    student_db_read_version,
     student_db_read_by_id,
     student_db_read_by_ids,
+    student_db_read_transcript,
     student_db_insert,
+    student_db_insert_many,
+    student_db_import,
     student_db_update,
+    student_db_update_many,
     student_db_archive,
+    student_db_archive_many,
 )
 from .term import (
     term_db_read_all,
+    term_db_read_version,
     term_db_read_by_id,
     term_db_read_by_ids,
     term_db_insert,
+    term_db_insert_many,
     term_db_update,
+    term_db_update_many,
     term_db_archive,
+    term_db_archive_many,
 )
 
 from .enrollment import (
     enrollment_db_read_all,
+    enrollment_db_read_version,
     enrollment_db_read_by_id,
     enrollment_db_read_by_ids,
     enrollment_db_insert,
+    enrollment_db_insert_many,
     enrollment_db_update,
+    enrollment_db_update_many,
     enrollment_db_archive,
+    enrollment_db_archive_many,
+    enrollment_db_read_student_sessions,
 )
 
 from .assignment import (
     assignment_db_read_all,
+    assignment_db_read_version,
     assignment_db_read_by_id,
     assignment_db_read_by_ids,
     assignment_db_insert,
+    assignment_db_insert_many,
     assignment_db_update,
+    assignment_db_update_many,
     assignment_db_archive,
+    assignment_db_archive_many,
 )
 
 from .course_schedule import (
     course_schedule_db_read_all,
+    course_schedule_db_read_version,
     course_schedule_db_read_by_id,
     course_schedule_db_read_by_ids,
     course_schedule_db_insert,
+    course_schedule_db_insert_many,
     course_schedule_db_update,
+    course_schedule_db_update_many,
     course_schedule_db_archive,
+    course_schedule_db_archive_many,
+    course_schedule_db_read_slots,
+    course_schedule_db_read_course_keys,
+    course_schedule_db_read_sessions,
 )
+
+from .grade_stats import (
+    grade_stats_db_rebuild,
+    student_grade_stats_db_read,
+    course_grade_stats_db_read,
+)
+
+from .report import (
+    report_db_read_room_sessions,
+    report_db_read_teaching_load,
+    report_db_read_department_summary,
+)
+
+from .waitlist import (
+    waitlist_db_add,
+    waitlist_db_promote,
+    waitlist_db_read,
+)
+
+from .search import search_db_people
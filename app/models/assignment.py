@@ -1,30 +1,73 @@
+from app.models.report import teaching_load_cache
+from db.cache import ReadCache, id_arg, ids_arg, pair_ids
 from db.database import Database
 from db.db_utils import (
+    BASE_FIELDS,
     get_insert_returning_query,
+    get_insert_many_query,
+    get_update_many_query,
+    get_update_many_params,
     handle_insert_result,
+    get_archive_many_query,
     get_archived_condition,
+    get_keyset_pagination,
+    get_filter_conditions,
+    get_select_columns,
+    get_version_query,
     BOOLEAN_TRUE,
 )
 
 db = Database()
+cache = ReadCache("assignments")
 
+ASSIGNMENT_COLUMNS = ["instructor_id", "course_id"]
+ASSIGNMENT_FIELDS = BASE_FIELDS + ASSIGNMENT_COLUMNS
 
-def assignment_db_read_all(active_only=False):
-    query = "SELECT * FROM assignments"
+# Columns list endpoints can filter on, and how to parse their values
+ASSIGNMENT_FILTERS = {"instructor_id": int, "course_id": int, "is_archived": bool}
+
+
+def assignment_db_read_all(
+    active_only=False,
+    limit=None,
+    after_id=None,
+    stream=False,
+    filters=None,
+    fields=None,
+):
+    columns = get_select_columns(fields, ASSIGNMENT_FIELDS)
+    query = f"SELECT {columns} FROM assignments"
+    conditions, params = get_filter_conditions(filters, ASSIGNMENT_FILTERS)
     if active_only:
-        query += f" WHERE {get_archived_condition()}"
-    query += ";"
-    result = db.execute_query(query)
+        conditions.insert(0, get_archived_condition(False))
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    pagination, page_params = get_keyset_pagination(bool(conditions), limit, after_id)
+    query += pagination + ";"
+    params += page_params
+    if stream:
+        return (dict(row) for row in db.stream_query(query, params))
+    result = db.execute_query(query, params)
     # Convert all rows to regular dicts for consistency
     return [dict(row) for row in result] if result else []
 
 
+def assignment_db_read_version(active_only=False):
+    query = get_version_query("assignments")
+    if active_only:
+        query += f" WHERE {get_archived_condition()}"
+    result = db.execute_query(query + ";")
+    return dict(result[0]) if result else None
+
+
+@cache.read_by_id
 def assignment_db_read_by_id(assignment_id):
     query = "SELECT * FROM assignments WHERE id = ?;"
     result = db.execute_query(query, (assignment_id,))
     return dict(result[0]) if result else None
 
 
+@cache.read_by_ids
 def assignment_db_read_by_ids(assignment_ids):
     if not assignment_ids:
         return []
@@ -34,13 +77,22 @@ def assignment_db_read_by_ids(assignment_ids):
     return [dict(row) for row in result] if result else []
 
 
+@teaching_load_cache.invalidates
 def assignment_db_insert(assignment_data):
-    columns = ["instructor_id", "course_id"]
-    query = get_insert_returning_query("assignments", columns)
+    query = get_insert_returning_query("assignments", ASSIGNMENT_COLUMNS)
     cursor_or_result = db.execute_query(query, assignment_data)
     return handle_insert_result(cursor_or_result)
 
 
+@teaching_load_cache.invalidates
+def assignment_db_insert_many(assignment_rows):
+    query = get_insert_many_query("assignments", ASSIGNMENT_COLUMNS)
+    result = db.execute_values(query, assignment_rows)
+    return [dict(row) for row in result] if result else []
+
+
+@teaching_load_cache.invalidates
+@cache.evicts(id_arg)
 def assignment_db_update(assignment_id, assignment_data):
     archived_condition = get_archived_condition(False)
     query = f"""
@@ -53,6 +105,17 @@ def assignment_db_update(assignment_id, assignment_data):
     return cursor.rowcount if cursor else 0
 
 
+@teaching_load_cache.invalidates
+@cache.evicts(pair_ids)
+def assignment_db_update_many(assignment_rows):
+    query = get_update_many_query("assignments", ASSIGNMENT_COLUMNS)
+    params = get_update_many_params(ASSIGNMENT_COLUMNS, assignment_rows)
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+@teaching_load_cache.invalidates
+@cache.evicts(id_arg)
 def assignment_db_archive(assignment_id):
     archived_condition_false = get_archived_condition(False)
     query = f"""
@@ -62,3 +125,11 @@ def assignment_db_archive(assignment_id):
     """
     cursor = db.execute_query(query, (assignment_id,))
     return cursor.rowcount if cursor else 0
+
+
+@teaching_load_cache.invalidates
+@cache.evicts(ids_arg)
+def assignment_db_archive_many(assignment_ids):
+    query = get_archive_many_query("assignments")
+    result = db.execute_query(query, (list(assignment_ids),))
+    return [dict(row) for row in result] if result else []
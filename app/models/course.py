@@ -1,30 +1,81 @@
+from app.models.student import STUDENT_FIELDS
+from app.models.report import schedule_report_cache, teaching_load_cache
+from app.models.waitlist import waitlist_db_promote
+from db.cache import ReadCache, id_arg, ids_arg, pair_ids
 from db.database import Database
 from db.db_utils import (
+    BASE_FIELDS,
     get_insert_returning_query,
+    get_insert_many_query,
+    get_update_many_query,
+    get_update_many_params,
     handle_insert_result,
+    get_archive_many_query,
     get_archived_condition,
+    get_keyset_pagination,
+    get_filter_conditions,
+    get_select_columns,
+    get_version_query,
     BOOLEAN_TRUE,
 )
 
 db = Database()
+cache = ReadCache("courses")
 
+COURSE_COLUMNS = ["title", "code", "term_id", "department_id", "capacity"]
+# enrolled_count is maintained by the enrollment writes, never set directly
+COURSE_FIELDS = BASE_FIELDS + COURSE_COLUMNS + ["enrolled_count"]
 
-def course_db_read_all(active_only=False):
-    query = "SELECT * FROM courses"
+# Columns list endpoints can filter on, and how to parse their values
+COURSE_FILTERS = {
+    "term_id": int,
+    "department_id": int,
+    "code": str,
+    "is_archived": bool,
+}
+
+
+def course_db_read_all(
+    active_only=False,
+    limit=None,
+    after_id=None,
+    stream=False,
+    filters=None,
+    fields=None,
+):
+    columns = get_select_columns(fields, COURSE_FIELDS)
+    query = f"SELECT {columns} FROM courses"
+    conditions, params = get_filter_conditions(filters, COURSE_FILTERS)
+    if active_only:
+        conditions.insert(0, get_archived_condition(False))
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    pagination, page_params = get_keyset_pagination(bool(conditions), limit, after_id)
+    query += pagination + ";"
+    params += page_params
+    if stream:
+        return (dict(row) for row in db.stream_query(query, params))
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+def course_db_read_version(active_only=False):
+    query = get_version_query("courses")
     if active_only:
         archived_condition = get_archived_condition(False)
         query += f" WHERE {archived_condition}"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(query + ";")
+    return dict(result[0]) if result else None
 
 
+@cache.read_by_id
 def course_db_read_by_id(course_id):
     query = "SELECT * FROM courses WHERE id = %s;"
     result = db.execute_query(query, (course_id,))
     return dict(result[0]) if result else None
 
 
+@cache.read_by_ids
 def course_db_read_by_ids(course_ids):
     if not course_ids:
         return []
@@ -34,25 +85,72 @@ def course_db_read_by_ids(course_ids):
     return [dict(row) for row in result] if result else []
 
 
+def course_db_read_roster(course_id, limit=None, after_id=None, fields=None):
+    """
+    Read the students actively enrolled in a course in one join over
+    enrollments and students, paged on the enrollment ID. fields limits the
+    student columns returned; enrollment_id and grade are always included.
+    """
+    columns = get_select_columns(fields, STUDENT_FIELDS, table_alias="s")
+    archived_condition = get_archived_condition(False)
+    query = f"""
+    SELECT e.id AS enrollment_id, e.grade, {columns}
+    FROM enrollments e
+    JOIN students s ON s.id = e.student_id
+    WHERE e.course_id = %s AND e.{archived_condition}"""
+    pagination, page_params = get_keyset_pagination(True, limit, after_id, "e.id")
+    query += (pagination or " ORDER BY e.id") + ";"
+    result = db.execute_query(query, (course_id, *page_params))
+    return [dict(row) for row in result] if result else []
+
+
 def course_db_insert(course_data):
-    columns = ["title", "code", "term_id", "department_id"]
-    query = get_insert_returning_query("courses", columns)
+    query = get_insert_returning_query("courses", COURSE_COLUMNS)
     cursor_or_result = db.execute_query(query, course_data)
     return handle_insert_result(cursor_or_result)
 
 
+def course_db_insert_many(course_rows):
+    query = get_insert_many_query("courses", COURSE_COLUMNS)
+    result = db.execute_values(query, course_rows)
+    return [dict(row) for row in result] if result else []
+
+
+@teaching_load_cache.invalidates
+@schedule_report_cache.invalidates
+@cache.evicts(id_arg)
 def course_db_update(course_id, course_data):
     archived_condition = get_archived_condition(False)
     query = f"""
     UPDATE courses
-    SET title = %s, code = %s, term_id = %s, department_id = %s, updated_at = CURRENT_TIMESTAMP
+    SET title = %s, code = %s, term_id = %s, department_id = %s, capacity = %s,
+        updated_at = CURRENT_TIMESTAMP
     WHERE id = %s AND {archived_condition};
     """
     values = course_data + (course_id,)
     cursor = db.execute_query(query, values)
-    return cursor.rowcount if cursor else 0
+    rows_updated = cursor.rowcount if cursor else 0
+    if rows_updated:
+        # A raised capacity frees seats for the waitlist
+        waitlist_db_promote([course_id])
+    return rows_updated
 
 
+@teaching_load_cache.invalidates
+@schedule_report_cache.invalidates
+@cache.evicts(pair_ids)
+def course_db_update_many(course_rows):
+    query = get_update_many_query("courses", COURSE_COLUMNS)
+    params = get_update_many_params(COURSE_COLUMNS, course_rows)
+    result = db.execute_query(query, params)
+    rows = [dict(row) for row in result] if result else []
+    waitlist_db_promote([row["id"] for row in rows])
+    return rows
+
+
+@teaching_load_cache.invalidates
+@schedule_report_cache.invalidates
+@cache.evicts(id_arg)
 def course_db_archive(course_id):
     archived_condition_false = get_archived_condition(False)
     query = f"""
@@ -62,3 +160,62 @@ def course_db_archive(course_id):
     """
     cursor = db.execute_query(query, (course_id,))
     return cursor.rowcount if cursor else 0
+
+
+@teaching_load_cache.invalidates
+@schedule_report_cache.invalidates
+@cache.evicts(ids_arg)
+def course_db_archive_many(course_ids):
+    query = get_archive_many_query("courses")
+    result = db.execute_query(query, (list(course_ids),))
+    return [dict(row) for row in result] if result else []
+
+
+@cache.evicts(id_arg)
+def course_db_take_seat(course_id):
+    """
+    Take one seat in a course if it has one free. The conditional UPDATE
+    locks only this course's row, so concurrent enrollments in it queue
+    while other courses are unaffected. Returns True if a seat was taken.
+    """
+    query = """
+    UPDATE courses
+    SET enrolled_count = enrolled_count + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND (capacity IS NULL OR enrolled_count < capacity);
+    """
+    cursor = db.execute_query(query, (course_id,))
+    return bool(cursor.rowcount) if cursor else False
+
+
+@cache.evicts(ids_arg)
+def course_db_release_seats(seats_by_course):
+    """Give back seats, given as {course_id: seats}, and serve the waitlists."""
+    if not seats_by_course:
+        return []
+    # Lock rows in ID order, like the bulk enrollment insert, to avoid deadlocks
+    query = """
+    WITH locked AS (
+        SELECT id FROM courses WHERE id = ANY(%s) ORDER BY id FOR UPDATE
+    )
+    UPDATE courses c
+    SET enrolled_count = GREATEST(c.enrolled_count - r.seats, 0),
+        updated_at = CURRENT_TIMESTAMP
+    FROM locked l
+    JOIN UNNEST(%s::int[], %s::int[]) AS r(id, seats) ON r.id = l.id
+    WHERE c.id = l.id;
+    """
+    course_ids, seats = zip(*sorted(seats_by_course.items()))
+    db.execute_query(query, (list(course_ids), list(course_ids), list(seats)))
+    return waitlist_db_promote(list(seats_by_course))
+
+
+def course_db_recount_enrolled():
+    """Recompute every course's enrolled_count from its active enrollments."""
+    query = """
+    UPDATE courses c
+    SET enrolled_count = (
+        SELECT COUNT(*) FROM enrollments e
+        WHERE e.course_id = c.id AND e.is_archived = FALSE
+    );
+    """
+    db.execute_query(query)
@@ -1,30 +1,78 @@
+from app.models.report import schedule_report_cache, teaching_load_cache
+from db.cache import ReadCache, id_arg, ids_arg, pair_ids
 from db.database import Database
 from db.db_utils import (
+    BASE_FIELDS,
     get_insert_returning_query,
+    get_insert_many_query,
+    get_update_many_query,
+    get_update_many_params,
     handle_insert_result,
+    get_archive_many_query,
     get_archived_condition,
+    get_keyset_pagination,
+    get_filter_conditions,
+    get_select_columns,
+    get_version_query,
     BOOLEAN_TRUE,
 )
 
 db = Database()
+cache = ReadCache("course_schedule")
 
+COURSE_SCHEDULE_COLUMNS = ["course_id", "day", "time", "room"]
+COURSE_SCHEDULE_FIELDS = BASE_FIELDS + COURSE_SCHEDULE_COLUMNS
 
-def course_schedule_db_read_all(active_only=False):
-    query = "SELECT * FROM course_schedule"
+# Columns list endpoints can filter on, and how to parse their values
+COURSE_SCHEDULE_FILTERS = {
+    "course_id": int,
+    "day": str,
+    "room": str,
+    "is_archived": bool,
+}
+
+
+def course_schedule_db_read_all(
+    active_only=False,
+    limit=None,
+    after_id=None,
+    stream=False,
+    filters=None,
+    fields=None,
+):
+    columns = get_select_columns(fields, COURSE_SCHEDULE_FIELDS)
+    query = f"SELECT {columns} FROM course_schedule"
+    conditions, params = get_filter_conditions(filters, COURSE_SCHEDULE_FILTERS)
+    if active_only:
+        conditions.insert(0, get_archived_condition(False))
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    pagination, page_params = get_keyset_pagination(bool(conditions), limit, after_id)
+    query += pagination + ";"
+    params += page_params
+    if stream:
+        return (dict(row) for row in db.stream_query(query, params))
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+def course_schedule_db_read_version(active_only=False):
+    query = get_version_query("course_schedule")
     if active_only:
         archived_condition = get_archived_condition(False)
         query += f" WHERE {archived_condition}"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(query + ";")
+    return dict(result[0]) if result else None
 
 
+@cache.read_by_id
 def course_schedule_db_read_by_id(course_schedule_id):
     query = "SELECT * FROM course_schedule WHERE id = %s;"
     result = db.execute_query(query, (course_schedule_id,))
     return dict(result[0]) if result else None
 
 
+@cache.read_by_ids
 def course_schedule_db_read_by_ids(course_schedule_ids):
     if not course_schedule_ids:
         return []
@@ -34,13 +82,25 @@ def course_schedule_db_read_by_ids(course_schedule_ids):
     return [dict(row) for row in result] if result else []
 
 
+@teaching_load_cache.invalidates
+@schedule_report_cache.invalidates
 def course_schedule_db_insert(course_schedule_data):
-    columns = ["course_id", "day", "time", "room"]
-    query = get_insert_returning_query("course_schedule", columns)
+    query = get_insert_returning_query("course_schedule", COURSE_SCHEDULE_COLUMNS)
     cursor_or_result = db.execute_query(query, course_schedule_data)
     return handle_insert_result(cursor_or_result)
 
 
+@teaching_load_cache.invalidates
+@schedule_report_cache.invalidates
+def course_schedule_db_insert_many(course_schedule_rows):
+    query = get_insert_many_query("course_schedule", COURSE_SCHEDULE_COLUMNS)
+    result = db.execute_values(query, course_schedule_rows)
+    return [dict(row) for row in result] if result else []
+
+
+@teaching_load_cache.invalidates
+@schedule_report_cache.invalidates
+@cache.evicts(id_arg)
 def course_schedule_db_update(course_schedule_id, course_schedule_data):
     archived_condition = get_archived_condition(False)
     query = f"""
@@ -53,6 +113,19 @@ def course_schedule_db_update(course_schedule_id, course_schedule_data):
     return cursor.rowcount if cursor else 0
 
 
+@teaching_load_cache.invalidates
+@schedule_report_cache.invalidates
+@cache.evicts(pair_ids)
+def course_schedule_db_update_many(course_schedule_rows):
+    query = get_update_many_query("course_schedule", COURSE_SCHEDULE_COLUMNS)
+    params = get_update_many_params(COURSE_SCHEDULE_COLUMNS, course_schedule_rows)
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+@teaching_load_cache.invalidates
+@schedule_report_cache.invalidates
+@cache.evicts(id_arg)
 def course_schedule_db_archive(course_schedule_id):
     archived_condition_false = get_archived_condition(False)
     query = f"""
@@ -62,3 +135,97 @@ def course_schedule_db_archive(course_schedule_id):
     """
     cursor = db.execute_query(query, (course_schedule_id,))
     return cursor.rowcount if cursor else 0
+
+
+@teaching_load_cache.invalidates
+@schedule_report_cache.invalidates
+@cache.evicts(ids_arg)
+def course_schedule_db_archive_many(course_schedule_ids):
+    query = get_archive_many_query("course_schedule")
+    result = db.execute_query(query, (list(course_schedule_ids),))
+    return [dict(row) for row in result] if result else []
+
+
+def course_schedule_db_read_slots(term_ids=None, rooms=None, instructor_ids=None):
+    """
+    Active sessions of active courses with their term and the instructors
+    assigned to the course, in one query. term_ids narrows to those terms.
+    rooms (normalized, see normalize_room) and instructor_ids narrow to the
+    sessions held in one of those rooms or taught by one of those
+    instructors, all a conflict check of new sessions has to look at.
+    """
+    query = """
+    SELECT cs.id, cs.course_id, cs.day, cs.time, cs.room, c.term_id,
+           COALESCE(
+               ARRAY_AGG(a.instructor_id ORDER BY a.instructor_id)
+                   FILTER (WHERE a.instructor_id IS NOT NULL),
+               '{}'
+           ) AS instructor_ids
+    FROM course_schedule cs
+    JOIN courses c ON c.id = cs.course_id AND c.is_archived = FALSE
+    LEFT JOIN assignments a ON a.course_id = cs.course_id AND a.is_archived = FALSE
+    WHERE cs.is_archived = FALSE
+    """
+    params = ()
+    if term_ids is not None:
+        query += " AND c.term_id = ANY(%s)"
+        params = (list(term_ids),)
+    if rooms is not None or instructor_ids is not None:
+        # The room expression matches idx_course_schedule_room_key
+        query += r"""
+        AND (
+            LOWER(BTRIM(REGEXP_REPLACE(cs.room, '\s+', ' ', 'g'))) = ANY(%s)
+            OR EXISTS (
+                SELECT 1 FROM assignments a2
+                WHERE a2.course_id = cs.course_id AND a2.is_archived = FALSE
+                AND a2.instructor_id = ANY(%s)
+            )
+        )
+        """
+        params += (list(rooms or []), list(instructor_ids or []))
+    query += " GROUP BY cs.id, c.term_id ORDER BY cs.id;"
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+def course_schedule_db_read_course_keys(course_ids):
+    """
+    Map course ID -> {"term_id", "instructor_ids"} for active courses, i.e.
+    what new sessions of those courses are checked against.
+    """
+    if not course_ids:
+        return {}
+    query = """
+    SELECT c.id, c.term_id,
+           COALESCE(
+               ARRAY_AGG(a.instructor_id ORDER BY a.instructor_id)
+                   FILTER (WHERE a.instructor_id IS NOT NULL),
+               '{}'
+           ) AS instructor_ids
+    FROM courses c
+    LEFT JOIN assignments a ON a.course_id = c.id AND a.is_archived = FALSE
+    WHERE c.id = ANY(%s) AND c.is_archived = FALSE
+    GROUP BY c.id;
+    """
+    result = db.execute_query(query, (list(course_ids),))
+    return {
+        row["id"]: {
+            "term_id": row["term_id"],
+            "instructor_ids": list(row["instructor_ids"]),
+        }
+        for row in result or []
+    }
+
+
+def course_schedule_db_read_sessions(course_ids):
+    """Active sessions of the given active courses with the course's term."""
+    if not course_ids:
+        return []
+    query = """
+    SELECT cs.course_id, c.term_id, cs.day, cs.time
+    FROM course_schedule cs
+    JOIN courses c ON c.id = cs.course_id AND c.is_archived = FALSE
+    WHERE cs.course_id = ANY(%s) AND cs.is_archived = FALSE;
+    """
+    result = db.execute_query(query, (list(course_ids),))
+    return [dict(row) for row in result] if result else []
@@ -1,30 +1,72 @@
+from db.cache import ReadCache, id_arg, ids_arg, pair_ids
 from db.database import Database
 from db.db_utils import (
+    BASE_FIELDS,
     get_insert_returning_query,
+    get_insert_many_query,
+    get_update_many_query,
+    get_update_many_params,
     handle_insert_result,
+    get_archive_many_query,
     get_archived_condition,
+    get_keyset_pagination,
+    get_filter_conditions,
+    get_select_columns,
+    get_version_query,
     BOOLEAN_TRUE,
 )
 
 db = Database()
+cache = ReadCache("departments")
 
+DEPARTMENT_COLUMNS = ["name"]
+DEPARTMENT_FIELDS = BASE_FIELDS + DEPARTMENT_COLUMNS
 
-def department_db_read_all(active_only=False):
-    query = "SELECT * FROM departments"
+# Columns list endpoints can filter on, and how to parse their values
+DEPARTMENT_FILTERS = {"name": str, "is_archived": bool}
+
+
+def department_db_read_all(
+    active_only=False,
+    limit=None,
+    after_id=None,
+    stream=False,
+    filters=None,
+    fields=None,
+):
+    columns = get_select_columns(fields, DEPARTMENT_FIELDS)
+    query = f"SELECT {columns} FROM departments"
+    conditions, params = get_filter_conditions(filters, DEPARTMENT_FILTERS)
+    if active_only:
+        conditions.insert(0, get_archived_condition(False))
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    pagination, page_params = get_keyset_pagination(bool(conditions), limit, after_id)
+    query += pagination + ";"
+    params += page_params
+    if stream:
+        return (dict(row) for row in db.stream_query(query, params))
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+def department_db_read_version(active_only=False):
+    query = get_version_query("departments")
     if active_only:
         archived_condition = get_archived_condition(False)
         query += f" WHERE {archived_condition}"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(query + ";")
+    return dict(result[0]) if result else None
 
 
+@cache.read_by_id
 def department_db_read_by_id(department_id):
     query = "SELECT * FROM departments WHERE id = %s;"
     result = db.execute_query(query, (department_id,))
     return dict(result[0]) if result else None
 
 
+@cache.read_by_ids
 def department_db_read_by_ids(department_ids):
     if not department_ids:
         return []
@@ -35,12 +77,18 @@ def department_db_read_by_ids(department_ids):
 
 
 def department_db_insert(department_data):
-    columns = ["name"]
-    query = get_insert_returning_query("departments", columns)
+    query = get_insert_returning_query("departments", DEPARTMENT_COLUMNS)
     cursor_or_result = db.execute_query(query, department_data)
     return handle_insert_result(cursor_or_result)
 
 
+def department_db_insert_many(department_rows):
+    query = get_insert_many_query("departments", DEPARTMENT_COLUMNS)
+    result = db.execute_values(query, department_rows)
+    return [dict(row) for row in result] if result else []
+
+
+@cache.evicts(id_arg)
 def department_db_update(department_id, department_data):
     archived_condition = get_archived_condition(False)
     query = f"""
@@ -53,6 +101,15 @@ def department_db_update(department_id, department_data):
     return cursor.rowcount if cursor else 0
 
 
+@cache.evicts(pair_ids)
+def department_db_update_many(department_rows):
+    query = get_update_many_query("departments", DEPARTMENT_COLUMNS)
+    params = get_update_many_params(DEPARTMENT_COLUMNS, department_rows)
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+@cache.evicts(id_arg)
 def department_db_archive(department_id):
     archived_condition_false = get_archived_condition(False)
     query = f"""
@@ -62,3 +119,10 @@ def department_db_archive(department_id):
     """
     cursor = db.execute_query(query, (department_id,))
     return cursor.rowcount if cursor else 0
+
+
+@cache.evicts(ids_arg)
+def department_db_archive_many(department_ids):
+    query = get_archive_many_query("departments")
+    result = db.execute_query(query, (list(department_ids),))
+    return [dict(row) for row in result] if result else []
@@ -1,30 +1,90 @@
+from collections import Counter
+
+from app.models.grade_stats import (
+    changed_grade_keys,
+    enrollment_grade_key,
+    grade_stats_db_read_keys,
+    grade_stats_db_refresh,
+)
+from app.models.course import (
+    cache as course_cache,
+    course_db_release_seats,
+    course_db_take_seat,
+)
+from app.models.report import teaching_load_cache
+from app.models.waitlist import waitlist_db_add
+from db.cache import ReadCache, id_arg, ids_arg, pair_ids
 from db.database import Database
 from db.db_utils import (
-    get_insert_returning_query,
+    BASE_FIELDS,
+    get_update_many_query,
+    get_update_many_params,
     handle_insert_result,
+    get_archive_many_query,
     get_archived_condition,
+    get_keyset_pagination,
+    get_filter_conditions,
+    get_select_columns,
+    get_version_query,
     BOOLEAN_TRUE,
 )
 
 db = Database()
+cache = ReadCache("enrollments")
+
+ENROLLMENT_COLUMNS = ["student_id", "course_id", "grade"]
+ENROLLMENT_FIELDS = BASE_FIELDS + ENROLLMENT_COLUMNS
+
+# Columns list endpoints can filter on, and how to parse their values
+ENROLLMENT_FILTERS = {
+    "student_id": int,
+    "course_id": int,
+    "grade": str,
+    "is_archived": bool,
+}
 
 
-def enrollment_db_read_all(active_only=False):
-    query = "SELECT * FROM enrollments"
+def enrollment_db_read_all(
+    active_only=False,
+    limit=None,
+    after_id=None,
+    stream=False,
+    filters=None,
+    fields=None,
+):
+    columns = get_select_columns(fields, ENROLLMENT_FIELDS)
+    query = f"SELECT {columns} FROM enrollments"
+    conditions, params = get_filter_conditions(filters, ENROLLMENT_FILTERS)
+    if active_only:
+        conditions.insert(0, get_archived_condition(False))
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    pagination, page_params = get_keyset_pagination(bool(conditions), limit, after_id)
+    query += pagination + ";"
+    params += page_params
+    if stream:
+        return (dict(row) for row in db.stream_query(query, params))
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+def enrollment_db_read_version(active_only=False):
+    query = get_version_query("enrollments")
     if active_only:
         archived_condition = get_archived_condition(False)
         query += f" WHERE {archived_condition}"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(query + ";")
+    return dict(result[0]) if result else None
 
 
+@cache.read_by_id
 def enrollment_db_read_by_id(enrollment_id):
     query = "SELECT * FROM enrollments WHERE id = %s;"
     result = db.execute_query(query, (enrollment_id,))
     return dict(result[0]) if result else None
 
 
+@cache.read_by_ids
 def enrollment_db_read_by_ids(enrollment_ids):
     if not enrollment_ids:
         return []
@@ -34,31 +94,221 @@ def enrollment_db_read_by_ids(enrollment_ids):
     return [dict(row) for row in result] if result else []
 
 
+@teaching_load_cache.invalidates
 def enrollment_db_insert(enrollment_data):
-    columns = ["student_id", "course_id", "grade"]
-    query = get_insert_returning_query("enrollments", columns)
-    cursor_or_result = db.execute_query(query, enrollment_data)
-    return handle_insert_result(cursor_or_result)
+    """
+    Insert an enrollment if its course has a free seat. The seat is taken by
+    a conditional UPDATE in the same statement, so a rolled-back insert gives
+    it back. A student who finds the course full is put on its waitlist and
+    ValueError reports their place in the queue.
+    """
+    student_id, course_id, grade = enrollment_data
+    query = """
+    WITH seat AS (
+        UPDATE courses
+        SET enrolled_count = enrolled_count + 1, updated_at = CURRENT_TIMESTAMP
+        WHERE id = %s AND (capacity IS NULL OR enrolled_count < capacity)
+        RETURNING id
+    ),
+    dequeued AS (
+        DELETE FROM course_waitlist
+        WHERE course_id IN (SELECT id FROM seat) AND student_id = %s
+    )
+    INSERT INTO enrollments (student_id, course_id, grade)
+    SELECT %s::int, id, %s::varchar FROM seat
+    RETURNING *;
+    """
+    cursor_or_result = db.execute_query(
+        query, (course_id, student_id, student_id, grade)
+    )
+    enrollment_id = handle_insert_result(cursor_or_result)
+    if enrollment_id:
+        course_cache.evict([course_id])
+        grade_stats_db_refresh([tuple(enrollment_data)])
+        return enrollment_id
+    position = waitlist_db_add(course_id, student_id)
+    if position is None:
+        raise ValueError(f"Course ID {course_id} not found.")
+    raise ValueError(
+        f"Course ID {course_id} is full; student {student_id} is number "
+        f"{position} on the waitlist."
+    )
+
+
+@teaching_load_cache.invalidates
+def enrollment_db_insert_many(enrollment_rows):
+    """
+    Insert enrollments in one statement, taking their seats in bulk: each
+    course's row is locked once, in ID order so concurrent batches cannot
+    deadlock, and its count raised by the batch's rows for it. If any course
+    is missing or lacks the seats nothing is written and ValueError is
+    raised, so callers fall back to row by row inserts (which waitlist the
+    overflow).
+    """
+    if not enrollment_rows:
+        return []
+    query = """
+    WITH requested AS (
+        SELECT r.ord::int AS ord, r.student_id::int AS student_id,
+               r.course_id::int AS course_id, r.grade::varchar AS grade
+        FROM (VALUES %s) AS r(ord, student_id, course_id, grade)
+    ),
+    demand AS (
+        SELECT course_id, COUNT(*) AS seats FROM requested GROUP BY course_id
+    ),
+    locked AS (
+        SELECT c.id, d.seats,
+               c.capacity IS NULL OR c.enrolled_count + d.seats <= c.capacity
+                   AS available
+        FROM courses c
+        JOIN demand d ON d.course_id = c.id
+        ORDER BY c.id
+        FOR UPDATE OF c
+    ),
+    granted AS (
+        SELECT id, seats FROM locked
+        WHERE (SELECT COUNT(*) FROM locked WHERE available)
+            = (SELECT COUNT(*) FROM demand)
+    ),
+    seats AS (
+        UPDATE courses c
+        SET enrolled_count = c.enrolled_count + g.seats,
+            updated_at = CURRENT_TIMESTAMP
+        FROM granted g
+        WHERE c.id = g.id
+    ),
+    dequeued AS (
+        DELETE FROM course_waitlist w
+        USING requested r
+        JOIN granted g ON g.id = r.course_id
+        WHERE w.course_id = r.course_id AND w.student_id = r.student_id
+    )
+    INSERT INTO enrollments (student_id, course_id, grade)
+    SELECT r.student_id, r.course_id, r.grade
+    FROM requested r
+    JOIN granted g ON g.id = r.course_id
+    ORDER BY r.ord
+    RETURNING *;
+    """
+    numbered = [(ord, *row) for ord, row in enumerate(enrollment_rows)]
+    result = db.execute_values(query, numbered)
+    rows = [dict(row) for row in result] if result else []
+    if len(rows) < len(enrollment_rows):
+        raise ValueError("Not every course in the batch has enough free seats.")
+    course_cache.evict({row["course_id"] for row in rows})
+    grade_stats_db_refresh(enrollment_grade_key(row) for row in rows)
+    return rows
 
 
+@teaching_load_cache.invalidates
+@cache.evicts(id_arg)
 def enrollment_db_update(enrollment_id, enrollment_data):
+    """
+    Update an enrollment. Moving it to another course takes a seat there
+    first (raising ValueError if the course is full) and gives the old
+    course's seat back once the update succeeds.
+    """
     archived_condition = get_archived_condition(False)
     query = f"""
     UPDATE enrollments
     SET student_id = %s, course_id = %s, grade = %s, updated_at = CURRENT_TIMESTAMP
     WHERE id = %s AND {archived_condition};
     """
+    old_keys = grade_stats_db_read_keys([enrollment_id])
+    old_course_id = old_keys[enrollment_id][1] if enrollment_id in old_keys else None
+    new_course_id = enrollment_data[1]
+    moving = old_course_id is not None and str(old_course_id) != str(new_course_id)
+    if moving and not course_db_take_seat(new_course_id):
+        raise ValueError(f"Course ID {new_course_id} is full or not found.")
     values = enrollment_data + (enrollment_id,)
-    cursor = db.execute_query(query, values)
-    return cursor.rowcount if cursor else 0
+    try:
+        cursor = db.execute_query(query, values)
+    except Exception:
+        if moving:
+            course_db_release_seats({int(new_course_id): 1})
+        raise
+    rows_updated = cursor.rowcount if cursor else 0
+    if moving:
+        released = old_course_id if rows_updated else int(new_course_id)
+        course_db_release_seats({released: 1})
+    if rows_updated:
+        new_keys = {enrollment_id: tuple(enrollment_data)}
+        grade_stats_db_refresh(changed_grade_keys(old_keys, new_keys))
+    return rows_updated
+
+
+@teaching_load_cache.invalidates
+@cache.evicts(pair_ids)
+def enrollment_db_update_many(enrollment_rows):
+    """
+    Update enrollments in one statement. Course moves need a seat each, so a
+    batch containing one raises ValueError and is retried row by row.
+    """
+    query = get_update_many_query("enrollments", ENROLLMENT_COLUMNS)
+    params = get_update_many_params(ENROLLMENT_COLUMNS, enrollment_rows)
+    old_keys = grade_stats_db_read_keys([row_id for row_id, _ in enrollment_rows])
+    for row_id, row in enrollment_rows:
+        if row_id in old_keys and str(old_keys[row_id][1]) != str(row[1]):
+            raise ValueError("Course changes are applied one enrollment at a time.")
+    result = db.execute_query(query, params)
+    rows = [dict(row) for row in result] if result else []
+    new_keys = {row["id"]: enrollment_grade_key(row) for row in rows}
+    grade_stats_db_refresh(changed_grade_keys(old_keys, new_keys))
+    return rows
 
 
+@teaching_load_cache.invalidates
+@cache.evicts(id_arg)
 def enrollment_db_archive(enrollment_id):
+    """Archive an enrollment, freeing its seat for the course's waitlist."""
     archived_condition_false = get_archived_condition(False)
     query = f"""
     UPDATE enrollments
     SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
     WHERE id = %s AND {archived_condition_false};
     """
+    old_keys = grade_stats_db_read_keys([enrollment_id])
     cursor = db.execute_query(query, (enrollment_id,))
-    return cursor.rowcount if cursor else 0
+    rows_updated = cursor.rowcount if cursor else 0
+    if rows_updated:
+        grade_stats_db_refresh(old_keys.values())
+        _release_seats(old_keys.values())
+    return rows_updated
+
+
+@teaching_load_cache.invalidates
+@cache.evicts(ids_arg)
+def enrollment_db_archive_many(enrollment_ids):
+    query = get_archive_many_query("enrollments")
+    result = db.execute_query(query, (list(enrollment_ids),))
+    rows = [dict(row) for row in result] if result else []
+    grade_stats_db_refresh(enrollment_grade_key(row) for row in rows)
+    _release_seats(enrollment_grade_key(row) for row in rows)
+    return rows
+
+
+def _release_seats(keys):
+    """
+    Give back the seats of archived enrollments, given as (student_id,
+    course_id, grade); waitlisted students are enrolled into them.
+    """
+    course_db_release_seats(dict(Counter(course_id for _, course_id, _ in keys)))
+
+
+def enrollment_db_read_student_sessions(student_ids):
+    """
+    Weekly sessions of every active enrollment of the given students, in one
+    query, for timetable clash checks.
+    """
+    if not student_ids:
+        return []
+    query = """
+    SELECT e.id AS enrollment_id, e.student_id, e.course_id, c.term_id,
+           cs.day, cs.time
+    FROM enrollments e
+    JOIN courses c ON c.id = e.course_id AND c.is_archived = FALSE
+    JOIN course_schedule cs ON cs.course_id = e.course_id AND cs.is_archived = FALSE
+    WHERE e.student_id = ANY(%s) AND e.is_archived = FALSE;
+    """
+    result = db.execute_query(query, (list(student_ids),))
+    return [dict(row) for row in result] if result else []
@@ -0,0 +1,87 @@
+from db.database import Database
+from db.db_utils import get_grade_stats_lock_query, get_grade_stats_refresh_query
+
+db = Database()
+
+
+def enrollment_grade_key(row):
+    """The columns grade statistics depend on: (student_id, course_id, grade)."""
+    return row.get("student_id"), row.get("course_id"), row.get("grade")
+
+
+def changed_grade_keys(old_keys, new_keys):
+    """
+    Keys whose statistics a write invalidated. Both arguments map enrollment
+    ID -> (student_id, course_id, grade); unchanged enrollments are skipped.
+    """
+    keys = []
+    for enrollment_id, new in new_keys.items():
+        old = old_keys.get(enrollment_id)
+        if old != new:
+            keys.extend(key for key in (old, new) if key)
+    return keys
+
+
+def grade_stats_db_read_keys(enrollment_ids):
+    """
+    Current (student_id, course_id, grade) of the given active enrollments,
+    read before a write so the old student and course can be refreshed too.
+    """
+    if not enrollment_ids:
+        return {}
+    query = """
+    SELECT id, student_id, course_id, grade FROM enrollments
+    WHERE id = ANY(%s) AND is_archived = FALSE;
+    """
+    result = db.execute_query(query, (list(enrollment_ids),))
+    return {row["id"]: enrollment_grade_key(row) for row in result or []}
+
+
+def grade_stats_db_refresh(keys):
+    """
+    Recompute the stored statistics of the students and courses in keys, an
+    iterable of (student_id, course_id, grade). Ungraded enrollments do not
+    affect statistics and are skipped. Only the touched students and courses
+    are read, through the enrollments indexes.
+
+    Each key is locked first, in one round trip with the refresh, so
+    concurrent writers to the same student or course refresh it one after
+    the other (see get_grade_stats_lock_query).
+    """
+    graded = [key for key in keys if key and (key[2] or "").strip()]
+    for table, key_column, ids in (
+        ("student_grade_stats", "student_id", {key[0] for key in graded}),
+        ("course_grade_stats", "course_id", {key[1] for key in graded}),
+    ):
+        if not ids:
+            continue
+        ids = sorted(ids)
+        query = get_grade_stats_lock_query(table) + get_grade_stats_refresh_query(
+            table, key_column
+        )
+        db.execute_query(query, (ids, ids))
+
+
+def grade_stats_db_rebuild():
+    """Recompute statistics for every student and course, e.g. after a bulk load."""
+    for table, key_column, source in (
+        ("student_grade_stats", "student_id", "students"),
+        ("course_grade_stats", "course_id", "courses"),
+    ):
+        lock = get_grade_stats_lock_query(table, per_key=False)
+        refresh = get_grade_stats_refresh_query(
+            table, key_column, keys_sql=f"(SELECT id FROM {source})"
+        )
+        db.execute_query(lock + refresh)
+
+
+def student_grade_stats_db_read(student_id):
+    query = "SELECT * FROM student_grade_stats WHERE student_id = %s;"
+    result = db.execute_query(query, (student_id,))
+    return dict(result[0]) if result else None
+
+
+def course_grade_stats_db_read(course_id):
+    query = "SELECT * FROM course_grade_stats WHERE course_id = %s;"
+    result = db.execute_query(query, (course_id,))
+    return dict(result[0]) if result else None
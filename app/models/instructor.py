@@ -1,29 +1,87 @@
+from app.models.report import teaching_load_cache
+from db.cache import ReadCache, id_arg, ids_arg, pair_ids
 from db.database import Database
 from db.db_utils import (
+    BASE_FIELDS,
     get_insert_returning_query,
+    get_insert_many_query,
+    get_update_many_query,
+    get_update_many_params,
     handle_insert_result,
+    get_archive_many_query,
     get_archived_condition,
+    get_keyset_pagination,
+    get_filter_conditions,
+    get_select_columns,
+    get_version_query,
     BOOLEAN_TRUE,
 )
 
 db = Database()
+cache = ReadCache("instructors")
 
+INSTRUCTOR_COLUMNS = [
+    "first_name",
+    "last_name",
+    "email",
+    "address",
+    "province",
+    "employment",
+    "status",
+    "department_id",
+]
+INSTRUCTOR_FIELDS = BASE_FIELDS + INSTRUCTOR_COLUMNS
 
-def instructor_db_read_all(active_only=False):
-    query = "SELECT * FROM instructors"
+# Columns list endpoints can filter on, and how to parse their values
+INSTRUCTOR_FILTERS = {
+    "department_id": int,
+    "status": str,
+    "employment": str,
+    "province": str,
+    "is_archived": bool,
+}
+
+
+def instructor_db_read_all(
+    active_only=False,
+    limit=None,
+    after_id=None,
+    stream=False,
+    filters=None,
+    fields=None,
+):
+    columns = get_select_columns(fields, INSTRUCTOR_FIELDS)
+    query = f"SELECT {columns} FROM instructors"
+    conditions, params = get_filter_conditions(filters, INSTRUCTOR_FILTERS)
     if active_only:
-        query += " WHERE status = 'active'"
-    query += ";"
-    result = db.execute_query(query)
+        conditions.insert(0, "status = 'active'")
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    pagination, page_params = get_keyset_pagination(bool(conditions), limit, after_id)
+    query += pagination + ";"
+    params += page_params
+    if stream:
+        return (dict(row) for row in db.stream_query(query, params))
+    result = db.execute_query(query, params)
     return [dict(row) for row in result] if result else []
 
 
+def instructor_db_read_version(active_only=False):
+    query = get_version_query("instructors")
+    if active_only:
+        query += " WHERE status = 'active'"
+    result = db.execute_query(query + ";")
+    return dict(result[0]) if result else None
+
+
+@cache.read_by_id
 def instructor_db_read_by_id(instructor_id):
     query = "SELECT * FROM instructors WHERE id = %s;"
     result = db.execute_query(query, (instructor_id,))
     return dict(result[0]) if result else None
 
 
+@cache.read_by_ids
 def instructor_db_read_by_ids(instructor_ids):
     if not instructor_ids:
         return []
@@ -34,21 +92,19 @@ def instructor_db_read_by_ids(instructor_ids):
 
 
 def instructor_db_insert(instructor_data):
-    columns = [
-        "first_name",
-        "last_name",
-        "email",
-        "address",
-        "province",
-        "employment",
-        "status",
-        "department_id",
-    ]
-    query = get_insert_returning_query("instructors", columns)
+    query = get_insert_returning_query("instructors", INSTRUCTOR_COLUMNS)
     cursor_or_result = db.execute_query(query, instructor_data)
     return handle_insert_result(cursor_or_result)
 
 
+def instructor_db_insert_many(instructor_rows):
+    query = get_insert_many_query("instructors", INSTRUCTOR_COLUMNS)
+    result = db.execute_values(query, instructor_rows)
+    return [dict(row) for row in result] if result else []
+
+
+@teaching_load_cache.invalidates
+@cache.evicts(id_arg)
 def instructor_db_update(instructor_id, instructor_data):
     archived_condition = get_archived_condition(False)
     query = f"""
@@ -61,6 +117,17 @@ def instructor_db_update(instructor_id, instructor_data):
     return cursor.rowcount if cursor else 0
 
 
+@teaching_load_cache.invalidates
+@cache.evicts(pair_ids)
+def instructor_db_update_many(instructor_rows):
+    query = get_update_many_query("instructors", INSTRUCTOR_COLUMNS)
+    params = get_update_many_params(INSTRUCTOR_COLUMNS, instructor_rows)
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+@teaching_load_cache.invalidates
+@cache.evicts(id_arg)
 def instructor_db_archive(instructor_id):
     archived_condition_false = get_archived_condition(False)
     query = f"""
@@ -70,3 +137,11 @@ def instructor_db_archive(instructor_id):
     """
     cursor = db.execute_query(query, (instructor_id,))
     return cursor.rowcount if cursor else 0
+
+
+@teaching_load_cache.invalidates
+@cache.evicts(ids_arg)
+def instructor_db_archive_many(instructor_ids):
+    query = get_archive_many_query("instructors", "status = 'inactive'")
+    result = db.execute_query(query, (list(instructor_ids),))
+    return [dict(row) for row in result] if result else []
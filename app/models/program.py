@@ -1,30 +1,72 @@
+from db.cache import ReadCache, id_arg, ids_arg, pair_ids
 from db.database import Database
 from db.db_utils import (
+    BASE_FIELDS,
     get_insert_returning_query,
+    get_insert_many_query,
+    get_update_many_query,
+    get_update_many_params,
     handle_insert_result,
+    get_archive_many_query,
     get_archived_condition,
+    get_keyset_pagination,
+    get_filter_conditions,
+    get_select_columns,
+    get_version_query,
     BOOLEAN_TRUE,
 )
 
 db = Database()
+cache = ReadCache("programs")
 
+PROGRAM_COLUMNS = ["name", "type", "department_id"]
+PROGRAM_FIELDS = BASE_FIELDS + PROGRAM_COLUMNS
 
-def program_db_read_all(active_only=False):
-    query = "SELECT * FROM programs"
+# Columns list endpoints can filter on, and how to parse their values
+PROGRAM_FILTERS = {"department_id": int, "type": str, "is_archived": bool}
+
+
+def program_db_read_all(
+    active_only=False,
+    limit=None,
+    after_id=None,
+    stream=False,
+    filters=None,
+    fields=None,
+):
+    columns = get_select_columns(fields, PROGRAM_FIELDS)
+    query = f"SELECT {columns} FROM programs"
+    conditions, params = get_filter_conditions(filters, PROGRAM_FILTERS)
+    if active_only:
+        conditions.insert(0, get_archived_condition(False))
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    pagination, page_params = get_keyset_pagination(bool(conditions), limit, after_id)
+    query += pagination + ";"
+    params += page_params
+    if stream:
+        return (dict(row) for row in db.stream_query(query, params))
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+def program_db_read_version(active_only=False):
+    query = get_version_query("programs")
     if active_only:
         archived_condition = get_archived_condition(False)
         query += f" WHERE {archived_condition}"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(query + ";")
+    return dict(result[0]) if result else None
 
 
+@cache.read_by_id
 def program_db_read_by_id(program_id):
     query = "SELECT * FROM programs WHERE id = %s;"
     result = db.execute_query(query, (program_id,))
     return dict(result[0]) if result else None
 
 
+@cache.read_by_ids
 def program_db_read_by_ids(program_ids):
     if not program_ids:
         return []
@@ -35,12 +77,18 @@ def program_db_read_by_ids(program_ids):
 
 
 def program_db_insert(program_data):
-    columns = ["name", "type", "department_id"]
-    query = get_insert_returning_query("programs", columns)
+    query = get_insert_returning_query("programs", PROGRAM_COLUMNS)
     cursor_or_result = db.execute_query(query, program_data)
     return handle_insert_result(cursor_or_result)
 
 
+def program_db_insert_many(program_rows):
+    query = get_insert_many_query("programs", PROGRAM_COLUMNS)
+    result = db.execute_values(query, program_rows)
+    return [dict(row) for row in result] if result else []
+
+
+@cache.evicts(id_arg)
 def program_db_update(program_id, program_data):
     archived_condition = get_archived_condition(False)
     query = f"""
@@ -53,6 +101,15 @@ def program_db_update(program_id, program_data):
     return cursor.rowcount if cursor else 0
 
 
+@cache.evicts(pair_ids)
+def program_db_update_many(program_rows):
+    query = get_update_many_query("programs", PROGRAM_COLUMNS)
+    params = get_update_many_params(PROGRAM_COLUMNS, program_rows)
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+@cache.evicts(id_arg)
 def program_db_archive(program_id):
     archived_condition_false = get_archived_condition(False)
     query = f"""
@@ -62,3 +119,10 @@ def program_db_archive(program_id):
     """
     cursor = db.execute_query(query, (program_id,))
     return cursor.rowcount if cursor else 0
+
+
+@cache.evicts(ids_arg)
+def program_db_archive_many(program_ids):
+    query = get_archive_many_query("programs")
+    result = db.execute_query(query, (list(program_ids),))
+    return [dict(row) for row in result] if result else []
@@ -0,0 +1,144 @@
+from db.cache import QueryCache
+from db.database import Database
+
+db = Database()
+
+# Reports over course_schedule; any schedule or course write starts a new
+# generation, so a cached report is served until the next such write.
+schedule_report_cache = QueryCache("schedule_reports")
+
+
+@schedule_report_cache.cached
+def report_db_read_room_sessions(term_id=None):
+    """Room, day and time of every active session of active courses."""
+    query = """
+    SELECT cs.id, cs.room, cs.day, cs.time
+    FROM course_schedule cs
+    JOIN courses c ON c.id = cs.course_id AND c.is_archived = FALSE
+    WHERE cs.is_archived = FALSE
+    """
+    params = ()
+    if term_id is not None:
+        query += " AND c.term_id = %s"
+        params = (term_id,)
+    result = db.execute_query(query + " ORDER BY cs.id;", params)
+    return [dict(row) for row in result] if result else []
+
+
+# Teaching load depends on assignments, schedules and enrollments, and on
+# course and instructor writes that move or hide them.
+teaching_load_cache = QueryCache("teaching_load")
+
+
+@teaching_load_cache.cached
+def report_db_read_teaching_load(instructor_id=None, department_id=None, term_id=None):
+    """
+    One row per active assignment of the given instructor, or of every
+    instructor in the given department, with the course's enrolled count
+    and sessions. Enrollments and sessions are grouped per course before
+    the join so neither multiplies the other.
+    """
+    conditions = ["a.is_archived = FALSE"]
+    params = []
+    if instructor_id is not None:
+        conditions.append("a.instructor_id = %s")
+        params.append(instructor_id)
+    if department_id is not None:
+        conditions.append("i.department_id = %s")
+        params.append(department_id)
+    if term_id is not None:
+        conditions.append("c.term_id = %s")
+        params.append(term_id)
+    query = f"""
+    WITH teaching AS (
+        SELECT DISTINCT a.instructor_id, i.first_name, i.last_name,
+               c.id AS course_id, c.code, c.title, c.term_id
+        FROM assignments a
+        JOIN instructors i ON i.id = a.instructor_id AND i.is_archived = FALSE
+        JOIN courses c ON c.id = a.course_id AND c.is_archived = FALSE
+        WHERE {" AND ".join(conditions)}
+    ),
+    enrolled AS (
+        SELECT e.course_id, COUNT(*) AS enrolled
+        FROM enrollments e
+        WHERE e.is_archived = FALSE
+          AND e.course_id IN (SELECT course_id FROM teaching)
+        GROUP BY e.course_id
+    ),
+    sessions AS (
+        SELECT cs.course_id,
+               JSON_AGG(JSON_BUILD_OBJECT('day', cs.day, 'time', cs.time)
+                        ORDER BY cs.id) AS sessions
+        FROM course_schedule cs
+        WHERE cs.is_archived = FALSE
+          AND cs.course_id IN (SELECT course_id FROM teaching)
+        GROUP BY cs.course_id
+    )
+    SELECT t.*, COALESCE(en.enrolled, 0) AS enrolled,
+           COALESCE(s.sessions, '[]'::json) AS sessions
+    FROM teaching t
+    LEFT JOIN enrolled en ON en.course_id = t.course_id
+    LEFT JOIN sessions s ON s.course_id = t.course_id
+    ORDER BY t.instructor_id, t.term_id, t.code;
+    """
+    result = db.execute_query(query, tuple(params))
+    return [dict(row) for row in result] if result else []
+
+
+# Dashboard counts may lag writes by up to this many seconds
+DEPARTMENT_SUMMARY_TTL = 60
+
+department_summary_cache = QueryCache("department_summary", ttl=DEPARTMENT_SUMMARY_TTL)
+
+
+@department_summary_cache.cached
+def report_db_read_department_summary(department_id=None):
+    """
+    Active programs, instructors, courses and students of every active
+    department, or of one. Each count is one grouped COUNT over the table's
+    department foreign-key index (students through their program), joined
+    to departments once, instead of counting row by row.
+    """
+    # psycopg2 inlines the parameters, so the planner folds the IS NULL test
+    # away and sees a plain department_id = N it can use the index for
+    query = """
+    WITH program_counts AS (
+        SELECT department_id, COUNT(*) AS programs
+        FROM programs
+        WHERE is_archived = FALSE AND (%s::int IS NULL OR department_id = %s)
+        GROUP BY department_id
+    ),
+    instructor_counts AS (
+        SELECT department_id, COUNT(*) AS instructors
+        FROM instructors
+        WHERE is_archived = FALSE AND (%s::int IS NULL OR department_id = %s)
+        GROUP BY department_id
+    ),
+    course_counts AS (
+        SELECT department_id, COUNT(*) AS courses
+        FROM courses
+        WHERE is_archived = FALSE AND (%s::int IS NULL OR department_id = %s)
+        GROUP BY department_id
+    ),
+    student_counts AS (
+        SELECT p.department_id, COUNT(*) AS active_students
+        FROM students s
+        JOIN programs p ON p.id = s.program_id
+        WHERE s.is_archived = FALSE AND s.status = 'active' AND (%s::int IS NULL OR p.department_id = %s)
+        GROUP BY p.department_id
+    )
+    SELECT d.id AS department_id, d.name,
+           COALESCE(pc.programs, 0) AS programs,
+           COALESCE(ic.instructors, 0) AS instructors,
+           COALESCE(cc.courses, 0) AS courses,
+           COALESCE(sc.active_students, 0) AS active_students
+    FROM departments d
+    LEFT JOIN program_counts pc ON pc.department_id = d.id
+    LEFT JOIN instructor_counts ic ON ic.department_id = d.id
+    LEFT JOIN course_counts cc ON cc.department_id = d.id
+    LEFT JOIN student_counts sc ON sc.department_id = d.id
+    WHERE d.is_archived = FALSE AND (%s::int IS NULL OR d.id = %s)
+    ORDER BY d.id;
+    """
+    result = db.execute_query(query, (department_id,) * 10)
+    return [dict(row) for row in result] if result else []
@@ -0,0 +1,105 @@
+import re
+
+from db.cache import QueryCache
+from db.database import Database
+from db.db_utils import get_archived_condition
+
+db = Database()
+
+# Searchable tables and the type each reports its results as
+SEARCH_TABLES = {"students": "student", "instructors": "instructor"}
+SEARCH_COLUMNS = ["id", "first_name", "last_name", "email"]
+
+# Text matched by GET /api/search. These expressions must stay identical to
+# the ones the search indexes in db/schema.sql and db/trigram.sql are built
+# on, or the planner cannot use them.
+SEARCH_DOCUMENT = "first_name || ' ' || last_name || ' ' || email"
+SEARCH_VECTOR = f"to_tsvector('simple', {SEARCH_DOCUMENT})"
+SEARCH_TEXT = f"lower({SEARCH_DOCUMENT})"
+
+# Trigram indexes only narrow substring matches of at least three characters
+SEARCH_MIN_SUBSTRING = 3
+
+# Whether pg_trgm is installed, rechecked every few minutes so installing it
+# later enables substring search without a restart
+TRIGRAM_CHECK_TTL = 300
+search_extension_cache = QueryCache("search_extensions", ttl=TRIGRAM_CHECK_TTL)
+
+
+def get_search_prefix_query(term):
+    """
+    Turn free text into a tsquery matching every word as a prefix:
+    "jo smi" -> "jo:* & smi:*". Only letters and digits are kept, so the
+    result is always a valid tsquery; returns None if no words remain.
+    """
+    words = re.findall(r"[^\W_]+", term.lower())
+    return " & ".join(f"{word}:*" for word in words) or None
+
+
+def get_search_query(table, result_type, columns, substring=True, trigram=True):
+    """
+    Get a ranked search over one table's SEARCH_DOCUMENT for
+    get_search_params. Rows match on word prefixes through the tsvector
+    index and, when substring is set, anywhere in the text through the
+    trigram index; closer matches rank higher. Without trigram (pg_trgm is
+    not installed) only the tsvector rank is used.
+    """
+    column_names = ", ".join(columns)
+    condition = f"{SEARCH_VECTOR} @@ q.query"
+    if substring:
+        condition = f"({condition} OR {SEARCH_TEXT} LIKE %s)"
+    rank = f"ts_rank({SEARCH_VECTOR}, q.query)"
+    if trigram:
+        rank += f" + similarity({SEARCH_TEXT}, %s)"
+    archived_condition = get_archived_condition(False)
+    return f"""
+    SELECT '{result_type}' AS type, {column_names},
+           {rank} AS rank
+    FROM {table}, to_tsquery('simple', %s) AS q(query)
+    WHERE {archived_condition} AND {condition}
+    ORDER BY rank DESC, id
+    LIMIT %s"""
+
+
+def get_search_params(term, limit, substring=True, trigram=True):
+    """Parameters for get_search_query, in placeholder order."""
+    lowered = term.lower()
+    params = [lowered] if trigram else []
+    params.append(get_search_prefix_query(term) or "")
+    if substring:
+        escaped = re.sub(r"([\\%_])", r"\\\1", lowered)
+        params.append(f"%{escaped}%")
+    params.append(limit)
+    return params
+
+
+@search_extension_cache.cached
+def search_db_has_trigram():
+    """Whether the pg_trgm extension behind substring search is installed."""
+    query = "SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') AS installed;"
+    result = db.execute_query(query)
+    return bool(result and result[0]["installed"])
+
+
+def search_db_people(term, limit, tables=None):
+    """
+    Active students and instructors whose name or email matches term, best
+    match first. Each table returns at most limit rows of its own from its
+    indexes before the results are merged, so the cost does not grow with
+    the size of the tables. Without pg_trgm, only word prefixes match.
+    """
+    trigram = search_db_has_trigram()
+    substring = trigram and len(term.strip()) >= SEARCH_MIN_SUBSTRING
+    # Nothing an index can match, e.g. "@"
+    if get_search_prefix_query(term) is None and not substring:
+        return []
+    parts, params = [], []
+    for table in tables or list(SEARCH_TABLES):
+        query = get_search_query(
+            table, SEARCH_TABLES[table], SEARCH_COLUMNS, substring, trigram
+        )
+        parts.append(f"({query})")
+        params += get_search_params(term, limit, substring, trigram)
+    query = " UNION ALL ".join(parts) + "\n    ORDER BY rank DESC, type, id LIMIT %s;"
+    result = db.execute_query(query, (*params, limit))
+    return [dict(row) for row in result] if result else []
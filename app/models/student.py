@@ -1,29 +1,97 @@
+from db.cache import ReadCache, id_arg, ids_arg, pair_ids
 from db.database import Database
 from db.db_utils import (
+    BASE_FIELDS,
     get_insert_returning_query,
+    get_insert_many_query,
+    get_update_many_query,
+    get_update_many_params,
     handle_insert_result,
+    get_archive_many_query,
     get_archived_condition,
+    get_keyset_pagination,
+    get_filter_conditions,
+    get_select_columns,
+    get_version_query,
     BOOLEAN_TRUE,
 )
 
 db = Database()
+cache = ReadCache("students")
 
+STUDENT_COLUMNS = [
+    "first_name",
+    "last_name",
+    "email",
+    "address",
+    "city",
+    "province",
+    "country",
+    "address_type",
+    "status",
+    "coop",
+    "is_international",
+    "program_id",
+]
+STUDENT_FIELDS = BASE_FIELDS + STUDENT_COLUMNS
 
-def student_db_read_all(active_only=False):
-    query = "SELECT * FROM students"
+# Rows sent per COPY by student_db_import
+IMPORT_CHUNK_SIZE = 10000
+
+# Columns list endpoints can filter on, and how to parse their values
+STUDENT_FILTERS = {
+    "program_id": int,
+    "status": str,
+    "is_international": bool,
+    "coop": bool,
+    "address_type": str,
+    "city": str,
+    "province": str,
+    "country": str,
+    "is_archived": bool,
+}
+
+
+def student_db_read_all(
+    active_only=False,
+    limit=None,
+    after_id=None,
+    stream=False,
+    filters=None,
+    fields=None,
+):
+    columns = get_select_columns(fields, STUDENT_FIELDS)
+    query = f"SELECT {columns} FROM students"
+    conditions, params = get_filter_conditions(filters, STUDENT_FILTERS)
     if active_only:
-        query += " WHERE status = 'active'"
-    query += ";"
-    result = db.execute_query(query)
+        conditions.insert(0, "status = 'active'")
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    pagination, page_params = get_keyset_pagination(bool(conditions), limit, after_id)
+    query += pagination + ";"
+    params += page_params
+    if stream:
+        return (dict(row) for row in db.stream_query(query, params))
+    result = db.execute_query(query, params)
     return [dict(row) for row in result] if result else []
 
 
+def student_db_read_version(active_only=False):
+    query = get_version_query("students")
+    if active_only:
+        query += " WHERE status = 'active'"
+    result = db.execute_query(query + ";")
+    return dict(result[0]) if result else None
+
+
+@cache.read_by_id
 def student_db_read_by_id(student_id):
     query = "SELECT * FROM students WHERE id = %s;"
     result = db.execute_query(query, (student_id,))
     return dict(result[0]) if result else None
 
 
+@cache.read_by_ids
 def student_db_read_by_ids(student_ids):
     if not student_ids:
         return []
@@ -33,26 +101,55 @@ def student_db_read_by_ids(student_ids):
     return [dict(row) for row in result] if result else []
 
 
+def student_db_read_transcript(student_id):
+    """
+    Read a student with all of their active enrollments, joined with course,
+    term and department, in one query. Returns one row per enrollment (or a
+    single row with NULL enrollment columns), ordered by term.
+    """
+    archived_condition = get_archived_condition(False)
+    query = f"""
+    SELECT
+        s.id AS student_id, s.first_name, s.last_name, s.email, s.program_id,
+        e.id AS enrollment_id, e.grade,
+        c.id AS course_id, c.code AS course_code, c.title AS course_title,
+        d.id AS department_id, d.name AS department_name,
+        t.id AS term_id, t.name AS term_name, t.start_date, t.end_date
+    FROM students s
+    LEFT JOIN enrollments e ON e.student_id = s.id AND e.{archived_condition}
+    LEFT JOIN courses c ON c.id = e.course_id
+    LEFT JOIN terms t ON t.id = c.term_id
+    LEFT JOIN departments d ON d.id = c.department_id
+    WHERE s.id = %s
+    ORDER BY t.start_date NULLS LAST, t.id, c.code;
+    """
+    result = db.execute_query(query, (student_id,))
+    return [dict(row) for row in result] if result else []
+
+
 def student_db_insert(student_data):
-    columns = [
-        "first_name",
-        "last_name",
-        "email",
-        "address",
-        "city",
-        "province",
-        "country",
-        "address_type",
-        "status",
-        "coop",
-        "is_international",
-        "program_id",
-    ]
-    query = get_insert_returning_query("students", columns)
+    query = get_insert_returning_query("students", STUDENT_COLUMNS)
     cursor_or_result = db.execute_query(query, student_data)
     return handle_insert_result(cursor_or_result)
 
 
+def student_db_insert_many(student_rows):
+    query = get_insert_many_query("students", STUDENT_COLUMNS)
+    result = db.execute_values(query, student_rows)
+    return [dict(row) for row in result] if result else []
+
+
+def student_db_import(student_rows):
+    """
+    Load rows in STUDENT_COLUMNS order with COPY, all or none; returns how
+    many were loaded.
+    """
+    return db.copy_rows(
+        "students", STUDENT_COLUMNS, student_rows, chunk_size=IMPORT_CHUNK_SIZE
+    )
+
+
+@cache.evicts(id_arg)
 def student_db_update(student_id, student_data):
     archived_condition = get_archived_condition(False)
     query = f"""
@@ -66,6 +163,15 @@ def student_db_update(student_id, student_data):
     return cursor.rowcount if cursor else 0
 
 
+@cache.evicts(pair_ids)
+def student_db_update_many(student_rows):
+    query = get_update_many_query("students", STUDENT_COLUMNS)
+    params = get_update_many_params(STUDENT_COLUMNS, student_rows)
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+@cache.evicts(id_arg)
 def student_db_archive(student_id):
     archived_condition_false = get_archived_condition(False)
     query = f"""
@@ -75,3 +181,10 @@ def student_db_archive(student_id):
     """
     cursor = db.execute_query(query, (student_id,))
     return cursor.rowcount if cursor else 0
+
+
+@cache.evicts(ids_arg)
+def student_db_archive_many(student_ids):
+    query = get_archive_many_query("students", "status = 'inactive'")
+    result = db.execute_query(query, (list(student_ids),))
+    return [dict(row) for row in result] if result else []
@@ -1,30 +1,73 @@
+from datetime import date
+from db.cache import ReadCache, id_arg, ids_arg, pair_ids
 from db.database import Database
 from db.db_utils import (
+    BASE_FIELDS,
     get_insert_returning_query,
+    get_insert_many_query,
+    get_update_many_query,
+    get_update_many_params,
     handle_insert_result,
+    get_archive_many_query,
     get_archived_condition,
+    get_keyset_pagination,
+    get_filter_conditions,
+    get_select_columns,
+    get_version_query,
     BOOLEAN_TRUE,
 )
 
 db = Database()
+cache = ReadCache("terms")
 
+TERM_COLUMNS = ["name", "start_date", "end_date"]
+TERM_FIELDS = BASE_FIELDS + TERM_COLUMNS
 
-def term_db_read_all(active_only=False):
-    query = "SELECT * FROM terms"
+# Columns list endpoints can filter on, and how to parse their values
+TERM_FILTERS = {"name": str, "start_date": date, "end_date": date, "is_archived": bool}
+
+
+def term_db_read_all(
+    active_only=False,
+    limit=None,
+    after_id=None,
+    stream=False,
+    filters=None,
+    fields=None,
+):
+    columns = get_select_columns(fields, TERM_FIELDS)
+    query = f"SELECT {columns} FROM terms"
+    conditions, params = get_filter_conditions(filters, TERM_FILTERS)
+    if active_only:
+        conditions.insert(0, get_archived_condition(False))
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    pagination, page_params = get_keyset_pagination(bool(conditions), limit, after_id)
+    query += pagination + ";"
+    params += page_params
+    if stream:
+        return (dict(row) for row in db.stream_query(query, params))
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+def term_db_read_version(active_only=False):
+    query = get_version_query("terms")
     if active_only:
         archived_condition = get_archived_condition(False)
         query += f" WHERE {archived_condition}"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(query + ";")
+    return dict(result[0]) if result else None
 
 
+@cache.read_by_id
 def term_db_read_by_id(term_id):
     query = "SELECT * FROM terms WHERE id = %s;"
     result = db.execute_query(query, (term_id,))
     return dict(result[0]) if result else None
 
 
+@cache.read_by_ids
 def term_db_read_by_ids(term_ids):
     if not term_ids:
         return []
@@ -35,12 +78,18 @@ def term_db_read_by_ids(term_ids):
 
 
 def term_db_insert(term_data):
-    columns = ["name", "start_date", "end_date"]
-    query = get_insert_returning_query("terms", columns)
+    query = get_insert_returning_query("terms", TERM_COLUMNS)
     cursor_or_result = db.execute_query(query, term_data)
     return handle_insert_result(cursor_or_result)
 
 
+def term_db_insert_many(term_rows):
+    query = get_insert_many_query("terms", TERM_COLUMNS)
+    result = db.execute_values(query, term_rows)
+    return [dict(row) for row in result] if result else []
+
+
+@cache.evicts(id_arg)
 def term_db_update(term_id, term_data):
     archived_condition = get_archived_condition(False)
     query = f"""
@@ -53,6 +102,15 @@ def term_db_update(term_id, term_data):
     return cursor.rowcount if cursor else 0
 
 
+@cache.evicts(pair_ids)
+def term_db_update_many(term_rows):
+    query = get_update_many_query("terms", TERM_COLUMNS)
+    params = get_update_many_params(TERM_COLUMNS, term_rows)
+    result = db.execute_query(query, params)
+    return [dict(row) for row in result] if result else []
+
+
+@cache.evicts(id_arg)
 def term_db_archive(term_id):
     archived_condition_false = get_archived_condition(False)
     query = f"""
@@ -62,3 +120,10 @@ def term_db_archive(term_id):
     """
     cursor = db.execute_query(query, (term_id,))
     return cursor.rowcount if cursor else 0
+
+
+@cache.evicts(ids_arg)
+def term_db_archive_many(term_ids):
+    query = get_archive_many_query("terms")
+    result = db.execute_query(query, (list(term_ids),))
+    return [dict(row) for row in result] if result else []
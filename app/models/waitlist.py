@@ -0,0 +1,135 @@
+from app.models.course_schedule import course_schedule_db_read_sessions
+from app.utils.scheduling import Timetables, group_course_sessions
+from db.database import Database
+
+db = Database()
+
+
+def waitlist_db_add(course_id, student_id):
+    """
+    Queue a student for a full course. Returns the student's 1-based position,
+    or None if the course does not exist. Queuing twice keeps the first place.
+    """
+    query = """
+    WITH course AS (
+        SELECT id FROM courses WHERE id = %s
+    ),
+    added AS (
+        INSERT INTO course_waitlist (course_id, student_id)
+        SELECT id, %s FROM course
+        ON CONFLICT (course_id, student_id) DO NOTHING
+        RETURNING id, course_id
+    ),
+    entry AS (
+        SELECT id, course_id FROM added
+        UNION ALL
+        SELECT w.id, w.course_id FROM course_waitlist w
+        JOIN course c ON c.id = w.course_id
+        WHERE w.student_id = %s
+    )
+    SELECT (
+        SELECT COUNT(*) FROM course_waitlist w
+        WHERE w.course_id = e.course_id AND w.id < e.id
+    ) + 1 AS position
+    FROM entry e;
+    """
+    result = db.execute_query(query, (course_id, student_id, student_id))
+    return result[0]["position"] if result else None
+
+
+def waitlist_db_promote(course_ids):
+    """
+    Enroll waitlisted students, in queue order, into the free seats of the
+    given courses. Each course's row is locked (in ID order) while its seats
+    are handed out, exactly as when enrolling directly. Like a direct
+    enrollment, a student whose timetable the course would clash with is
+    passed over and stays queued. Returns the new enrollment rows.
+    """
+    if not course_ids:
+        return []
+    query = """
+    WITH free AS (
+        SELECT id, capacity - enrolled_count AS seats
+        FROM courses
+        WHERE id = ANY(%s) AND (capacity IS NULL OR enrolled_count < capacity)
+        ORDER BY id
+        FOR UPDATE
+    )
+    SELECT w.id, w.course_id, w.student_id, f.seats
+    FROM course_waitlist w
+    JOIN free f ON f.id = w.course_id
+    ORDER BY w.id;
+    """
+    queue = db.execute_query(query, (sorted(set(course_ids)),)) or []
+    promoted_ids = _unclashing_waitlist_ids(queue)
+    if not promoted_ids:
+        return []
+
+    query = """
+    WITH promoted AS (
+        DELETE FROM course_waitlist
+        WHERE id = ANY(%s)
+        RETURNING id, course_id, student_id
+    ),
+    seats AS (
+        UPDATE courses c
+        SET enrolled_count = c.enrolled_count + p.promoted,
+            updated_at = CURRENT_TIMESTAMP
+        FROM (
+            SELECT course_id, COUNT(*) AS promoted FROM promoted GROUP BY course_id
+        ) p
+        WHERE c.id = p.course_id
+    )
+    INSERT INTO enrollments (student_id, course_id)
+    SELECT student_id, course_id FROM promoted ORDER BY id
+    RETURNING *;
+    """
+    result = db.execute_query(query, (promoted_ids,))
+    return [dict(row) for row in result] if result else []
+
+
+def _unclashing_waitlist_ids(queue):
+    """
+    Walk queue rows (id, course_id, student_id, seats), in queue order, and
+    pick the waitlist IDs to promote: while their course has seats left
+    (seats is None when unlimited), students whose timetable the course does
+    not clash with, checked against each other's promotions too.
+    """
+    if not queue:
+        return []
+    # enrollment imports this module
+    from app.models.enrollment import enrollment_db_read_student_sessions
+
+    course_sessions = group_course_sessions(
+        course_schedule_db_read_sessions({row["course_id"] for row in queue})
+    )
+    timetables = Timetables()
+    timetables.add_sessions(
+        enrollment_db_read_student_sessions({row["student_id"] for row in queue})
+    )
+    seats = {row["course_id"]: row["seats"] for row in queue}
+    promoted_ids = []
+    for row in queue:
+        course_id, student_id = row["course_id"], row["student_id"]
+        if seats[course_id] is not None and seats[course_id] <= 0:
+            continue
+        sessions = course_sessions.get(course_id, [])
+        if timetables.clash(student_id, sessions) is not None:
+            continue
+        promoted_ids.append(row["id"])
+        timetables.add(student_id, course_id, sessions)
+        if seats[course_id] is not None:
+            seats[course_id] -= 1
+    return promoted_ids
+
+
+def waitlist_db_read(course_id):
+    query = """
+    SELECT w.id, w.student_id, w.created_at,
+           ROW_NUMBER() OVER (ORDER BY w.id) AS position
+    FROM course_waitlist w
+    WHERE w.course_id = %s
+    ORDER BY w.id;
+    """
+    result = db.execute_query(query, (course_id,))
+    return [dict(row) for row in result] if result else []
@@ -8,3 +8,5 @@ from .instructor import instructor_bp
 from .program import program_bp
 from .student import student_bp
 from .term import term_bp
+from .report import report_bp
+from .search import search_bp
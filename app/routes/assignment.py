@@ -5,9 +5,20 @@ from app.utils import (
     api_response_error,
     handle_exceptions_read,
     handle_exceptions_write,
+    get_pagination_args,
+    get_filter_args,
+    get_next_cursor,
+    get_stream_format,
+    ndjson_response,
+    wants_list_validators,
+    list_validators,
+    row_validators,
+    check_not_modified,
+    with_validators,
 )
 from app.services import (
     get_all_assignments,
+    get_assignments_version,
     get_assignment_by_id,
     create_new_assignments,
     update_assignments,
@@ -21,8 +32,37 @@ assignment_bp = Blueprint("assignment", __name__)
 @handle_exceptions_read()
 def handle_read_all_assignments():
     active_only = request.args.get("active_only", "false").lower() == "true"
-    assignments = get_all_assignments(active_only=active_only)
-    return api_response(assignments, "Assignments fetched successfully.")
+    limit, after_id = get_pagination_args(request.args)
+    filters, fields = get_filter_args(request.args)
+    if get_stream_format(request.args):
+        assignments = get_all_assignments(
+            active_only=active_only,
+            limit=limit,
+            after_id=after_id,
+            filters=filters,
+            fields=fields,
+            stream=True,
+        )
+        return ndjson_response(assignments)
+    validators = None
+    if wants_list_validators(after_id, filters):
+        validators = list_validators(get_assignments_version(active_only), request.args)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    assignments = get_all_assignments(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        filters=filters,
+        fields=fields,
+    )
+    response = api_response(
+        assignments,
+        "Assignments fetched successfully.",
+        next_cursor=get_next_cursor(assignments, limit),
+    )
+    return with_validators(response, validators)
 
 
 @assignment_bp.route("/api/assignments/<int:assignment_id>", methods=["GET"])
@@ -31,7 +71,12 @@ def handle_get_assignment_by_id(assignment_id):
     assignment = get_assignment_by_id(assignment_id)
     if assignment is None:
         return api_response_error("Assignment not found.", 404)
-    return api_response(assignment, "Assignment fetched successfully.")
+    validators = row_validators(assignment)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    response = api_response(assignment, "Assignment fetched successfully.")
+    return with_validators(response, validators)
 
 
 @assignment_bp.route("/api/assignments", methods=["POST"])
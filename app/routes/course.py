@@ -5,10 +5,24 @@ from app.utils import (
     api_response_error,
     handle_exceptions_read,
     handle_exceptions_write,
+    get_pagination_args,
+    get_filter_args,
+    get_next_cursor,
+    get_stream_format,
+    ndjson_response,
+    wants_list_validators,
+    list_validators,
+    row_validators,
+    check_not_modified,
+    with_validators,
 )
 from app.services import (
     get_all_courses,
+    get_courses_version,
     get_course_by_id,
+    course_roster,
+    course_waitlist,
+    get_course_grade_stats,
     create_new_courses,
     update_courses,
     archive_courses,
@@ -21,8 +35,37 @@ course_bp = Blueprint("course", __name__)
 @handle_exceptions_read()
 def handle_read_all_courses():
     active_only = request.args.get("active_only", "false").lower() == "true"
-    courses = get_all_courses(active_only=active_only)
-    return api_response(courses, "Courses fetched successfully.")
+    limit, after_id = get_pagination_args(request.args)
+    filters, fields = get_filter_args(request.args)
+    if get_stream_format(request.args):
+        courses = get_all_courses(
+            active_only=active_only,
+            limit=limit,
+            after_id=after_id,
+            filters=filters,
+            fields=fields,
+            stream=True,
+        )
+        return ndjson_response(courses)
+    validators = None
+    if wants_list_validators(after_id, filters):
+        validators = list_validators(get_courses_version(active_only), request.args)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    courses = get_all_courses(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        filters=filters,
+        fields=fields,
+    )
+    response = api_response(
+        courses,
+        "Courses fetched successfully.",
+        next_cursor=get_next_cursor(courses, limit),
+    )
+    return with_validators(response, validators)
 
 
 @course_bp.route("/api/courses/<int:course_id>", methods=["GET"])
@@ -31,7 +74,45 @@ def handle_get_course_by_id(course_id):
     course = get_course_by_id(course_id)
     if course is None:
         return api_response_error("Course not found.", 404)
-    return api_response(course, "Course fetched successfully.")
+    validators = row_validators(course)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    response = api_response(course, "Course fetched successfully.")
+    return with_validators(response, validators)
+
+
+@course_bp.route("/api/courses/<int:course_id>/roster", methods=["GET"])
+@handle_exceptions_read()
+def handle_get_course_roster(course_id):
+    limit, after_id = get_pagination_args(request.args)
+    _, fields = get_filter_args(request.args)
+    roster = course_roster(course_id, limit=limit, after_id=after_id, fields=fields)
+    if roster is None:
+        return api_response_error("Course not found.", 404)
+    return api_response(
+        roster,
+        "Roster fetched successfully.",
+        next_cursor=get_next_cursor(roster, limit, key="enrollment_id"),
+    )
+
+
+@course_bp.route("/api/courses/<int:course_id>/waitlist", methods=["GET"])
+@handle_exceptions_read()
+def handle_get_course_waitlist(course_id):
+    waitlist = course_waitlist(course_id)
+    if waitlist is None:
+        return api_response_error("Course not found.", 404)
+    return api_response(waitlist, "Waitlist fetched successfully.")
+
+
+@course_bp.route("/api/courses/<int:course_id>/grade-stats", methods=["GET"])
+@handle_exceptions_read()
+def handle_get_course_grade_stats(course_id):
+    stats = get_course_grade_stats(course_id)
+    if stats is None:
+        return api_response_error("Course not found.", 404)
+    return api_response(stats, "Grade statistics fetched successfully.")
 
 
 @course_bp.route("/api/courses", methods=["POST"])
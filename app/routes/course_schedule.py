@@ -5,13 +5,26 @@ from app.utils import (
     api_response_error,
     handle_exceptions_read,
     handle_exceptions_write,
+    get_pagination_args,
+    get_filter_args,
+    get_id_arg,
+    get_next_cursor,
+    get_stream_format,
+    ndjson_response,
+    wants_list_validators,
+    list_validators,
+    row_validators,
+    check_not_modified,
+    with_validators,
 )
 from app.services import (
     get_all_course_schedules,
+    get_course_schedules_version,
     get_course_schedule_by_id,
     create_new_course_schedules,
     update_course_schedules,
     archive_course_schedules,
+    get_course_schedule_conflicts,
 )
 
 course_schedule_bp = Blueprint("course_schedule", __name__)
@@ -21,8 +34,46 @@ course_schedule_bp = Blueprint("course_schedule", __name__)
 @handle_exceptions_read()
 def handle_read_all_course_schedules():
     active_only = request.args.get("active_only", "false").lower() == "true"
-    course_schedules = get_all_course_schedules(active_only=active_only)
-    return api_response(course_schedules, "Course schedules fetched successfully.")
+    limit, after_id = get_pagination_args(request.args)
+    filters, fields = get_filter_args(request.args)
+    if get_stream_format(request.args):
+        course_schedules = get_all_course_schedules(
+            active_only=active_only,
+            limit=limit,
+            after_id=after_id,
+            filters=filters,
+            fields=fields,
+            stream=True,
+        )
+        return ndjson_response(course_schedules)
+    validators = None
+    if wants_list_validators(after_id, filters):
+        validators = list_validators(
+            get_course_schedules_version(active_only), request.args
+        )
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    course_schedules = get_all_course_schedules(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        filters=filters,
+        fields=fields,
+    )
+    response = api_response(
+        course_schedules,
+        "Course schedules fetched successfully.",
+        next_cursor=get_next_cursor(course_schedules, limit),
+    )
+    return with_validators(response, validators)
+
+
+@course_schedule_bp.route("/api/course_schedules/conflicts", methods=["GET"])
+@handle_exceptions_read()
+def handle_get_course_schedule_conflicts():
+    report = get_course_schedule_conflicts(term_id=get_id_arg(request.args, "term_id"))
+    return api_response(report, "Course schedule conflicts fetched successfully.")
 
 
 @course_schedule_bp.route(
@@ -33,7 +84,12 @@ def handle_get_course_schedule_by_id(course_schedule_id):
     course_schedule = get_course_schedule_by_id(course_schedule_id)
     if course_schedule is None:
         return api_response_error("Course schedule not found.", 404)
-    return api_response(course_schedule, "Course schedule fetched successfully.")
+    validators = row_validators(course_schedule)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    response = api_response(course_schedule, "Course schedule fetched successfully.")
+    return with_validators(response, validators)
 
 
 @course_schedule_bp.route("/api/course_schedules", methods=["POST"])
@@ -5,13 +5,28 @@ from app.utils import (
     api_response_error,
     handle_exceptions_read,
     handle_exceptions_write,
+    get_pagination_args,
+    get_filter_args,
+    get_id_arg,
+    get_next_cursor,
+    get_stream_format,
+    ndjson_response,
+    wants_list_validators,
+    list_validators,
+    row_validators,
+    check_not_modified,
+    with_validators,
 )
 from app.services import (
     get_all_departments,
+    get_departments_version,
     get_department_by_id,
     create_new_departments,
     update_departments,
     archive_departments,
+    get_department_teaching_load,
+    get_department_summaries,
+    get_department_summary,
 )
 
 department_bp = Blueprint("department", __name__)
@@ -21,8 +36,37 @@ department_bp = Blueprint("department", __name__)
 @handle_exceptions_read()
 def handle_read_all_departments():
     active_only = request.args.get("active_only", "false").lower() == "true"
-    departments = get_all_departments(active_only=active_only)
-    return api_response(departments, "Departments fetched successfully.")
+    limit, after_id = get_pagination_args(request.args)
+    filters, fields = get_filter_args(request.args)
+    if get_stream_format(request.args):
+        departments = get_all_departments(
+            active_only=active_only,
+            limit=limit,
+            after_id=after_id,
+            filters=filters,
+            fields=fields,
+            stream=True,
+        )
+        return ndjson_response(departments)
+    validators = None
+    if wants_list_validators(after_id, filters):
+        validators = list_validators(get_departments_version(active_only), request.args)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    departments = get_all_departments(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        filters=filters,
+        fields=fields,
+    )
+    response = api_response(
+        departments,
+        "Departments fetched successfully.",
+        next_cursor=get_next_cursor(departments, limit),
+    )
+    return with_validators(response, validators)
 
 
 @department_bp.route("/api/departments/<int:department_id>", methods=["GET"])
@@ -31,7 +75,41 @@ def handle_get_department_by_id(department_id):
     department = get_department_by_id(department_id)
     if department is None:
         return api_response_error("Department not found.", 404)
-    return api_response(department, "Department fetched successfully.")
+    validators = row_validators(department)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    response = api_response(department, "Department fetched successfully.")
+    return with_validators(response, validators)
+
+
+@department_bp.route(
+    "/api/departments/<int:department_id>/teaching-load", methods=["GET"]
+)
+@handle_exceptions_read()
+def handle_get_department_teaching_load(department_id):
+    load = get_department_teaching_load(
+        department_id, term_id=get_id_arg(request.args, "term_id")
+    )
+    if load is None:
+        return api_response_error("Department not found.", 404)
+    return api_response(load, "Teaching load fetched successfully.")
+
+
+@department_bp.route("/api/departments/summary", methods=["GET"])
+@handle_exceptions_read()
+def handle_get_department_summaries():
+    summaries = get_department_summaries()
+    return api_response(summaries, "Department summaries fetched successfully.")
+
+
+@department_bp.route("/api/departments/<int:department_id>/summary", methods=["GET"])
+@handle_exceptions_read()
+def handle_get_department_summary(department_id):
+    summary = get_department_summary(department_id)
+    if summary is None:
+        return api_response_error("Department not found.", 404)
+    return api_response(summary, "Department summary fetched successfully.")
 
 
 @department_bp.route("/api/departments", methods=["POST"])
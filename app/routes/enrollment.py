@@ -5,9 +5,20 @@ from app.utils import (
     api_response_error,
     handle_exceptions_read,
     handle_exceptions_write,
+    get_pagination_args,
+    get_filter_args,
+    get_next_cursor,
+    get_stream_format,
+    ndjson_response,
+    wants_list_validators,
+    list_validators,
+    row_validators,
+    check_not_modified,
+    with_validators,
 )
 from app.services import (
     get_all_enrollments,
+    get_enrollments_version,
     get_enrollment_by_id,
     create_new_enrollments,
     update_enrollments,
@@ -21,8 +32,37 @@ enrollment_bp = Blueprint("enrollment", __name__)
 @handle_exceptions_read()
 def handle_read_all_enrollments():
     active_only = request.args.get("active_only", "false").lower() == "true"
-    enrollments = get_all_enrollments(active_only=active_only)
-    return api_response(enrollments, "Enrollments fetched successfully.")
+    limit, after_id = get_pagination_args(request.args)
+    filters, fields = get_filter_args(request.args)
+    if get_stream_format(request.args):
+        enrollments = get_all_enrollments(
+            active_only=active_only,
+            limit=limit,
+            after_id=after_id,
+            filters=filters,
+            fields=fields,
+            stream=True,
+        )
+        return ndjson_response(enrollments)
+    validators = None
+    if wants_list_validators(after_id, filters):
+        validators = list_validators(get_enrollments_version(active_only), request.args)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    enrollments = get_all_enrollments(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        filters=filters,
+        fields=fields,
+    )
+    response = api_response(
+        enrollments,
+        "Enrollments fetched successfully.",
+        next_cursor=get_next_cursor(enrollments, limit),
+    )
+    return with_validators(response, validators)
 
 
 @enrollment_bp.route("/api/enrollments/<int:enrollment_id>", methods=["GET"])
@@ -31,22 +71,32 @@ def handle_get_enrollment_by_id(enrollment_id):
     enrollment = get_enrollment_by_id(enrollment_id)
     if enrollment is None:
         return api_response_error("Enrollment not found.", 404)
-    return api_response(enrollment, "Enrollment fetched successfully.")
+    validators = row_validators(enrollment)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    response = api_response(enrollment, "Enrollment fetched successfully.")
+    return with_validators(response, validators)
 
 
 @enrollment_bp.route("/api/enrollments", methods=["POST"])
 @handle_exceptions_write()
 def handle_create_enrollment():
-    results, error_data, status_code = create_new_enrollments(request.get_json())
+    check_clashes = request.args.get("check_clashes", "true").lower() != "false"
+    results, error_data, status_code = create_new_enrollments(
+        request.get_json(), check_clashes=check_clashes
+    )
 
-    if error_data:
+    if not results:
         return api_response_error(error_data, status_code)
 
+    # Rows rejected (e.g. for a timetable clash) next to the ones created
     response_data, status_code = build_bulk_response(
         success_list=results,
         success_msg_single="Enrollment created successfully.",
         success_msg_bulk="{} enrollments created successfully.",
         created=True,
+        errors=error_data,
     )
     return jsonify(response_data), status_code
 
@@ -54,7 +104,10 @@ def handle_create_enrollment():
 @enrollment_bp.route("/api/enrollments", methods=["PUT"])
 @handle_exceptions_write()
 def handle_update_enrollments():
-    results, error_data, status_code = update_enrollments(request.get_json())
+    check_clashes = request.args.get("check_clashes", "true").lower() != "false"
+    results, error_data, status_code = update_enrollments(
+        request.get_json(), check_clashes=check_clashes
+    )
 
     if error_data:
         return api_response_error(error_data, status_code)
@@ -1,4 +1,14 @@
-from flask import Blueprint, jsonify
+import os
+from flask import Blueprint, jsonify, request
+from app.utils import (
+    RequestMetrics,
+    api_response_error,
+    get_pagination_args,
+    handle_exceptions_read,
+)
+from db.cache import ReadCache
+from db.database import Database
+from db.query_stats import QueryStats, slow_query_ms
 
 home_bp = Blueprint("home", __name__)
 
@@ -23,3 +33,67 @@ def index():
             ],
         }
     ), 200
+
+
+@home_bp.route("/health")
+def health():
+    return jsonify(
+        {
+            "status": "OK",
+            "db_pool": Database.pool_stats(),
+            "cache": ReadCache.stats(),
+        }
+    ), 200
+
+
+# Pool counters that only ever grow; the rest are current levels
+POOL_COUNTERS = {"checkouts", "waits", "wait_time_total", "timeouts", "recycled"}
+
+
+@home_bp.route("/metrics")
+def metrics():
+    pool = Database.pool_stats()
+    caches = ReadCache.stats()
+    extra = {
+        f"db_pool_{name}": (
+            "counter" if name in POOL_COUNTERS else "gauge",
+            f"Connection pool {name.replace('_', ' ')}.",
+            {(): value},
+        )
+        for name, value in pool.items()
+    }
+    for name in ("hits", "misses", "evictions"):
+        extra[f"cache_{name}_total"] = (
+            "counter",
+            f"Read cache {name}, by namespace.",
+            {(("namespace", ns),): counts[name] for ns, counts in caches.items()},
+        )
+    return RequestMetrics.response(extra)
+
+
+def _debug_queries_enabled():
+    """Query statistics expose SQL text, so production has to opt in."""
+    default = "false" if os.getenv("FLASK_ENV") == "production" else "true"
+    return os.getenv("DEBUG_QUERIES", default).lower() == "true"
+
+
+@home_bp.route("/debug/queries", methods=["GET"])
+@handle_exceptions_read()
+def debug_queries():
+    if not _debug_queries_enabled():
+        return api_response_error("Not found.", 404)
+    limit, _ = get_pagination_args(request.args)
+    return jsonify(
+        {
+            "slow_query_ms": slow_query_ms(),
+            "queries": QueryStats.snapshot(limit=limit),
+        }
+    ), 200
+
+
+@home_bp.route("/debug/queries", methods=["DELETE"])
+def reset_debug_queries():
+    if not _debug_queries_enabled():
+        return api_response_error("Not found.", 404)
+    QueryStats.reset()
+    return jsonify({"message": "Query statistics reset."}), 200
@@ -5,13 +5,26 @@ from app.utils import (
     api_response_error,
     handle_exceptions_read,
     handle_exceptions_write,
+    get_pagination_args,
+    get_filter_args,
+    get_id_arg,
+    get_next_cursor,
+    get_stream_format,
+    ndjson_response,
+    wants_list_validators,
+    list_validators,
+    row_validators,
+    check_not_modified,
+    with_validators,
 )
 from app.services import (
     get_all_instructors,
+    get_instructors_version,
     get_instructor_by_id,
     create_new_instructors,
     update_instructors,
     archive_instructors,
+    get_instructor_load,
 )
 
 instructor_bp = Blueprint("instructor", __name__)
@@ -21,8 +34,37 @@ instructor_bp = Blueprint("instructor", __name__)
 @handle_exceptions_read()
 def handle_read_all_instructors():
     active_only = request.args.get("active_only", "false").lower() == "true"
-    instructors = get_all_instructors(active_only=active_only)
-    return api_response(instructors, "Instructors fetched successfully.")
+    limit, after_id = get_pagination_args(request.args)
+    filters, fields = get_filter_args(request.args)
+    if get_stream_format(request.args):
+        instructors = get_all_instructors(
+            active_only=active_only,
+            limit=limit,
+            after_id=after_id,
+            filters=filters,
+            fields=fields,
+            stream=True,
+        )
+        return ndjson_response(instructors)
+    validators = None
+    if wants_list_validators(after_id, filters):
+        validators = list_validators(get_instructors_version(active_only), request.args)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    instructors = get_all_instructors(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        filters=filters,
+        fields=fields,
+    )
+    response = api_response(
+        instructors,
+        "Instructors fetched successfully.",
+        next_cursor=get_next_cursor(instructors, limit),
+    )
+    return with_validators(response, validators)
 
 
 @instructor_bp.route("/api/instructors/<int:instructor_id>", methods=["GET"])
@@ -31,7 +73,23 @@ def handle_get_instructor_by_id(instructor_id):
     instructor = get_instructor_by_id(instructor_id)
     if instructor is None:
         return api_response_error("Instructor not found.", 404)
-    return api_response(instructor, "Instructor fetched successfully.")
+    validators = row_validators(instructor)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    response = api_response(instructor, "Instructor fetched successfully.")
+    return with_validators(response, validators)
+
+
+@instructor_bp.route("/api/instructors/<int:instructor_id>/load", methods=["GET"])
+@handle_exceptions_read()
+def handle_get_instructor_load(instructor_id):
+    load = get_instructor_load(
+        instructor_id, term_id=get_id_arg(request.args, "term_id")
+    )
+    if load is None:
+        return api_response_error("Instructor not found.", 404)
+    return api_response(load, "Teaching load fetched successfully.")
 
 
 @instructor_bp.route("/api/instructors", methods=["POST"])
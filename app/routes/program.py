@@ -5,9 +5,20 @@ from app.utils import (
     api_response_error,
     handle_exceptions_read,
     handle_exceptions_write,
+    get_pagination_args,
+    get_filter_args,
+    get_next_cursor,
+    get_stream_format,
+    ndjson_response,
+    wants_list_validators,
+    list_validators,
+    row_validators,
+    check_not_modified,
+    with_validators,
 )
 from app.services import (
     get_all_programs,
+    get_programs_version,
     get_program_by_id,
     create_new_programs,
     update_programs,
@@ -21,8 +32,37 @@ program_bp = Blueprint("program", __name__)
 @handle_exceptions_read()
 def handle_read_all_programs():
     active_only = request.args.get("active_only", "false").lower() == "true"
-    programs = get_all_programs(active_only=active_only)
-    return api_response(programs, "Programs fetched successfully.")
+    limit, after_id = get_pagination_args(request.args)
+    filters, fields = get_filter_args(request.args)
+    if get_stream_format(request.args):
+        programs = get_all_programs(
+            active_only=active_only,
+            limit=limit,
+            after_id=after_id,
+            filters=filters,
+            fields=fields,
+            stream=True,
+        )
+        return ndjson_response(programs)
+    validators = None
+    if wants_list_validators(after_id, filters):
+        validators = list_validators(get_programs_version(active_only), request.args)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    programs = get_all_programs(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        filters=filters,
+        fields=fields,
+    )
+    response = api_response(
+        programs,
+        "Programs fetched successfully.",
+        next_cursor=get_next_cursor(programs, limit),
+    )
+    return with_validators(response, validators)
 
 
 @program_bp.route("/api/programs/<int:program_id>", methods=["GET"])
@@ -31,7 +71,12 @@ def handle_get_program_by_id(program_id):
     program = get_program_by_id(program_id)
     if program is None:
         return api_response_error("Program not found.", 404)
-    return api_response(program, "Program fetched successfully.")
+    validators = row_validators(program)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    response = api_response(program, "Program fetched successfully.")
+    return with_validators(response, validators)
 
 
 @program_bp.route("/api/programs", methods=["POST"])
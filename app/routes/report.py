@@ -0,0 +1,12 @@
+from flask import Blueprint, request
+from app.utils import api_response, get_id_arg, handle_exceptions_read
+from app.services import get_room_utilization
+
+report_bp = Blueprint("report", __name__)
+
+
+@report_bp.route("/api/reports/room-utilization", methods=["GET"])
+@handle_exceptions_read()
+def handle_get_room_utilization():
+    report = get_room_utilization(term_id=get_id_arg(request.args, "term_id"))
+    return api_response(report, "Room utilization fetched successfully.")
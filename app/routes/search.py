@@ -0,0 +1,14 @@
+from flask import Blueprint, request
+from app.utils import api_response, get_pagination_args, handle_exceptions_read
+from app.services import search_people
+
+search_bp = Blueprint("search", __name__)
+
+
+@search_bp.route("/api/search", methods=["GET"])
+@handle_exceptions_read()
+def handle_search():
+    limit, _ = get_pagination_args(request.args)
+    types = [t for t in request.args.get("type", "").split(",") if t] or None
+    results = search_people(request.args.get("q"), limit=limit, types=types)
+    return api_response(results, "Search results fetched successfully.")
@@ -1,3 +1,5 @@
+import codecs
+
 from flask import Blueprint, jsonify, request
 from app.utils import (
     build_bulk_response,
@@ -5,11 +7,25 @@ from app.utils import (
     api_response_error,
     handle_exceptions_read,
     handle_exceptions_write,
+    get_pagination_args,
+    get_filter_args,
+    get_next_cursor,
+    get_stream_format,
+    ndjson_response,
+    wants_list_validators,
+    list_validators,
+    row_validators,
+    check_not_modified,
+    with_validators,
 )
 from app.services import (
     get_all_students,
+    get_students_version,
     get_student_by_id,
+    get_student_transcript,
+    get_student_gpa,
     create_new_students,
+    import_students,
     update_students,
     archive_students,
 )
@@ -21,8 +37,37 @@ student_bp = Blueprint("student", __name__)
 @handle_exceptions_read()
 def handle_read_all_students():
     active_only = request.args.get("active_only", "false").lower() == "true"
-    students = get_all_students(active_only=active_only)
-    return api_response(students, "Students fetched successfully.")
+    limit, after_id = get_pagination_args(request.args)
+    filters, fields = get_filter_args(request.args)
+    if get_stream_format(request.args):
+        students = get_all_students(
+            active_only=active_only,
+            limit=limit,
+            after_id=after_id,
+            filters=filters,
+            fields=fields,
+            stream=True,
+        )
+        return ndjson_response(students)
+    validators = None
+    if wants_list_validators(after_id, filters):
+        validators = list_validators(get_students_version(active_only), request.args)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    students = get_all_students(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        filters=filters,
+        fields=fields,
+    )
+    response = api_response(
+        students,
+        "Students fetched successfully.",
+        next_cursor=get_next_cursor(students, limit),
+    )
+    return with_validators(response, validators)
 
 
 @student_bp.route("/api/students/<int:student_id>", methods=["GET"])
@@ -31,7 +76,30 @@ def handle_get_student_by_id(student_id):
     student = get_student_by_id(student_id)
     if student is None:
         return api_response_error("Student not found.", 404)
-    return api_response(student, "Student fetched successfully.")
+    validators = row_validators(student)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    response = api_response(student, "Student fetched successfully.")
+    return with_validators(response, validators)
+
+
+@student_bp.route("/api/students/<int:student_id>/transcript", methods=["GET"])
+@handle_exceptions_read()
+def handle_get_student_transcript(student_id):
+    transcript = get_student_transcript(student_id)
+    if transcript is None:
+        return api_response_error("Student not found.", 404)
+    return api_response(transcript, "Transcript fetched successfully.")
+
+
+@student_bp.route("/api/students/<int:student_id>/gpa", methods=["GET"])
+@handle_exceptions_read()
+def handle_get_student_gpa(student_id):
+    gpa = get_student_gpa(student_id)
+    if gpa is None:
+        return api_response_error("Student not found.", 404)
+    return api_response(gpa, "GPA fetched successfully.")
 
 
 @student_bp.route("/api/students", methods=["POST"])
@@ -51,6 +119,27 @@ def handle_create_student():
     return jsonify(response_data), status_code
 
 
+@student_bp.route("/api/students/import", methods=["POST"])
+@handle_exceptions_write()
+def handle_import_students():
+    # A multipart upload's "file" field, or the request body itself (text/csv)
+    upload = request.files.get("file")
+    stream = upload.stream if upload else request.stream
+    # Decoded line by line; TextIOWrapper needs readable(), which uploads
+    # spooled to a SpooledTemporaryFile lack before Python 3.11
+    lines = codecs.iterdecode(stream, "utf-8-sig")
+    result, error_data, status_code = import_students(lines)
+
+    if error_data:
+        return api_response_error(error_data, status_code)
+
+    return api_response(
+        result,
+        f"{result['imported']} students imported successfully.",
+        status_code,
+    )
+
+
 @student_bp.route("/api/students", methods=["PUT"])
 @handle_exceptions_write()
 def handle_update_students():
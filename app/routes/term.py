@@ -5,9 +5,20 @@ from app.utils import (
     api_response_error,
     handle_exceptions_read,
     handle_exceptions_write,
+    get_pagination_args,
+    get_filter_args,
+    get_next_cursor,
+    get_stream_format,
+    ndjson_response,
+    wants_list_validators,
+    list_validators,
+    row_validators,
+    check_not_modified,
+    with_validators,
 )
 from app.services import (
     get_all_terms,
+    get_terms_version,
     get_term_by_id,
     create_new_terms,
     update_terms,
@@ -21,8 +32,37 @@ term_bp = Blueprint("term", __name__)
 @handle_exceptions_read()
 def handle_read_all_terms():
     active_only = request.args.get("active_only", "false").lower() == "true"
-    terms = get_all_terms(active_only=active_only)
-    return api_response(terms, "Terms fetched successfully.")
+    limit, after_id = get_pagination_args(request.args)
+    filters, fields = get_filter_args(request.args)
+    if get_stream_format(request.args):
+        terms = get_all_terms(
+            active_only=active_only,
+            limit=limit,
+            after_id=after_id,
+            filters=filters,
+            fields=fields,
+            stream=True,
+        )
+        return ndjson_response(terms)
+    validators = None
+    if wants_list_validators(after_id, filters):
+        validators = list_validators(get_terms_version(active_only), request.args)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    terms = get_all_terms(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        filters=filters,
+        fields=fields,
+    )
+    response = api_response(
+        terms,
+        "Terms fetched successfully.",
+        next_cursor=get_next_cursor(terms, limit),
+    )
+    return with_validators(response, validators)
 
 
 @term_bp.route("/api/terms/<int:term_id>", methods=["GET"])
@@ -31,7 +71,12 @@ def handle_get_term_by_id(term_id):
     term = get_term_by_id(term_id)
     if term is None:
         return api_response_error("Term not found.", 404)
-    return api_response(term, "Term fetched successfully.")
+    validators = row_validators(term)
+    not_modified = check_not_modified(validators)
+    if not_modified:
+        return not_modified
+    response = api_response(term, "Term fetched successfully.")
+    return with_validators(response, validators)
 
 
 @term_bp.route("/api/terms", methods=["POST"])
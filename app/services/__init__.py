@@ -1,13 +1,17 @@
 from .student import (
     get_all_students,
+    get_students_version,
     get_student_by_id,
+    get_student_transcript,
     create_new_students,
+    import_students,
     update_students,
     archive_students,
 )
 
 from .instructor import (
     get_all_instructors,
+    get_instructors_version,
     get_instructor_by_id,
     create_new_instructors,
     update_instructors,
@@ -16,6 +20,7 @@ from .instructor import (
 
 from .department import (
     get_all_departments,
+    get_departments_version,
     get_department_by_id,
     create_new_departments,
     update_departments,
@@ -24,6 +29,7 @@ from .department import (
 
 from .program import (
     get_all_programs,
+    get_programs_version,
     get_program_by_id,
     create_new_programs,
     update_programs,
@@ -32,7 +38,10 @@ from .program import (
 
 from .course import (
     get_all_courses,
+    get_courses_version,
     get_course_by_id,
+    course_roster,
+    course_waitlist,
     create_new_courses,
     update_courses,
     archive_courses,
@@ -40,6 +49,7 @@ from .course import (
 
 from .term import (
     get_all_terms,
+    get_terms_version,
     get_term_by_id,
     create_new_terms,
     update_terms,
@@ -48,6 +58,7 @@ from .term import (
 
 from .enrollment import (
     get_all_enrollments,
+    get_enrollments_version,
     get_enrollment_by_id,
     create_new_enrollments,
     update_enrollments,
@@ -56,6 +67,7 @@ from .enrollment import (
 
 from .assignment import (
     get_all_assignments,
+    get_assignments_version,
     get_assignment_by_id,
     create_new_assignments,
     update_assignments,
@@ -64,8 +76,25 @@ from .assignment import (
 
 from .course_schedule import (
     get_all_course_schedules,
+    get_course_schedules_version,
     get_course_schedule_by_id,
     create_new_course_schedules,
     update_course_schedules,
     archive_course_schedules,
+    get_course_schedule_conflicts,
 )
+
+from .grade_stats import (
+    get_student_gpa,
+    get_course_grade_stats,
+)
+
+from .report import (
+    get_room_utilization,
+    get_instructor_load,
+    get_department_teaching_load,
+    get_department_summaries,
+    get_department_summary,
+)
+
+from .search import search_people
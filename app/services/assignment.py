@@ -1,10 +1,14 @@
 from app.models import (
     assignment_db_read_all,
+    assignment_db_read_version,
     assignment_db_read_by_id,
     assignment_db_read_by_ids,
     assignment_db_insert,
+    assignment_db_insert_many,
     assignment_db_update,
+    assignment_db_update_many,
     assignment_db_archive,
+    assignment_db_archive_many,
 )
 from app.utils import (
     assignment_dict_to_row,
@@ -18,13 +22,26 @@ def assignment_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
-def get_all_assignments(active_only):
-    results = assignment_db_read_all(active_only=active_only)
+def get_all_assignments(
+    active_only, limit=None, after_id=None, stream=False, filters=None, fields=None
+):
+    results = assignment_db_read_all(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        stream=stream,
+        filters=filters,
+        fields=fields,
+    )
     if results is None:
         raise RuntimeError("Failed to fetch assignments.")
     return results
 
 
+def get_assignments_version(active_only):
+    return assignment_db_read_version(active_only=active_only)
+
+
 def get_assignment_by_id(assignment_id: int):
     assignment = assignment_db_read_by_id(assignment_id)
     return assignment
@@ -34,6 +51,7 @@ def create_new_assignments(data):
     return bulk_create_entities(
         data,
         insert_func=assignment_db_insert,
+        insert_many_func=assignment_db_insert_many,
         to_row_func=assignment_dict_to_row,
         to_dict_func=assignment_row_to_dict,
         read_by_ids_func=assignment_db_read_by_ids,
@@ -47,6 +65,7 @@ def update_assignments(data):
     return bulk_update_entities(
         data,
         update_func=assignment_db_update,
+        update_many_func=assignment_db_update_many,
         get_existing_func=assignment_db_read_by_id,
         to_row_func=assignment_dict_to_row,
         to_dict_func=assignment_row_to_dict,
@@ -64,6 +83,7 @@ def archive_assignments(ids):
     return bulk_archive_entities(
         ids,
         archive_func=assignment_db_archive,
+        archive_many_func=assignment_db_archive_many,
         get_existing_func=assignment_db_read_by_id,
         to_dict_func=assignment_row_to_dict,
         read_by_ids_func=assignment_db_read_by_ids,
@@ -1,10 +1,16 @@
 from app.models import (
     course_db_read_all,
+    course_db_read_version,
     course_db_read_by_id,
     course_db_read_by_ids,
+    course_db_read_roster,
     course_db_insert,
+    course_db_insert_many,
     course_db_update,
+    course_db_update_many,
     course_db_archive,
+    course_db_archive_many,
+    waitlist_db_read,
 )
 from app.utils import (
     course_dict_to_row,
@@ -18,22 +24,64 @@ def course_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
-def get_all_courses(active_only):
-    results = course_db_read_all(active_only=active_only)
+def get_all_courses(
+    active_only, limit=None, after_id=None, stream=False, filters=None, fields=None
+):
+    results = course_db_read_all(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        stream=stream,
+        filters=filters,
+        fields=fields,
+    )
     if results is None:
         raise RuntimeError("Failed to fetch courses.")
     return results
 
 
+def get_courses_version(active_only):
+    return course_db_read_version(active_only=active_only)
+
+
 def get_course_by_id(course_id: int):
     course = course_db_read_by_id(course_id)
     return course
 
 
+def course_roster(course_id: int, limit=None, after_id=None, fields=None):
+    """
+    Students enrolled in a course, one page at a time.
+    Returns None if the course does not exist.
+    """
+    if course_db_read_by_id(course_id) is None:
+        return None
+    return course_db_read_roster(
+        course_id, limit=limit, after_id=after_id, fields=fields
+    )
+
+
+def course_waitlist(course_id: int):
+    """
+    Students waiting for a seat in a course, in the order they will be
+    enrolled. Returns None if the course does not exist.
+    """
+    course = course_db_read_by_id(course_id)
+    if course is None:
+        return None
+    return {
+        "course_id": course_id,
+        "capacity": course.get("capacity"),
+        "enrolled_count": course.get("enrolled_count"),
+        "waitlist": waitlist_db_read(course_id),
+    }
+
+
 def create_new_courses(data):
     return bulk_create_entities(
         data,
         insert_func=course_db_insert,
+        insert_many_func=course_db_insert_many,
         to_row_func=course_dict_to_row,
         to_dict_func=course_row_to_dict,
         read_by_ids_func=course_db_read_by_ids,
@@ -47,6 +95,7 @@ def update_courses(data):
     return bulk_update_entities(
         data,
         update_func=course_db_update,
+        update_many_func=course_db_update_many,
         get_existing_func=course_db_read_by_id,
         to_row_func=course_dict_to_row,
         to_dict_func=course_row_to_dict,
@@ -64,6 +113,7 @@ def archive_courses(ids):
     return bulk_archive_entities(
         ids,
         archive_func=course_db_archive,
+        archive_many_func=course_db_archive_many,
         get_existing_func=course_db_read_by_id,
         to_dict_func=course_row_to_dict,
         read_by_ids_func=course_db_read_by_ids,
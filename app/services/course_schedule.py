@@ -1,16 +1,27 @@
 from app.models import (
     course_schedule_db_read_all,
+    course_schedule_db_read_version,
     course_schedule_db_read_by_id,
     course_schedule_db_read_by_ids,
     course_schedule_db_insert,
+    course_schedule_db_insert_many,
     course_schedule_db_update,
+    course_schedule_db_update_many,
     course_schedule_db_archive,
+    course_schedule_db_archive_many,
+    course_schedule_db_read_slots,
+    course_schedule_db_read_course_keys,
 )
 from app.utils import (
     course_schedule_dict_to_row,
     bulk_create_entities,
     bulk_update_entities,
     bulk_archive_entities,
+    schedule_intervals,
+    build_conflict_index,
+    describe_conflict,
+    find_schedule_conflicts,
+    normalize_room,
 )
 
 
@@ -18,25 +29,124 @@ def course_schedule_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
-def get_all_course_schedules(active_only):
-    results = course_schedule_db_read_all(active_only=active_only)
+def get_all_course_schedules(
+    active_only, limit=None, after_id=None, stream=False, filters=None, fields=None
+):
+    results = course_schedule_db_read_all(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        stream=stream,
+        filters=filters,
+        fields=fields,
+    )
     if results is None:
         raise RuntimeError("Failed to fetch course schedules.")
     return results
 
 
+def get_course_schedules_version(active_only):
+    return course_schedule_db_read_version(active_only=active_only)
+
+
 def get_course_schedule_by_id(course_schedule_id: int):
     course_schedule = course_schedule_db_read_by_id(course_schedule_id)
     return course_schedule
 
 
+def check_course_schedule_conflicts(pairs, updating=False):
+    """
+    Reject sessions that double-book a room or an instructor in the same term.
+
+    pairs are (key, (course_id, day, time, room)) as given to the bulk helpers'
+    validate_func; key is the schedule ID when updating. Only the stored
+    sessions that share a term and a room or an instructor with the new ones
+    are read and indexed, R of them, so a request of N sessions costs
+    O((R + N) log (R + N)) plus the index inserts (see IntervalIndex), not a
+    scan of every session of the term. Each new session is checked, then
+    added so sessions in the same request are checked against each other
+    too. Returns {key: error message}.
+    """
+    rejected = {}
+    parsed = []
+    # Sessions being updated are checked with their new values only; keys
+    # are compared as the integer IDs stored
+    replaced_ids = {}  # key -> schedule ID
+    for key, _ in pairs if updating else []:
+        try:
+            replaced_ids[key] = int(key)
+        except (TypeError, ValueError):
+            pass  # Matches no stored session; the update reports it
+    for key, (course_id, day, time, room) in pairs:
+        # JSON may carry "3" for 3; compare IDs as the integers stored
+        try:
+            course_id = int(course_id)
+        except (TypeError, ValueError):
+            rejected[key] = f"Invalid course ID: {course_id!r}."
+            continue
+        try:
+            intervals = schedule_intervals(day, time)
+        except ValueError as e:
+            rejected[key] = str(e)
+            continue
+        parsed.append((key, course_id, day, time, room, intervals))
+
+    courses = course_schedule_db_read_course_keys(
+        {course_id for _, course_id, *_ in parsed}
+    )
+    slots = []
+    for key, course_id, day, time, room, intervals in parsed:
+        if course_id not in courses:
+            continue  # Unknown or archived course; the write reports it
+        slot = {
+            "id": replaced_ids.get(key),
+            "course_id": course_id,
+            "day": day,
+            "time": time,
+            "room": room,
+            **courses[course_id],
+        }
+        slots.append((key, slot, intervals))
+
+    if not slots:
+        return rejected
+
+    stored = course_schedule_db_read_slots(
+        {slot["term_id"] for _, slot, _ in slots},
+        rooms={normalize_room(slot["room"]) for _, slot, _ in slots},
+        instructor_ids={
+            iid for _, slot, _ in slots for iid in slot["instructor_ids"] or []
+        },
+    )
+    skipped_ids = set(replaced_ids.values())
+    index = build_conflict_index(
+        slot for slot in stored if slot["id"] not in skipped_ids
+    )
+    for key, slot, intervals in slots:
+        clashes = index.conflicts(slot, intervals)
+        if clashes:
+            rejected[key] = describe_conflict(*clashes[0])
+            continue
+        index.add(slot, intervals)
+    return rejected
+
+
+def get_course_schedule_conflicts(term_id=None):
+    """Every room and instructor double booking among active sessions."""
+    slots = course_schedule_db_read_slots([term_id] if term_id else None)
+    conflicts, unparsed_ids = find_schedule_conflicts(slots)
+    return {"conflicts": conflicts, "unparsed_ids": unparsed_ids}
+
+
 def create_new_course_schedules(data):
     return bulk_create_entities(
         data,
         insert_func=course_schedule_db_insert,
+        insert_many_func=course_schedule_db_insert_many,
         to_row_func=course_schedule_dict_to_row,
         to_dict_func=course_schedule_row_to_dict,
         read_by_ids_func=course_schedule_db_read_by_ids,
+        validate_func=check_course_schedule_conflicts,
         no_success_msg="No course schedules were created.",
         success_status_code=201,
         failure_status_code=400,
@@ -47,10 +157,14 @@ def update_course_schedules(data):
     return bulk_update_entities(
         data,
         update_func=course_schedule_db_update,
+        update_many_func=course_schedule_db_update_many,
         get_existing_func=course_schedule_db_read_by_id,
         to_row_func=course_schedule_dict_to_row,
         to_dict_func=course_schedule_row_to_dict,
         read_by_ids_func=course_schedule_db_read_by_ids,
+        validate_func=lambda pairs: check_course_schedule_conflicts(
+            pairs, updating=True
+        ),
         no_success_msg="No course schedules were updated.",
         missing_id_msg="Missing course schedule ID for update.",
         not_found_msg="Course schedule ID {id} not found.",
@@ -64,6 +178,7 @@ def archive_course_schedules(ids):
     return bulk_archive_entities(
         ids,
         archive_func=course_schedule_db_archive,
+        archive_many_func=course_schedule_db_archive_many,
         get_existing_func=course_schedule_db_read_by_id,
         to_dict_func=course_schedule_row_to_dict,
         read_by_ids_func=course_schedule_db_read_by_ids,
@@ -1,10 +1,14 @@
 from app.models import (
     department_db_read_all,
+    department_db_read_version,
     department_db_read_by_id,
     department_db_read_by_ids,
     department_db_insert,
+    department_db_insert_many,
     department_db_update,
+    department_db_update_many,
     department_db_archive,
+    department_db_archive_many,
 )
 from app.utils import (
     department_dict_to_row,
@@ -18,13 +22,26 @@ def department_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
-def get_all_departments(active_only):
-    results = department_db_read_all(active_only=active_only)
+def get_all_departments(
+    active_only, limit=None, after_id=None, stream=False, filters=None, fields=None
+):
+    results = department_db_read_all(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        stream=stream,
+        filters=filters,
+        fields=fields,
+    )
     if results is None:
         raise RuntimeError("Failed to fetch departments.")
     return results
 
 
+def get_departments_version(active_only):
+    return department_db_read_version(active_only=active_only)
+
+
 def get_department_by_id(department_id: int):
     department = department_db_read_by_id(department_id)
     return department
@@ -34,6 +51,7 @@ def create_new_departments(data):
     return bulk_create_entities(
         data,
         insert_func=department_db_insert,
+        insert_many_func=department_db_insert_many,
         to_row_func=department_dict_to_row,
         to_dict_func=department_row_to_dict,
         read_by_ids_func=department_db_read_by_ids,
@@ -47,6 +65,7 @@ def update_departments(data):
     return bulk_update_entities(
         data,
         update_func=department_db_update,
+        update_many_func=department_db_update_many,
         get_existing_func=department_db_read_by_id,
         to_row_func=department_dict_to_row,
         to_dict_func=department_row_to_dict,
@@ -64,6 +83,7 @@ def archive_departments(ids):
     return bulk_archive_entities(
         ids,
         archive_func=department_db_archive,
+        archive_many_func=department_db_archive_many,
         get_existing_func=department_db_read_by_id,
         to_dict_func=department_row_to_dict,
         read_by_ids_func=department_db_read_by_ids,
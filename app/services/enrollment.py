@@ -1,16 +1,24 @@
 from app.models import (
     enrollment_db_read_all,
+    enrollment_db_read_version,
     enrollment_db_read_by_id,
     enrollment_db_read_by_ids,
     enrollment_db_insert,
+    enrollment_db_insert_many,
     enrollment_db_update,
+    enrollment_db_update_many,
     enrollment_db_archive,
+    enrollment_db_archive_many,
+    enrollment_db_read_student_sessions,
+    course_schedule_db_read_sessions,
 )
 from app.utils import (
     enrollment_dict_to_row,
     bulk_create_entities,
     bulk_update_entities,
     bulk_archive_entities,
+    Timetables,
+    group_course_sessions,
 )
 
 
@@ -18,39 +26,127 @@ def enrollment_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
-def get_all_enrollments(active_only):
-    results = enrollment_db_read_all(active_only=active_only)
+def get_all_enrollments(
+    active_only, limit=None, after_id=None, stream=False, filters=None, fields=None
+):
+    results = enrollment_db_read_all(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        stream=stream,
+        filters=filters,
+        fields=fields,
+    )
     if results is None:
         raise RuntimeError("Failed to fetch enrollments.")
     return results
 
 
+def get_enrollments_version(active_only):
+    return enrollment_db_read_version(active_only=active_only)
+
+
 def get_enrollment_by_id(enrollment_id: int):
     enrollment = enrollment_db_read_by_id(enrollment_id)
     return enrollment
 
 
-def create_new_enrollments(data):
+def check_enrollment_clashes(pairs, updating=False):
+    """
+    Reject enrollments whose course meets while another of the student's
+    courses in the same term does.
+
+    pairs are (key, (student_id, course_id, grade)) as given to the bulk
+    helpers' validate_func; key is the enrollment ID when updating. The
+    sessions of all requested courses and the timetables of all requested
+    students are read in two queries however many rows there are, then each
+    enrollment is checked against its student's sorted intervals and added
+    so rows in the same request are checked against each other too.
+    Returns {key: error message}.
+    """
+    rejected = {}
+    checked = []
+    for key, row in pairs:
+        # JSON may carry "3" for 3; compare IDs as the integers stored
+        ids = []
+        for name, value in (("student", row[0]), ("course", row[1])):
+            try:
+                ids.append(int(value))
+            except (TypeError, ValueError):
+                rejected[key] = f"Invalid {name} ID: {value!r}."
+                break
+        else:
+            checked.append((key, *ids))
+
+    course_sessions = group_course_sessions(
+        course_schedule_db_read_sessions({row[2] for row in checked})
+    )
+    # Enrollments being updated are checked with their new values only;
+    # keys are compared as the integer IDs stored, like the rows' IDs above
+    replaced_ids = set()
+    for key, _ in pairs if updating else []:
+        try:
+            replaced_ids.add(int(key))
+        except (TypeError, ValueError):
+            pass  # Matches no stored enrollment; the update reports it
+    # Courses without (parsable) sessions cannot clash with anything
+    checked = [row for row in checked if course_sessions.get(row[2])]
+    if not checked:
+        return rejected
+
+    timetables = Timetables()
+    timetables.add_sessions(
+        session
+        for session in enrollment_db_read_student_sessions({row[1] for row in checked})
+        if session["enrollment_id"] not in replaced_ids
+    )
+
+    for key, student_id, course_id in checked:
+        clash = timetables.clash(student_id, course_sessions[course_id])
+        if clash == course_id:
+            rejected[key] = (
+                f"Student {student_id} is already enrolled in course {course_id}."
+            )
+        elif clash is not None:
+            rejected[key] = (
+                f"Course {course_id} clashes with course {clash} "
+                f"in student {student_id}'s timetable."
+            )
+        else:
+            timetables.add(student_id, course_id, course_sessions[course_id])
+    return rejected
+
+
+def create_new_enrollments(data, check_clashes=True):
     return bulk_create_entities(
         data,
         insert_func=enrollment_db_insert,
+        insert_many_func=enrollment_db_insert_many,
         to_row_func=enrollment_dict_to_row,
         to_dict_func=enrollment_row_to_dict,
         read_by_ids_func=enrollment_db_read_by_ids,
+        validate_func=check_enrollment_clashes if check_clashes else None,
+        partial_errors=True,
         no_success_msg="No enrollments were created.",
         success_status_code=201,
         failure_status_code=400,
     )
 
 
-def update_enrollments(data):
+def update_enrollments(data, check_clashes=True):
     return bulk_update_entities(
         data,
         update_func=enrollment_db_update,
+        update_many_func=enrollment_db_update_many,
         get_existing_func=enrollment_db_read_by_id,
         to_row_func=enrollment_dict_to_row,
         to_dict_func=enrollment_row_to_dict,
         read_by_ids_func=enrollment_db_read_by_ids,
+        validate_func=(
+            (lambda pairs: check_enrollment_clashes(pairs, updating=True))
+            if check_clashes
+            else None
+        ),
         no_success_msg="No enrollments were updated.",
         missing_id_msg="Missing enrollment ID for update.",
         not_found_msg="Enrollment ID {id} not found.",
@@ -64,6 +160,7 @@ def archive_enrollments(ids):
     return bulk_archive_entities(
         ids,
         archive_func=enrollment_db_archive,
+        archive_many_func=enrollment_db_archive_many,
         get_existing_func=enrollment_db_read_by_id,
         to_dict_func=enrollment_row_to_dict,
         read_by_ids_func=enrollment_db_read_by_ids,
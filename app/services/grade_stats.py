@@ -0,0 +1,34 @@
+from app.models import (
+    student_db_read_by_id,
+    course_db_read_by_id,
+    student_grade_stats_db_read,
+    course_grade_stats_db_read,
+)
+
+
+def grade_stats_row_to_dict(row, key_column, key):
+    """Stored statistics as a response dict; missing rows mean no graded enrollments."""
+    row = row or {key_column: key, "gpa": None, "graded_count": 0, "distribution": {}}
+    gpa = row["gpa"]
+    return {
+        key_column: row[key_column],
+        "gpa": float(gpa) if gpa is not None else None,
+        "graded_count": row["graded_count"],
+        "distribution": row["distribution"],
+    }
+
+
+def get_student_gpa(student_id: int):
+    """GPA and grade distribution of a student, or None if the student does not exist."""
+    if student_db_read_by_id(student_id) is None:
+        return None
+    row = student_grade_stats_db_read(student_id)
+    return grade_stats_row_to_dict(row, "student_id", student_id)
+
+
+def get_course_grade_stats(course_id: int):
+    """Average grade points and grade distribution of a course, or None if it does not exist."""
+    if course_db_read_by_id(course_id) is None:
+        return None
+    row = course_grade_stats_db_read(course_id)
+    return grade_stats_row_to_dict(row, "course_id", course_id)
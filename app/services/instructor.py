@@ -1,10 +1,14 @@
 from app.models import (
     instructor_db_read_all,
+    instructor_db_read_version,
     instructor_db_read_by_id,
     instructor_db_read_by_ids,
     instructor_db_insert,
+    instructor_db_insert_many,
     instructor_db_update,
+    instructor_db_update_many,
     instructor_db_archive,
+    instructor_db_archive_many,
 )
 from app.utils import (
     instructor_dict_to_row,
@@ -18,13 +22,26 @@ def instructor_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
-def get_all_instructors(active_only):
-    results = instructor_db_read_all(active_only=active_only)
+def get_all_instructors(
+    active_only, limit=None, after_id=None, stream=False, filters=None, fields=None
+):
+    results = instructor_db_read_all(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        stream=stream,
+        filters=filters,
+        fields=fields,
+    )
     if results is None:
         raise RuntimeError("Failed to fetch instructors.")
     return results
 
 
+def get_instructors_version(active_only):
+    return instructor_db_read_version(active_only=active_only)
+
+
 def get_instructor_by_id(instructor_id: int):
     instructor = instructor_db_read_by_id(instructor_id)
     return instructor
@@ -34,6 +51,7 @@ def create_new_instructors(data):
     return bulk_create_entities(
         data,
         insert_func=instructor_db_insert,
+        insert_many_func=instructor_db_insert_many,
         to_row_func=instructor_dict_to_row,
         to_dict_func=instructor_row_to_dict,
         read_by_ids_func=instructor_db_read_by_ids,
@@ -47,6 +65,7 @@ def update_instructors(data):
     return bulk_update_entities(
         data,
         update_func=instructor_db_update,
+        update_many_func=instructor_db_update_many,
         get_existing_func=instructor_db_read_by_id,
         to_row_func=instructor_dict_to_row,
         to_dict_func=instructor_row_to_dict,
@@ -64,6 +83,7 @@ def archive_instructors(ids):
     return bulk_archive_entities(
         ids,
         archive_func=instructor_db_archive,
+        archive_many_func=instructor_db_archive_many,
         get_existing_func=instructor_db_read_by_id,
         to_dict_func=instructor_row_to_dict,
         read_by_ids_func=instructor_db_read_by_ids,
@@ -1,10 +1,14 @@
 from app.models import (
     program_db_read_all,
+    program_db_read_version,
     program_db_read_by_id,
     program_db_read_by_ids,
     program_db_insert,
+    program_db_insert_many,
     program_db_update,
+    program_db_update_many,
     program_db_archive,
+    program_db_archive_many,
 )
 from app.utils import (
     program_dict_to_row,
@@ -18,13 +22,26 @@ def program_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
-def get_all_programs(active_only):
-    results = program_db_read_all(active_only=active_only)
+def get_all_programs(
+    active_only, limit=None, after_id=None, stream=False, filters=None, fields=None
+):
+    results = program_db_read_all(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        stream=stream,
+        filters=filters,
+        fields=fields,
+    )
     if results is None:
         raise RuntimeError("Failed to fetch programs.")
     return results
 
 
+def get_programs_version(active_only):
+    return program_db_read_version(active_only=active_only)
+
+
 def get_program_by_id(program_id: int):
     program = program_db_read_by_id(program_id)
     return program
@@ -34,6 +51,7 @@ def create_new_programs(data):
     return bulk_create_entities(
         data,
         insert_func=program_db_insert,
+        insert_many_func=program_db_insert_many,
         to_row_func=program_dict_to_row,
         to_dict_func=program_row_to_dict,
         read_by_ids_func=program_db_read_by_ids,
@@ -47,6 +65,7 @@ def update_programs(data):
     return bulk_update_entities(
         data,
         update_func=program_db_update,
+        update_many_func=program_db_update_many,
         get_existing_func=program_db_read_by_id,
         to_row_func=program_dict_to_row,
         to_dict_func=program_row_to_dict,
@@ -64,6 +83,7 @@ def archive_programs(ids):
     return bulk_archive_entities(
         ids,
         archive_func=program_db_archive,
+        archive_many_func=program_db_archive_many,
         get_existing_func=program_db_read_by_id,
         to_dict_func=program_row_to_dict,
         read_by_ids_func=program_db_read_by_ids,
@@ -0,0 +1,96 @@
+from app.models import (
+    instructor_db_read_by_id,
+    department_db_read_by_id,
+    report_db_read_room_sessions,
+    report_db_read_teaching_load,
+    report_db_read_department_summary,
+)
+from app.utils import room_utilization, scheduled_hours
+
+
+def get_room_utilization(term_id=None):
+    """Occupied hours per room and weekday, for one term or all of them."""
+    rooms, unparsed_ids = room_utilization(report_db_read_room_sessions(term_id))
+    return {"term_id": term_id, "rooms": rooms, "unparsed_ids": unparsed_ids}
+
+
+def teaching_load_course(row):
+    return {
+        "course_id": row["course_id"],
+        "code": row["code"],
+        "title": row["title"],
+        "term_id": row["term_id"],
+        "scheduled_hours": scheduled_hours(row["sessions"]),
+        "enrolled": row["enrolled"],
+    }
+
+
+def teaching_load_totals(courses):
+    return {
+        "course_count": len(courses),
+        "scheduled_hours": round(sum(c["scheduled_hours"] for c in courses), 2),
+        "enrolled_total": sum(c["enrolled"] for c in courses),
+    }
+
+
+def get_instructor_load(instructor_id: int, term_id=None):
+    """Courses, weekly hours and enrolled students of an instructor, or None if missing."""
+    if instructor_db_read_by_id(instructor_id) is None:
+        return None
+    rows = report_db_read_teaching_load(instructor_id=instructor_id, term_id=term_id)
+    courses = [teaching_load_course(row) for row in rows]
+    return {
+        "instructor_id": instructor_id,
+        "term_id": term_id,
+        **teaching_load_totals(courses),
+        "courses": courses,
+    }
+
+
+def get_department_teaching_load(department_id: int, term_id=None):
+    """
+    Teaching load of every instructor in a department, or None if the
+    department does not exist. Department totals count a co-taught course once.
+    """
+    if department_db_read_by_id(department_id) is None:
+        return None
+    rows = report_db_read_teaching_load(department_id=department_id, term_id=term_id)
+    instructors = {}
+    courses = {}
+    for row in rows:
+        course = teaching_load_course(row)
+        courses[course["course_id"]] = course
+        instructor = instructors.setdefault(
+            row["instructor_id"],
+            {
+                "instructor_id": row["instructor_id"],
+                "first_name": row["first_name"],
+                "last_name": row["last_name"],
+                "courses": [],
+            },
+        )
+        instructor["courses"].append(course)
+    return {
+        "department_id": department_id,
+        "term_id": term_id,
+        "instructor_count": len(instructors),
+        **teaching_load_totals(list(courses.values())),
+        "instructors": [
+            {
+                **{k: v for k, v in instructor.items() if k != "courses"},
+                **teaching_load_totals(instructor["courses"]),
+            }
+            for instructor in instructors.values()
+        ],
+    }
+
+
+def get_department_summaries():
+    """Program, instructor, course and active student counts per department."""
+    return report_db_read_department_summary()
+
+
+def get_department_summary(department_id: int):
+    """The same counts for one department, or None if it does not exist."""
+    rows = report_db_read_department_summary(department_id=department_id)
+    return rows[0] if rows else None
@@ -0,0 +1,26 @@
+from app.models import search_db_people
+from app.models.search import SEARCH_TABLES
+
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+SEARCH_MAX_LENGTH = 100
+
+
+def search_people(term, limit=None, types=None):
+    """
+    Ranked typeahead search over student and instructor names and emails.
+    types narrows the search to some of SEARCH_TABLES.
+    """
+    term = (term or "").strip()
+    if not term:
+        raise ValueError("q is required.")
+    if len(term) > SEARCH_MAX_LENGTH:
+        raise ValueError(f"q must be at most {SEARCH_MAX_LENGTH} characters.")
+    unknown = [t for t in types or [] if t not in SEARCH_TABLES]
+    if unknown:
+        raise ValueError(f"type must be one of: {', '.join(SEARCH_TABLES)}.")
+    limit = min(limit or SEARCH_DEFAULT_LIMIT, SEARCH_MAX_LIMIT)
+    rows = search_db_people(term, limit, tables=types or None)
+    for row in rows:
+        row["rank"] = round(float(row["rank"]), 4)
+    return rows
@@ -1,39 +1,109 @@
 from app.models import (
     student_db_read_all,
+    student_db_read_version,
     student_db_read_by_id,
     student_db_read_by_ids,
+    student_db_read_transcript,
     student_db_insert,
+    student_db_insert_many,
+    student_db_import,
     student_db_update,
+    student_db_update_many,
     student_db_archive,
+    student_db_archive_many,
 )
 from app.utils import (
     student_dict_to_row,
     bulk_create_entities,
     bulk_update_entities,
     bulk_archive_entities,
+    import_csv_entities,
 )
+from app.models.student import STUDENT_COLUMNS
 
 
 def student_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
-def get_all_students(active_only):
-    results = student_db_read_all(active_only=active_only)
+def get_all_students(
+    active_only, limit=None, after_id=None, stream=False, filters=None, fields=None
+):
+    results = student_db_read_all(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        stream=stream,
+        filters=filters,
+        fields=fields,
+    )
     if results is None:
         raise RuntimeError("Failed to fetch students.")
     return results
 
 
+def get_students_version(active_only):
+    return student_db_read_version(active_only=active_only)
+
+
 def get_student_by_id(student_id: int):
     student = student_db_read_by_id(student_id)
     return student
 
 
+def get_student_transcript(student_id: int):
+    """
+    Build a student's transcript from one joined query, with enrollments
+    grouped by term in term order. Returns None if the student does not exist.
+    """
+    rows = student_db_read_transcript(student_id)
+    if not rows:
+        return None
+
+    first = rows[0]
+    terms = {}
+    for row in rows:
+        if row["enrollment_id"] is None:
+            continue
+        term = terms.setdefault(
+            row["term_id"],
+            {
+                "term_id": row["term_id"],
+                "name": row["term_name"],
+                "start_date": row["start_date"],
+                "end_date": row["end_date"],
+                "courses": [],
+            },
+        )
+        term["courses"].append(
+            {
+                "enrollment_id": row["enrollment_id"],
+                "course_id": row["course_id"],
+                "code": row["course_code"],
+                "title": row["course_title"],
+                "department_id": row["department_id"],
+                "department_name": row["department_name"],
+                "grade": row["grade"],
+            }
+        )
+
+    return {
+        "student": {
+            "id": first["student_id"],
+            "first_name": first["first_name"],
+            "last_name": first["last_name"],
+            "email": first["email"],
+            "program_id": first["program_id"],
+        },
+        "terms": list(terms.values()),
+    }
+
+
 def create_new_students(data):
     return bulk_create_entities(
         data,
         insert_func=student_db_insert,
+        insert_many_func=student_db_insert_many,
         to_row_func=student_dict_to_row,
         to_dict_func=student_row_to_dict,
         read_by_ids_func=student_db_read_by_ids,
@@ -43,10 +113,24 @@ def create_new_students(data):
     )
 
 
+def import_students(lines):
+    """Create students from a CSV file with a header row; see import_csv_entities."""
+    return import_csv_entities(
+        lines,
+        import_func=student_db_import,
+        to_row_func=student_dict_to_row,
+        columns=STUDENT_COLUMNS,
+        required=("first_name", "last_name", "email"),
+        types={"coop": bool, "is_international": bool, "program_id": int},
+        no_success_msg="No students were imported.",
+    )
+
+
 def update_students(data):
     return bulk_update_entities(
         data,
         update_func=student_db_update,
+        update_many_func=student_db_update_many,
         get_existing_func=student_db_read_by_id,
         to_row_func=student_dict_to_row,
         to_dict_func=student_row_to_dict,
@@ -64,6 +148,7 @@ def archive_students(ids):
     return bulk_archive_entities(
         ids,
         archive_func=student_db_archive,
+        archive_many_func=student_db_archive_many,
         get_existing_func=student_db_read_by_id,
         to_dict_func=student_row_to_dict,
         read_by_ids_func=student_db_read_by_ids,
@@ -1,10 +1,14 @@
 from app.models import (
     term_db_read_all,
+    term_db_read_version,
     term_db_read_by_id,
     term_db_read_by_ids,
     term_db_insert,
+    term_db_insert_many,
     term_db_update,
+    term_db_update_many,
     term_db_archive,
+    term_db_archive_many,
 )
 from app.utils import (
     term_dict_to_row,
@@ -18,13 +22,26 @@ def term_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
-def get_all_terms(active_only):
-    results = term_db_read_all(active_only=active_only)
+def get_all_terms(
+    active_only, limit=None, after_id=None, stream=False, filters=None, fields=None
+):
+    results = term_db_read_all(
+        active_only=active_only,
+        limit=limit,
+        after_id=after_id,
+        stream=stream,
+        filters=filters,
+        fields=fields,
+    )
     if results is None:
         raise RuntimeError("Failed to fetch terms.")
     return results
 
 
+def get_terms_version(active_only):
+    return term_db_read_version(active_only=active_only)
+
+
 def get_term_by_id(term_id: int):
     term = term_db_read_by_id(term_id)
     return term
@@ -34,6 +51,7 @@ def create_new_terms(data):
     return bulk_create_entities(
         data,
         insert_func=term_db_insert,
+        insert_many_func=term_db_insert_many,
         to_row_func=term_dict_to_row,
         to_dict_func=term_row_to_dict,
         read_by_ids_func=term_db_read_by_ids,
@@ -47,6 +65,7 @@ def update_terms(data):
     return bulk_update_entities(
         data,
         update_func=term_db_update,
+        update_many_func=term_db_update_many,
         get_existing_func=term_db_read_by_id,
         to_row_func=term_dict_to_row,
         to_dict_func=term_row_to_dict,
@@ -64,6 +83,7 @@ def archive_terms(ids):
     return bulk_archive_entities(
         ids,
         archive_func=term_db_archive,
+        archive_many_func=term_db_archive_many,
         get_existing_func=term_db_read_by_id,
         to_dict_func=term_row_to_dict,
         read_by_ids_func=term_db_read_by_ids,
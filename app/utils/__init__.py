@@ -16,6 +16,17 @@ from .routes_helpers import (
     api_response_error,
     build_bulk_response,
     from_bulk_result,
+    get_pagination_args,
+    get_filter_args,
+    get_id_arg,
+    get_next_cursor,
+    get_stream_format,
+    ndjson_response,
+    wants_list_validators,
+    list_validators,
+    row_validators,
+    check_not_modified,
+    with_validators,
 )
 
 from .handle_exceptions import (
@@ -27,4 +38,21 @@ from .service_helper import (
     bulk_create_entities,
     bulk_update_entities,
     bulk_archive_entities,
+    import_csv_entities,
 )
+
+from .scheduling import (
+    schedule_intervals,
+    parsed_intervals,
+    IntervalIndex,
+    Timetables,
+    group_course_sessions,
+    build_conflict_index,
+    describe_conflict,
+    find_schedule_conflicts,
+    normalize_room,
+    room_utilization,
+    scheduled_hours,
+)
+
+from .metrics import RequestMetrics
@@ -46,6 +46,7 @@ def course_dict_to_row(data):
         data.get("code", None),
         data.get("term_id"),
         data.get("department_id"),
+        data.get("capacity"),
     )
 
 
@@ -9,6 +9,9 @@ def handle_exceptions_read(default_status_code=500):
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
+            except ValueError as e:
+                logging.warning(f"Invalid query parameter: {str(e)}")
+                return api_response_error(f"Invalid query parameter: {str(e)}.", 400)
             except Exception as e:
                 logging.exception("Unexpected error in read operation.")
                 return api_response_error(
@@ -0,0 +1,204 @@
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Tuple
+
+from flask import Response, g, request
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _slow_request_statements():
+    """Requests issuing more statements than this are logged, to spot N+1 loops."""
+    return int(os.getenv("SLOW_REQUEST_STATEMENTS", "100"))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Iterable[Tuple[str, str]] = ()) -> str:
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Cumulative-bucket histogram per label set, in Prometheus' shape."""
+
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self._series: Dict[Labels, List] = {}  # labels -> [bucket counts, sum, count]
+
+    def observe(self, labels: Labels, value: float) -> None:
+        series = self._series.setdefault(labels, [[0] * len(self.buckets), 0.0, 0])
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            series[0][index] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = _format_labels(labels, [("le", _format_value(float(bound)))])
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            inf = _format_labels(labels, [("le", "+Inf")])
+            lines.append(f"{self.name}_bucket{inf} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {repr(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._series: Dict[Labels, float] = {}
+
+    def inc(self, labels: Labels, value: float = 1) -> None:
+        self._series[labels] = self._series.get(labels, 0) + value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._series.items()):
+            lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class RequestMetrics:
+    """
+    Per-request latency and SQL instrumentation.
+
+    Every request is timed and labelled by blueprint and endpoint (never by
+    raw path, which would create a series per ID). Database records the
+    number and duration of the statements each request runs; both are added
+    to the response as a Server-Timing header and aggregated for /metrics in
+    Prometheus text format. The statements-per-request histogram is what
+    shows N+1 loops: an endpoint whose statement count grows with the
+    payload lands in the high buckets.
+    """
+
+    _lock = threading.Lock()
+    request_duration = Histogram(
+        "http_request_duration_seconds",
+        "Time spent handling requests, by endpoint.",
+        LATENCY_BUCKETS,
+    )
+    requests_total = Counter(
+        "http_requests_total", "Requests handled, by endpoint and status."
+    )
+    request_statements = Histogram(
+        "db_statements_per_request",
+        "SQL statements run per request, by endpoint.",
+        STATEMENT_BUCKETS,
+    )
+    db_seconds_total = Counter(
+        "db_duration_seconds_total", "Time spent in the database, by endpoint."
+    )
+
+    @classmethod
+    def init_app(cls, app):
+        """
+        Time every request. Register before Database.init_app so the
+        after_request hook runs after the transaction commits and its time
+        is included.
+        """
+        app.before_request(cls._start_request)
+        app.after_request(cls._finish_request)
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            for metric in cls._metrics():
+                metric._series.clear()
+
+    @classmethod
+    def _metrics(cls):
+        return (
+            cls.request_duration,
+            cls.requests_total,
+            cls.request_statements,
+            cls.db_seconds_total,
+        )
+
+    @staticmethod
+    def _start_request():
+        g.request_started = time.perf_counter()
+
+    @classmethod
+    def _finish_request(cls, response):
+        started = g.get("request_started")
+        if started is None:
+            return response
+        elapsed = time.perf_counter() - started
+        statements = g.get("db_statements", 0)
+        db_seconds = g.get("db_seconds", 0.0)
+
+        response.headers["Server-Timing"] = (
+            f"app;dur={elapsed * 1000:.2f}, "
+            f'db;desc="{statements} statements";dur={db_seconds * 1000:.2f}'
+        )
+
+        endpoint = request.endpoint or "unmatched"
+        labels = (
+            ("blueprint", request.blueprint or ""),
+            ("endpoint", endpoint),
+            ("method", request.method),
+        )
+        with cls._lock:
+            cls.request_duration.observe(labels, elapsed)
+            cls.requests_total.inc(labels + (("status", str(response.status_code)),))
+            cls.request_statements.observe(labels, statements)
+            cls.db_seconds_total.inc(labels, db_seconds)
+
+        if statements > _slow_request_statements():
+            logger.warning(
+                f"{request.method} {request.path} ran {statements} SQL statements "
+                f"({db_seconds * 1000:.1f} ms in the database)"
+            )
+        return response
+
+    @classmethod
+    def render(
+        cls, extra: Dict[str, Tuple[str, str, Dict[Labels, float]]] = None
+    ) -> str:
+        """
+        All metrics in Prometheus text format. extra adds metrics kept
+        elsewhere, such as pool and cache counters, as
+        {name: (type, help, {labels: value})}.
+        """
+        with cls._lock:
+            lines = [line for metric in cls._metrics() for line in metric.render()]
+        for name, (metric_type, help_text, series) in sorted((extra or {}).items()):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+            for labels, value in sorted(series.items()):
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def response(cls, extra=None) -> Response:
+        return Response(cls.render(extra), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,5 +1,35 @@
-from typing import Callable, Any, Dict, List, Union, Tuple, Optional, Sequence
-from flask import jsonify, Response
+import base64
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import (
+    Callable,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Union,
+    Tuple,
+    Optional,
+    Sequence,
+    Mapping,
+)
+from flask import jsonify, request, Response, current_app, stream_with_context
+
+# (ETag, Last-Modified) pair used for conditional GETs
+Validators = Tuple[str, Optional[datetime]]
+
+# Upper bound for ?limit= on list endpoints
+MAX_PAGE_LIMIT = 1000
+
+# Supported values for ?stream= on list endpoints
+STREAM_FORMATS = ("ndjson",)
+
+# Query parameters list endpoints handle themselves; anything else is a filter
+LIST_PARAMS = ("active_only", "limit", "cursor", "after_id", "stream", "fields")
+# Parameters starting with this are never filters (no column does), so client
+# cache-busters such as jQuery's ?_=<timestamp> are ignored
+RESERVED_PARAM_PREFIX = "_"
 
 
 def normalize_to_list(data):
@@ -76,13 +106,212 @@ def handle_bulk_process(
     return success_results, None, None
 
 
+def encode_cursor(last_id: int) -> str:
+    """Encode the last seen ID into an opaque pagination cursor."""
+    raw = json.dumps({"after_id": last_id}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode an opaque pagination cursor back into the last seen ID."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        after_id = json.loads(base64.urlsafe_b64decode(padded))["after_id"]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(after_id, int):
+        raise ValueError("Invalid cursor")
+    return after_id
+
+
+def get_pagination_args(
+    args: Mapping[str, str],
+) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Read keyset pagination parameters from the query string.
+
+    Accepts ?limit= together with either the opaque ?cursor= returned as
+    next_cursor, or a raw ?after_id=. Returns (limit, after_id), with None
+    for anything not supplied.
+    """
+    limit = args.get("limit")
+    if limit is not None:
+        if not limit.isdigit() or int(limit) < 1:
+            raise ValueError("limit must be a positive integer")
+        limit = min(int(limit), MAX_PAGE_LIMIT)
+
+    after_id = None
+    if args.get("cursor"):
+        after_id = decode_cursor(args["cursor"])
+    elif args.get("after_id") is not None:
+        if not args["after_id"].isdigit():
+            raise ValueError("after_id must be a non-negative integer")
+        after_id = int(args["after_id"])
+
+    return limit, after_id
+
+
+def get_id_arg(args: Mapping[str, str], name: str) -> Optional[int]:
+    """Read an optional ID query parameter such as ?term_id=, or None if absent."""
+    value = args.get(name)
+    if value is None:
+        return None
+    if not value.isdigit():
+        raise ValueError(f"{name} must be a positive integer")
+    return int(value)
+
+
+def get_filter_args(
+    args: Mapping[str, str],
+) -> Tuple[Dict[str, str], Optional[List[str]]]:
+    """
+    Split list query parameters into column filters and a sparse fieldset.
+
+    Returns ({column: raw value}, [field, ...] or None). Values are validated
+    against each model's whitelist when the query is built, so an unknown
+    parameter is rejected unless it starts with RESERVED_PARAM_PREFIX.
+    """
+    filters = {
+        key: value
+        for key, value in args.items()
+        if key not in LIST_PARAMS and not key.startswith(RESERVED_PARAM_PREFIX)
+    }
+    fields = None
+    if args.get("fields"):
+        fields = [field.strip() for field in args["fields"].split(",") if field.strip()]
+    return filters, fields
+
+
+def get_next_cursor(
+    rows: List[Dict[str, Any]], limit: Optional[int], key: str = "id"
+) -> Optional[str]:
+    """
+    Return the cursor for the next page, or None when this is the last page.
+    key names the column the rows are paged on.
+    """
+    if not limit or len(rows) < limit:
+        return None
+    return encode_cursor(rows[-1][key])
+
+
+def get_stream_format(args: Mapping[str, str]) -> Optional[str]:
+    """Return the requested ?stream= export format, or None for a regular response."""
+    stream = args.get("stream")
+    if not stream:
+        return None
+    stream = stream.lower()
+    if stream not in STREAM_FORMATS:
+        raise ValueError(f"stream must be one of: {', '.join(STREAM_FORMATS)}")
+    return stream
+
+
+def ndjson_response(rows: Iterable[Dict[str, Any]]) -> Response:
+    """
+    Stream rows as newline-delimited JSON, one object per line.
+    Rows are serialized as they are produced, so a generator backed by a
+    server-side cursor is never materialized in memory.
+    """
+
+    def generate():
+        for row in rows:
+            yield current_app.json.dumps(row) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+def _to_http_date(value: Any) -> Optional[datetime]:
+    """Timestamp columns are stored without a zone; treat them as UTC, whole seconds."""
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.replace(microsecond=0)
+
+
+def _make_etag(*parts: Any) -> str:
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def wants_list_validators(after_id: Optional[int], filters: Mapping[str, str]) -> bool:
+    """
+    Whether a list request gets conditional GET validators. The version
+    behind them counts every row of the table, a scan that grows with it,
+    so only the first page of an unfiltered list pays for it; later keyset
+    pages and filtered lists are cheap indexed reads and skip it.
+    """
+    return after_id is None and not filters
+
+
+def list_validators(
+    version: Optional[Mapping[str, Any]], args: Mapping[str, str]
+) -> Optional[Validators]:
+    """
+    Validators for a list response, built from the table's max(updated_at)
+    and row count plus the query string, so each limit or fieldset gets its
+    own ETag. Returns None when the version is unknown.
+    """
+    if not version:
+        return None
+    last_modified = version.get("last_modified")
+    etag = _make_etag(last_modified, version.get("row_count"), sorted(args.items()))
+    return etag, _to_http_date(last_modified)
+
+
+def row_validators(row: Mapping[str, Any]) -> Optional[Validators]:
+    """Validators for a single record, built from its own updated_at."""
+    updated_at = row.get("updated_at")
+    if updated_at is None:
+        return None
+    return _make_etag(row.get("id"), updated_at), _to_http_date(updated_at)
+
+
+def check_not_modified(validators: Optional[Validators]) -> Optional[Response]:
+    """
+    Return a bodyless 304 when the request's If-None-Match or
+    If-Modified-Since shows the client already has this version.
+    If-None-Match wins when both are sent.
+    """
+    if validators is None:
+        return None
+    etag, last_modified = validators
+    if request.if_none_match:
+        fresh = request.if_none_match.contains_weak(etag)
+    elif request.if_modified_since and last_modified:
+        fresh = last_modified <= request.if_modified_since
+    else:
+        fresh = False
+    if not fresh:
+        return None
+    return with_validators(Response(status=304), validators)
+
+
+def with_validators(
+    response: Union[Response, Tuple[Response, int]],
+    validators: Optional[Validators],
+) -> Union[Response, Tuple[Response, int]]:
+    """Attach ETag and Last-Modified, and ask clients to revalidate before reuse."""
+    if validators is None:
+        return response
+    resp = response[0] if isinstance(response, tuple) else response
+    etag, last_modified = validators
+    resp.set_etag(etag, weak=True)
+    if last_modified:
+        resp.last_modified = last_modified
+    resp.headers["Cache-Control"] = "no-cache"
+    return response
+
+
 def api_response(
     data: Any,
     message: str = "Success",
     status_code: int = 200,
+    next_cursor: Optional[str] = None,
 ) -> Tuple[Response, int]:
     """Generic success response."""
-    return jsonify({"message": message, "data": data}), status_code
+    payload = {"message": message, "data": data}
+    if next_cursor is not None:
+        payload["next_cursor"] = next_cursor
+    return jsonify(payload), status_code
 
 
 def api_response_error(
@@ -102,10 +331,12 @@ def build_bulk_response(
     success_msg_bulk: str,
     success_code: int = 200,
     created: bool = False,
+    errors: Optional[List[Dict[str, Any]]] = None,
 ) -> Tuple[Dict[str, Any], int]:
     """
     Decide between single-object vs list response
     and automatically switch to 201 when created=True.
+    errors lists the items of a partially successful request that failed.
     """
     if len(success_list) == 1:
         payload = {"message": success_msg_single, "data": success_list[0]}
@@ -114,6 +345,8 @@ def build_bulk_response(
             "message": success_msg_bulk.format(len(success_list)),
             "data": success_list,
         }
+    if errors:
+        payload["errors"] = errors
 
     status = 201 if created else success_code
     return payload, status
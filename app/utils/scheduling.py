@@ -0,0 +1,364 @@
+import re
+from bisect import bisect_left, bisect_right, insort_right
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Sessions stored with only a start time ("10:00 AM") are assumed to last this long
+DEFAULT_SESSION_MINUTES = 60
+
+MINUTES_PER_DAY = 24 * 60
+
+WEEKDAYS = [
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+]
+
+DAY_ALIASES = {
+    **{day: index for index, day in enumerate(WEEKDAYS)},
+    **{day[:3]: index for index, day in enumerate(WEEKDAYS)},
+    "tues": 1,
+    "wed": 2,
+    "thur": 3,
+    "thurs": 3,
+}
+
+_TIME_RE = re.compile(r"^(\d{1,2})(?::(\d{2}))?\s*([ap]\.?m\.?)?$", re.IGNORECASE)
+
+# (start, end) in minutes from Monday 00:00
+Interval = Tuple[int, int]
+
+
+def parse_days(day: str) -> List[int]:
+    """Parse "Monday", "Mon/Wed" or "Tue, Thu" into weekday indexes (Monday = 0)."""
+    if not isinstance(day, str):
+        raise ValueError(f"Invalid schedule day: {day!r}")
+    parts = [p for p in re.split(r"\s*(?:,|/|&|\band\b)\s*", day.strip().lower()) if p]
+    if not parts:
+        raise ValueError(f"Invalid schedule day: {day!r}")
+    days = []
+    for part in parts:
+        if part not in DAY_ALIASES:
+            raise ValueError(f"Invalid schedule day: {day!r}")
+        days.append(DAY_ALIASES[part])
+    return sorted(set(days))
+
+
+def _parse_clock(value: str, meridiem: Optional[str] = None) -> int:
+    match = _TIME_RE.match(value.strip())
+    if not match:
+        raise ValueError
+    hour, minute = int(match.group(1)), int(match.group(2) or 0)
+    meridiem = (match.group(3) or meridiem or "").replace(".", "").lower()
+    if minute > 59 or hour > (12 if meridiem else 23) or (meridiem and hour == 0):
+        raise ValueError
+    if meridiem:
+        hour = hour % 12 + (12 if meridiem == "pm" else 0)
+    return hour * 60 + minute
+
+
+def parse_time_range(time: str) -> Interval:
+    """
+    Parse "10:00", "10:00 AM", "10:00-11:30" or "9 - 10:30 AM" into minutes
+    after midnight. A missing end time means a DEFAULT_SESSION_MINUTES session;
+    a missing AM/PM on the start takes the end's.
+    """
+    try:
+        parts = re.split(r"\s*(?:-|–|\bto\b)\s*", time.strip(), maxsplit=1)
+        if len(parts) == 1:
+            start = _parse_clock(parts[0])
+            end = start + DEFAULT_SESSION_MINUTES
+        else:
+            end_match = _TIME_RE.match(parts[1].strip())
+            meridiem = end_match.group(3) if end_match else None
+            start = _parse_clock(parts[0], meridiem)
+            end = _parse_clock(parts[1])
+    except (ValueError, AttributeError):
+        raise ValueError(f"Invalid schedule time: {time!r}")
+    if end <= start or end > MINUTES_PER_DAY:
+        raise ValueError(f"Invalid schedule time: {time!r}")
+    return start, end
+
+
+def schedule_intervals(day: str, time: str) -> List[Interval]:
+    """Weekly intervals (minutes from Monday 00:00) of one course_schedule row."""
+    start, end = parse_time_range(time)
+    return [
+        (weekday * MINUTES_PER_DAY + start, weekday * MINUTES_PER_DAY + end)
+        for weekday in parse_days(day)
+    ]
+
+
+def parsed_intervals(day: str, time: str) -> List[Interval]:
+    """schedule_intervals, or no intervals for stored rows that cannot be parsed."""
+    try:
+        return schedule_intervals(day, time)
+    except ValueError:
+        return []
+
+
+def normalize_room(room: str) -> str:
+    """
+    Rooms compare case- and whitespace-insensitively. Keep in step with the
+    room expression of course_schedule_db_read_slots and its index.
+    """
+    return " ".join((room or "").split()).lower()
+
+
+_start = itemgetter(0)
+
+
+class IntervalIndex:
+    """
+    Sorted half-open intervals with overlap queries in O(log M + k).
+
+    Intervals are kept sorted by start. Anything overlapping [start, end)
+    must start before `end` and, since no stored interval is longer than
+    the longest one seen, after `start - longest`; two bisects bound the
+    candidates. add bisects in O(log M) but shifts the list to insert, so
+    it is O(M) in the worst case; a memmove, cheap next to the queries
+    that fill the index.
+    """
+
+    def __init__(self):
+        self._items = []  # (start, end, ref), sorted by start
+        self._longest = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, start: int, end: int, ref: Any) -> None:
+        insort_right(self._items, (start, end, ref), key=_start)
+        self._longest = max(self._longest, end - start)
+
+    def overlapping(self, start: int, end: int) -> List[Any]:
+        low = bisect_right(self._items, start - self._longest, key=_start)
+        high = bisect_left(self._items, end, key=_start)
+        return [ref for s, e, ref in self._items[low:high] if s < end and e > start]
+
+
+class ConflictIndex:
+    """
+    Room and instructor bookings per term, for finding double bookings.
+
+    Slots are dicts with id, course_id, term_id, room, instructor_ids, day and
+    time. Two slots conflict when they share a term and either the room or an
+    instructor, and their weekly intervals overlap.
+    """
+
+    def __init__(self):
+        self._indexes: Dict[Tuple, IntervalIndex] = {}
+
+    def _keys(self, slot: Dict[str, Any]) -> List[Tuple[str, Any]]:
+        keys = [("room", normalize_room(slot["room"]))]
+        keys += [("instructor", iid) for iid in slot.get("instructor_ids") or []]
+        return keys
+
+    def add(self, slot: Dict[str, Any], intervals: Iterable[Interval]) -> None:
+        intervals = list(intervals)
+        for kind, value in self._keys(slot):
+            index = self._indexes.setdefault(
+                (slot["term_id"], kind, value), IntervalIndex()
+            )
+            for start, end in intervals:
+                index.add(start, end, slot)
+
+    def conflicts(
+        self, slot: Dict[str, Any], intervals: Iterable[Interval]
+    ) -> List[Tuple[str, Any, Dict[str, Any]]]:
+        """
+        Indexed bookings that clash with slot as (reason, room or instructor ID,
+        other slot), one per other slot and reason. A slot never clashes with
+        itself.
+        """
+        found = {}
+        intervals = list(intervals)
+        for kind, value in self._keys(slot):
+            index = self._indexes.get((slot["term_id"], kind, value))
+            if index is None:
+                continue
+            for start, end in intervals:
+                for other in index.overlapping(start, end):
+                    if slot.get("id") is not None and other.get("id") == slot["id"]:
+                        continue
+                    found.setdefault((id(other), kind), (kind, value, other))
+        return list(found.values())
+
+
+def describe_conflict(kind: str, value: Any, other: Dict[str, Any]) -> str:
+    """Human-readable reason a new booking was rejected."""
+    when = f"on {other['day']} at {other['time']}"
+    if kind == "room":
+        return f"Room '{other['room']}' is already booked {when} by course {other['course_id']}."
+    return f"Instructor {value} already teaches course {other['course_id']} {when}."
+
+
+def build_conflict_index(slots: Iterable[Dict[str, Any]]) -> ConflictIndex:
+    """Index existing bookings; rows whose day or time cannot be parsed are skipped."""
+    index = ConflictIndex()
+    for slot in slots:
+        try:
+            intervals = schedule_intervals(slot["day"], slot["time"])
+        except ValueError:
+            continue
+        index.add(slot, intervals)
+    return index
+
+
+def group_course_sessions(
+    sessions: Iterable[Dict[str, Any]],
+) -> Dict[Any, List[Tuple[Any, int, int]]]:
+    """
+    Weekly intervals of session rows (course_id, term_id, day, time) as
+    {course_id: [(term_id, start, end), ...]}. Unparsable times are left out.
+    """
+    grouped: Dict[Any, List[Tuple[Any, int, int]]] = {}
+    for session in sessions:
+        grouped.setdefault(session["course_id"], []).extend(
+            (session["term_id"], start, end)
+            for start, end in parsed_intervals(session["day"], session["time"])
+        )
+    return grouped
+
+
+class Timetables:
+    """
+    Students' weekly timetables, an IntervalIndex of course IDs per student
+    and term, for enrollment clash checks. Sessions are (term_id, start, end)
+    as grouped by group_course_sessions.
+    """
+
+    def __init__(self):
+        self._indexes: Dict[Tuple[Any, Any], IntervalIndex] = {}
+
+    def add(self, student_id: Any, course_id: Any, sessions: Iterable) -> None:
+        for term_id, start, end in sessions:
+            index = self._indexes.setdefault((student_id, term_id), IntervalIndex())
+            index.add(start, end, course_id)
+
+    def add_sessions(self, sessions: Iterable[Dict[str, Any]]) -> None:
+        """Add enrolled session rows (student_id, course_id, term_id, day, time)."""
+        for session in sessions:
+            intervals = parsed_intervals(session["day"], session["time"])
+            self.add(
+                session["student_id"],
+                session["course_id"],
+                [(session["term_id"], start, end) for start, end in intervals],
+            )
+
+    def clash(self, student_id: Any, sessions: Iterable) -> Optional[Any]:
+        """A course in the student's timetable meeting during sessions, or None."""
+        for term_id, start, end in sessions:
+            index = self._indexes.get((student_id, term_id))
+            clashes = index.overlapping(start, end) if index else []
+            if clashes:
+                return clashes[0]
+        return None
+
+
+def _session(slot: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: slot[key] for key in ("id", "course_id", "day", "time", "room")}
+
+
+def find_schedule_conflicts(
+    slots: Iterable[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """
+    Every clashing pair among slots, each reported once, plus the IDs of slots
+    whose day or time cannot be parsed. Runs in O(N log N).
+    """
+    index = ConflictIndex()
+    conflicts = []
+    unparsed = []
+    for slot in sorted(slots, key=lambda s: s["id"]):
+        try:
+            intervals = schedule_intervals(slot["day"], slot["time"])
+        except ValueError:
+            unparsed.append(slot["id"])
+            continue
+        for kind, value, other in index.conflicts(slot, intervals):
+            conflicts.append(
+                {
+                    "type": kind,
+                    "term_id": slot["term_id"],
+                    # Rooms are matched case- and whitespace-insensitively;
+                    # report the spelling of the first booking
+                    **(
+                        {"room": other["room"]}
+                        if kind == "room"
+                        else {"instructor_id": value}
+                    ),
+                    "sessions": [_session(other), _session(slot)],
+                }
+            )
+        index.add(slot, intervals)
+    return conflicts, unparsed
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """Sort intervals and merge the ones that overlap or touch."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def scheduled_hours(sessions: Iterable[Dict[str, Any]]) -> float:
+    """Weekly hours covered by sessions with day and time; unparsable ones count 0."""
+    intervals = [
+        interval
+        for session in sessions
+        for interval in parsed_intervals(session["day"], session["time"])
+    ]
+    return round(sum(end - start for start, end in merge_intervals(intervals)) / 60, 2)
+
+
+def room_utilization(
+    sessions: Iterable[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """
+    Occupied hours per room and weekday from rows with id, room, day and
+    time, plus the IDs of rows that cannot be parsed. Time a room is double
+    booked is only counted once.
+    """
+    rooms = {}  # normalized room -> {"room", "sessions", "intervals"}
+    unparsed = []
+    for session in sessions:
+        try:
+            intervals = schedule_intervals(session["day"], session["time"])
+        except ValueError:
+            unparsed.append(session["id"])
+            continue
+        room = rooms.setdefault(
+            normalize_room(session["room"]),
+            {"room": session["room"], "sessions": 0, "intervals": []},
+        )
+        room["sessions"] += 1
+        room["intervals"].extend(intervals)
+
+    report = []
+    for key in sorted(rooms):
+        room = rooms[key]
+        minutes = [0] * len(WEEKDAYS)
+        for start, end in merge_intervals(room["intervals"]):
+            minutes[start // MINUTES_PER_DAY] += end - start
+        report.append(
+            {
+                "room": room["room"],
+                "sessions": room["sessions"],
+                "weekly_hours": round(sum(minutes) / 60, 2),
+                "hours_by_day": {
+                    WEEKDAYS[day].title(): round(total / 60, 2)
+                    for day, total in enumerate(minutes)
+                    if total
+                },
+            }
+        )
+    return report, unparsed
@@ -1,5 +1,13 @@
+import csv
+
 from .routes_helpers import normalize_to_list
 
+# Rows sent per multi-row statement by the bulk helpers
+BULK_CHUNK_SIZE = 500
+
+CSV_TRUE = ("true", "t", "yes", "y", "1")
+CSV_FALSE = ("false", "f", "no", "n", "0")
+
 
 def bulk_create_entities(
     data,
@@ -8,15 +16,19 @@ def bulk_create_entities(
     to_row_func,  # converts dict to DB row format
     to_dict_func,  # converts DB row to dict for response
     read_by_ids_func,  # reads rows by list of IDs
+    insert_many_func=None,  # inserts a list of rows in one statement, returns created rows
+    validate_func=None,  # checks (index, row) pairs together, returns {index: error message}
+    partial_errors=False,  # on partial success, return the failed rows' errors too
+    chunk_size=BULK_CHUNK_SIZE,
     no_success_msg="No entities were created.",
     success_status_code=201,
     failure_status_code=400,
 ):
     items = normalize_to_list(data)
-    created_ids = []
+    rows = []
     errors = []
 
-    for item in items:
+    for index, item in enumerate(items):
         # Clean string fields
         if isinstance(item, dict):
             item = {
@@ -24,26 +36,72 @@ def bulk_create_entities(
             }
 
         try:
-            row = to_row_func(item)
-            new_id = insert_func(row)
-            if new_id:
-                created_ids.append(new_id)
-            else:
-                errors.append(
-                    {"message": "Failed to insert entity (unknown DB error)."}
-                )
+            rows.append((index, to_row_func(item)))
         except (ValueError, RuntimeError) as e:
-            errors.append({"message": str(e)})
+            errors.append({"index": index, "message": str(e)})
 
-    if not created_ids:
-        return [], {"message": no_success_msg, "details": errors}, failure_status_code
+    if validate_func and rows:
+        rejected = validate_func(rows)
+        errors.extend(
+            {"index": index, "message": rejected[index]}
+            for index, _ in rows
+            if index in rejected
+        )
+        rows = [(index, row) for index, row in rows if index not in rejected]
 
-    created_rows = read_by_ids_func(created_ids)
-    created_entities = [to_dict_func(row) for row in created_rows]
+    created_entities = []
+    created_ids = []
+
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start : start + chunk_size]
+
+        if insert_many_func:
+            try:
+                created_rows = insert_many_func([row for _, row in chunk])
+                created_entities.extend(to_dict_func(row) for row in created_rows)
+                continue
+            except (ValueError, RuntimeError):
+                # A bad row fails the whole chunk; retry it row by row so
+                # every item still gets its own error.
+                pass
+
+        for index, row in chunk:
+            try:
+                new_id = insert_func(row)
+                if new_id:
+                    created_ids.append(new_id)
+                else:
+                    errors.append(
+                        {
+                            "index": index,
+                            "message": "Failed to insert entity (unknown DB error).",
+                        }
+                    )
+            except (ValueError, RuntimeError) as e:
+                errors.append({"index": index, "message": str(e)})
+
+    if created_ids:
+        created_rows = read_by_ids_func(created_ids)
+        created_entities.extend(to_dict_func(row) for row in created_rows)
+
+    if not created_entities:
+        return [], {"message": no_success_msg, "details": errors}, failure_status_code
 
+    if partial_errors and errors:
+        return created_entities, errors, success_status_code
     return created_entities, None, success_status_code
 
 
+def _id_key(entity_id):
+    """
+    JSON may carry "5" for 5; key both as the integer so duplicates of one
+    row merge. Anything else is kept as sent and reported as not found.
+    """
+    if isinstance(entity_id, str) and entity_id.isdigit():
+        return int(entity_id)
+    return entity_id
+
+
 def bulk_update_entities(
     data,
     *,
@@ -52,6 +110,9 @@ def bulk_update_entities(
     to_row_func,  # converts dict to DB row format
     to_dict_func,  # converts DB row to dict for response
     read_by_ids_func,  # reads rows by list of IDs
+    update_many_func=None,  # updates a list of (ID, row) pairs in one statement, returns updated rows
+    validate_func=None,  # checks (ID, row) pairs together, returns {ID: error message}
+    chunk_size=BULK_CHUNK_SIZE,
     no_success_msg="No entities were updated.",
     missing_id_msg="Missing entity ID for update.",
     not_found_msg="Entity ID {id} not found.",
@@ -60,7 +121,7 @@ def bulk_update_entities(
     failure_status_code=400,
 ):
     items = normalize_to_list(data)
-    updated_ids = []
+    updates = {}  # entity ID -> incoming fields, later items win
     errors = []
 
     for item in items:
@@ -70,36 +131,93 @@ def bulk_update_entities(
                 k: (v.strip() if isinstance(v, str) else v) for k, v in item.items()
             }
 
-        entity_id = item.get("id")
+        entity_id = _id_key(item.get("id"))
         if not entity_id:
             errors.append({"message": missing_id_msg})
             continue
+        updates[entity_id] = {**updates.get(entity_id, {}), **item}
 
-        existing = get_existing_func(entity_id)
-        if not existing:
-            errors.append({"message": not_found_msg.format(id=entity_id)})
-            continue
+    updated_entities = []
+    updated_ids = []
+    entity_ids = list(updates)
+    pending = []
 
-        # Merge incoming data over existing data
-        if not isinstance(existing, dict):
-            existing = to_dict_func(existing)
-        merged = {**existing, **item}
+    for start in range(0, len(entity_ids), chunk_size):
+        chunk_ids = entity_ids[start : start + chunk_size]
 
-        try:
-            row = to_row_func(merged)
-            success = update_func(entity_id, row)
-            if success:
-                updated_ids.append(entity_id)
-            else:
-                errors.append({"message": not_updated_msg.format(id=entity_id)})
-        except (ValueError, RuntimeError) as e:
-            errors.append({"message": str(e)})
+        # One query for the whole chunk when batching, one per ID otherwise
+        if update_many_func:
+            existing_rows = {
+                str(row["id"]): row for row in read_by_ids_func(chunk_ids) or []
+            }
+        else:
+            existing_rows = {
+                str(entity_id): get_existing_func(entity_id) for entity_id in chunk_ids
+            }
 
-    if not updated_ids:
-        return [], errors, failure_status_code
+        for entity_id in chunk_ids:
+            existing = existing_rows.get(str(entity_id))
+            if not existing:
+                errors.append({"message": not_found_msg.format(id=entity_id)})
+                continue
+
+            # Merge incoming data over existing data
+            if not isinstance(existing, dict):
+                existing = to_dict_func(existing)
+            merged = {**existing, **updates[entity_id]}
+
+            try:
+                pending.append((entity_id, to_row_func(merged)))
+            except (ValueError, RuntimeError) as e:
+                errors.append({"message": str(e)})
+
+    # Validate the merged rows together so rows in the same request are
+    # checked against each other, not only against what is stored
+    if validate_func and pending:
+        rejected = validate_func(pending)
+        errors.extend(
+            {"message": rejected[entity_id]}
+            for entity_id, _ in pending
+            if entity_id in rejected
+        )
+        pending = [
+            (entity_id, row) for entity_id, row in pending if entity_id not in rejected
+        ]
 
-    updated_rows = read_by_ids_func(updated_ids)
-    updated_entities = [to_dict_func(row) for row in updated_rows]
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start : start + chunk_size]
+
+        if update_many_func:
+            try:
+                updated_rows = {str(row["id"]): row for row in update_many_func(chunk)}
+                for entity_id, _ in chunk:
+                    row = updated_rows.get(str(entity_id))
+                    if row:
+                        updated_entities.append(to_dict_func(row))
+                    else:
+                        errors.append({"message": not_updated_msg.format(id=entity_id)})
+                continue
+            except (ValueError, RuntimeError):
+                # A bad row fails the whole chunk; retry it row by row so
+                # every item still gets its own error.
+                pass
+
+        for entity_id, row in chunk:
+            try:
+                success = update_func(entity_id, row)
+                if success:
+                    updated_ids.append(entity_id)
+                else:
+                    errors.append({"message": not_updated_msg.format(id=entity_id)})
+            except (ValueError, RuntimeError) as e:
+                errors.append({"message": str(e)})
+
+    if updated_ids:
+        updated_rows = read_by_ids_func(updated_ids)
+        updated_entities.extend(to_dict_func(row) for row in updated_rows)
+
+    if not updated_entities:
+        return [], errors, failure_status_code
 
     return updated_entities, errors if errors else None, success_status_code
 
@@ -111,6 +229,8 @@ def bulk_archive_entities(
     get_existing_func,  # function to read existing entity by ID
     to_dict_func,  # converts DB row to dict for response
     read_by_ids_func,  # reads rows by list of IDs
+    archive_many_func=None,  # archives a list of IDs in one statement, returns archived rows
+    chunk_size=BULK_CHUNK_SIZE,
     no_success_msg="No entities were archived.",
     id_type=int,
     missing_id_msg="Invalid ID.",
@@ -123,28 +243,133 @@ def bulk_archive_entities(
     if not all(isinstance(i, id_type) for i in normalized_ids):
         return [], [{"message": f"All IDs must be of type {id_type.__name__}"}], 400
 
+    archived_entities = []
     archived_ids = []
     errors = []
+    entity_ids = list(dict.fromkeys(normalized_ids))  # drop duplicates, keep order
 
-    for entity_id in normalized_ids:
-        existing = get_existing_func(entity_id)
-        if not existing:
-            errors.append({"message": not_found_msg.format(id=entity_id)})
-            continue
+    for start in range(0, len(entity_ids), chunk_size):
+        chunk_ids = entity_ids[start : start + chunk_size]
 
-        try:
-            rows_updated = archive_func(entity_id)
-            if rows_updated > 0:
-                archived_ids.append(entity_id)
-            else:
-                errors.append({"message": not_updated_msg.format(id=entity_id)})
-        except Exception as e:
-            errors.append({"message": str(e)})
-
-    if not archived_ids:
-        return [], errors, failure_status_code
+        if archive_many_func:
+            try:
+                archived_rows = {
+                    str(row["id"]): row for row in archive_many_func(chunk_ids)
+                }
+                # IDs the UPDATE did not return were missing or already archived
+                for entity_id in chunk_ids:
+                    row = archived_rows.get(str(entity_id))
+                    if row:
+                        archived_entities.append(to_dict_func(row))
+                    else:
+                        errors.append({"message": not_found_msg.format(id=entity_id)})
+                continue
+            except (ValueError, RuntimeError):
+                # Retry the chunk ID by ID so every item still gets its own error.
+                pass
+
+        for entity_id in chunk_ids:
+            existing = get_existing_func(entity_id)
+            if not existing:
+                errors.append({"message": not_found_msg.format(id=entity_id)})
+                continue
+
+            try:
+                rows_updated = archive_func(entity_id)
+                if rows_updated > 0:
+                    archived_ids.append(entity_id)
+                else:
+                    errors.append({"message": not_updated_msg.format(id=entity_id)})
+            except Exception as e:
+                errors.append({"message": str(e)})
 
-    archived_rows = read_by_ids_func(archived_ids)
-    archived_entities = [to_dict_func(row) for row in archived_rows]
+    if archived_ids:
+        archived_rows = read_by_ids_func(archived_ids)
+        archived_entities.extend(to_dict_func(row) for row in archived_rows)
+
+    if not archived_entities:
+        return [], errors, failure_status_code
 
     return archived_entities, errors if errors else None, success_status_code
+
+
+def _parse_csv_value(column, raw, value_type):
+    if value_type is bool:
+        if raw.lower() not in CSV_TRUE + CSV_FALSE:
+            raise ValueError(f"{column} must be true or false")
+        return raw.lower() in CSV_TRUE
+    if value_type is int:
+        if not raw.isdigit():
+            raise ValueError(f"{column} must be an integer")
+        return int(raw)
+    return raw
+
+
+def import_csv_entities(
+    lines,
+    *,
+    import_func,  # loads an iterable of DB rows in one go, returns the row count
+    to_row_func,  # converts dict to DB row format
+    columns,  # columns the CSV may have
+    required=(),  # columns every row needs a value for
+    types=None,  # column -> int or bool, for values that are not text
+    no_success_msg="No entities were imported.",
+    success_status_code=201,
+    failure_status_code=400,
+):
+    """
+    Import a CSV file, read lazily from lines, so it is never held in memory
+    whole. The header names the columns. Values are stripped; empty ones are
+    left out so to_row_func applies its defaults. The import is all or
+    nothing: the first bad row fails it, numbered from 1 for the first row
+    after the header.
+    """
+
+    def failure(problem):
+        return (
+            None,
+            {"message": no_success_msg, "details": [{"message": problem}]},
+            failure_status_code,
+        )
+
+    reader = csv.DictReader(lines)
+    try:
+        header = [name.strip() for name in reader.fieldnames or []]
+    except (ValueError, csv.Error) as e:  # UnicodeDecodeError is a ValueError
+        return failure(f"Header: {e}")
+    unknown = [name for name in header if name not in columns]
+    missing = [name for name in required if name not in header]
+    if not header:
+        return failure("The CSV file is empty.")
+    if unknown:
+        return failure(f"Unknown column(s): {', '.join(unknown)}.")
+    if missing:
+        return failure(f"Missing column(s): {', '.join(missing)}.")
+    reader.fieldnames = header
+    types = types or {}
+
+    def rows():
+        for number, record in enumerate(reader, start=1):
+            if None in record:
+                raise ValueError(f"Row {number}: more fields than the header.")
+            item = {}
+            for column, raw in record.items():
+                raw = (raw or "").strip()
+                if not raw:
+                    continue
+                try:
+                    item[column] = _parse_csv_value(column, raw, types.get(column))
+                except ValueError as e:
+                    raise ValueError(f"Row {number}: {e}")
+            absent = [column for column in required if column not in item]
+            if absent:
+                raise ValueError(f"Row {number}: {', '.join(absent)} is required.")
+            yield to_row_func(item)
+
+    try:
+        count = import_func(rows())
+    except (ValueError, RuntimeError, csv.Error) as e:
+        return failure(str(e))
+    if not count:
+        return None, {"message": no_success_msg, "details": []}, failure_status_code
+    return {"imported": count}, None, success_status_code
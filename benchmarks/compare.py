@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark Comparison Script
+Compares two results files written by benchmarks.run, scenario by scenario:
+
+    python -m benchmarks.compare benchmarks/results/before.json benchmarks/results/after.json
+
+Exits with status 1 when any scenario's p95 latency grew by more than
+--threshold percent, so it can gate a CI job.
+"""
+
+import argparse
+import json
+import sys
+
+METRICS = ("p50_ms", "p95_ms", "requests_per_s", "sql_statements_per_request")
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def change(before, after):
+    """Relative change in percent, or None when there is nothing to compare."""
+    if before in (None, 0) or after is None:
+        return None
+    return round((after - before) * 100 / before, 1)
+
+
+def compare(before, after):
+    """One row per scenario present in both reports, with each metric's change."""
+    previous = {scenario["name"]: scenario for scenario in before["scenarios"]}
+    rows = []
+    for scenario in after["scenarios"]:
+        old = previous.get(scenario["name"])
+        if old is None:
+            continue
+        row = {"name": scenario["name"]}
+        for metric in METRICS:
+            row[metric] = (old.get(metric), scenario.get(metric))
+            row[f"{metric}_change"] = change(old.get(metric), scenario.get(metric))
+        rows.append(row)
+    return rows
+
+
+def regressions(rows, threshold):
+    """Scenarios whose p95 latency grew by more than threshold percent."""
+    return [
+        row["name"]
+        for row in rows
+        if row["p95_ms_change"] is not None and row["p95_ms_change"] > threshold
+    ]
+
+
+def _format(value, delta):
+    if value is None:
+        return "-"
+    return f"{value:g}" + (f" ({delta:+.1f}%)" if delta is not None else "")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="p95 latency growth, in percent, that counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    before, after = load(args.before), load(args.after)
+    print(f"before: {before.get('commit')}  after: {after.get('commit')}")
+    rows = compare(before, after)
+    print(f"{'scenario':<28}" + "".join(f"{metric:>28}" for metric in METRICS))
+    for row in rows:
+        cells = "".join(
+            f"{_format(row[metric][1], row[f'{metric}_change']):>28}"
+            for metric in METRICS
+        )
+        print(f"{row['name']:<28}{cells}")
+
+    slower = regressions(rows, args.threshold)
+    if slower:
+        print(
+            f"\n⚠️  p95 regressed by more than {args.threshold:g}%: {', '.join(slower)}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
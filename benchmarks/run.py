@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+API Benchmark Runner
+Measures latency and throughput of the list, get-by-id and bulk create,
+update and archive routes against a seeded database (see benchmarks.seed):
+
+    python -m benchmarks.run                       # in-process, via Flask's test client
+    python -m benchmarks.run --base-url http://localhost:5000
+    python -m benchmarks.compare benchmarks/results/old.json benchmarks/results/new.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+
+sys.path.append(".")
+
+from db import data
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+RESOURCES = ("students", "courses", "enrollments")
+# Fields unique to each created row, to match update payloads to created IDs
+UNIQUE_FIELDS = {
+    "students": ("email",),
+    "courses": ("code",),
+    "enrollments": ("student_id", "course_id"),
+}
+
+_STATEMENTS_RE = re.compile(r'db;desc="(\d+) statements"')
+
+
+# =======================
+# Clients
+# =======================
+
+
+class AppClient:
+    """Calls the app in-process through Flask's test client; no HTTP server involved."""
+
+    target = "in-process"
+
+    def __init__(self):
+        from app import create_app
+
+        self._client = create_app().test_client()
+
+    def request(self, method, path, payload=None):
+        response = self._client.open(path, method=method, json=payload)
+        return response.status_code, response.headers, response.get_json(silent=True)
+
+
+class HttpClient:
+    """Calls a running server over HTTP."""
+
+    def __init__(self, base_url):
+        self.target = base_url.rstrip("/")
+
+    def request(self, method, path, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else None
+        req = urllib.request.Request(
+            self.target + path,
+            data=body,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(req) as response:
+                return response.status, response.headers, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, None
+
+
+# =======================
+# Statistics
+# =======================
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def sql_statements(headers):
+    """The SQL statement count from a Server-Timing header, or None without one."""
+    match = _STATEMENTS_RE.search(headers.get("Server-Timing", "") if headers else "")
+    return int(match.group(1)) if match else None
+
+
+def summarize(name, samples, elapsed):
+    """
+    Reduce (seconds, status, rows, statements) samples of one scenario to
+    latency percentiles in milliseconds and request and row throughput.
+    """
+    latencies = sorted(sample[0] for sample in samples)
+    rows = sum(sample[2] for sample in samples)
+    statements = [sample[3] for sample in samples if sample[3] is not None]
+    count = len(samples)
+    return {
+        "name": name,
+        "requests": count,
+        "errors": sum(1 for sample in samples if sample[1] >= 400),
+        "rows": rows,
+        "mean_ms": round(sum(latencies) * 1000 / count, 3) if count else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        "requests_per_s": round(count / elapsed, 2) if elapsed else 0.0,
+        "rows_per_s": round(rows / elapsed, 2) if elapsed else 0.0,
+        "sql_statements_per_request": (
+            round(sum(statements) / len(statements), 2) if statements else None
+        ),
+    }
+
+
+# =======================
+# Scenarios
+# =======================
+
+
+def unique_key(resource, row):
+    return tuple(row.get(field) for field in UNIQUE_FIELDS[resource])
+
+
+class Benchmark:
+    """
+    Runs every scenario against one client. Bulk scenarios write fresh rows
+    (tagged with a per-run token so reruns never collide), update them and
+    archive them again, so the seeded dataset is left as it was found apart
+    from archived rows.
+    """
+
+    def __init__(self, client, requests=200, batch_size=100, page_size=100, seed=0):
+        self.client = client
+        self.requests = requests
+        self.batch_size = batch_size
+        self.page_size = page_size
+        self.rng = random.Random(seed)
+        self.token = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        self.ids = {resource: [] for resource in RESOURCES}
+        # resource -> {unique key: ID} of the rows the bulk creates returned
+        self.created = {resource: {} for resource in RESOURCES}
+        self.results = []
+
+    def call(self, method, path, payload=None):
+        started = time.perf_counter()
+        status, headers, body = self.client.request(method, path, payload)
+        seconds = time.perf_counter() - started
+        if status >= 400:
+            logging.warning(f"{method} {path} returned {status}: {body}")
+        result = (body or {}).get("data")
+        rows = len(result) if isinstance(result, list) else int(bool(result))
+        return (seconds, status, rows, sql_statements(headers)), body
+
+    def measure(self, name, calls):
+        samples = []
+        started = time.perf_counter()
+        for call in calls:
+            samples.append(call())
+        summary = summarize(name, samples, time.perf_counter() - started)
+        self.results.append(summary)
+        print(
+            f"{name:<28} {summary['p50_ms']:>9.2f} {summary['p95_ms']:>9.2f} "
+            f"{summary['requests_per_s']:>9.1f} {summary['rows_per_s']:>10.1f}"
+            f"{'  errors: %d' % summary['errors'] if summary['errors'] else ''}"
+        )
+        return samples
+
+    def list_pages(self, resource):
+        """Walk the keyset pages of a list endpoint, wrapping around at the end."""
+        cursor = None
+        for _ in range(self.requests):
+            path = f"/api/{resource}?limit={self.page_size}"
+            if cursor:
+                path += f"&cursor={cursor}"
+
+            def call(path=path):
+                nonlocal cursor
+                sample, body = self.call("GET", path)
+                body = body or {}
+                self.ids[resource] += [row["id"] for row in body.get("data") or []]
+                cursor = body.get("next_cursor")
+                return sample
+
+            yield call
+
+    def get_by_id(self, resource):
+        ids = self.ids[resource] or [1]
+        for _ in range(self.requests):
+            yield lambda: self.call("GET", f"/api/{resource}/{self.rng.choice(ids)}")[0]
+
+    def bulk(self, method, resource, batches):
+        def call(payload):
+            sample, body = self.call(method, f"/api/{resource}", payload)
+            if method == "POST" and body:
+                result = body.get("data")
+                result = result if isinstance(result, list) else [result]
+                for row in result:
+                    if row:
+                        self.created[resource][unique_key(resource, row)] = row["id"]
+            return sample
+
+        for payload in batches:
+            yield lambda payload=payload: call(payload)
+
+    def batches(self, rows):
+        for start in range(0, len(rows), self.batch_size):
+            yield rows[start : start + self.batch_size]
+
+    def new_rows(self, resource):
+        """Create payloads, the same for every run apart from unique emails and codes."""
+        count = self.requests_per_bulk() * self.batch_size
+        if resource == "students":
+            return [
+                {
+                    "first_name": row[1],
+                    "last_name": row[2],
+                    "email": f"bench.{self.token}.{index}@school.edu",
+                    "address": row[4],
+                    "city": row[5],
+                    "province": row[6],
+                    "country": row[7],
+                    "program_id": row[12],
+                }
+                for index, row in enumerate(data.generate_students(count, seed=1))
+            ]
+        if resource == "courses":
+            return [
+                {
+                    "title": row[1],
+                    "code": f"B{self.token}{index:06d}",
+                    "term_id": row[3],
+                    "department_id": row[4],
+                }
+                for index, row in enumerate(data.generate_courses(count, seed=1))
+            ]
+        # One course per new student, so no enrollment can clash with another
+        course_ids = self.ids["courses"] or [1]
+        return [
+            {"student_id": student_id, "course_id": self.rng.choice(course_ids)}
+            for student_id in self.created["students"].values()
+        ]
+
+    def updated_rows(self, resource, payloads):
+        """
+        Update payloads for the created rows, matched on their unique fields
+        since a create may reject rows or return them in another order.
+        """
+        changes = {"students": "city", "courses": "title", "enrollments": "grade"}
+        field = changes[resource]
+        created = self.created[resource]
+        return [
+            {
+                **payload,
+                "id": created[unique_key(resource, payload)],
+                field: "B+" if field == "grade" else "Bench",
+            }
+            for payload in payloads
+            if unique_key(resource, payload) in created
+        ]
+
+    def requests_per_bulk(self):
+        """Bulk scenarios send fewer, larger requests than the read scenarios."""
+        return max(1, self.requests // 10)
+
+    def run(self, warmup=10):
+        print(
+            f"{'scenario':<28} {'p50 ms':>9} {'p95 ms':>9} {'req/s':>9} {'rows/s':>10}"
+        )
+        for resource in RESOURCES:
+            for _, call in zip(range(warmup), self.list_pages(resource)):
+                call()
+            self.measure(f"{resource}.list", self.list_pages(resource))
+            self.measure(f"{resource}.get_by_id", self.get_by_id(resource))
+
+        payloads = {}
+        for resource in RESOURCES:
+            payloads[resource] = self.new_rows(resource)
+            self.measure(
+                f"{resource}.bulk_create",
+                self.bulk("POST", resource, self.batches(payloads[resource])),
+            )
+        for resource in RESOURCES:
+            rows = self.updated_rows(resource, payloads[resource])
+            self.measure(
+                f"{resource}.bulk_update",
+                self.bulk("PUT", resource, self.batches(rows)),
+            )
+        # Enrollments first, so their seats are released before the courses go
+        for resource in reversed(RESOURCES):
+            self.measure(
+                f"{resource}.bulk_archive",
+                self.bulk(
+                    "PATCH",
+                    resource,
+                    (
+                        {"ids": ids}
+                        for ids in self.batches(list(self.created[resource].values()))
+                    ),
+                ),
+            )
+        return self.results
+
+
+# =======================
+# Results
+# =======================
+
+
+def git_revision():
+    try:
+        sha = subprocess.check_output(["git", "rev-parse", "HEAD"], text=True).strip()
+        dirty = bool(
+            subprocess.check_output(["git", "status", "--porcelain"], text=True).strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return sha, dirty
+
+
+def write_results(results, settings, output=None):
+    """Write results with the commit and settings they were measured at; returns the path."""
+    sha, dirty = git_revision()
+    now = datetime.now(timezone.utc)
+    report = {
+        "commit": sha,
+        "dirty": dirty,
+        "created_at": now.isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "settings": settings,
+        "scenarios": results,
+    }
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        name = f"{now:%Y%m%dT%H%M%S}-{(sha or 'unknown')[:8]}.json"
+        output = os.path.join(RESULTS_DIR, name)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", help="benchmark a running server instead")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="results file (default: benchmarks/results/)")
+    args = parser.parse_args(argv)
+
+    # Per-statement query logging would dominate the timings
+    logging.getLogger("db.database").setLevel(logging.WARNING)
+    client = HttpClient(args.base_url) if args.base_url else AppClient()
+    benchmark = Benchmark(
+        client, args.requests, args.batch_size, args.page_size, args.seed
+    )
+    results = benchmark.run(args.warmup)
+    settings = {key: value for key, value in vars(args).items() if key != "output"}
+    settings["target"] = client.target
+    print(f"\n📄 {write_results(results, settings, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark Seeding Script
+Loads the sample data plus a synthetic dataset of the requested size, e.g.
+
+    python -m benchmarks.seed --students 100000 --courses 2000 --reset
+"""
+
+import argparse
+import logging
+import sys
+
+sys.path.append(".")
+
+from db.database import Database
+from db.init import init_database, populate_sample_data, populate_synthetic_data
+
+
+def reset_database(db):
+    """Empty every table and restart its ID sequence."""
+    tables = db.execute_query(
+        "SELECT table_name FROM information_schema.tables "
+        "WHERE table_schema = 'public' AND table_type = 'BASE TABLE';"
+    )
+    names = ", ".join(row["table_name"] for row in tables)
+    if names:
+        db.execute_query(f"TRUNCATE {names} RESTART IDENTITY CASCADE;")
+
+
+def seed(students, courses, enrollments_per_student=3, seed=0, reset=False):
+    """
+    Load the schema, the sample data and a synthetic dataset of the given
+    size (see db.init.populate_synthetic_data), optionally into an emptied
+    database. The same arguments always produce the same rows.
+    """
+    if reset:
+        reset_database(Database())
+    if not init_database() or not populate_sample_data():
+        raise RuntimeError("Could not load the schema and sample data.")
+    if not populate_synthetic_data(students, courses, enrollments_per_student, seed):
+        raise RuntimeError("Could not load the synthetic data.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, default=10000)
+    parser.add_argument("--courses", type=int, default=500)
+    parser.add_argument("--enrollments-per-student", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--reset", action="store_true", help="empty every table before seeding"
+    )
+    args = parser.parse_args(argv)
+
+    logging.getLogger("db.database").setLevel(logging.WARNING)
+    seed(
+        args.students,
+        args.courses,
+        args.enrollments_per_student,
+        args.seed,
+        args.reset,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+import copy
+import logging
+import os
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import wraps
+
+from flask import g, has_request_context
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    In-process cache with least-recently-used eviction and a per-entry TTL.
+    Safe to share between threads; each worker process has its own copy.
+    Values are deep-copied in and out, as RedisCache's pickling does, so
+    neither the caller that stored a value nor one that read it can change
+    the cached entry (query results nest rows in lists).
+    """
+
+    def __init__(self, maxsize=1024, ttl=60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get_many(self, keys):
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._data.get(key)
+                if entry is None:
+                    continue
+                expires_at, value = entry
+                if expires_at <= now:
+                    del self._data[key]
+                    continue
+                self._data.move_to_end(key)
+                found[key] = copy.deepcopy(value)
+        return found
+
+    def set_many(self, items, ttl=None):
+        expires_at = time.monotonic() + (ttl or self.ttl)
+        with self._lock:
+            for key, value in items.items():
+                self._data[key] = (expires_at, copy.deepcopy(value))
+                self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete_many(self, keys):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class RedisCache:
+    """
+    Shared cache backed by Redis, so every worker sees the same entries and
+    a write in one process invalidates reads in all of them.
+    Requires the optional `redis` package.
+    """
+
+    def __init__(self, url, ttl=60.0, prefix="school_api:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requires the 'redis' package (pip install redis)"
+            ) from e
+        self.ttl = ttl
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+
+    def get_many(self, keys):
+        if not keys:
+            return {}
+        values = self._client.mget([self.prefix + key for key in keys])
+        return {
+            key: pickle.loads(value)
+            for key, value in zip(keys, values)
+            if value is not None
+        }
+
+    def set_many(self, items, ttl=None):
+        expires = max(int(ttl or self.ttl), 1)
+        pipe = self._client.pipeline()
+        for key, value in items.items():
+            pipe.set(self.prefix + key, pickle.dumps(value), ex=expires)
+        pipe.execute()
+
+    def delete_many(self, keys):
+        if keys:
+            self._client.delete(*(self.prefix + key for key in keys))
+
+    def clear(self):
+        keys = list(self._client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+
+def id_arg(entity_id, *args, **kwargs):
+    """IDs for writes whose first argument is a single ID."""
+    return [entity_id]
+
+
+def ids_arg(entity_ids, *args, **kwargs):
+    """IDs for writes whose first argument is a list of IDs."""
+    return list(entity_ids)
+
+
+def pair_ids(id_row_pairs, *args, **kwargs):
+    """IDs for writes whose first argument is a list of (ID, row) pairs."""
+    return [entity_id for entity_id, _ in id_row_pairs]
+
+
+def _create_backend():
+    """
+    Build the cache backend from the environment:
+    CACHE_BACKEND (memory, redis or none), CACHE_TTL, CACHE_MAXSIZE, CACHE_URL.
+    """
+    backend = os.getenv("CACHE_BACKEND", "memory").lower()
+    ttl = float(os.getenv("CACHE_TTL", 60))
+    if backend == "none":
+        return None
+    if backend == "redis":
+        return RedisCache(os.getenv("CACHE_URL", "redis://localhost:6379/0"), ttl=ttl)
+    if backend == "memory":
+        return LRUCache(maxsize=int(os.getenv("CACHE_MAXSIZE", 1024)), ttl=ttl)
+    raise ValueError(f"Unknown CACHE_BACKEND: {backend}")
+
+
+class ReadCache:
+    """
+    Read-through cache for one table's *_db_read_by_id(s) model functions.
+
+    - @cache.read_by_id / @cache.read_by_ids serve rows from the backend and
+      only query the database for IDs that are not cached.
+    - @cache.evicts(ids_from) drops the IDs touched by a write. The same IDs
+      are dropped again when the request's transaction ends, so a row read
+      before the commit (or from a rolled-back transaction) never lingers.
+    """
+
+    _backend = _MISSING
+    _instances = []
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        ReadCache._instances.append(self)
+
+    @classmethod
+    def backend(cls):
+        if cls._backend is _MISSING:
+            cls._backend = _create_backend()
+        return cls._backend
+
+    @classmethod
+    def init_app(cls, app):
+        """Replay write evictions once the request's transaction is over."""
+        app.teardown_appcontext(cls._evict_request_writes)
+
+    @staticmethod
+    def _evict_request_writes(exception=None):
+        pending = g.pop("cache_evictions", None)
+        backend = ReadCache.backend()
+        if not pending or backend is None:
+            return
+        try:
+            backend.delete_many(list(pending))
+        except Exception as e:
+            logger.warning(f"Cache eviction failed after request: {e}")
+
+    @classmethod
+    def stats(cls):
+        """Hit and miss counters for every cached table."""
+        return {
+            cache.namespace: {
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "evictions": cache.evictions,
+            }
+            for cache in cls._instances
+        }
+
+    @classmethod
+    def clear_all(cls):
+        backend = cls.backend()
+        if backend is not None:
+            backend.clear()
+
+    def _key(self, entity_id):
+        return f"{self.namespace}:{entity_id}"
+
+    def _count(self, hits=0, misses=0, evictions=0):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.evictions += evictions
+
+    def _get(self, keys):
+        backend = self.backend()
+        if backend is None:
+            return {}
+        try:
+            return backend.get_many(keys)
+        except Exception as e:
+            logger.warning(f"Cache read failed for {self.namespace}: {e}")
+            return {}
+
+    def _set(self, items, ttl=None):
+        backend = self.backend()
+        if backend is None or not items:
+            return
+        try:
+            backend.set_many(items, ttl=ttl)
+        except Exception as e:
+            logger.warning(f"Cache write failed for {self.namespace}: {e}")
+
+    def evict(self, entity_ids):
+        backend = self.backend()
+        keys = [self._key(entity_id) for entity_id in entity_ids]
+        if backend is None or not keys:
+            return
+        self._count(evictions=len(keys))
+        if has_request_context():
+            g.setdefault("cache_evictions", set()).update(keys)
+        try:
+            backend.delete_many(keys)
+        except Exception as e:
+            logger.warning(f"Cache eviction failed for {self.namespace}: {e}")
+
+    def read_by_id(self, func):
+        @wraps(func)
+        def wrapper(entity_id):
+            key = self._key(entity_id)
+            cached = self._get([key])
+            if key in cached:
+                self._count(hits=1)
+                return cached[key]
+            self._count(misses=1)
+            row = func(entity_id)
+            if row is not None:
+                self._set({key: row})
+            return row
+
+        return wrapper
+
+    def read_by_ids(self, func):
+        @wraps(func)
+        def wrapper(entity_ids):
+            if not entity_ids:
+                return func(entity_ids)
+            keys = [self._key(entity_id) for entity_id in entity_ids]
+            cached = self._get(keys)
+            missing_ids = [
+                entity_id
+                for entity_id, key in zip(entity_ids, keys)
+                if key not in cached
+            ]
+            self._count(
+                hits=len(entity_ids) - len(missing_ids), misses=len(missing_ids)
+            )
+            if not missing_ids:
+                return [cached[key] for key in dict.fromkeys(keys)]
+
+            rows = func(missing_ids)
+            self._set({self._key(row["id"]): row for row in rows if "id" in row})
+            return [cached[key] for key in dict.fromkeys(keys) if key in cached] + rows
+
+        return wrapper
+
+    def evicts(self, ids_from):
+        """
+        Evict the IDs a write touched. ids_from receives the write's
+        arguments and returns the affected IDs.
+        """
+
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.evict(ids_from(*args, **kwargs))
+
+            return wrapper
+
+        return decorator
+
+
+class QueryCache(ReadCache):
+    """
+    Cache for results computed over whole tables, such as reports, that
+    any write to those tables can change.
+
+    Such entries cannot be evicted by ID, so every key carries a generation
+    token and a write just drops the token: the next read starts a new
+    generation and entries of the old one are never read again, aging out
+    of the backend. Like row evictions, the token is dropped again when the
+    writing request ends.
+
+    - @cache.cached caches a function's result per set of arguments.
+    - @cache.invalidates starts a new generation after a write.
+    """
+
+    def __init__(self, namespace, ttl=None):
+        super().__init__(namespace)
+        self.ttl = ttl  # None uses the backend's CACHE_TTL
+
+    def _generation(self):
+        key = self._key("generation")
+        cached = self._get([key])
+        if key in cached:
+            return cached[key]
+        generation = uuid.uuid4().hex
+        self._set({key: generation}, ttl=self.ttl)
+        return generation
+
+    def invalidate(self):
+        self.evict(["generation"])
+
+    def cached(self, func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            arguments = repr((args, sorted(kwargs.items())))
+            key = self._key(f"{self._generation()}:{func.__name__}:{arguments}")
+            cached = self._get([key])
+            if key in cached:
+                self._count(hits=1)
+                return cached[key]
+            self._count(misses=1)
+            result = func(*args, **kwargs)
+            self._set({key: result}, ttl=self.ttl)
+            return result
+
+        return wrapper
+
+    def invalidates(self, func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.invalidate()
+
+        return wrapper
@@ -0,0 +1,177 @@
+import json
+import re
+import struct
+from datetime import date, datetime
+
+COPY_FORMATS = ("text", "csv", "binary")
+
+_COPY_ESCAPES = {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+_COPY_SPECIAL_RE = re.compile(r"[\\\t\n\r]")
+_CSV_QUOTE_RE = re.compile(r'[",\n\r]')
+
+# Binary COPY: signature, flags and header extension length; a -1 field count ends the data
+BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+BINARY_TRAILER = struct.pack("!h", -1)
+_BINARY_NULL = struct.pack("!i", -1)
+_POSTGRES_EPOCH = datetime(2000, 1, 1)
+
+
+def get_copy_query(table, columns, format="text"):
+    query = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    if format != "text":
+        query += f" WITH (FORMAT {format})"
+    return query
+
+
+def copy_text_value(value):
+    """One value in PostgreSQL's COPY text format."""
+    if value is None:
+        return "\\N"
+    if value is True or value is False:
+        return "t" if value else "f"
+    text = str(value)
+    if _COPY_SPECIAL_RE.search(text):
+        return _COPY_SPECIAL_RE.sub(lambda m: _COPY_ESCAPES[m.group()], text)
+    return text
+
+
+def copy_csv_value(value):
+    """
+    One value in COPY's CSV format, where an unquoted empty field is NULL, so
+    empty strings are quoted.
+    """
+    if value is None:
+        return ""
+    if value is True or value is False:
+        return "t" if value else "f"
+    text = str(value)
+    if not text or _CSV_QUOTE_RE.search(text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _timestamp(value):
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    delta = value - _POSTGRES_EPOCH
+    return struct.pack(
+        "!q", (delta.days * 86400 + delta.seconds) * 10**6 + delta.microseconds
+    )
+
+
+def _date(value):
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    return struct.pack("!i", (value - _POSTGRES_EPOCH.date()).days)
+
+
+def _text(value):
+    return str(value).encode()
+
+
+def _jsonb(value):
+    text = value if isinstance(value, str) else json.dumps(value)
+    return b"\x01" + text.encode()
+
+
+# information_schema.columns.data_type -> binary encoder
+BINARY_ENCODERS = {
+    "smallint": struct.Struct("!h").pack,
+    "integer": struct.Struct("!i").pack,
+    "bigint": struct.Struct("!q").pack,
+    "real": struct.Struct("!f").pack,
+    "double precision": struct.Struct("!d").pack,
+    "boolean": lambda value: struct.pack("!?", bool(value)),
+    "text": _text,
+    "character varying": _text,
+    "character": _text,
+    "json": lambda value: _text(value if isinstance(value, str) else json.dumps(value)),
+    "jsonb": _jsonb,
+    "date": _date,
+    "timestamp without time zone": _timestamp,
+}
+
+
+def get_binary_encoders(column_types):
+    """
+    Encoders for binary COPY, one per column type. Types outside
+    BINARY_ENCODERS (numeric, time, timestamptz...) have to be loaded in
+    text or CSV format instead.
+    """
+    unsupported = [t for t in column_types if t not in BINARY_ENCODERS]
+    if unsupported:
+        raise ValueError(
+            f"Binary COPY does not support {', '.join(sorted(set(unsupported)))} "
+            f"columns; use the text or csv format."
+        )
+    return [BINARY_ENCODERS[t] for t in column_types]
+
+
+class CopyStream:
+    """
+    A read-only file over rows for cursor.copy_expert, in COPY's text, csv
+    or binary format (binary needs one encoder per column, see
+    get_binary_encoders). Rows are encoded only as COPY reads them, so a
+    generator of any size is loaded in constant memory. rows counts the
+    rows handed out so far.
+
+    psycopg2 replaces an exception raised inside read() with a generic
+    "error in .read() call", so an error from rows, or a row that cannot be
+    encoded, ends the stream instead and is kept in error for the caller to
+    raise. first_row numbers the rows in those errors.
+    """
+
+    def __init__(self, rows, format="text", encoders=None, first_row=1):
+        if format not in COPY_FORMATS:
+            raise ValueError(f"format must be one of {', '.join(COPY_FORMATS)}")
+        self._rows = iter(rows)
+        self._format = format
+        self._encoders = encoders
+        self._buffer = BINARY_HEADER if format == "binary" else b""
+        self._done = False
+        self._first_row = first_row
+        self.rows = 0
+        self.error = None
+
+    def _encode(self, row):
+        if self._format == "text":
+            return ("\t".join(map(copy_text_value, row)) + "\n").encode()
+        if self._format == "csv":
+            return (",".join(map(copy_csv_value, row)) + "\n").encode()
+        fields = [struct.pack("!h", len(row))]
+        for encode, value in zip(self._encoders, row):
+            if value is None:
+                fields.append(_BINARY_NULL)
+            else:
+                data = encode(value)
+                fields.append(struct.pack("!i", len(data)) + data)
+        return b"".join(fields)
+
+    def read(self, size=-1):
+        chunks, length = [self._buffer], len(self._buffer)
+        while not self._done and (size is None or size < 0 or length < size):
+            try:
+                row = next(self._rows, None)
+            except Exception as e:
+                self.error, row = e, None
+            if row is not None:
+                try:
+                    data = self._encode(row)
+                except (TypeError, ValueError, struct.error) as e:
+                    number = self._first_row + self.rows
+                    self.error = ValueError(f"Row {number}: cannot encode {row!r}: {e}")
+                    row = None
+            if row is None:
+                self._done = True
+                if self._format == "binary":
+                    chunks.append(BINARY_TRAILER)
+                break
+            chunks.append(data)
+            length += len(data)
+            self.rows += 1
+        data = b"".join(chunks)
+        if size is None or size < 0:
+            self._buffer = b""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
@@ -1,3 +1,4 @@
+import random
 from datetime import datetime
 
 now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -312,3 +313,216 @@ course_schedule = [
     (4, 4, "Thursday", "3:00 PM", "Room 104", now, now, 0),
     (5, 5, "Friday", "11:00 AM", "Room 105", now, now, 0),
 ]
+
+
+# =======================
+# Synthetic data
+# =======================
+# Deterministic rows in the same shapes as the sample data above, for
+# loading a database of any size (benchmarks, load tests). IDs continue
+# after the sample rows, so both can be loaded together.
+
+FIRST_NAMES = [
+    "Alex",
+    "Amira",
+    "Ben",
+    "Chen",
+    "Diego",
+    "Elena",
+    "Fatima",
+    "Hiro",
+    "Isla",
+    "Jamal",
+    "Kai",
+    "Lena",
+    "Mateo",
+    "Nia",
+    "Omar",
+    "Priya",
+    "Quinn",
+    "Rosa",
+    "Sam",
+    "Tariq",
+    "Uma",
+    "Victor",
+    "Wei",
+    "Yara",
+    "Zoe",
+]
+LAST_NAMES = [
+    "Ahmed",
+    "Brown",
+    "Chen",
+    "Dubois",
+    "Evans",
+    "Garcia",
+    "Hassan",
+    "Ito",
+    "Jones",
+    "Khan",
+    "Lee",
+    "Martin",
+    "Nguyen",
+    "Okafor",
+    "Patel",
+    "Rossi",
+    "Singh",
+    "Tremblay",
+    "Wong",
+    "Yilmaz",
+]
+CITIES = [
+    ("Calgary", "AB"),
+    ("Edmonton", "AB"),
+    ("Vancouver", "BC"),
+    ("Victoria", "BC"),
+    ("Winnipeg", "MB"),
+    ("Toronto", "ON"),
+    ("Ottawa", "ON"),
+    ("Montreal", "QC"),
+    ("Halifax", "NS"),
+]
+COURSE_SUBJECTS = [
+    "Programming",
+    "Databases",
+    "Networks",
+    "Security",
+    "Algorithms",
+    "Cloud Computing",
+    "Operating Systems",
+    "Web Development",
+    "Testing",
+]
+GRADES = ["A+", "A", "A-", "B+", "B", "B-", "C+", "C", "D", "F"]
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+
+
+def _rng(table, seed):
+    """One generator per table, so changing one table's size leaves the others alone."""
+    return random.Random(f"{table}:{seed}")
+
+
+def generate_students(count, seed=0, start_id=None):
+    """Yield count student rows shaped like `students`."""
+    rng = _rng("students", seed)
+    start_id = start_id or len(students) + 1
+    program_ids = [row[0] for row in programs]
+    for student_id in range(start_id, start_id + count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        city, province = rng.choice(CITIES)
+        yield (
+            student_id,
+            first,
+            last,
+            f"{first}.{last}.{student_id}@school.edu".lower(),
+            f"{rng.randint(1, 9999)} {rng.choice(LAST_NAMES)} St",
+            city,
+            province,
+            "Canada",
+            rng.choice(["local", "permanent"]),
+            "active" if rng.random() < 0.9 else "inactive",
+            rng.random() < 0.3,
+            rng.random() < 0.2,
+            rng.choice(program_ids),
+            now,
+            now,
+            0,
+        )
+
+
+def generate_courses(count, seed=0, start_id=None):
+    """Yield count course rows shaped like `courses`; codes are unique."""
+    rng = _rng("courses", seed)
+    start_id = start_id or len(courses) + 1
+    term_ids = [row[0] for row in terms]
+    department_ids = [row[0] for row in departments]
+    for course_id in range(start_id, start_id + count):
+        subject = rng.choice(COURSE_SUBJECTS)
+        yield (
+            course_id,
+            f"{subject} {rng.randint(1, 4)}",
+            f"GEN{course_id:06d}",
+            rng.choice(term_ids),
+            rng.choice(department_ids),
+            now,
+            now,
+            0,
+        )
+
+
+def generate_enrollments(student_ids, course_ids, per_student=3, seed=0, start_id=None):
+    """
+    Yield enrollment rows shaped like `enrollments`: per_student distinct
+    courses for each student, a quarter of them still ungraded.
+    """
+    rng = _rng("enrollments", seed)
+    enrollment_id = start_id or len(enrollments) + 1
+    course_ids = list(course_ids)
+    per_student = min(per_student, len(course_ids))
+    for student_id in student_ids:
+        for course_id in rng.sample(course_ids, per_student):
+            grade = rng.choice(GRADES) if rng.random() < 0.75 else None
+            yield (enrollment_id, student_id, course_id, grade, now, now)
+            enrollment_id += 1
+
+
+def generate_instructors(count, seed=0, start_id=None):
+    """Yield count instructor rows shaped like `instructors`."""
+    rng = _rng("instructors", seed)
+    start_id = start_id or len(instructors) + 1
+    department_ids = [row[0] for row in departments]
+    for instructor_id in range(start_id, start_id + count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        yield (
+            instructor_id,
+            first,
+            last,
+            f"{first}.{last}.{instructor_id}@faculty.school.edu".lower(),
+            f"{rng.randint(1, 9999)} {rng.choice(LAST_NAMES)} Ave",
+            rng.choice(CITIES)[1],
+            "full-time" if rng.random() < 0.7 else "part-time",
+            "active",
+            rng.choice(department_ids),
+            now,
+            now,
+            0,
+        )
+
+
+def generate_assignments(course_ids, instructor_ids=None, seed=0, start_id=None):
+    """Yield one assignment row per course, shaped like `assignments`."""
+    rng = _rng("assignments", seed)
+    assignment_id = start_id or len(assignments) + 1
+    instructor_ids = list(instructor_ids or [row[0] for row in instructors])
+    for course_id in course_ids:
+        yield (assignment_id, rng.choice(instructor_ids), course_id, now, now, 0)
+        assignment_id += 1
+
+
+def generate_course_schedule(course_ids, seed=0, start_id=None, rooms=300):
+    """
+    Yield one weekly one-hour session per course, shaped like
+    `course_schedule`. Each course gets its own room, day and hour until
+    all rooms x 5 days x 10 hours are taken, so rooms are only double-booked
+    beyond that many courses.
+    """
+    rng = _rng("course_schedule", seed)
+    schedule_id = start_id or len(course_schedule) + 1
+    course_ids = list(course_ids)
+    slot_count = rooms * len(WEEKDAYS) * 10
+    slots = rng.sample(range(slot_count), min(len(course_ids), slot_count))
+    for index, course_id in enumerate(course_ids):
+        slot = slots[index] if index < len(slots) else rng.randrange(slot_count)
+        room, slot = divmod(slot, len(WEEKDAYS) * 10)
+        day, hour = divmod(slot, 10)
+        yield (
+            schedule_id,
+            course_id,
+            WEEKDAYS[day],
+            f"{hour + 8}:00-{hour + 9}:00",
+            f"Room {room + 100}",
+            now,
+            now,
+            0,
+        )
+        schedule_id += 1
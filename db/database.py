@@ -1,9 +1,17 @@
 import psycopg2
 import psycopg2.extras
-from psycopg2 import pool
 import logging
 import os
+import re
+import time
+import uuid
+from contextlib import contextmanager
+from itertools import islice
 from dotenv import load_dotenv
+from flask import g, has_request_context, jsonify
+from db.copy_stream import CopyStream, get_binary_encoders, get_copy_query
+from db.pool import ConnectionPool
+from db.query_stats import QueryStats, calling_function, fingerprint, slow_query_ms
 
 # Ensure environment variables from .env are loaded as early as possible so
 # Database() instances pick them up no matter the import order elsewhere in
@@ -33,17 +41,94 @@ def _check_required_env_vars(vars_list, env_type):
         raise ValueError(error_msg)
 
 
+def _get_pool_settings():
+    """Read connection pool sizing and health-check settings from the environment."""
+    return {
+        "minconn": int(os.getenv("DB_POOL_MIN", "1")),
+        "maxconn": int(os.getenv("DB_POOL_MAX", "3")),
+        "timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "recycle": float(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "ping_interval": float(os.getenv("DB_POOL_PING_INTERVAL", "30")),
+    }
+
+
 def _is_production():
     """Check if running in production environment."""
     return os.getenv("FLASK_ENV", "development") == "production"
 
 
+# Savepoint taken before every statement in a request-scoped transaction, so a
+# failing statement can be undone without aborting the rest of the request.
+# Each statement releases the previous one's, so at most one is ever open.
+_STATEMENT_SAVEPOINT = "db_statement"
+# Savepoint around a whole copy_rows, so a rejected row undoes every chunk
+_COPY_SAVEPOINT = "db_copy"
+# Bytes COPY reads from a row stream at a time
+COPY_BUFFER_SIZE = 1 << 20
+_COPY_LINE_RE = re.compile(r"COPY \w+, line (\d+)")
+# Savepoint around the EXPLAIN of a slow statement, so a failing EXPLAIN
+# cannot abort the transaction it runs in
+_EXPLAIN_SAVEPOINT = "db_explain"
+# Statements EXPLAIN accepts; anything else is logged without a plan
+_EXPLAINABLE_STATEMENTS = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+# Error for a request whose transaction had to be rolled back as a whole
+_ABORTED_REQUEST_MSG = (
+    "Database error: the request's transaction was rolled back after an error."
+)
+
+
+def _explainable(query):
+    """
+    Whether a slow statement can be explained: one statement of a kind
+    EXPLAIN accepts. EXPLAIN only covers the first statement of a string, and
+    the rest would run again.
+    """
+    text = fingerprint(query)
+    return ";" not in text and text.split(" ", 1)[0].upper() in _EXPLAINABLE_STATEMENTS
+
+
+def _row_count(result):
+    """Rows a statement returned, or for a cursor the rows it affected."""
+    if isinstance(result, list):
+        return len(result)
+    rowcount = getattr(result, "rowcount", 0)
+    return rowcount if isinstance(rowcount, int) and rowcount > 0 else 0
+
+
+def _chunks(rows, size):
+    """rows as consecutive iterators of size rows, or one iterator without a size."""
+    rows = iter(rows)
+    if not size:
+        yield rows
+        return
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _copy_error_message(error, rows_before):
+    """
+    A COPY error's message, led by the position of the rejected row in the
+    whole load; PostgreSQL reports it per COPY, as "COPY table, line N".
+    """
+    message = (error.diag.message_primary or str(error)).strip()
+    if error.diag.message_detail:
+        message += f" {error.diag.message_detail.strip()}"
+    match = _COPY_LINE_RE.search(error.diag.context or str(error))
+    if match:
+        message = f"Row {rows_before + int(match.group(1))}: {message}"
+    return message
+
+
 class Database:
     # Class-level flags to track if we've already logged the database type
     _logged_azure = False
     _logged_local = False
     _pool = None  # Connection pool
     _db_config = None  # Store config for pool creation
+    _request_scoped = False  # Set by init_app()
 
     def __init__(self):
         """
@@ -100,18 +185,151 @@ class Database:
 
             # Create connection pool once
             try:
-                Database._pool = pool.SimpleConnectionPool(
-                    1,  # minimum connections
-                    3,  # maximum connections (reduced for memory constraints)
-                    **Database._db_config,
+                pool_settings = _get_pool_settings()
+                Database._pool = ConnectionPool(**pool_settings, **Database._db_config)
+                logger.info(
+                    f"Database connection pool created "
+                    f"({pool_settings['minconn']}-{pool_settings['maxconn']} connections)"
                 )
-                logger.info("Database connection pool created (1-3 connections)")
             except Exception as e:
                 logger.error(f"Failed to create connection pool: {e}")
                 raise
 
         self.conn = None
         self.cursor = None
+        self._in_transaction = False  # Set by transaction()
+
+    @classmethod
+    def pool_stats(cls):
+        """
+        Get connection pool usage counters (in use, idle, waits, wait time).
+        """
+        return cls._pool.stats() if cls._pool else {}
+
+    @classmethod
+    def init_app(cls, app):
+        """
+        Enable request-scoped connections for a Flask app.
+        Every query made while handling a request shares one pooled connection,
+        cursor and transaction, which is committed once after the request and
+        returned to the pool on teardown.
+        """
+        cls._request_scoped = True
+        app.after_request(cls._commit_request)
+        app.teardown_appcontext(cls._release_request)
+
+    @staticmethod
+    def _record_statement(seconds, statements=1):
+        """
+        Add a statement's duration to the current request's totals, which
+        request metrics report as SQL count and DB time per request.
+        """
+        if has_request_context():
+            g.db_statements = g.get("db_statements", 0) + statements
+            g.db_seconds = g.get("db_seconds", 0.0) + seconds
+
+    @staticmethod
+    def _in_request_scope():
+        """Check if queries should join the current request's transaction."""
+        return Database._request_scoped and has_request_context()
+
+    @staticmethod
+    def _request_connection():
+        """
+        Get the request's connection and cursor, checking one out on first use.
+        Once the request's transaction has been aborted (see _abort_request),
+        further statements are refused rather than run outside it.
+        """
+        if g.get("db_failed"):
+            raise RuntimeError(_ABORTED_REQUEST_MSG)
+        if "db_conn" not in g:
+            try:
+                g.db_conn = Database._pool.getconn()
+                g.db_cursor = g.db_conn.cursor(
+                    cursor_factory=psycopg2.extras.RealDictCursor
+                )
+            except psycopg2.Error as e:
+                conn = g.pop("db_conn", None)
+                if conn is not None:
+                    Database._pool.putconn(conn)
+                logger.error(f"Error connecting to database: {e}")
+                raise
+        return g.db_conn, g.db_cursor
+
+    @staticmethod
+    def _commit_request(response):
+        """
+        Commit the request's transaction once, after the view has run. A
+        request that failed with a 5xx response is rolled back instead, so
+        none of the writes it made before failing are kept.
+        """
+        conn = g.get("db_conn")
+        if conn is None:
+            return response
+        started = time.perf_counter()
+        g.pop("db_savepoint", None)
+        if g.pop("db_failed", False):
+            response = jsonify({"error": _ABORTED_REQUEST_MSG})
+            response.status_code = 500
+        if response.status_code >= 500:
+            try:
+                conn.rollback()
+            except psycopg2.Error as e:
+                logger.error(f"Error rolling back failed request: {e}")
+            return response
+        try:
+            conn.commit()
+            Database._record_statement(time.perf_counter() - started, statements=0)
+        except psycopg2.Error as e:
+            logger.error(f"Error committing request transaction: {e}")
+            conn.rollback()
+            response = jsonify({"error": f"Database error: {str(e)}."})
+            response.status_code = 500
+        return response
+
+    @staticmethod
+    def _release_request(exception=None):
+        """
+        Roll back anything left uncommitted and return the request's
+        connection to the pool.
+        """
+        conn = g.pop("db_conn", None)
+        cursor = g.pop("db_cursor", None)
+        if conn is None:
+            return
+        try:
+            conn.rollback()
+            if cursor:
+                cursor.close()
+        except psycopg2.Error as e:
+            logger.error(f"Error releasing request connection: {e}")
+        finally:
+            Database._pool.putconn(conn)
+
+    @staticmethod
+    def _rollback_statement(conn, cursor):
+        """
+        Undo a failed statement inside the request's transaction.
+        """
+        try:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {_STATEMENT_SAVEPOINT};")
+        except psycopg2.Error:
+            # No usable savepoint, so the whole transaction has to go
+            Database._abort_request(conn)
+
+    @staticmethod
+    def _abort_request(conn):
+        """
+        Roll back the request's whole transaction and mark the request
+        failed, so earlier statements the view thinks succeeded are not
+        silently lost: _commit_request turns the response into a 500.
+        """
+        try:
+            conn.rollback()
+        except psycopg2.Error as e:
+            logger.error(f"Error rolling back request transaction: {e}")
+        g.pop("db_savepoint", None)
+        g.db_failed = True
 
     def connect(self):
         """
@@ -152,62 +370,312 @@ class Database:
                 self.conn = None
                 self.cursor = None
 
-    def execute_query(self, query, params=()):
+    @contextmanager
+    def transaction(self):
         """
-        Execute a single SQL query (PostgreSQL only).
+        Run every statement this instance makes outside a request in one
+        transaction on one connection, committed when the block ends and
+        rolled back if it raises, instead of committing each on its own.
         """
         self.connect()
+        self._in_transaction = True
         try:
-            if "?" in query:
-                query = query.replace("?", "%s")
-            self.cursor.execute(query, params)
+            yield self
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+            self.close()
+
+    @staticmethod
+    def _explain(conn, query, params):
+        """The plan of a statement, without running it, or None if it fails."""
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                f"SAVEPOINT {_EXPLAIN_SAVEPOINT}; EXPLAIN {query.strip().rstrip(';')}",
+                params,
+            )
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+            cursor.execute(f"RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT};")
+            return plan
+        except psycopg2.Error as e:
+            try:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {_EXPLAIN_SAVEPOINT};")
+            except psycopg2.Error:
+                pass
+            logger.warning(f"Could not explain slow query: {e}")
+            return None
+        finally:
+            cursor.close()
+
+    def _log_slow_query(self, conn, query, params, seconds, source):
+        """
+        Log a statement over SLOW_QUERY_MS with its plan, when params are known
+        and it is a single explainable statement.
+        """
+        plan = None
+        if params is not None and _explainable(query):
+            plan = self._explain(conn, query, params)
+        message = f"Slow query ({seconds * 1000:.1f} ms"
+        message += f", {source})" if source else ")"
+        message += f": {fingerprint(query)}"
+        if plan:
+            message += f"\n{plan}"
+        logger.warning(message)
+
+    def _run_statement(self, query, run, params=None):
+        """
+        Run one statement via run(cursor, sql) and translate database errors.
+        Inside a request (see init_app) the statement runs on the request's
+        shared connection and is committed with the rest of the request;
+        otherwise it gets its own pooled connection and is committed at once.
+
+        Every statement is timed into QueryStats under its fingerprint; one
+        slower than SLOW_QUERY_MS is logged, with its EXPLAIN plan when
+        params are given.
+        """
+        scoped = self._in_request_scope()
+        if scoped:
+            conn, cursor = self._request_connection()
+        else:
+            self.connect()
+            conn, cursor = self.conn, self.cursor
+        # Outside a request or transaction(), each statement commits on its own
+        own = not scoped and not self._in_transaction
+        source = calling_function()
+        result, elapsed, failed = None, None, True
+        started = time.perf_counter()
+        try:
+            if scoped:
+                # Sent in the same round trip as the query itself. The previous
+                # statement's savepoint is released here rather than after it
+                # ran, which would cost a round trip and reset a returned
+                # cursor's rowcount.
+                release = (
+                    f"RELEASE SAVEPOINT {_STATEMENT_SAVEPOINT}; "
+                    if g.get("db_savepoint")
+                    else ""
+                )
+                result = run(
+                    cursor, f"{release}SAVEPOINT {_STATEMENT_SAVEPOINT}; {query}"
+                )
+                g.db_savepoint = True
+            else:
+                result = run(cursor, query)
+            elapsed = time.perf_counter() - started
+            failed = False
+            if elapsed * 1000 >= slow_query_ms():
+                self._log_slow_query(conn, query, params, elapsed, source)
 
             # Only log queries in development to reduce log volume in production
             if not _is_production():
                 logger.info(f"Executed query: {query}")
 
-            if (
-                query.strip().lower().startswith("select")
-                or "returning" in query.lower()
-            ):
-                return self.cursor.fetchall()
-            else:
-                self.conn.commit()
-                return self.cursor
+            if own:
+                conn.commit()
+            return result
         except psycopg2.IntegrityError as e:
+            if scoped:
+                self._rollback_statement(conn, cursor)
             logger.warning(f"Integrity error: {e}")
             raise ValueError(f"Integrity error: {str(e)}")
         except psycopg2.Error as e:
+            if scoped:
+                self._rollback_statement(conn, cursor)
             logger.error(f"Error executing query: {e}")
             raise RuntimeError(f"Database error: {str(e)}")
         finally:
-            self.close()
+            if elapsed is None:
+                elapsed = time.perf_counter() - started
+            self._record_statement(elapsed)
+            QueryStats.record(query, elapsed, _row_count(result), failed, source)
+            if own:
+                self.close()
 
-    def execute_many(self, query, param_list):
+    def execute_query(self, query, params=()):
         """
-        Execute a query with multiple sets of parameters (bulk insert, PostgreSQL only).
+        Execute a single SQL query (PostgreSQL only).
         """
-        self.connect()
+        if "?" in query:
+            query = query.replace("?", "%s")
+
+        def run(cursor, sql):
+            cursor.execute(sql, params)
+            # Only statements that produce rows (SELECT, RETURNING...) have a description
+            return cursor.fetchall() if cursor.description is not None else cursor
+
+        return self._run_statement(query, run, params)
+
+    def execute_values(self, query, rows, page_size=None):
+        """
+        Execute a multi-row statement with psycopg2.extras.execute_values.
+        The query must contain a single VALUES %s placeholder; all rows are sent
+        in one statement (or one per page_size rows) and any RETURNING rows are
+        fetched and returned.
+        """
+        if not rows:
+            return []
+
+        def run(cursor, sql):
+            return psycopg2.extras.execute_values(
+                cursor, sql, rows, page_size=page_size or len(rows), fetch=True
+            )
+
+        return self._run_statement(query, run)
+
+    def stream_query(self, query, params=(), batch_size=1000):
+        """
+        Stream the rows of a SELECT query through a server-side (named) cursor.
+        Rows are fetched in batches of batch_size so memory stays flat no matter
+        how large the result is. Uses its own pooled connection, held until the
+        generator is exhausted or closed.
+        """
+        conn = Database._pool.getconn()
+        cursor = None
         try:
             if "?" in query:
                 query = query.replace("?", "%s")
-            self.cursor.executemany(query, param_list)
-            self.conn.commit()
+            cursor = conn.cursor(
+                name=f"stream_{uuid.uuid4().hex}",
+                cursor_factory=psycopg2.extras.RealDictCursor,
+            )
+            cursor.itersize = batch_size
+            cursor.execute(query, params)
 
-            # Only log in development to reduce log volume in production
+            # Only log queries in development to reduce log volume in production
             if not _is_production():
-                logger.info(f"Executed many: {query}")
+                logger.info(f"Streaming query: {query}")
 
-            return self.cursor
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
         except psycopg2.Error as e:
-            logger.error(f"Error executing many: {e}")
-            return None
+            logger.error(f"Error streaming query: {e}")
+            raise RuntimeError(f"Database error: {str(e)}")
         finally:
-            self.close()
+            try:
+                if cursor is not None:
+                    cursor.close()
+                conn.commit()
+            except psycopg2.Error as e:
+                logger.error(f"Error closing streaming cursor: {e}")
+            Database._pool.putconn(conn)
+
+    def execute_many(self, query, param_list):
+        """
+        Execute a query once per set of parameters (PostgreSQL only). Each set
+        is a round trip; use execute_values or copy_rows for bulk loads.
+        """
+        if "?" in query:
+            query = query.replace("?", "%s")
+
+        def run(cursor, sql):
+            cursor.executemany(sql, param_list)
+            return cursor
+
+        return self._run_statement(query, run)
+
+    def _column_types(self, table, columns):
+        """PostgreSQL types of table's columns, in the order given."""
+        rows = self.execute_query(
+            """
+            SELECT column_name, data_type FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = %s;
+            """,
+            (table,),
+        )
+        types = {row["column_name"]: row["data_type"] for row in rows or []}
+        unknown = [column for column in columns if column not in types]
+        if unknown:
+            raise ValueError(f"Unknown column for {table}: {', '.join(unknown)}")
+        return [types[column] for column in columns]
+
+    def copy_rows(self, table, columns, rows, format="text", chunk_size=None):
+        """
+        Bulk-load rows, tuples in column order, from any iterable with
+        COPY ... FROM STDIN in text, csv or binary format. Rows are encoded as
+        PostgreSQL reads them, so memory stays flat however many there are;
+        with chunk_size they are sent as one COPY per chunk_size rows.
+
+        Either every row is loaded or none: inside a request the chunks share
+        a savepoint in the request's transaction, otherwise they share one
+        transaction. A row PostgreSQL rejects raises ValueError (a constraint
+        or a bad value) or RuntimeError, naming its 1-based position in rows;
+        an exception raised by rows itself is re-raised as it is. Returns the
+        number of rows loaded.
+        """
+        encoders = None
+        if format == "binary":
+            encoders = get_binary_encoders(self._column_types(table, columns))
+        query = get_copy_query(table, columns, format)
+
+        scoped = self._in_request_scope()
+        if scoped:
+            conn, cursor = self._request_connection()
+            cursor.execute(f"SAVEPOINT {_COPY_SAVEPOINT};")
+        else:
+            self.connect()
+            conn, cursor = self.conn, self.cursor
+        own = not scoped and not self._in_transaction
+        source = calling_function()
+        loaded = 0
+        try:
+            for chunk in _chunks(rows, chunk_size):
+                stream = CopyStream(chunk, format, encoders, first_row=loaded + 1)
+                started, failed = time.perf_counter(), True
+                try:
+                    cursor.copy_expert(query, stream, size=COPY_BUFFER_SIZE)
+                    failed = False
+                finally:
+                    elapsed = time.perf_counter() - started
+                    self._record_statement(elapsed)
+                    QueryStats.record(query, elapsed, stream.rows, failed, source)
+                if stream.error:
+                    raise stream.error
+                loaded += stream.rows
+
+            if scoped:
+                cursor.execute(f"RELEASE SAVEPOINT {_COPY_SAVEPOINT};")
+            elif own:
+                conn.commit()
+            # Only log in development to reduce log volume in production
+            if not _is_production():
+                logger.info(f"Copied {loaded} rows into {table}.")
+            return loaded
+        except Exception as e:
+            # An error from rows ends its COPY early, so undo what it did load
+            if scoped:
+                try:
+                    cursor.execute(f"ROLLBACK TO SAVEPOINT {_COPY_SAVEPOINT};")
+                except psycopg2.Error:
+                    self._abort_request(conn)
+            elif own:
+                conn.rollback()
+            if not isinstance(e, psycopg2.Error):
+                raise
+            message = _copy_error_message(e, loaded)
+            if isinstance(e, psycopg2.IntegrityError):
+                logger.warning(f"Integrity error: {message}")
+                raise ValueError(f"Integrity error: {message}")
+            if isinstance(e, psycopg2.DataError):
+                logger.warning(f"Invalid data: {message}")
+                raise ValueError(f"Invalid data: {message}")
+            logger.error(f"Error copying rows: {message}")
+            raise RuntimeError(f"Database error: {message}")
+        finally:
+            if own:
+                self.close()
 
     def execute_script(self, script):
         """
         Execute multiple SQL commands from a script (PostgreSQL only).
+        The script runs in one transaction: if any command fails, nothing
+        is applied and RuntimeError is raised.
         """
         self.connect()
         try:
@@ -222,7 +690,9 @@ class Database:
                 logger.info(f"Executed script with multiple SQL commands.")
 
         except psycopg2.Error as e:
+            self.conn.rollback()
             logger.error(f"Error executing script: {e}")
+            raise RuntimeError(f"Database error: {str(e)}")
         finally:
             self.close()
 
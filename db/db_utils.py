@@ -1,6 +1,12 @@
+import json
+from datetime import date
+
 # PostgreSQL boolean constants
 BOOLEAN_TRUE = "TRUE"
 
+# Bookkeeping columns every table has besides its *_COLUMNS
+BASE_FIELDS = ["id", "created_at", "updated_at", "is_archived"]
+
 
 def get_insert_returning_query(table, columns, returning_column="id"):
     """
@@ -12,6 +18,134 @@ def get_insert_returning_query(table, columns, returning_column="id"):
     return f"{base_query} RETURNING {returning_column};"
 
 
+def get_insert_many_query(table, columns, returning_column="*"):
+    """
+    Get a multi-row INSERT query for psycopg2.extras.execute_values (VALUES %s)
+    """
+    column_names = ", ".join(columns)
+    return (
+        f"INSERT INTO {table} ({column_names}) VALUES %s RETURNING {returning_column};"
+    )
+
+
+def get_update_many_query(table, columns):
+    """
+    Get a single UPDATE ... FROM query that applies many rows at once (PostgreSQL only).
+    Rows are passed as one JSON array (see get_update_many_params) and typed by
+    json_populate_recordset against the table's own row type.
+    """
+    assignments = ", ".join(f"{column} = v.{column}" for column in columns)
+    archived_condition = get_archived_condition(False)
+    return f"""
+    UPDATE {table} AS t
+    SET {assignments}, updated_at = CURRENT_TIMESTAMP
+    FROM json_populate_recordset(NULL::{table}, %s) AS v
+    WHERE t.id = v.id AND t.{archived_condition}
+    RETURNING t.*;
+    """
+
+
+def get_update_many_params(columns, id_row_pairs):
+    """
+    Build the JSON array param for get_update_many_query from (id, row) pairs
+    """
+    records = [
+        {"id": entity_id, **dict(zip(columns, row))} for entity_id, row in id_row_pairs
+    ]
+    return (json.dumps(records, default=str),)
+
+
+def get_archive_many_query(table, extra_assignments=""):
+    """
+    Get a single UPDATE that archives every active row whose ID is in the
+    %s array (PostgreSQL only). IDs that are missing or already archived
+    are simply not returned.
+    """
+    archived_condition = get_archived_condition(False)
+    extra = f"{extra_assignments}, " if extra_assignments else ""
+    return f"""
+    UPDATE {table}
+    SET is_archived = {BOOLEAN_TRUE}, {extra}updated_at = CURRENT_TIMESTAMP
+    WHERE id = ANY(%s) AND {archived_condition}
+    RETURNING *;
+    """
+
+
+def get_version_query(table):
+    """
+    Get a query for a table's max(updated_at) and row count, used as the
+    version stamp for conditional GETs. Callers append their own WHERE clause.
+    Counting reads every row, so the routes only ask for it on the first page
+    of an unfiltered list (see wants_list_validators).
+    """
+    return (
+        f"SELECT MAX(updated_at) AS last_modified, COUNT(*) AS row_count FROM {table}"
+    )
+
+
+def get_grade_stats_lock_query(stats_table, per_key=True):
+    """
+    Get a statement that serializes grade statistics refreshes, to run just
+    before get_grade_stats_refresh_query in the same transaction. The refresh
+    recomputes whole aggregates, so two writers refreshing the same key from
+    their own snapshots would let the later commit overwrite the newer value.
+
+    Per key, it takes a transaction-level advisory lock for each of the IDs in
+    a %s list, in ID order so concurrent refreshes cannot deadlock. Otherwise
+    (a full rebuild) it locks the stats table against concurrent refreshes.
+    Under READ COMMITTED the refresh, as the next statement, then takes its
+    snapshot after the other writer has committed.
+    """
+    if not per_key:
+        return f"LOCK TABLE {stats_table} IN EXCLUSIVE MODE;"
+    return f"""
+    SELECT pg_advisory_xact_lock('{stats_table}'::regclass::oid::int, k.id)
+    FROM (SELECT DISTINCT id FROM UNNEST(%s::int[]) AS u(id) ORDER BY id) AS k;
+    """
+
+
+def get_grade_stats_refresh_query(
+    stats_table, key_column, keys_sql="UNNEST(%s::int[])"
+):
+    """
+    Get an upsert that recomputes grade statistics (GPA, graded count and grade
+    distribution) for the keys produced by keys_sql, e.g. a list of student IDs
+    or "SELECT id FROM students" for a full rebuild. Grades are normalized with
+    UPPER(TRIM()) and mapped through the grade_points table.
+    """
+    archived_condition = get_archived_condition(False)
+    return f"""
+    INSERT INTO {stats_table} ({key_column}, gpa, graded_count, distribution, updated_at)
+    SELECT
+        k.id,
+        ROUND(AVG(gp.points), 2),
+        COUNT(gp.points),
+        COALESCE(
+            (
+                SELECT jsonb_object_agg(d.grade, d.n)
+                FROM (
+                    SELECT UPPER(TRIM(e2.grade)) AS grade, COUNT(*) AS n
+                    FROM enrollments e2
+                    WHERE e2.{key_column} = k.id AND e2.{archived_condition}
+                    AND COALESCE(TRIM(e2.grade), '') <> ''
+                    GROUP BY 1
+                ) d
+            ),
+            '{{}}'::jsonb
+        ),
+        CURRENT_TIMESTAMP
+    FROM {keys_sql} AS k(id)
+    LEFT JOIN enrollments e ON e.{key_column} = k.id AND e.{archived_condition}
+    LEFT JOIN grade_points gp ON gp.grade = UPPER(TRIM(e.grade))
+    GROUP BY k.id
+    ON CONFLICT ({key_column}) DO UPDATE SET
+        gpa = EXCLUDED.gpa,
+        graded_count = EXCLUDED.graded_count,
+        distribution = EXCLUDED.distribution,
+        updated_at = EXCLUDED.updated_at;
+    """
+
+
 def handle_insert_result(result):
     """
     Handle the result of an INSERT operation for PostgreSQL
@@ -24,3 +158,79 @@ def get_archived_condition(archived_value=False):
     Get the appropriate condition for checking archived status (PostgreSQL only)
     """
     return f"is_archived = {str(archived_value).upper()}"
+
+
+def get_keyset_pagination(has_where=False, limit=None, after_id=None, column="id"):
+    """
+    Get a keyset pagination clause (id > after_id ORDER BY id LIMIT n) and its params.
+    Pass column to page on a qualified key such as "e.id" in joins.
+    """
+    if limit is None and after_id is None:
+        return "", ()
+
+    clause = ""
+    params = []
+    if after_id is not None:
+        clause += f" {'AND' if has_where else 'WHERE'} {column} > %s"
+        params.append(after_id)
+    clause += f" ORDER BY {column}"
+    if limit is not None:
+        clause += " LIMIT %s"
+        params.append(limit)
+    return clause, tuple(params)
+
+
+def _parse_filter_value(column, raw, value_type):
+    if value_type is bool:
+        if raw.lower() not in ("true", "false"):
+            raise ValueError(f"{column} must be true or false")
+        return raw.lower() == "true"
+    if value_type is int:
+        if not raw.isdigit():
+            raise ValueError(f"{column} must be an integer")
+        return int(raw)
+    if value_type is date:
+        try:
+            return date.fromisoformat(raw)
+        except ValueError:
+            raise ValueError(f"{column} must be a date (YYYY-MM-DD)")
+    return raw
+
+
+def get_filter_conditions(filters, allowed):
+    """
+    Compile ?column=value filters into parameterized equality conditions.
+    `allowed` maps each filterable column to its type (int, bool, date or str);
+    any other column is rejected. A comma-separated value matches any of them.
+    """
+    conditions = []
+    params = []
+    for column, raw in (filters or {}).items():
+        if column not in allowed:
+            raise ValueError(f"Unknown filter: {column}")
+        values = [
+            _parse_filter_value(column, value.strip(), allowed[column])
+            for value in raw.split(",")
+        ]
+        if len(values) == 1:
+            conditions.append(f"{column} = %s")
+            params.append(values[0])
+        else:
+            conditions.append(f"{column} = ANY(%s)")
+            params.append(values)
+    return conditions, tuple(params)
+
+
+def get_select_columns(fields, allowed, table_alias=None):
+    """
+    Get the column list for a sparse fieldset, or * when no fields are asked for.
+    id is always selected so keyset pagination keeps working. Pass table_alias
+    to qualify the columns in a join.
+    """
+    prefix = f"{table_alias}." if table_alias else ""
+    if not fields:
+        return f"{prefix}*"
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown field: {', '.join(unknown)}")
+    return ", ".join(prefix + field for field in dict.fromkeys(["id", *fields]))
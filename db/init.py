@@ -1,16 +1,114 @@
 #!/usr/bin/env python3
 """
 Database Initialization Script
-This script initializes the database with the schema and sample data.
+This script initializes the database with the schema and sample data, and
+optionally a synthetic dataset of any size on top of it:
+
+    python db/init.py --students 200000 --courses 2000 --enrollments-per-student 10
 """
 
+import argparse
 import os
 import sys
+import time
 
 sys.path.append(".")
 
 from db.database import Database
 
+# Columns of every table loaded with sample or synthetic rows, in row order
+TABLE_COLUMNS = {
+    "departments": ["id", "name", "created_at", "updated_at", "is_archived"],
+    "programs": [
+        "id",
+        "name",
+        "type",
+        "department_id",
+        "created_at",
+        "updated_at",
+        "is_archived",
+    ],
+    "terms": ["id", "name", "start_date", "end_date", "created_at", "updated_at"],
+    "instructors": [
+        "id",
+        "first_name",
+        "last_name",
+        "email",
+        "address",
+        "province",
+        "employment",
+        "status",
+        "department_id",
+        "created_at",
+        "updated_at",
+        "is_archived",
+    ],
+    "students": [
+        "id",
+        "first_name",
+        "last_name",
+        "email",
+        "address",
+        "city",
+        "province",
+        "country",
+        "address_type",
+        "status",
+        "coop",
+        "is_international",
+        "program_id",
+        "created_at",
+        "updated_at",
+        "is_archived",
+    ],
+    "courses": [
+        "id",
+        "title",
+        "code",
+        "term_id",
+        "department_id",
+        "created_at",
+        "updated_at",
+        "is_archived",
+    ],
+    "assignments": [
+        "id",
+        "instructor_id",
+        "course_id",
+        "created_at",
+        "updated_at",
+        "is_archived",
+    ],
+    "course_schedule": [
+        "id",
+        "course_id",
+        "day",
+        "time",
+        "room",
+        "created_at",
+        "updated_at",
+        "is_archived",
+    ],
+    "enrollments": [
+        "id",
+        "student_id",
+        "course_id",
+        "grade",
+        "created_at",
+        "updated_at",
+    ],
+}
+
+# Tables populate_synthetic_data generates rows for
+SYNTHETIC_TABLES = (
+    "instructors",
+    "students",
+    "courses",
+    "assignments",
+    "course_schedule",
+    "enrollments",
+)
+
 
 def init_database():
     """Initialize database with schema"""
@@ -29,6 +127,7 @@ def init_database():
         # Execute the schema
         db.execute_script(schema_sql)
         print("✅ Schema created successfully!")
+        init_trigram_search(db)
 
         # Verify tables were created
         tables_query = """
@@ -51,158 +150,202 @@ def init_database():
         return False
 
 
+def init_trigram_search(db):
+    """
+    Create pg_trgm and the substring search indexes. They run on their own,
+    after the schema, so a server that does not allow the extension keeps
+    the rest of the schema; search then matches word prefixes only.
+    Returns whether the extension is set up.
+    """
+    try:
+        with open("db/trigram.sql", "r") as f:
+            db.execute_script(f.read())
+    except RuntimeError as e:
+        print(f"⚠️  pg_trgm unavailable, search will match word prefixes only: {e}")
+        return False
+    print("✅ Trigram search indexes created.")
+    return True
+
+
+def load_rows(db, table, rows):
+    """
+    Stream rows into table with COPY, then move the table's ID sequence past
+    them. Returns the number of rows.
+    """
+    count = db.copy_rows(table, TABLE_COLUMNS[table], rows)
+    db.execute_query(f"SELECT setval('{table}_id_seq', (SELECT MAX(id) FROM {table}));")
+    return count
+
+
 def populate_sample_data():
     """Populate database with sample data"""
     print("\n🌱 Populating sample data...")
 
     try:
         db = Database()
-        from db.data import (
-            departments,
-            programs,
-            instructors,
-            terms,
-            courses,
-            students,
-            enrollments,
-            assignments,
-            course_schedule,
-        )
-
-        # Insert departments (convert boolean)
-        departments_pg = [
-            tuple(bool(v) if i == 4 else v for i, v in enumerate(row))
-            for row in departments
-        ]
-        db.execute_many(
-            "INSERT INTO departments (id, name, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s)",
-            departments_pg,
-        )
-
-        db.execute_query(
-            "SELECT setval('departments_id_seq', (SELECT MAX(id) FROM departments));"
-        )
+        from db import data
 
-        # Insert programs (convert boolean)
-        programs_pg = [
-            tuple(bool(v) if i == 6 else v for i, v in enumerate(row))
-            for row in programs
-        ]
-        db.execute_many(
-            "INSERT INTO programs (id, name, type, department_id, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s, %s, %s)",
-            programs_pg,
+        # Sample rows have fixed IDs, so they can only be loaded once
+        existing = db.execute_query(
+            "SELECT EXISTS (SELECT 1 FROM departments) AS loaded;"
         )
+        if existing and existing[0]["loaded"]:
+            print("✅ Sample data already present, skipping.")
+            return True
 
-        db.execute_query(
-            "SELECT setval('programs_id_seq', (SELECT MAX(id) FROM programs));"
-        )
+        # Parents before children, for the foreign keys
+        for table in TABLE_COLUMNS:
+            load_rows(db, table, getattr(data, table))
 
-        # Insert instructors (convert boolean)
-        instructors_pg = [
-            tuple(bool(v) if i == 11 else v for i, v in enumerate(row))
-            for row in instructors
-        ]
-        db.execute_many(
-            "INSERT INTO instructors (id, first_name, last_name, email, address, province, employment, status, department_id, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
-            instructors_pg,
-        )
+        # Sample rows bypass the models, so compute grade statistics in one pass
+        from app.models.grade_stats import grade_stats_db_rebuild
 
-        db.execute_query(
-            "SELECT setval('instructors_id_seq', (SELECT MAX(id) FROM instructors));"
-        )
+        grade_stats_db_rebuild()
 
-        # Insert terms
-        db.execute_many(
-            "INSERT INTO terms (id, name, start_date, end_date, created_at, updated_at) VALUES (%s, %s, %s, %s, %s, %s)",
-            terms,
-        )
+        # ... and count the seats taken in each course
+        from app.models.course import course_db_recount_enrolled
 
-        db.execute_query("SELECT setval('terms_id_seq', (SELECT MAX(id) FROM terms));")
+        course_db_recount_enrolled()
 
-        # Insert courses (convert boolean)
-        courses_pg = [
-            tuple(bool(v) if i == 7 else v for i, v in enumerate(row))
-            for row in courses
-        ]
-        db.execute_many(
-            "INSERT INTO courses (id, title, code, term_id, department_id, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
-            courses_pg,
-        )
+        print("✅ Sample data populated successfully!")
+        return True
 
-        db.execute_query(
-            "SELECT setval('courses_id_seq', (SELECT MAX(id) FROM courses));"
-        )
+    except Exception as e:
+        print(f"❌ Error populating sample data: {e}")
+        return False
 
-        # Insert students (convert Python bools to PostgreSQL bools, force is_archived to False)
-        # Map sample data to database schema structure
-        students_pg = [
-            tuple(
-                list(row[:10])  # First 10 fields (id through status)
-                + [bool(row[10])]  # coop (convert to bool)
-                + [bool(row[11])]  # is_international (convert to bool)
-                + [row[12]]  # program_id
-                + list(row[13:15])  # created_at, updated_at
-                + [False]  # is_archived (force to False)
-            )
-            for row in students
-        ]
-        db.execute_many(
-            "INSERT INTO students (id, first_name, last_name, email, address, city, province, country, address_type, status, coop, is_international, program_id, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
-            students_pg,
-        )
 
-        # Reset students sequence to max ID after inserting with explicit IDs
-        db.execute_query(
-            "SELECT setval('students_id_seq', (SELECT MAX(id) FROM students));"
-        )
+def populate_synthetic_data(students, courses, enrollments_per_student=10, seed=0):
+    """
+    Add a synthetic dataset on top of the sample data: `students` students,
+    `courses` courses each with an instructor assignment and a weekly
+    session, one instructor per four courses, and enrollments_per_student
+    distinct courses per student. The same arguments always produce the
+    same rows; IDs continue after the rows already in each table. The rows
+    are loaded in one transaction, so a failed run loads nothing.
+    """
+    print(f"\n🏗️  Generating {students} students and {courses} courses...")
 
-        # Insert enrollments
-        db.execute_many(
-            "INSERT INTO enrollments (id, student_id, course_id, grade, created_at, updated_at) VALUES (%s, %s, %s, %s, %s, %s)",
-            enrollments,
-        )
+    try:
+        from db import data
 
-        db.execute_query(
-            "SELECT setval('enrollments_id_seq', (SELECT MAX(id) FROM enrollments));"
-        )
+        db = Database()
 
-        # Insert assignments (convert boolean)
-        assignments_pg = [
-            tuple(bool(v) if i == 5 else v for i, v in enumerate(row))
-            for row in assignments
-        ]
-        db.execute_many(
-            "INSERT INTO assignments (id, instructor_id, course_id, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s, %s)",
-            assignments_pg,
+        # Every run generates instructors (and courses, when asked for), so
+        # either shows an earlier run was loaded
+        existing = db.execute_query(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM instructors WHERE email LIKE '%@faculty.school.edu'
+            ) OR EXISTS (SELECT 1 FROM courses WHERE code LIKE 'GEN%') AS loaded;
+            """
         )
-
-        db.execute_query(
-            "SELECT setval('assignments_id_seq', (SELECT MAX(id) FROM assignments));"
+        if existing and existing[0]["loaded"]:
+            print("✅ Synthetic data already present, skipping.")
+            return True
+
+        # Start after whatever is there, sample data or rows added since
+        last_ids = db.execute_query(
+            "SELECT "
+            + ", ".join(
+                f"(SELECT COALESCE(MAX(id), 0) FROM {table}) AS {table}"
+                for table in SYNTHETIC_TABLES
+            )
+            + ";"
+        )[0]
+        start_ids = {table: last_ids[table] + 1 for table in SYNTHETIC_TABLES}
+
+        started = time.perf_counter()
+        instructor_count = max(1, courses // 4)
+        instructor_ids = range(
+            start_ids["instructors"], start_ids["instructors"] + instructor_count
         )
-
-        # Insert course_schedule (convert boolean)
-        course_schedule_pg = [
-            tuple(bool(v) if i == 7 else v for i, v in enumerate(row))
-            for row in course_schedule
+        course_ids = range(start_ids["courses"], start_ids["courses"] + courses)
+        student_ids = range(start_ids["students"], start_ids["students"] + students)
+
+        tables = [
+            (
+                "instructors",
+                data.generate_instructors(
+                    instructor_count, seed, start_ids["instructors"]
+                ),
+            ),
+            (
+                "students",
+                data.generate_students(students, seed, start_ids["students"]),
+            ),
+            ("courses", data.generate_courses(courses, seed, start_ids["courses"])),
+            (
+                "assignments",
+                data.generate_assignments(
+                    course_ids, instructor_ids, seed, start_ids["assignments"]
+                ),
+            ),
+            (
+                "course_schedule",
+                data.generate_course_schedule(
+                    course_ids, seed, start_ids["course_schedule"]
+                ),
+            ),
         ]
-        db.execute_many(
-            "INSERT INTO course_schedule (id, course_id, day, time, room, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
-            course_schedule_pg,
-        )
-
-        db.execute_query(
-            "SELECT setval('course_schedule_id_seq', (SELECT MAX(id) FROM course_schedule));"
-        )
-
-        print("✅ Sample data populated successfully!")
+        if courses:
+            tables.append(
+                (
+                    "enrollments",
+                    data.generate_enrollments(
+                        student_ids,
+                        course_ids,
+                        enrollments_per_student,
+                        seed,
+                        start_ids["enrollments"],
+                    ),
+                )
+            )
+        # One transaction, so a failure partway leaves nothing for the rerun
+        # check above to mistake for a finished load
+        with db.transaction():
+            for table, rows in tables:
+                table_started = time.perf_counter()
+                count = load_rows(db, table, rows)
+                print(
+                    f"  - {table}: {count} rows in "
+                    f"{time.perf_counter() - table_started:.1f}s"
+                )
+
+        # Generated rows bypass the models, like the sample data
+        from app.models.grade_stats import grade_stats_db_rebuild
+        from app.models.course import course_db_recount_enrolled
+
+        grade_stats_db_rebuild()
+        course_db_recount_enrolled()
+        db.execute_query("ANALYZE;")
+
+        print(f"✅ Synthetic data populated in {time.perf_counter() - started:.1f}s!")
         return True
 
     except Exception as e:
-        print(f"❌ Error populating sample data: {e}")
+        print(f"❌ Error populating synthetic data: {e}")
         return False
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Initialize the database.")
+    parser.add_argument(
+        "--students",
+        type=int,
+        default=0,
+        help="synthetic students to add to the sample data (default: none)",
+    )
+    parser.add_argument("--courses", type=int, default=0)
+    parser.add_argument("--enrollments-per-student", type=int, default=10)
+    parser.add_argument(
+        "--seed", type=int, default=0, help="same seed, same synthetic rows"
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
+    args = parse_args()
     print("Database Setup")
     print("=" * 40)
 
@@ -213,6 +356,11 @@ if __name__ == "__main__":
         # Populate sample data
         data_ok = populate_sample_data()
 
+        if data_ok and (args.students or args.courses):
+            data_ok = populate_synthetic_data(
+                args.students, args.courses, args.enrollments_per_student, args.seed
+            )
+
         if data_ok:
             print("\n🎉 Database setup complete!")
             sys.exit(0)
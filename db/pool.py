@@ -0,0 +1,207 @@
+import logging
+import threading
+import time
+from collections import deque
+
+import psycopg2
+from psycopg2 import extensions
+from psycopg2.pool import PoolError
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(PoolError):
+    """Raised when no connection becomes available within the acquire timeout."""
+
+
+class ConnectionPool:
+    """
+    Thread-safe PostgreSQL connection pool.
+
+    - Keeps between minconn and maxconn connections open.
+    - getconn() blocks up to `timeout` seconds when every connection is in use.
+    - Connections older than `recycle` seconds are replaced on checkout.
+    - Connections idle longer than `ping_interval` seconds are pinged with
+      SELECT 1 on checkout, and replaced if the server has dropped them.
+    - stats() reports usage and wait counters for sizing the pool.
+    """
+
+    def __init__(
+        self,
+        minconn,
+        maxconn,
+        timeout=30.0,
+        recycle=1800.0,
+        ping_interval=30.0,
+        **conn_kwargs,
+    ):
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ValueError(
+                f"Invalid pool size: min={minconn}, max={maxconn} "
+                "(expected 0 <= min <= max and max >= 1)"
+            )
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self.recycle = recycle
+        self.ping_interval = ping_interval
+        self._conn_kwargs = conn_kwargs
+
+        self._lock = threading.Condition()
+        self._idle = deque()  # (conn, created_at, last_used_at), most recent last
+        self._in_use = {}  # id(conn) -> created_at
+        self._size = 0  # open connections plus connections being opened
+        self._closed = False
+
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._timeouts = 0
+        self._recycled = 0
+
+        for _ in range(minconn):
+            conn = self._connect()
+            self._size += 1
+            self._idle.append((conn, time.monotonic(), time.monotonic()))
+
+    def _connect(self):
+        return psycopg2.connect(**self._conn_kwargs)
+
+    def _discard(self, conn):
+        """Close a connection that will not go back to the pool."""
+        try:
+            if not conn.closed:
+                conn.close()
+        except psycopg2.Error:
+            pass
+
+    def _is_usable(self, conn, created_at, last_used_at):
+        """Check an idle connection before handing it out."""
+        now = time.monotonic()
+        if conn.closed:
+            return False
+        if self.recycle and now - created_at > self.recycle:
+            with self._lock:
+                self._recycled += 1
+            return False
+        if now - last_used_at >= self.ping_interval:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1;")
+                conn.rollback()
+            except psycopg2.Error as e:
+                logger.warning(f"Discarding stale pooled connection: {e}")
+                return False
+        return True
+
+    def getconn(self, timeout=None):
+        """
+        Check out a connection, waiting up to `timeout` seconds (defaults to
+        the pool timeout) for one to be returned when the pool is exhausted.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        waited = False
+
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise PoolError("connection pool is closed")
+                if self._idle or self._size < self.maxconn:
+                    break
+                remaining = timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeout(
+                        f"No database connection available after {timeout}s "
+                        f"({self.maxconn} in use)"
+                    )
+                waited = True
+                self._lock.wait(remaining)
+
+            if self._idle:
+                conn, created_at, last_used_at = self._idle.pop()
+            else:
+                conn, created_at, last_used_at = None, None, None
+                self._size += 1  # reserve a slot, connect outside the lock
+
+        # Health checks and connects happen outside the lock so one slow
+        # server round trip does not block every other thread.
+        if conn is not None and not self._is_usable(conn, created_at, last_used_at):
+            self._discard(conn)
+            conn = None
+        if conn is None:
+            try:
+                conn = self._connect()
+                created_at = time.monotonic()
+            except psycopg2.Error:
+                with self._lock:
+                    self._size -= 1
+                    self._lock.notify()
+                raise
+
+        with self._lock:
+            self._in_use[id(conn)] = created_at
+            self._checkouts += 1
+            if waited:
+                wait_time = time.monotonic() - start
+                self._waits += 1
+                self._wait_time += wait_time
+                self._max_wait_time = max(self._max_wait_time, wait_time)
+        return conn
+
+    def putconn(self, conn, close=False):
+        """
+        Return a connection to the pool. Broken connections, or any returned
+        with close=True, are closed instead and their slot is freed.
+        """
+        with self._lock:
+            created_at = self._in_use.pop(id(conn), None)
+        if created_at is None:
+            raise PoolError("trying to put unkeyed connection")
+
+        if not close and not conn.closed:
+            try:
+                status = conn.get_transaction_status()
+                if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                    close = True
+                elif status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except psycopg2.Error:
+                close = True
+
+        with self._lock:
+            if close or conn.closed or self._closed:
+                self._discard(conn)
+                self._size -= 1
+            else:
+                self._idle.append((conn, created_at, time.monotonic()))
+            self._lock.notify()
+
+    def closeall(self):
+        """Close every idle connection and refuse further checkouts."""
+        with self._lock:
+            self._closed = True
+            while self._idle:
+                conn, _, _ = self._idle.pop()
+                self._discard(conn)
+                self._size -= 1
+            self._lock.notify_all()
+
+    def stats(self):
+        """Snapshot of pool usage counters."""
+        with self._lock:
+            return {
+                "min": self.minconn,
+                "max": self.maxconn,
+                "size": self._size,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "wait_time_total": round(self._wait_time, 6),
+                "wait_time_max": round(self._max_wait_time, 6),
+                "timeouts": self._timeouts,
+                "recycled": self._recycled,
+            }
@@ -0,0 +1,141 @@
+import logging
+import os
+import re
+import sys
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Latencies kept per fingerprint for percentiles; older ones are dropped
+SAMPLES_PER_FINGERPRINT = 1000
+# Distinct fingerprints tracked; statements beyond this are counted as "other"
+MAX_FINGERPRINTS = 500
+OTHER_FINGERPRINT = "(other)"
+
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_RE = re.compile(r"%s|%\(\w+\)s|\?")
+_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_ROWS_RE = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+
+
+def fingerprint(query):
+    """
+    Normalize a statement so calls that differ only in their values share
+    one fingerprint: literals and placeholders become ?, and any list of
+    them, such as the IN (%s, %s, ...) lists of the *_db_read_by_ids
+    functions or multi-row VALUES, collapses to (...).
+    """
+    text = _COMMENT_RE.sub(" ", query)
+    text = _STRING_RE.sub("?", text)
+    text = _PLACEHOLDER_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = " ".join(text.split())
+    text = _LIST_RE.sub("(...)", text)
+    text = _ROWS_RE.sub("(...)", text)
+    return text.rstrip("; ")
+
+
+def calling_function():
+    """
+    The model function that issued the current statement, e.g.
+    app.models.student.student_db_read_by_ids, or None outside the models.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("app.models"):
+            return f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def _percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def slow_query_ms():
+    """Statements slower than this many milliseconds are logged with their plan."""
+    return float(os.getenv("SLOW_QUERY_MS", "200"))
+
+
+class QueryStats:
+    """
+    In-process statistics per statement fingerprint: calls, errors, rows,
+    total time and latency percentiles over the most recent calls, plus the
+    model functions the statement was issued from. Shared by every Database
+    instance in the process.
+    """
+
+    _lock = threading.Lock()
+    _entries = {}
+
+    @classmethod
+    def record(cls, query, seconds, rows=0, error=False, source=None):
+        key = fingerprint(query)
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                if len(cls._entries) >= MAX_FINGERPRINTS:
+                    key = OTHER_FINGERPRINT
+                    entry = cls._entries.get(key)
+                if entry is None:
+                    entry = cls._entries[key] = {
+                        "calls": 0,
+                        "errors": 0,
+                        "rows": 0,
+                        "total_seconds": 0.0,
+                        "max_seconds": 0.0,
+                        "samples": deque(maxlen=SAMPLES_PER_FINGERPRINT),
+                        "sources": set(),
+                    }
+            entry["calls"] += 1
+            entry["errors"] += int(error)
+            entry["rows"] += rows or 0
+            entry["total_seconds"] += seconds
+            entry["max_seconds"] = max(entry["max_seconds"], seconds)
+            entry["samples"].append(seconds)
+            if source and len(entry["sources"]) < 10:
+                entry["sources"].add(source)
+        return key
+
+    @classmethod
+    def snapshot(cls, limit=None):
+        """Per-fingerprint statistics in milliseconds, most total time first."""
+        with cls._lock:
+            entries = [
+                (key, dict(entry, samples=sorted(entry["samples"])))
+                for key, entry in cls._entries.items()
+            ]
+        entries.sort(key=lambda item: item[1]["total_seconds"], reverse=True)
+        rows = []
+        for key, entry in entries[:limit]:
+            samples = entry["samples"]
+            rows.append(
+                {
+                    "fingerprint": key,
+                    "sources": sorted(entry["sources"]),
+                    "calls": entry["calls"],
+                    "errors": entry["errors"],
+                    "rows": entry["rows"],
+                    "rows_per_call": round(entry["rows"] / entry["calls"], 2),
+                    "total_ms": round(entry["total_seconds"] * 1000, 3),
+                    "mean_ms": round(entry["total_seconds"] * 1000 / entry["calls"], 3),
+                    "p50_ms": round(_percentile(samples, 0.50) * 1000, 3),
+                    "p95_ms": round(_percentile(samples, 0.95) * 1000, 3),
+                    "p99_ms": round(_percentile(samples, 0.99) * 1000, 3),
+                    "max_ms": round(entry["max_seconds"] * 1000, 3),
+                }
+            )
+        return rows
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._entries.clear()
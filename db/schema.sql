@@ -78,6 +78,10 @@ CREATE TABLE IF NOT EXISTS courses (
     code VARCHAR(20) UNIQUE NOT NULL,
     term_id INTEGER NOT NULL,
     department_id INTEGER NOT NULL,
+    -- NULL capacity means unlimited seats
+    capacity INTEGER CHECK (capacity IS NULL OR capacity >= 0),
+    -- Active enrollments, maintained by the enrollment write paths
+    enrolled_count INTEGER NOT NULL DEFAULT 0 CHECK (enrolled_count >= 0),
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     is_archived BOOLEAN NOT NULL DEFAULT FALSE,
@@ -123,9 +127,70 @@ CREATE TABLE IF NOT EXISTS course_schedule (
     FOREIGN KEY (course_id) REFERENCES courses(id)
 );
 
+-- Databases created before seat tracking
+ALTER TABLE courses ADD COLUMN IF NOT EXISTS capacity INTEGER CHECK (capacity IS NULL OR capacity >= 0);
+ALTER TABLE courses ADD COLUMN IF NOT EXISTS enrolled_count INTEGER NOT NULL DEFAULT 0 CHECK (enrolled_count >= 0);
+-- Backfill the seat counters from the active enrollments. Only courses whose
+-- count is off are written, so this is a no-op once they are in step
+UPDATE courses c
+SET enrolled_count = COALESCE(n.enrolled, 0)
+FROM courses c2
+LEFT JOIN (
+    SELECT course_id, COUNT(*) AS enrolled FROM enrollments
+    WHERE is_archived = FALSE GROUP BY course_id
+) n ON n.course_id = c2.id
+WHERE c.id = c2.id AND c.enrolled_count <> COALESCE(n.enrolled, 0);
+
+-- Students waiting for a seat in a full course, served in ID order
+CREATE TABLE IF NOT EXISTS course_waitlist (
+    id SERIAL PRIMARY KEY,
+    course_id INTEGER NOT NULL,
+    student_id INTEGER NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (course_id, student_id),
+    FOREIGN KEY (course_id) REFERENCES courses(id),
+    FOREIGN KEY (student_id) REFERENCES students(id)
+);
+
+-- Grade points used for GPA. Grades not listed here (P, W, I, ...) count in
+-- the distribution but not in the GPA
+CREATE TABLE IF NOT EXISTS grade_points (
+    grade VARCHAR(5) PRIMARY KEY,
+    points NUMERIC(3, 2) NOT NULL
+);
+
+INSERT INTO grade_points (grade, points) VALUES
+    ('A+', 4.00), ('A', 4.00), ('A-', 3.70),
+    ('B+', 3.30), ('B', 3.00), ('B-', 2.70),
+    ('C+', 2.30), ('C', 2.00), ('C-', 1.70),
+    ('D+', 1.30), ('D', 1.00), ('D-', 0.70),
+    ('F', 0.00)
+ON CONFLICT (grade) DO NOTHING;
+
+-- Grade statistics per student and per course, refreshed by the application
+-- whenever an enrollment's grade changes
+CREATE TABLE IF NOT EXISTS student_grade_stats (
+    student_id INTEGER PRIMARY KEY,
+    gpa NUMERIC(3, 2),
+    graded_count INTEGER NOT NULL DEFAULT 0,
+    distribution JSONB NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (student_id) REFERENCES students(id)
+);
+
+CREATE TABLE IF NOT EXISTS course_grade_stats (
+    course_id INTEGER PRIMARY KEY,
+    gpa NUMERIC(3, 2),
+    graded_count INTEGER NOT NULL DEFAULT 0,
+    distribution JSONB NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (course_id) REFERENCES courses(id)
+);
+
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_students_email ON students(email);
 CREATE INDEX IF NOT EXISTS idx_students_program_id ON students(program_id);
+CREATE INDEX IF NOT EXISTS idx_programs_department_id ON programs(department_id);
 CREATE INDEX IF NOT EXISTS idx_instructors_email ON instructors(email);
 CREATE INDEX IF NOT EXISTS idx_instructors_department_id ON instructors(department_id);
 CREATE INDEX IF NOT EXISTS idx_courses_code ON courses(code);
@@ -134,7 +199,20 @@ CREATE INDEX IF NOT EXISTS idx_courses_department_id ON courses(department_id);
 CREATE INDEX IF NOT EXISTS idx_terms_is_archived ON terms(is_archived);
 CREATE INDEX IF NOT EXISTS idx_enrollments_student_id ON enrollments(student_id);
 CREATE INDEX IF NOT EXISTS idx_enrollments_course_id ON enrollments(course_id);
+-- Roster pages: active enrollments of one course in enrollment ID order
+CREATE INDEX IF NOT EXISTS idx_enrollments_course_active ON enrollments(course_id, id) WHERE is_archived = FALSE;
 CREATE INDEX IF NOT EXISTS idx_enrollments_is_archived ON enrollments(is_archived);
 CREATE INDEX IF NOT EXISTS idx_assignments_instructor_id ON assignments(instructor_id);
 CREATE INDEX IF NOT EXISTS idx_assignments_course_id ON assignments(course_id);
 CREATE INDEX IF NOT EXISTS idx_course_schedule_course_id ON course_schedule(course_id);
+-- Conflict checks: active sessions by room, normalized as in normalize_room
+CREATE INDEX IF NOT EXISTS idx_course_schedule_room_key ON course_schedule(LOWER(BTRIM(REGEXP_REPLACE(room, '\s+', ' ', 'g')))) WHERE is_archived = FALSE;
+-- Waitlist queue order per course
+CREATE INDEX IF NOT EXISTS idx_course_waitlist_course_id ON course_waitlist(course_id, id);
+
+-- Typeahead search (GET /api/search): word prefixes through the tsvector
+-- indexes. Substrings go through trigram indexes, created separately from
+-- db/trigram.sql. The indexed expressions must match SEARCH_VECTOR and
+-- SEARCH_TEXT in app/models/search.py.
+CREATE INDEX IF NOT EXISTS idx_students_search_vector ON students USING GIN (to_tsvector('simple', first_name || ' ' || last_name || ' ' || email));
+CREATE INDEX IF NOT EXISTS idx_instructors_search_vector ON instructors USING GIN (to_tsvector('simple', first_name || ' ' || last_name || ' ' || email));
@@ -0,0 +1,7 @@
+-- Substring search (GET /api/search) through trigram indexes. pg_trgm is not
+-- available everywhere (on Azure it has to be allow-listed in the server's
+-- azure.extensions parameter), so db/init.py runs this file on its own after
+-- schema.sql. Without it, search matches word prefixes only.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_students_search_trgm ON students USING GIN (lower(first_name || ' ' || last_name || ' ' || email) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_instructors_search_trgm ON instructors USING GIN (lower(first_name || ' ' || last_name || ' ' || email) gin_trgm_ops);
@@ -1,13 +1,18 @@
+import json
 import pytest
-from datetime import date
+from datetime import date, datetime
 from unittest.mock import patch
 from app.models import (
     assignment_db_read_all,
+    assignment_db_read_version,
     assignment_db_read_by_id,
     assignment_db_read_by_ids,
     assignment_db_insert,
+    assignment_db_insert_many,
     assignment_db_update,
+    assignment_db_update_many,
     assignment_db_archive,
+    assignment_db_archive_many,
 )
 from app.services import (
     get_all_assignments,
@@ -111,18 +116,36 @@ def mock_db_create():
         yield mock
 
 
+@pytest.fixture
+def mock_db_create_many():
+    with patch("app.services.assignment.assignment_db_insert_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_update():
     with patch("app.services.assignment.assignment_db_update") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_update_many():
+    with patch("app.services.assignment.assignment_db_update_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_archive():
     with patch("app.services.assignment.assignment_db_archive") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_archive_many():
+    with patch("app.services.assignment.assignment_db_archive_many") as mock:
+        yield mock
+
+
 # =======================
 # Service Tests
 # =======================
@@ -157,10 +180,13 @@ class TestAssignmentCreateService:
     def test_create_new_assignments(
         self,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_assignment_create_data,
         valid_assignment_rows,
     ):
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [1, 2]
         mock_db_read_many.return_value = valid_assignment_rows
 
@@ -175,8 +201,14 @@ class TestAssignmentCreateService:
         mock_db_read_many.assert_called_once_with([1, 2])
 
     def test_create_new_assignments_failure(
-        self, mock_db_create, mock_db_read_many, valid_assignment_create_data
+        self,
+        mock_db_create,
+        mock_db_create_many,
+        mock_db_read_many,
+        valid_assignment_create_data,
     ):
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [None, None]
         results, error, status_code = create_new_assignments(
             valid_assignment_create_data
@@ -187,6 +219,28 @@ class TestAssignmentCreateService:
         assert status_code == 400
         mock_db_read_many.assert_not_called()
 
+    def test_create_new_assignments_batched(
+        self,
+        mock_db_create,
+        mock_db_create_many,
+        mock_db_read_many,
+        valid_assignment_create_data,
+        valid_assignment_rows,
+    ):
+        mock_db_create_many.return_value = valid_assignment_rows
+
+        results, error, status_code = create_new_assignments(
+            valid_assignment_create_data
+        )
+
+        assert results == valid_assignment_rows
+        assert error is None
+        assert status_code == 201
+        mock_db_create_many.assert_called_once()
+        assert len(mock_db_create_many.call_args.args[0]) == 2
+        mock_db_create.assert_not_called()
+        mock_db_read_many.assert_not_called()
+
 
 class TestAssignmentUpdateService:
     @patch("app.models.assignment.db")  # Mock the db instance
@@ -196,16 +250,14 @@ class TestAssignmentUpdateService:
         mock_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_assignment_update_data,
         valid_assignment_row,
     ):
         # This test is fully mocked and does not require a real DB connection
-        mock_db_update.return_value = 1
         mock_db_read_many.return_value = [valid_assignment_row]
-
-        mock_db_read_one.return_value = valid_assignment_row
+        mock_db_update_many.return_value = [valid_assignment_row]
 
         mock_dict_to_row.return_value = (1, 1)  # Mock conversion
 
@@ -214,7 +266,8 @@ class TestAssignmentUpdateService:
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
+        mock_db_update_many.assert_called_once()
+        mock_db_update.assert_not_called()
         mock_db_read_many.assert_called_once_with([1])
 
     @patch("app.models.assignment.db")  # Mock the db instance
@@ -224,14 +277,13 @@ class TestAssignmentUpdateService:
         mock_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_assignment_update_data,
         valid_assignment_row,
     ):
-        mock_db_update.return_value = 0  # Simulate no update
-
-        mock_db_read_one.return_value = valid_assignment_row
+        mock_db_read_many.return_value = [{"id": 1}]  # Record exists
+        mock_db_update_many.return_value = []  # Simulate no update
 
         mock_dict_to_row.return_value = (1, 1)  # Mock conversion
 
@@ -240,8 +292,8 @@ class TestAssignmentUpdateService:
         assert results == []
         assert error == [{"message": "Assignment ID 1 not updated."}]
         assert status_code == 400
-        assert mock_db_update.call_count == 1
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     @patch("app.models.assignment.db")  # Mock the db instance
     @patch("app.services.assignment.assignment_dict_to_row")
@@ -250,8 +302,8 @@ class TestAssignmentUpdateService:
         mock_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         assignment_missing_id,
     ):
         results, error, status_code = update_assignments(assignment_missing_id)
@@ -269,12 +321,13 @@ class TestAssignmentArchiveService:
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_assignment_ids,
         valid_assignment_row,
     ):
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [{"id": 1}, {"id": 2}]
         mock_db_read_one.return_value = valid_assignment_row  # Mock get_existing_func
         mock_db_read_many.return_value = [
             valid_assignment_row,
@@ -283,23 +336,26 @@ class TestAssignmentArchiveService:
         archived = archive_assignments(valid_assignment_ids)
 
         assert len(archived[0]) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with(valid_assignment_ids)
+        mock_db_archive.assert_not_called()
 
     @patch("app.models.assignment.db")  # Mock the db instance
     def test_archive_assignments_none_archived(
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_assignment_ids,
         valid_assignment_row,
     ):
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         mock_db_read_one.return_value = valid_assignment_row  # Mock get_existing_func
         archived = archive_assignments(valid_assignment_ids)
 
         assert archived[0] == []
+        mock_db_archive.assert_not_called()
 
     def test_archive_assignments_invalid_ids(self):
         results, errors, status = archive_assignments(["one", 2])
@@ -318,7 +374,57 @@ class TestAssignmentModel:
         mock_execute.return_value = [{"mocked": "data"}]
         result = assignment_db_read_all()
         assert result == [{"mocked": "data"}]
-        mock_execute.assert_called_once_with("SELECT * FROM assignments;")
+        mock_execute.assert_called_once_with("SELECT * FROM assignments;", ())
+
+    @patch("app.models.assignment.db.execute_query")
+    def test_assignment_db_read_all_paginated(self, mock_execute):
+        mock_execute.return_value = [{"id": 11}, {"id": 12}]
+        result = assignment_db_read_all(limit=2, after_id=10)
+        assert result == [{"id": 11}, {"id": 12}]
+        mock_execute.assert_called_once_with(
+            "SELECT * FROM assignments WHERE id > %s ORDER BY id LIMIT %s;", (10, 2)
+        )
+
+    @patch("app.models.assignment.db.stream_query")
+    @patch("app.models.assignment.db.execute_query")
+    def test_assignment_db_read_all_stream(self, mock_execute, mock_stream):
+        mock_stream.return_value = iter([{"id": 1}, {"id": 2}])
+        result = assignment_db_read_all(stream=True)
+        assert list(result) == [{"id": 1}, {"id": 2}]
+        mock_stream.assert_called_once_with("SELECT * FROM assignments;", ())
+        mock_execute.assert_not_called()
+
+    @patch("app.models.assignment.db.execute_query")
+    def test_assignment_db_read_all_filtered(self, mock_execute):
+        mock_execute.return_value = [{"id": 1, "instructor_id": "x"}]
+        result = assignment_db_read_all(
+            active_only=True,
+            filters={"course_id": "5"},
+            fields=["instructor_id"],
+            limit=10,
+        )
+        assert result == [{"id": 1, "instructor_id": "x"}]
+        mock_execute.assert_called_once_with(
+            "SELECT id, instructor_id FROM assignments WHERE is_archived = FALSE AND course_id = %s "
+            "ORDER BY id LIMIT %s;",
+            (5, 10),
+        )
+
+    def test_assignment_db_read_all_rejects_unknown_filter_and_field(self):
+        with pytest.raises(ValueError, match="Unknown filter: secret"):
+            assignment_db_read_all(filters={"secret": "1"})
+        with pytest.raises(ValueError, match="Unknown field: secret"):
+            assignment_db_read_all(fields=["secret"])
+
+    @patch("app.models.assignment.db.execute_query")
+    def test_assignment_db_read_version(self, mock_execute):
+        version = {"last_modified": datetime(2025, 1, 1), "row_count": 2}
+        mock_execute.return_value = [version]
+        assert assignment_db_read_version(active_only=True) == version
+        mock_execute.assert_called_once_with(
+            "SELECT MAX(updated_at) AS last_modified, COUNT(*) AS row_count "
+            "FROM assignments WHERE is_archived = FALSE;"
+        )
 
     @patch("app.models.assignment.db.execute_query")
     def test_assignment_db_read_all_active(self, mock_execute):
@@ -326,7 +432,7 @@ class TestAssignmentModel:
         result = assignment_db_read_all(active_only=True)
         assert result == [{"active": "assignment"}]
         mock_execute.assert_called_once_with(
-            "SELECT * FROM assignments WHERE is_archived = FALSE;"
+            "SELECT * FROM assignments WHERE is_archived = FALSE;", ()
         )
 
     @patch("app.models.assignment.db.execute_query")
@@ -387,6 +493,19 @@ class TestAssignmentModel:
         result = assignment_db_insert(("bad",))
         assert result is None
 
+    @patch("app.models.assignment.db.execute_values")
+    def test_assignment_db_insert_many(self, mock_execute_values):
+        mock_execute_values.return_value = [{"id": 1}, {"id": 2}]
+        rows = [("a",), ("b",)]
+
+        result = assignment_db_insert_many(rows)
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, called_rows = mock_execute_values.call_args.args
+        assert query.startswith("INSERT INTO assignments (")
+        assert "VALUES %s RETURNING *" in query
+        assert called_rows == rows
+
     @patch("app.models.assignment.db.execute_query")
     def test_assignment_db_update_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -401,6 +520,21 @@ class TestAssignmentModel:
         result = assignment_db_update(1, ("x",) * 2)
         assert result == 0
 
+    @patch("app.models.assignment.db.execute_query")
+    def test_assignment_db_update_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = assignment_db_update_many([(1, ("a",) * 12), (2, ("b",) * 12)])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        mock_execute.assert_called_once()
+        query, params = mock_execute.call_args.args
+        assert "UPDATE assignments AS t" in query
+        assert "json_populate_recordset(NULL::assignments, %s)" in query
+        assert "RETURNING t.*" in query
+        records = json.loads(params[0])
+        assert [r["id"] for r in records] == [1, 2]
+
     @patch("app.models.assignment.db.execute_query")
     def test_assignment_db_archive_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -414,6 +548,19 @@ class TestAssignmentModel:
         result = assignment_db_archive(999)
         assert result == 0
 
+    @patch("app.models.assignment.db.execute_query")
+    def test_assignment_db_archive_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = assignment_db_archive_many([1, 2, 3])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, params = mock_execute.call_args.args
+        assert "UPDATE assignments" in query
+        assert "WHERE id = ANY(%s) AND is_archived = FALSE" in query
+        assert "RETURNING *" in query
+        assert params == ([1, 2, 3],)
+
 
 # =======================
 # Route Tests
@@ -0,0 +1,179 @@
+import pytest
+from unittest.mock import patch
+
+from benchmarks.compare import compare, regressions
+from benchmarks.run import Benchmark, sql_statements, summarize
+from benchmarks.seed import seed
+from db import data
+
+# =======================
+# Generator Tests
+# =======================
+
+
+class TestGenerators:
+    def test_same_seed_same_rows(self):
+        assert list(data.generate_students(50, seed=7)) == list(
+            data.generate_students(50, seed=7)
+        )
+        assert list(data.generate_students(50, seed=7)) != list(
+            data.generate_students(50, seed=8)
+        )
+
+    def test_ids_continue_after_the_sample_data(self):
+        students = list(data.generate_students(3))
+        courses = list(data.generate_courses(3))
+
+        assert [row[0] for row in students] == [
+            len(data.students) + 1,
+            len(data.students) + 2,
+            len(data.students) + 3,
+        ]
+        assert len(students[0]) == len(data.students[0])
+        assert len(courses[0]) == len(data.courses[0])
+        assert len({row[3] for row in students}) == 3  # unique emails
+        assert len({row[2] for row in courses}) == 3  # unique codes
+
+    def test_enrollments_are_distinct_per_student(self):
+        rows = list(data.generate_enrollments([1, 2], [10, 11, 12], per_student=3))
+
+        assert len(rows) == 6
+        assert len({(row[1], row[2]) for row in rows}) == 6
+        assert [row[0] for row in rows] == list(
+            range(len(data.enrollments) + 1, len(data.enrollments) + 7)
+        )
+
+    def test_schedule_never_double_books_a_room(self):
+        rows = list(data.generate_course_schedule(range(1, 2001)))
+
+        assert len({(row[2], row[3], row[4]) for row in rows}) == 2000
+
+    def test_assignments_use_the_given_instructors(self):
+        rows = list(data.generate_assignments([1, 2, 3], instructor_ids=[40, 41]))
+
+        assert {row[1] for row in rows} <= {40, 41}
+
+
+# =======================
+# Seeding Tests
+# =======================
+
+
+class TestSeed:
+    @patch("benchmarks.seed.populate_synthetic_data", return_value=True)
+    @patch("benchmarks.seed.populate_sample_data", return_value=True)
+    @patch("benchmarks.seed.init_database", return_value=True)
+    def test_seed_loads_synthetic_data_on_top_of_the_sample(
+        self, mock_init, mock_sample, mock_synthetic
+    ):
+        seed(1000, 50, enrollments_per_student=4, seed=3)
+
+        mock_sample.assert_called_once()
+        mock_synthetic.assert_called_once_with(1000, 50, 4, 3)
+
+    @patch("benchmarks.seed.populate_synthetic_data", return_value=False)
+    @patch("benchmarks.seed.populate_sample_data", return_value=True)
+    @patch("benchmarks.seed.init_database", return_value=True)
+    def test_seed_fails_loudly(self, mock_init, mock_sample, mock_synthetic):
+        with pytest.raises(RuntimeError, match="synthetic data"):
+            seed(10, 1)
+
+
+# =======================
+# Runner Tests
+# =======================
+
+
+class FakeClient:
+    target = "fake"
+
+    def __init__(self):
+        self.calls = []
+        self.next_id = 1000
+
+    def request(self, method, path, payload=None):
+        self.calls.append((method, path))
+        headers = {"Server-Timing": 'app;dur=1.00, db;desc="2 statements";dur=0.50'}
+        if method == "GET" and "?" in path:
+            return 200, headers, {"data": [{"id": 1}, {"id": 2}], "next_cursor": "x"}
+        if method == "POST":
+            rows = []
+            for item in payload:
+                self.next_id += 1
+                rows.append({**item, "id": self.next_id})
+            return 201, headers, {"data": rows}
+        if method == "PATCH":
+            return 200, headers, {"data": [{"id": i} for i in payload["ids"]]}
+        return 200, headers, {"data": payload if method == "PUT" else {"id": 1}}
+
+
+class TestRunner:
+    def test_sql_statements_from_server_timing(self):
+        assert sql_statements({"Server-Timing": 'db;desc="7 statements";dur=1'}) == 7
+        assert sql_statements({}) is None
+
+    def test_summarize(self):
+        samples = [(ms / 1000, 200, 10, 3) for ms in range(1, 101)]
+        samples.append((0.2, 500, 0, None))
+
+        summary = summarize("students.list", samples, elapsed=2.0)
+
+        assert summary["requests"] == 101
+        assert summary["errors"] == 1
+        assert summary["p50_ms"] == 50.0
+        assert summary["max_ms"] == 200.0
+        assert summary["requests_per_s"] == 50.5
+        assert summary["rows_per_s"] == 500.0
+        assert summary["sql_statements_per_request"] == 3
+
+    def test_run_covers_every_route_family(self):
+        client = FakeClient()
+
+        results = Benchmark(client, requests=20, batch_size=5).run(warmup=2)
+
+        names = [result["name"] for result in results]
+        for resource in ("students", "courses", "enrollments"):
+            for scenario in (
+                "list",
+                "get_by_id",
+                "bulk_create",
+                "bulk_update",
+                "bulk_archive",
+            ):
+                assert f"{resource}.{scenario}" in names
+        assert all(result["errors"] == 0 for result in results)
+        assert ("GET", "/api/students?limit=100&cursor=x") in client.calls
+        archived = next(r for r in results if r["name"] == "students.bulk_archive")
+        assert archived["rows"] == 10
+
+    def test_updates_match_created_rows_by_unique_fields(self):
+        benchmark = Benchmark(FakeClient())
+        payloads = [{"email": "a@school.edu"}, {"email": "b@school.edu"}]
+        # The create rejected the first row
+        benchmark.created["students"] = {("b@school.edu",): 7}
+
+        rows = benchmark.updated_rows("students", payloads)
+
+        assert rows == [{"email": "b@school.edu", "id": 7, "city": "Bench"}]
+
+
+# =======================
+# Compare Tests
+# =======================
+
+
+class TestCompare:
+    def report(self, p95):
+        return {
+            "scenarios": [
+                {"name": "students.list", "p50_ms": 1.0, "p95_ms": p95},
+                {"name": "students.get_by_id", "p50_ms": 1.0, "p95_ms": 2.0},
+            ]
+        }
+
+    @pytest.mark.parametrize("p95, slower", [(2.1, []), (3.0, ["students.list"])])
+    def test_regressions(self, p95, slower):
+        rows = compare(self.report(2.0), self.report(p95))
+
+        assert rows[0]["p95_ms"] == (2.0, p95)
+        assert regressions(rows, threshold=10) == slower
@@ -0,0 +1,219 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from db.cache import LRUCache, QueryCache, ReadCache, id_arg, ids_arg, pair_ids
+from app.models import course_db_read_by_id, course_db_read_by_ids, course_db_update
+
+
+# =======================
+# Backend Tests
+# =======================
+
+
+class TestLRUCache:
+    def test_get_returns_copies(self):
+        cache = LRUCache()
+        cache.set_many({"a": {"id": 1}})
+
+        row = cache.get_many(["a"])["a"]
+        row["id"] = 99
+
+        assert cache.get_many(["a"]) == {"a": {"id": 1}}
+
+    def test_set_stores_copies(self):
+        cache = LRUCache()
+        report = [{"id": 1}]
+        cache.set_many({"a": report})
+
+        report[0]["extra"] = True
+        cache.get_many(["a"])["a"][0]["id"] = 99
+
+        assert cache.get_many(["a"]) == {"a": [{"id": 1}]}
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set_many({"a": 1, "b": 2})
+        cache.get_many(["a"])
+        cache.set_many({"c": 3})
+
+        assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+    def test_expired_entries_are_dropped(self):
+        cache = LRUCache(ttl=10)
+        with patch("db.cache.time.monotonic", return_value=100.0):
+            cache.set_many({"a": 1})
+        with patch("db.cache.time.monotonic", return_value=111.0):
+            assert cache.get_many(["a"]) == {}
+
+    def test_entry_ttl_overrides_default(self):
+        cache = LRUCache(ttl=60)
+        with patch("db.cache.time.monotonic", return_value=100.0):
+            cache.set_many({"a": 1}, ttl=5)
+        with patch("db.cache.time.monotonic", return_value=106.0):
+            assert cache.get_many(["a"]) == {}
+
+    def test_delete_many(self):
+        cache = LRUCache()
+        cache.set_many({"a": 1, "b": 2})
+        cache.delete_many(["a", "missing"])
+
+        assert cache.get_many(["a", "b"]) == {"b": 2}
+
+
+# =======================
+# Read-through Tests
+# =======================
+
+
+@pytest.fixture
+def read_cache():
+    with patch.object(ReadCache, "_backend", LRUCache()):
+        cache = ReadCache("widgets")
+        yield cache
+    ReadCache._instances.remove(cache)
+
+
+class TestReadCache:
+    def test_read_by_id_hits_after_first_miss(self, read_cache):
+        loader = MagicMock(return_value={"id": 1})
+        read = read_cache.read_by_id(loader)
+
+        assert read(1) == {"id": 1}
+        assert read(1) == {"id": 1}
+        loader.assert_called_once_with(1)
+        assert (read_cache.hits, read_cache.misses) == (1, 1)
+
+    def test_read_by_id_miss_does_not_share_the_cached_row(self, read_cache):
+        read = read_cache.read_by_id(MagicMock(return_value={"id": 1}))
+
+        read(1)["name"] = "added by a caller"
+
+        assert read(1) == {"id": 1}
+
+    def test_read_by_id_does_not_cache_missing_rows(self, read_cache):
+        loader = MagicMock(return_value=None)
+        read = read_cache.read_by_id(loader)
+
+        read(1)
+        read(1)
+
+        assert loader.call_count == 2
+
+    def test_read_by_ids_only_loads_uncached_ids(self, read_cache):
+        loader = MagicMock(side_effect=lambda ids: [{"id": i} for i in ids])
+        read_many = read_cache.read_by_ids(loader)
+
+        read_many([1, 2])
+        rows = read_many([1, 2, 3])
+
+        assert sorted(row["id"] for row in rows) == [1, 2, 3]
+        assert loader.call_args_list[-1].args == ([3],)
+        assert (read_cache.hits, read_cache.misses) == (2, 3)
+
+    def test_evicts_drops_written_ids_even_when_write_fails(self, read_cache):
+        read = read_cache.read_by_id(MagicMock(return_value={"id": 1}))
+        read(1)
+
+        @read_cache.evicts(id_arg)
+        def failing_update(entity_id, row):
+            raise RuntimeError("Database error")
+
+        with pytest.raises(RuntimeError):
+            failing_update(1, ("row",))
+
+        read(1)
+        assert read_cache.misses == 2
+        assert read_cache.evictions == 1
+
+    def test_request_writes_are_evicted_again_at_teardown(self, read_cache, client):
+        backend = ReadCache.backend()
+        with client.application.test_request_context():
+            read_cache.evict([1])
+            backend.set_many({"widgets:1": {"id": 1, "stale": True}})
+            ReadCache._evict_request_writes()
+
+        assert backend.get_many(["widgets:1"]) == {}
+
+    def test_id_helpers(self):
+        assert id_arg(1, ("row",)) == [1]
+        assert ids_arg((1, 2)) == [1, 2]
+        assert pair_ids([(1, ("a",)), (2, ("b",))]) == [1, 2]
+
+
+@pytest.fixture
+def query_cache():
+    with patch.object(ReadCache, "_backend", LRUCache()):
+        cache = QueryCache("reports")
+        yield cache
+    ReadCache._instances.remove(cache)
+
+
+class TestQueryCache:
+    def test_cached_per_arguments_until_invalidated(self, query_cache):
+        loader = MagicMock(side_effect=lambda term_id=None: [term_id])
+
+        @query_cache.cached
+        def report(term_id=None):
+            return loader(term_id)
+
+        assert report(1) == [1]
+        assert report(1) == [1]
+        assert report(2) == [2]
+        assert loader.call_count == 2
+
+        query_cache.invalidate()
+
+        assert report(1) == [1]
+        assert loader.call_count == 3
+        assert (query_cache.hits, query_cache.misses) == (1, 3)
+
+    def test_invalidates_even_when_write_fails(self, query_cache):
+        loader = MagicMock(return_value=[])
+
+        @query_cache.cached
+        def report():
+            return loader()
+
+        report()
+
+        @query_cache.invalidates
+        def failing_write():
+            raise RuntimeError("Database error")
+
+        with pytest.raises(RuntimeError):
+            failing_write()
+
+        report()
+        assert loader.call_count == 2
+
+
+# =======================
+# Model Integration Tests
+# =======================
+
+
+class TestModelCache:
+    @patch("app.models.course.db.execute_query")
+    def test_course_read_by_id_is_cached_until_update(self, mock_execute):
+        mock_execute.return_value = [{"id": 1, "title": "Math"}]
+
+        course_db_read_by_id(1)
+        course_db_read_by_ids([1])
+        assert mock_execute.call_count == 1
+
+        mock_execute.return_value = type("MockCursor", (), {"rowcount": 1})()
+        course_db_update(1, ("Math II", "MTH", 1, 1))
+
+        mock_execute.return_value = [{"id": 1, "title": "Math II"}]
+        assert course_db_read_by_id(1) == {"id": 1, "title": "Math II"}
+        assert mock_execute.call_count == 3
+
+    def test_health_reports_cache_stats(self, client):
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.get_json()["cache"]["courses"].keys() == {
+            "hits",
+            "misses",
+            "evictions",
+        }
@@ -10,27 +10,30 @@ os.environ["LOCAL_DB_NAME"] = "test_school_api"
 os.environ["LOCAL_DB_USER"] = "postgres"
 os.environ["LOCAL_DB_PASSWORD"] = "postgres"
 
-# Create a global patcher that starts before imports
-mock_pool_patcher = patch("psycopg2.pool.SimpleConnectionPool")
-mock_pool = mock_pool_patcher.start()
-
-# Create a mock pool instance
-mock_pool_instance = MagicMock()
-mock_pool.return_value = mock_pool_instance
+# Patch psycopg2.connect before imports so the connection pool hands out mocks
+mock_connect_patcher = patch("psycopg2.connect")
+mock_connect = mock_connect_patcher.start()
 
 # Mock the connection and cursor
 mock_conn = MagicMock()
+mock_conn.closed = 0
 mock_cursor = MagicMock()
 mock_cursor.fetchall.return_value = []
 mock_cursor.fetchone.return_value = None
 mock_conn.cursor.return_value = mock_cursor
-
-# Mock pool methods
-mock_pool_instance.getconn.return_value = mock_conn
-mock_pool_instance.putconn.return_value = None
+mock_connect.return_value = mock_conn
 
 # Now it's safe to import the app
 from app import create_app
+from db.cache import ReadCache
+
+
+@pytest.fixture(autouse=True)
+def clear_read_cache():
+    # Model tests mock the same IDs with different rows; never share cached reads
+    ReadCache.clear_all()
+    yield
+    ReadCache.clear_all()
 
 
 @pytest.fixture
@@ -42,4 +45,4 @@ def client():
 
 # Clean up the patcher when tests are done
 def pytest_unconfigure(config):
-    mock_pool_patcher.stop()
+    mock_connect_patcher.stop()
@@ -1,13 +1,20 @@
+import json
 import pytest
-from datetime import date
+from datetime import date, datetime
 from unittest.mock import patch
 from app.models import (
     course_schedule_db_read_all,
+    course_schedule_db_read_version,
     course_schedule_db_read_by_id,
     course_schedule_db_read_by_ids,
     course_schedule_db_insert,
+    course_schedule_db_insert_many,
     course_schedule_db_update,
+    course_schedule_db_update_many,
     course_schedule_db_archive,
+    course_schedule_db_archive_many,
+    course_schedule_db_read_slots,
+    course_schedule_db_read_course_keys,
 )
 from app.services import (
     get_all_course_schedules,
@@ -15,7 +22,9 @@ from app.services import (
     create_new_course_schedules,
     update_course_schedules,
     archive_course_schedules,
+    get_course_schedule_conflicts,
 )
+from app.services.course_schedule import check_course_schedule_conflicts
 
 # =======================
 # Fixtures
@@ -117,18 +126,36 @@ def mock_db_create():
         yield mock
 
 
+@pytest.fixture
+def mock_db_create_many():
+    with patch("app.services.course_schedule.course_schedule_db_insert_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_update():
     with patch("app.services.course_schedule.course_schedule_db_update") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_update_many():
+    with patch("app.services.course_schedule.course_schedule_db_update_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_archive():
     with patch("app.services.course_schedule.course_schedule_db_archive") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_archive_many():
+    with patch("app.services.course_schedule.course_schedule_db_archive_many") as mock:
+        yield mock
+
+
 # =======================
 # Service Tests
 # =======================
@@ -169,10 +196,13 @@ class TestCourseScheduleCreateService:
     def test_create_new_course_schedules(
         self,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_course_schedule_create_data,
         valid_course_schedule_rows,
     ):
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [1, 2]
         mock_db_read_many.return_value = valid_course_schedule_rows
 
@@ -187,8 +217,14 @@ class TestCourseScheduleCreateService:
         mock_db_read_many.assert_called_once_with([1, 2])
 
     def test_create_new_course_schedules_failure(
-        self, mock_db_create, mock_db_read_many, valid_course_schedule_create_data
+        self,
+        mock_db_create,
+        mock_db_create_many,
+        mock_db_read_many,
+        valid_course_schedule_create_data,
     ):
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [None, None]
         results, error, status_code = create_new_course_schedules(
             valid_course_schedule_create_data
@@ -199,6 +235,163 @@ class TestCourseScheduleCreateService:
         assert status_code == 400
         mock_db_read_many.assert_not_called()
 
+    def test_create_new_course_schedules_batched(
+        self,
+        mock_db_create,
+        mock_db_create_many,
+        mock_db_read_many,
+        valid_course_schedule_create_data,
+        valid_course_schedule_rows,
+    ):
+        mock_db_create_many.return_value = valid_course_schedule_rows
+
+        results, error, status_code = create_new_course_schedules(
+            valid_course_schedule_create_data
+        )
+
+        assert results == valid_course_schedule_rows
+        assert error is None
+        assert status_code == 201
+        mock_db_create_many.assert_called_once()
+        assert len(mock_db_create_many.call_args.args[0]) == 2
+        mock_db_create.assert_not_called()
+        mock_db_read_many.assert_not_called()
+
+
+class TestCourseScheduleConflictService:
+    @pytest.fixture
+    def mock_conflict_reads(self):
+        with (
+            patch(
+                "app.services.course_schedule.course_schedule_db_read_course_keys"
+            ) as mock_keys,
+            patch(
+                "app.services.course_schedule.course_schedule_db_read_slots"
+            ) as mock_slots,
+        ):
+            mock_keys.return_value = {
+                1: {"term_id": 1, "instructor_ids": [7]},
+                2: {"term_id": 1, "instructor_ids": []},
+            }
+            mock_slots.return_value = [
+                {
+                    "id": 10,
+                    "course_id": 3,
+                    "term_id": 1,
+                    "day": "Monday",
+                    "time": "10:00",
+                    "room": "Room 101",
+                    "instructor_ids": [7],
+                }
+            ]
+            yield mock_keys, mock_slots
+
+    def test_rejects_room_and_instructor_double_bookings(self, mock_conflict_reads):
+        mock_keys, mock_slots = mock_conflict_reads
+
+        rejected = check_course_schedule_conflicts(
+            [
+                (0, (1, "Monday", "10:30", "Lab 1")),
+                (1, (2, "Monday", "10:00", "room 101")),
+                (2, (2, "Tuesday", "10:00", "Room 101")),
+            ]
+        )
+
+        assert rejected == {
+            0: "Instructor 7 already teaches course 3 on Monday at 10:00.",
+            1: "Room 'Room 101' is already booked on Monday at 10:00 by course 3.",
+        }
+        mock_keys.assert_called_once_with({1, 2})
+        mock_slots.assert_called_once_with(
+            {1}, rooms={"lab 1", "room 101"}, instructor_ids={7}
+        )
+
+    def test_string_course_ids_are_checked_too(self, mock_conflict_reads):
+        mock_keys, _ = mock_conflict_reads
+
+        rejected = check_course_schedule_conflicts(
+            [
+                (0, ("2", "Monday", "10:00", "Room 101")),
+                (1, ("abc", "Monday", "10:00", "Lab 1")),
+            ]
+        )
+
+        assert rejected == {
+            0: "Room 'Room 101' is already booked on Monday at 10:00 by course 3.",
+            1: "Invalid course ID: 'abc'.",
+        }
+        mock_keys.assert_called_once_with({2})
+
+    def test_checks_rows_of_one_request_against_each_other(self, mock_conflict_reads):
+        rejected = check_course_schedule_conflicts(
+            [
+                (0, (2, "Friday", "09:00-10:30", "Lab 1")),
+                (1, (2, "Friday", "10:00", "Lab 1")),
+            ]
+        )
+
+        assert list(rejected) == [1]
+
+    def test_update_replaces_the_stored_session(self, mock_conflict_reads):
+        rejected = check_course_schedule_conflicts(
+            [(10, (1, "Monday", "10:30", "Room 101"))], updating=True
+        )
+
+        assert rejected == {}
+
+    def test_update_with_a_string_id_replaces_the_stored_session(
+        self, mock_conflict_reads
+    ):
+        rejected = check_course_schedule_conflicts(
+            [("10", (1, "Monday", "10:30", "Room 101"))], updating=True
+        )
+
+        assert rejected == {}
+
+    def test_rejects_unparsable_times_and_skips_unknown_courses(
+        self, mock_conflict_reads
+    ):
+        _, mock_slots = mock_conflict_reads
+
+        rejected = check_course_schedule_conflicts(
+            [(0, (1, "Monday", "TBA", "Lab 1")), (1, (99, "Monday", "10:00", "Lab"))]
+        )
+
+        assert rejected == {0: "Invalid schedule time: 'TBA'"}
+        mock_slots.assert_not_called()
+
+    def test_create_reports_conflicts(self, mock_conflict_reads, mock_db_create_many):
+        results, error, status_code = create_new_course_schedules(
+            {"course_id": 2, "day": "Monday", "time": "10:00", "room": "Room 101"}
+        )
+
+        assert results == []
+        assert status_code == 400
+        assert "already booked" in error["details"][0]["message"]
+        mock_db_create_many.assert_not_called()
+
+    @patch("app.services.course_schedule.course_schedule_db_read_slots")
+    def test_get_course_schedule_conflicts(self, mock_slots):
+        slot = {
+            "course_id": 1,
+            "term_id": 1,
+            "day": "Monday",
+            "time": "10:00",
+            "room": "Room 101",
+            "instructor_ids": [],
+        }
+        mock_slots.return_value = [
+            {"id": 1, **slot},
+            {"id": 2, **slot, "course_id": 2},
+            {"id": 3, **slot, "time": "TBA"},
+        ]
+
+        report = get_course_schedule_conflicts(term_id=1)
+
+        assert [c["type"] for c in report["conflicts"]] == ["room"]
+        assert report["unparsed_ids"] == [3]
+        mock_slots.assert_called_once_with([1])
+
 
 class TestCourseScheduleUpdateService:
     @patch("app.models.course_schedule.db")  # Mock the db instance
@@ -208,17 +401,16 @@ class TestCourseScheduleUpdateService:
         mock_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_course_schedule_update_data,
         valid_course_schedule_row,
     ):
         # This test is fully mocked and does not require a real DB connection
-        mock_db_update.return_value = 1
         mock_db_read_many.return_value = [valid_course_schedule_row]
+        mock_db_update_many.return_value = [valid_course_schedule_row]
 
         # All data is now dict format for PostgreSQL
-        mock_db_read_one.return_value = valid_course_schedule_row
 
         mock_dict_to_row.return_value = (
             1,
@@ -234,7 +426,8 @@ class TestCourseScheduleUpdateService:
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
+        mock_db_update_many.assert_called_once()
+        mock_db_update.assert_not_called()
         mock_db_read_many.assert_called_once_with([1])
 
     @patch("app.models.course_schedule.db")  # Mock the db instance
@@ -244,15 +437,15 @@ class TestCourseScheduleUpdateService:
         mock_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_course_schedule_update_data,
         valid_course_schedule_row,
     ):
-        mock_db_update.return_value = 0  # Simulate no update
+        mock_db_read_many.return_value = [{"id": 1}]  # Record exists
+        mock_db_update_many.return_value = []  # Simulate no update
 
         # All data is now dict format for PostgreSQL
-        mock_db_read_one.return_value = valid_course_schedule_row
 
         mock_dict_to_row.return_value = (
             1,
@@ -268,8 +461,8 @@ class TestCourseScheduleUpdateService:
         assert results == []
         assert error == [{"message": "Course schedule ID 1 not updated."}]
         assert status_code == 400
-        assert mock_db_update.call_count == 1
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     @patch("app.models.course_schedule.db")  # Mock the db instance
     @patch("app.services.course_schedule.course_schedule_dict_to_row")
@@ -278,8 +471,8 @@ class TestCourseScheduleUpdateService:
         mock_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         course_schedule_missing_id,
     ):
         results, error, status_code = update_course_schedules(
@@ -299,12 +492,13 @@ class TestCourseScheduleArchiveService:
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_course_schedule_ids,
         valid_course_schedule_row,
     ):
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [{"id": 1}, {"id": 2}]
         mock_db_read_one.return_value = (
             valid_course_schedule_row  # Mock get_existing_func
         )
@@ -315,25 +509,28 @@ class TestCourseScheduleArchiveService:
         archived = archive_course_schedules(valid_course_schedule_ids)
 
         assert len(archived[0]) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with(valid_course_schedule_ids)
+        mock_db_archive.assert_not_called()
 
     @patch("app.models.course_schedule.db")  # Mock the db instance
     def test_archive_course_schedules_none_archived(
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_course_schedule_ids,
         valid_course_schedule_row,
     ):
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         mock_db_read_one.return_value = (
             valid_course_schedule_row  # Mock get_existing_func
         )
         archived = archive_course_schedules(valid_course_schedule_ids)
 
         assert archived[0] == []
+        mock_db_archive.assert_not_called()
 
     def test_archive_course_schedules_invalid_ids(self):
         results, errors, status = archive_course_schedules(["one", 2])
@@ -352,7 +549,54 @@ class TestCourseScheduleModel:
         mock_execute.return_value = [{"mocked": "data"}]
         result = course_schedule_db_read_all()
         assert result == [{"mocked": "data"}]
-        mock_execute.assert_called_once_with("SELECT * FROM course_schedule;")
+        mock_execute.assert_called_once_with("SELECT * FROM course_schedule;", ())
+
+    @patch("app.models.course_schedule.db.execute_query")
+    def test_course_schedule_db_read_all_paginated(self, mock_execute):
+        mock_execute.return_value = [{"id": 11}, {"id": 12}]
+        result = course_schedule_db_read_all(limit=2, after_id=10)
+        assert result == [{"id": 11}, {"id": 12}]
+        mock_execute.assert_called_once_with(
+            "SELECT * FROM course_schedule WHERE id > %s ORDER BY id LIMIT %s;", (10, 2)
+        )
+
+    @patch("app.models.course_schedule.db.stream_query")
+    @patch("app.models.course_schedule.db.execute_query")
+    def test_course_schedule_db_read_all_stream(self, mock_execute, mock_stream):
+        mock_stream.return_value = iter([{"id": 1}, {"id": 2}])
+        result = course_schedule_db_read_all(stream=True)
+        assert list(result) == [{"id": 1}, {"id": 2}]
+        mock_stream.assert_called_once_with("SELECT * FROM course_schedule;", ())
+        mock_execute.assert_not_called()
+
+    @patch("app.models.course_schedule.db.execute_query")
+    def test_course_schedule_db_read_all_filtered(self, mock_execute):
+        mock_execute.return_value = [{"id": 1, "day": "x"}]
+        result = course_schedule_db_read_all(
+            active_only=True, filters={"room": "A101"}, fields=["day"], limit=10
+        )
+        assert result == [{"id": 1, "day": "x"}]
+        mock_execute.assert_called_once_with(
+            "SELECT id, day FROM course_schedule WHERE is_archived = FALSE AND room = %s "
+            "ORDER BY id LIMIT %s;",
+            ("A101", 10),
+        )
+
+    def test_course_schedule_db_read_all_rejects_unknown_filter_and_field(self):
+        with pytest.raises(ValueError, match="Unknown filter: secret"):
+            course_schedule_db_read_all(filters={"secret": "1"})
+        with pytest.raises(ValueError, match="Unknown field: secret"):
+            course_schedule_db_read_all(fields=["secret"])
+
+    @patch("app.models.course_schedule.db.execute_query")
+    def test_course_schedule_db_read_version(self, mock_execute):
+        version = {"last_modified": datetime(2025, 1, 1), "row_count": 2}
+        mock_execute.return_value = [version]
+        assert course_schedule_db_read_version(active_only=True) == version
+        mock_execute.assert_called_once_with(
+            "SELECT MAX(updated_at) AS last_modified, COUNT(*) AS row_count "
+            "FROM course_schedule WHERE is_archived = FALSE;"
+        )
 
     @patch("app.models.course_schedule.db.execute_query")
     def test_course_schedule_db_read_all_active(self, mock_execute):
@@ -427,6 +671,19 @@ class TestCourseScheduleModel:
         result = course_schedule_db_insert(("bad",))
         assert result is None
 
+    @patch("app.models.course_schedule.db.execute_values")
+    def test_course_schedule_db_insert_many(self, mock_execute_values):
+        mock_execute_values.return_value = [{"id": 1}, {"id": 2}]
+        rows = [("a",), ("b",)]
+
+        result = course_schedule_db_insert_many(rows)
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, called_rows = mock_execute_values.call_args.args
+        assert query.startswith("INSERT INTO course_schedule (")
+        assert "VALUES %s RETURNING *" in query
+        assert called_rows == rows
+
     @patch("app.models.course_schedule.db.execute_query")
     def test_course_schedule_db_update_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -441,6 +698,21 @@ class TestCourseScheduleModel:
         result = course_schedule_db_update(1, ("x",) * 4)
         assert result == 0
 
+    @patch("app.models.course_schedule.db.execute_query")
+    def test_course_schedule_db_update_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = course_schedule_db_update_many([(1, ("a",) * 12), (2, ("b",) * 12)])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        mock_execute.assert_called_once()
+        query, params = mock_execute.call_args.args
+        assert "UPDATE course_schedule AS t" in query
+        assert "json_populate_recordset(NULL::course_schedule, %s)" in query
+        assert "RETURNING t.*" in query
+        records = json.loads(params[0])
+        assert [r["id"] for r in records] == [1, 2]
+
     @patch("app.models.course_schedule.db.execute_query")
     def test_course_schedule_db_archive_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -454,6 +726,50 @@ class TestCourseScheduleModel:
         result = course_schedule_db_archive(999)
         assert result == 0
 
+    @patch("app.models.course_schedule.db.execute_query")
+    def test_course_schedule_db_archive_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = course_schedule_db_archive_many([1, 2, 3])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, params = mock_execute.call_args.args
+        assert "UPDATE course_schedule" in query
+        assert "WHERE id = ANY(%s) AND is_archived = FALSE" in query
+        assert "RETURNING *" in query
+        assert params == ([1, 2, 3],)
+
+    @patch("app.models.course_schedule.db.execute_query")
+    def test_course_schedule_db_read_slots(self, mock_execute):
+        mock_execute.return_value = [{"id": 1, "instructor_ids": [7]}]
+
+        assert course_schedule_db_read_slots([3]) == [{"id": 1, "instructor_ids": [7]}]
+        query, params = mock_execute.call_args.args
+        assert "LEFT JOIN assignments a" in query
+        assert "AND c.term_id = ANY(%s) GROUP BY cs.id, c.term_id" in query
+        assert params == ([3],)
+
+    @patch("app.models.course_schedule.db.execute_query")
+    def test_course_schedule_db_read_slots_by_room_or_instructor(self, mock_execute):
+        course_schedule_db_read_slots([3], rooms={"lab 1"}, instructor_ids={7})
+
+        query, params = mock_execute.call_args.args
+        assert (
+            r"LOWER(BTRIM(REGEXP_REPLACE(cs.room, '\s+', ' ', 'g'))) = ANY(%s)" in query
+        )
+        assert "AND a2.instructor_id = ANY(%s)" in query
+        assert params == ([3], ["lab 1"], [7])
+
+    @patch("app.models.course_schedule.db.execute_query")
+    def test_course_schedule_db_read_course_keys(self, mock_execute):
+        mock_execute.return_value = [{"id": 1, "term_id": 3, "instructor_ids": [7]}]
+
+        assert course_schedule_db_read_course_keys({1}) == {
+            1: {"term_id": 3, "instructor_ids": [7]}
+        }
+        assert course_schedule_db_read_course_keys(set()) == {}
+        mock_execute.assert_called_once()
+
 
 # =======================
 # Route Tests
@@ -520,6 +836,25 @@ class TestCourseScheduleReadRoute:
         assert "internal server error: db error" in data["error"].lower()
         mock_get_by_id.assert_called_once_with(1)
 
+    @patch("app.routes.course_schedule.get_course_schedule_conflicts")
+    def test_handle_get_course_schedule_conflicts(self, mock_conflicts, client):
+        mock_conflicts.return_value = {"conflicts": [], "unparsed_ids": []}
+
+        response = client.get("/api/course_schedules/conflicts?term_id=2")
+
+        assert response.status_code == 200
+        assert response.get_json()["data"] == {"conflicts": [], "unparsed_ids": []}
+        mock_conflicts.assert_called_once_with(term_id=2)
+
+    @patch("app.routes.course_schedule.get_course_schedule_conflicts")
+    def test_handle_get_course_schedule_conflicts_invalid_term(
+        self, mock_conflicts, client
+    ):
+        response = client.get("/api/course_schedules/conflicts?term_id=abc")
+
+        assert response.status_code == 400
+        mock_conflicts.assert_not_called()
+
 
 class TestCourseScheduleCreateRoute:
     @patch("app.routes.course_schedule.create_new_course_schedules")
@@ -1,17 +1,24 @@
+import json
 import pytest
-from datetime import date
+from datetime import date, datetime
 from unittest.mock import patch
 from app.models import (
     course_db_read_all,
+    course_db_read_version,
     course_db_read_by_id,
     course_db_read_by_ids,
+    course_db_read_roster,
     course_db_insert,
+    course_db_insert_many,
     course_db_update,
+    course_db_update_many,
     course_db_archive,
+    course_db_archive_many,
 )
 from app.services import (
     get_all_courses,
     get_course_by_id,
+    course_roster,
     create_new_courses,
     update_courses,
     archive_courses,
@@ -117,18 +124,36 @@ def mock_db_create():
         yield mock
 
 
+@pytest.fixture
+def mock_db_create_many():
+    with patch("app.services.course.course_db_insert_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_update():
     with patch("app.services.course.course_db_update") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_update_many():
+    with patch("app.services.course.course_db_update_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_archive():
     with patch("app.services.course.course_db_archive") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_archive_many():
+    with patch("app.services.course.course_db_archive_many") as mock:
+        yield mock
+
+
 # =======================
 # Service Tests
 # =======================
@@ -159,6 +184,27 @@ class TestCourseReadService:
         assert course is None
 
 
+class TestCourseRosterService:
+    @patch("app.services.course.course_db_read_roster")
+    def test_course_roster(self, mock_read_roster, mock_db_read_one):
+        mock_db_read_one.return_value = {"id": 1}
+        mock_read_roster.return_value = [{"enrollment_id": 10, "id": 3}]
+
+        roster = course_roster(1, limit=50, after_id=9, fields=["email"])
+
+        assert roster == [{"enrollment_id": 10, "id": 3}]
+        mock_read_roster.assert_called_once_with(
+            1, limit=50, after_id=9, fields=["email"]
+        )
+
+    @patch("app.services.course.course_db_read_roster")
+    def test_course_roster_course_not_found(self, mock_read_roster, mock_db_read_one):
+        mock_db_read_one.return_value = None
+
+        assert course_roster(999) is None
+        mock_read_roster.assert_not_called()
+
+
 @patch("app.models.course.db")
 @patch("app.services.course.course_dict_to_row")
 class TestCourseCreateService:
@@ -167,6 +213,7 @@ class TestCourseCreateService:
         mock_course_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_course_create_data,
         valid_course_rows,
@@ -174,6 +221,8 @@ class TestCourseCreateService:
         # Mock the course_dict_to_row function
         mock_course_dict_to_row.return_value = ("title", "code", 1, 1)
 
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [1, 2]
         mock_db_read_many.return_value = valid_course_rows
 
@@ -190,12 +239,15 @@ class TestCourseCreateService:
         mock_course_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_course_create_data,
     ):
         # Mock the course_dict_to_row function
         mock_course_dict_to_row.return_value = ("title", "code", 1, 1)
 
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [None, None]
         results, error, status_code = create_new_courses(valid_course_create_data)
 
@@ -204,6 +256,28 @@ class TestCourseCreateService:
         assert status_code == 400
         mock_db_read_many.assert_not_called()
 
+    def test_create_new_courses_batched(
+        self,
+        mock_course_dict_to_row,
+        mock_db_instance,
+        mock_db_create,
+        mock_db_create_many,
+        mock_db_read_many,
+        valid_course_create_data,
+        valid_course_rows,
+    ):
+        mock_db_create_many.return_value = valid_course_rows
+
+        results, error, status_code = create_new_courses(valid_course_create_data)
+
+        assert results == valid_course_rows
+        assert error is None
+        assert status_code == 201
+        mock_db_create_many.assert_called_once()
+        assert len(mock_db_create_many.call_args.args[0]) == 2
+        mock_db_create.assert_not_called()
+        mock_db_read_many.assert_not_called()
+
 
 @patch("app.models.course.db")
 @patch("app.services.course.course_dict_to_row")
@@ -213,25 +287,24 @@ class TestCourseUpdateService:
         mock_course_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_course_update_data,
         valid_course_row,
     ):
         # Mock the course_dict_to_row function
         mock_course_dict_to_row.return_value = ("title", "code", 1, 1)
 
-        mock_db_read_one.return_value = valid_course_row
-
-        mock_db_update.return_value = 1
         mock_db_read_many.return_value = [valid_course_row]
+        mock_db_update_many.return_value = [valid_course_row]
 
         results, error, status_code = update_courses(valid_course_update_data)
 
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
+        mock_db_update_many.assert_called_once()
+        mock_db_update.assert_not_called()
         mock_db_read_many.assert_called_once_with([1])
 
     def test_update_courses_no_success(
@@ -239,32 +312,31 @@ class TestCourseUpdateService:
         mock_course_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_course_update_data,
         valid_course_row,
     ):
         # Mock the course_dict_to_row function
         mock_course_dict_to_row.return_value = ("title", "code", 1, 1)
 
-        mock_db_read_one.return_value = valid_course_row
-
-        mock_db_update.return_value = 0
+        mock_db_read_many.return_value = [{"id": 1}]  # Record exists
+        mock_db_update_many.return_value = []  # Simulate no update
         results, error, status_code = update_courses(valid_course_update_data)
 
         assert results == []
         assert error == [{"message": "Course ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_courses_missing_id(
         self,
         mock_course_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         course_missing_id,
     ):
         results, error, status_code = update_courses(course_missing_id)
@@ -282,6 +354,7 @@ class TestCourseArchiveService:
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_course_ids,
@@ -293,16 +366,18 @@ class TestCourseArchiveService:
             valid_course_row,
             valid_course_row,
         ]  # Mock read_by_ids_func
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [{"id": 1}, {"id": 2}]
         archived = archive_courses(valid_course_ids)
 
         assert len(archived[0]) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with(valid_course_ids)
+        mock_db_archive.assert_not_called()
 
     def test_archive_courses_none_archived(
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_course_ids,
@@ -310,10 +385,11 @@ class TestCourseArchiveService:
     ):
         # Mock that courses exist
         mock_db_read_one.return_value = valid_course_row  # Mock get_existing_func
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         archived = archive_courses(valid_course_ids)
 
         assert archived[0] == []
+        mock_db_archive.assert_not_called()
 
     def test_archive_courses_invalid_ids(
         self, mock_db_instance, mock_db_archive, mock_db_read_one, mock_db_read_many
@@ -334,7 +410,54 @@ class TestCourseModel:
         mock_execute.return_value = [{"mocked": True}]
         result = course_db_read_all()
         assert result == [{"mocked": True}]
-        mock_execute.assert_called_once_with("SELECT * FROM courses;")
+        mock_execute.assert_called_once_with("SELECT * FROM courses;", ())
+
+    @patch("app.models.course.db.execute_query")
+    def test_course_db_read_all_paginated(self, mock_execute):
+        mock_execute.return_value = [{"id": 11}, {"id": 12}]
+        result = course_db_read_all(limit=2, after_id=10)
+        assert result == [{"id": 11}, {"id": 12}]
+        mock_execute.assert_called_once_with(
+            "SELECT * FROM courses WHERE id > %s ORDER BY id LIMIT %s;", (10, 2)
+        )
+
+    @patch("app.models.course.db.stream_query")
+    @patch("app.models.course.db.execute_query")
+    def test_course_db_read_all_stream(self, mock_execute, mock_stream):
+        mock_stream.return_value = iter([{"id": 1}, {"id": 2}])
+        result = course_db_read_all(stream=True)
+        assert list(result) == [{"id": 1}, {"id": 2}]
+        mock_stream.assert_called_once_with("SELECT * FROM courses;", ())
+        mock_execute.assert_not_called()
+
+    @patch("app.models.course.db.execute_query")
+    def test_course_db_read_all_filtered(self, mock_execute):
+        mock_execute.return_value = [{"id": 1, "code": "x"}]
+        result = course_db_read_all(
+            active_only=True, filters={"term_id": "5"}, fields=["code"], limit=10
+        )
+        assert result == [{"id": 1, "code": "x"}]
+        mock_execute.assert_called_once_with(
+            "SELECT id, code FROM courses WHERE is_archived = FALSE AND term_id = %s "
+            "ORDER BY id LIMIT %s;",
+            (5, 10),
+        )
+
+    def test_course_db_read_all_rejects_unknown_filter_and_field(self):
+        with pytest.raises(ValueError, match="Unknown filter: secret"):
+            course_db_read_all(filters={"secret": "1"})
+        with pytest.raises(ValueError, match="Unknown field: secret"):
+            course_db_read_all(fields=["secret"])
+
+    @patch("app.models.course.db.execute_query")
+    def test_course_db_read_version(self, mock_execute):
+        version = {"last_modified": datetime(2025, 1, 1), "row_count": 2}
+        mock_execute.return_value = [version]
+        assert course_db_read_version(active_only=True) == version
+        mock_execute.assert_called_once_with(
+            "SELECT MAX(updated_at) AS last_modified, COUNT(*) AS row_count "
+            "FROM courses WHERE is_archived = FALSE;"
+        )
 
     @patch("app.models.course.db.execute_query")
     def test_course_db_read_all_active(self, mock_execute):
@@ -402,20 +525,48 @@ class TestCourseModel:
         result = course_db_insert(("bad",))
         assert result is None
 
+    @patch("app.models.course.db.execute_values")
+    def test_course_db_insert_many(self, mock_execute_values):
+        mock_execute_values.return_value = [{"id": 1}, {"id": 2}]
+        rows = [("a",), ("b",)]
+
+        result = course_db_insert_many(rows)
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, called_rows = mock_execute_values.call_args.args
+        assert query.startswith("INSERT INTO courses (")
+        assert "VALUES %s RETURNING *" in query
+        assert called_rows == rows
+
     @patch("app.models.course.db.execute_query")
     def test_course_db_update_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
         mock_execute.return_value = mock_cursor
 
-        result = course_db_update(1, ("x",) * 4)
+        result = course_db_update(1, ("x",) * 5)
         assert result == 1
 
     @patch("app.models.course.db.execute_query")
     def test_course_db_update_failure(self, mock_execute):
         mock_execute.return_value = None
-        result = course_db_update(1, ("x",) * 4)
+        result = course_db_update(1, ("x",) * 5)
         assert result == 0
 
+    @patch("app.models.course.db.execute_query")
+    def test_course_db_update_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = course_db_update_many([(1, ("a",) * 12), (2, ("b",) * 12)])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        mock_execute.assert_called_once()
+        query, params = mock_execute.call_args.args
+        assert "UPDATE courses AS t" in query
+        assert "json_populate_recordset(NULL::courses, %s)" in query
+        assert "RETURNING t.*" in query
+        records = json.loads(params[0])
+        assert [r["id"] for r in records] == [1, 2]
+
     @patch("app.models.course.db.execute_query")
     def test_course_db_archive_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -429,6 +580,49 @@ class TestCourseModel:
         result = course_db_archive(999)
         assert result == 0
 
+    @patch("app.models.course.db.execute_query")
+    def test_course_db_archive_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = course_db_archive_many([1, 2, 3])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, params = mock_execute.call_args.args
+        assert "UPDATE courses" in query
+        assert "WHERE id = ANY(%s) AND is_archived = FALSE" in query
+        assert "RETURNING *" in query
+        assert params == ([1, 2, 3],)
+
+    @patch("app.models.course.db.execute_query")
+    def test_course_db_read_roster(self, mock_execute):
+        mock_execute.return_value = [{"enrollment_id": 11, "grade": "A", "id": 3}]
+
+        result = course_db_read_roster(1, limit=2, after_id=10, fields=["email"])
+
+        assert result == [{"enrollment_id": 11, "grade": "A", "id": 3}]
+        query, params = mock_execute.call_args.args
+        assert "SELECT e.id AS enrollment_id, e.grade, s.id, s.email" in query
+        assert "JOIN students s ON s.id = e.student_id" in query
+        assert query.endswith(
+            "WHERE e.course_id = %s AND e.is_archived = FALSE"
+            " AND e.id > %s ORDER BY e.id LIMIT %s;"
+        )
+        assert params == (1, 10, 2)
+
+    @patch("app.models.course.db.execute_query")
+    def test_course_db_read_roster_all_student_columns(self, mock_execute):
+        mock_execute.return_value = []
+
+        assert course_db_read_roster(1) == []
+        query, params = mock_execute.call_args.args
+        assert "e.grade, s.*" in query
+        assert query.endswith("ORDER BY e.id;")
+        assert params == (1,)
+
+    def test_course_db_read_roster_rejects_unknown_field(self):
+        with pytest.raises(ValueError, match="Unknown field: password"):
+            course_db_read_roster(1, fields=["password"])
+
 
 # =======================
 # Route Tests
@@ -495,6 +689,124 @@ class TestCourseReadRoute:
         assert "internal server error: db error" in data["error"].lower()
         mock_get_by_id.assert_called_once_with(1)
 
+    @patch("app.routes.course.get_courses_version")
+    @patch("app.routes.course.get_all_courses")
+    def test_handle_read_all_courses_sets_validators(
+        self, mock_get, mock_version, client
+    ):
+        mock_get.return_value = [{"id": 1}]
+        mock_version.return_value = {
+            "last_modified": datetime(2025, 1, 1, 12, 0, 0),
+            "row_count": 1,
+        }
+
+        response = client.get("/api/courses")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('W/"')
+        assert response.headers["Last-Modified"] == "Wed, 01 Jan 2025 12:00:00 GMT"
+        assert response.headers["Cache-Control"] == "no-cache"
+
+    @patch("app.routes.course.get_courses_version")
+    @patch("app.routes.course.get_all_courses")
+    def test_handle_read_all_courses_not_modified(self, mock_get, mock_version, client):
+        mock_get.return_value = [{"id": 1}]
+        mock_version.return_value = {
+            "last_modified": datetime(2025, 1, 1, 12, 0, 0),
+            "row_count": 1,
+        }
+        etag = client.get("/api/courses").headers["ETag"]
+        mock_get.reset_mock()
+
+        response = client.get("/api/courses", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+        mock_get.assert_not_called()
+
+    @patch("app.routes.course.get_courses_version")
+    @patch("app.routes.course.get_all_courses")
+    def test_handle_read_all_courses_modified_after_write(
+        self, mock_get, mock_version, client
+    ):
+        mock_get.return_value = [{"id": 1}]
+        mock_version.return_value = {
+            "last_modified": datetime(2025, 1, 1, 12, 0, 0),
+            "row_count": 1,
+        }
+        etag = client.get("/api/courses").headers["ETag"]
+        mock_version.return_value = {
+            "last_modified": datetime(2025, 1, 1, 12, 0, 5),
+            "row_count": 1,
+        }
+
+        response = client.get("/api/courses", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    @patch("app.routes.course.get_courses_version")
+    @patch("app.routes.course.get_all_courses")
+    def test_handle_read_all_courses_skips_version_for_later_pages(
+        self, mock_get, mock_version, client
+    ):
+        mock_get.return_value = [{"id": 1}]
+
+        for query in ("after_id=10", "term_id=1"):
+            response = client.get(f"/api/courses?{query}")
+
+            assert response.status_code == 200
+            assert "ETag" not in response.headers
+        mock_version.assert_not_called()
+
+    @patch("app.routes.course.get_course_by_id")
+    def test_handle_get_course_by_id_not_modified_since(self, mock_get_by_id, client):
+        mock_get_by_id.return_value = {
+            "id": 1,
+            "updated_at": datetime(2025, 1, 1, 12, 0, 0, 123456),
+        }
+
+        response = client.get(
+            "/api/courses/1",
+            headers={"If-Modified-Since": "Wed, 01 Jan 2025 12:00:00 GMT"},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["ETag"].startswith('W/"')
+
+    @patch("app.routes.course.course_roster")
+    def test_handle_get_course_roster(self, mock_roster, client):
+        mock_roster.return_value = [
+            {"enrollment_id": 10, "id": 3},
+            {"enrollment_id": 12, "id": 4},
+        ]
+
+        response = client.get("/api/courses/1/roster?limit=2&fields=first_name,email")
+        data = response.get_json()
+
+        assert response.status_code == 200
+        assert data["message"] == "Roster fetched successfully."
+        assert len(data["data"]) == 2
+        assert "next_cursor" in data
+        mock_roster.assert_called_once_with(
+            1, limit=2, after_id=None, fields=["first_name", "email"]
+        )
+
+        mock_roster.reset_mock()
+        mock_roster.return_value = []
+        client.get(f"/api/courses/1/roster?limit=2&cursor={data['next_cursor']}")
+        assert mock_roster.call_args.kwargs["after_id"] == 12
+
+    @patch("app.routes.course.course_roster")
+    def test_handle_get_course_roster_not_found(self, mock_roster, client):
+        mock_roster.return_value = None
+
+        response = client.get("/api/courses/999/roster")
+
+        assert response.status_code == 404
+        assert "Course not found" in response.get_json()["error"]
+
 
 class TestCourseCreateRoute:
     @patch("app.routes.course.create_new_courses")
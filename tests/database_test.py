@@ -0,0 +1,483 @@
+import psycopg2
+import pytest
+from flask import Flask
+from unittest.mock import MagicMock, patch
+from db.database import Database
+
+
+@pytest.fixture
+def mock_pool():
+    Database()  # make sure config and pool are initialized before patching
+    pool = MagicMock()
+    with patch.object(Database, "_pool", pool):
+        yield pool
+
+
+@pytest.fixture
+def scoped_app():
+    app = Flask(__name__)
+    Database.init_app(app)
+    return app
+
+
+# =======================
+# Request Scope Tests
+# =======================
+
+
+class TestRequestScope:
+    def test_queries_share_one_connection_per_request(self, mock_pool, scoped_app):
+        db = Database()
+
+        @scoped_app.route("/two-queries")
+        def two_queries():
+            db.execute_query("SELECT * FROM students;")
+            db.execute_query(
+                "UPDATE students SET status = 'active' WHERE id = %s;", (1,)
+            )
+            return "ok"
+
+        conn = mock_pool.getconn.return_value
+        response = scoped_app.test_client().get("/two-queries")
+
+        assert response.status_code == 200
+        mock_pool.getconn.assert_called_once()
+        mock_pool.putconn.assert_called_once_with(conn)
+        conn.cursor.assert_called_once()
+        conn.commit.assert_called_once()
+
+    def test_failed_statement_rolls_back_to_savepoint(self, mock_pool, scoped_app):
+        db = Database()
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        cursor.execute.side_effect = [psycopg2.IntegrityError("duplicate"), None]
+
+        @scoped_app.route("/failing-insert")
+        def failing_insert():
+            with pytest.raises(ValueError):
+                db.execute_query("INSERT INTO departments (name) VALUES (%s);", ("x",))
+            return "ok"
+
+        scoped_app.test_client().get("/failing-insert")
+
+        first_call = cursor.execute.call_args_list[0].args[0]
+        assert first_call.startswith("SAVEPOINT db_statement;")
+        cursor.execute.assert_called_with("ROLLBACK TO SAVEPOINT db_statement;")
+
+    def test_failed_savepoint_rollback_fails_the_request(self, mock_pool, scoped_app):
+        db = Database()
+        conn = mock_pool.getconn.return_value
+        cursor = conn.cursor.return_value
+        cursor.execute.side_effect = [
+            None,
+            psycopg2.OperationalError("server closed the connection"),
+            psycopg2.OperationalError("no savepoint"),
+        ]
+
+        @scoped_app.route("/savepoint-lost")
+        def savepoint_lost():
+            db.execute_query("UPDATE students SET status = 'active' WHERE id = 1;")
+            with pytest.raises(RuntimeError):
+                db.execute_query("UPDATE students SET status = 'active' WHERE id = 2;")
+            # The first update was rolled back with the rest, so nothing runs
+            with pytest.raises(RuntimeError, match="rolled back"):
+                db.execute_query("SELECT 1;")
+            return "ok"
+
+        response = scoped_app.test_client().get("/savepoint-lost")
+
+        assert response.status_code == 500
+        assert "rolled back" in response.get_json()["error"]
+        assert cursor.execute.call_count == 3
+        conn.commit.assert_not_called()
+        mock_pool.putconn.assert_called_once_with(conn)
+
+    def test_each_statement_releases_the_previous_savepoint(
+        self, mock_pool, scoped_app
+    ):
+        db = Database()
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+
+        @scoped_app.route("/three-queries")
+        def three_queries():
+            for _ in range(3):
+                db.execute_query("SELECT 1;")
+            return "ok"
+
+        scoped_app.test_client().get("/three-queries")
+
+        statements = [call.args[0] for call in cursor.execute.call_args_list]
+        assert statements == [
+            "SAVEPOINT db_statement; SELECT 1;",
+            "RELEASE SAVEPOINT db_statement; SAVEPOINT db_statement; SELECT 1;",
+            "RELEASE SAVEPOINT db_statement; SAVEPOINT db_statement; SELECT 1;",
+        ]
+
+    def test_commit_failure_returns_500(self, mock_pool, scoped_app):
+        db = Database()
+        conn = mock_pool.getconn.return_value
+        conn.commit.side_effect = psycopg2.OperationalError("connection lost")
+
+        @scoped_app.route("/commit-fails")
+        def commit_fails():
+            db.execute_query("SELECT 1;")
+            return "ok"
+
+        response = scoped_app.test_client().get("/commit-fails")
+
+        assert response.status_code == 500
+        assert "Database error" in response.get_json()["error"]
+        mock_pool.putconn.assert_called_once_with(conn)
+
+    def test_failed_request_is_rolled_back(self, mock_pool, scoped_app):
+        db = Database()
+        conn = mock_pool.getconn.return_value
+
+        @scoped_app.route("/fails-after-write")
+        def fails_after_write():
+            db.execute_query("UPDATE students SET status = 'active';")
+            return {"error": "Internal server error"}, 500
+
+        response = scoped_app.test_client().get("/fails-after-write")
+
+        assert response.status_code == 500
+        conn.commit.assert_not_called()
+        conn.rollback.assert_called()
+        mock_pool.putconn.assert_called_once_with(conn)
+
+    def test_cursor_failure_returns_the_connection(self, mock_pool, scoped_app):
+        db = Database()
+        conn = mock_pool.getconn.return_value
+        conn.cursor.side_effect = psycopg2.OperationalError("connection lost")
+
+        @scoped_app.route("/no-cursor")
+        def no_cursor():
+            with pytest.raises(psycopg2.OperationalError):
+                db.execute_query("SELECT 1;")
+            return "ok"
+
+        scoped_app.test_client().get("/no-cursor")
+
+        mock_pool.putconn.assert_called_once_with(conn)
+
+    def test_outside_request_uses_connection_per_query(self, mock_pool, scoped_app):
+        db = Database()
+        db.execute_query("SELECT 1;")
+        db.execute_query("SELECT 1;")
+
+        assert mock_pool.getconn.call_count == 2
+        assert mock_pool.putconn.call_count == 2
+
+
+class TestTransaction:
+    def test_statements_share_one_commit(self, mock_pool):
+        db = Database()
+        conn = mock_pool.getconn.return_value
+
+        with db.transaction():
+            db.execute_query("INSERT INTO terms (name) VALUES (%s);", ("Fall",))
+            db.copy_rows("terms", ["name"], [("Winter",)])
+            conn.commit.assert_not_called()
+
+        mock_pool.getconn.assert_called_once()
+        conn.commit.assert_called()
+        conn.rollback.assert_not_called()
+        mock_pool.putconn.assert_called_once_with(conn)
+
+    def test_failure_rolls_back_everything(self, mock_pool):
+        db = Database()
+        conn = mock_pool.getconn.return_value
+        conn.cursor.return_value.copy_expert.side_effect = psycopg2.OperationalError(
+            "connection lost"
+        )
+
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.execute_query("INSERT INTO terms (name) VALUES (%s);", ("Fall",))
+                db.copy_rows("terms", ["name"], [("Winter",)])
+
+        conn.rollback.assert_called_once()
+        mock_pool.putconn.assert_called_once_with(conn)
+
+
+# =======================
+# Query Tests
+# =======================
+
+
+class TestExecuteQuery:
+    def test_with_query_fetches_rows(self, mock_pool):
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        cursor.fetchall.return_value = [{"id": 1}]
+
+        result = Database().execute_query("WITH t AS (SELECT 1 AS id) SELECT * FROM t;")
+
+        assert result == [{"id": 1}]
+
+    def test_statement_without_rows_returns_cursor(self, mock_pool):
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        cursor.description = None
+
+        result = Database().execute_query(
+            "WITH t AS (SELECT 1 AS id) UPDATE courses SET capacity = 1 FROM t;"
+        )
+
+        assert result is cursor
+        cursor.fetchall.assert_not_called()
+
+
+# =======================
+# Multi-row Tests
+# =======================
+
+
+class TestExecuteValues:
+    def test_execute_values_sends_one_statement(self, mock_pool):
+        with patch("db.database.psycopg2.extras.execute_values") as mock_values:
+            mock_values.return_value = [{"id": 1}, {"id": 2}]
+            rows = [("a",), ("b",)]
+
+            result = Database().execute_values(
+                "INSERT INTO departments (name) VALUES %s RETURNING *;", rows
+            )
+
+        assert result == [{"id": 1}, {"id": 2}]
+        mock_values.assert_called_once()
+        assert mock_values.call_args.kwargs == {"page_size": 2, "fetch": True}
+        mock_pool.getconn.return_value.commit.assert_called()
+        mock_pool.putconn.assert_called_once()
+
+    def test_execute_values_empty_rows(self, mock_pool):
+        assert Database().execute_values("INSERT ... VALUES %s;", []) == []
+        mock_pool.getconn.assert_not_called()
+
+
+# =======================
+# Streaming Tests
+# =======================
+
+
+class TestStreamQuery:
+    def test_stream_query_fetches_in_batches(self, mock_pool):
+        conn = mock_pool.getconn.return_value
+        cursor = conn.cursor.return_value
+        cursor.fetchmany.side_effect = [[{"id": 1}, {"id": 2}], [{"id": 3}], []]
+
+        rows = list(Database().stream_query("SELECT * FROM students;", batch_size=2))
+
+        assert rows == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert conn.cursor.call_args.kwargs["name"].startswith("stream_")
+        cursor.execute.assert_called_once_with("SELECT * FROM students;", ())
+        cursor.fetchmany.assert_called_with(2)
+        cursor.close.assert_called_once()
+        mock_pool.putconn.assert_called_once_with(conn)
+
+    def test_stream_query_is_lazy(self, mock_pool):
+        Database().stream_query("SELECT * FROM students;")
+        mock_pool.getconn.assert_not_called()
+
+    def test_stream_query_returns_connection_when_closed_early(self, mock_pool):
+        conn = mock_pool.getconn.return_value
+        conn.cursor.return_value.fetchmany.return_value = [{"id": 1}, {"id": 2}]
+
+        rows = Database().stream_query("SELECT * FROM students;")
+        assert next(rows) == {"id": 1}
+        rows.close()
+
+        mock_pool.putconn.assert_called_once_with(conn)
+
+
+# =======================
+# COPY Tests
+# =======================
+
+
+def read_all(sql, stream, size):
+    """copy_expert stand-in that drains the stream like PostgreSQL does."""
+    while stream.read(size):
+        pass
+
+
+class TestCopyStream:
+    def test_text_format_is_encoded_lazily(self):
+        from db.copy_stream import CopyStream
+
+        stream = CopyStream(
+            iter([(1, "a\tb", None, True), (2, "back\\slash\n", 0, False)])
+        )
+
+        first = stream.read(4)
+        assert first == b"1\ta\\"
+        assert stream.rows == 1
+        assert first + stream.read() == (
+            b"1\ta\\tb\t\\N\tt\n2\tback\\\\slash\\n\t0\tf\n"
+        )
+        assert stream.rows == 2
+        assert stream.read(10) == b""
+
+    def test_csv_format_tells_null_from_empty(self):
+        from db.copy_stream import CopyStream
+
+        stream = CopyStream([(None, "", 'say "hi", bye', True)], format="csv")
+
+        assert stream.read() == b',"","say ""hi"", bye",t\n'
+
+    def test_binary_format(self):
+        from db.copy_stream import (
+            BINARY_HEADER,
+            BINARY_TRAILER,
+            CopyStream,
+            get_binary_encoders,
+        )
+
+        encoders = get_binary_encoders(
+            ["integer", "character varying", "boolean", "timestamp without time zone"]
+        )
+        stream = CopyStream([(7, "é", None, "2000-01-01 00:00:01")], "binary", encoders)
+
+        assert stream.read() == (
+            BINARY_HEADER
+            + b"\x00\x04"
+            + b"\x00\x00\x00\x04\x00\x00\x00\x07"
+            + b"\x00\x00\x00\x02\xc3\xa9"
+            + b"\xff\xff\xff\xff"
+            + b"\x00\x00\x00\x08\x00\x00\x00\x00\x00\x0f\x42\x40"
+            + BINARY_TRAILER
+        )
+
+    def test_binary_format_rejects_unsupported_types(self):
+        from db.copy_stream import get_binary_encoders
+
+        with pytest.raises(ValueError, match="does not support numeric"):
+            get_binary_encoders(["integer", "numeric"])
+
+    def test_errors_end_the_stream_instead_of_escaping_read(self):
+        from db.copy_stream import CopyStream
+
+        def rows():
+            yield (1,)
+            raise ValueError("Row 2: bad")
+
+        stream = CopyStream(rows())
+
+        assert stream.read() == b"1\n"
+        assert str(stream.error) == "Row 2: bad"
+
+    def test_unencodable_rows_are_numbered(self):
+        from db.copy_stream import CopyStream, get_binary_encoders
+
+        stream = CopyStream(
+            [(1,), ("x",)], "binary", get_binary_encoders(["integer"]), first_row=11
+        )
+        stream.read()
+
+        assert str(stream.error).startswith("Row 12: cannot encode ('x',)")
+
+
+class TestCopyRows:
+    def test_copy_rows_streams_and_commits(self, mock_pool):
+        conn = mock_pool.getconn.return_value
+        cursor = conn.cursor.return_value
+        cursor.copy_expert.side_effect = read_all
+
+        count = Database().copy_rows("terms", ["id", "name"], iter([(1, "F")] * 5))
+
+        assert count == 5
+        assert cursor.copy_expert.call_args.args[0] == (
+            "COPY terms (id, name) FROM STDIN"
+        )
+        conn.commit.assert_called()
+        mock_pool.putconn.assert_called_once()
+
+    def test_copy_rows_in_chunks(self, mock_pool):
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        cursor.copy_expert.side_effect = read_all
+
+        count = Database().copy_rows(
+            "terms", ["id"], ((i,) for i in range(5)), format="csv", chunk_size=2
+        )
+
+        assert count == 5
+        assert cursor.copy_expert.call_count == 3
+        assert cursor.copy_expert.call_args.args[0].endswith("WITH (FORMAT csv)")
+
+    def test_copy_rows_names_the_rejected_row(self, mock_pool):
+        conn = mock_pool.getconn.return_value
+        cursor = conn.cursor.return_value
+        error = psycopg2.IntegrityError(
+            "duplicate key value\nCONTEXT:  COPY terms, line 2"
+        )
+
+        def copy_expert(sql, stream, size):
+            read_all(sql, stream, size)
+            if cursor.copy_expert.call_count == 2:
+                raise error
+
+        cursor.copy_expert.side_effect = copy_expert
+
+        with pytest.raises(ValueError, match="Integrity error: Row 5: duplicate key"):
+            Database().copy_rows(
+                "terms", ["id"], [(i,) for i in range(6)], chunk_size=3
+            )
+        conn.rollback.assert_called_once()
+
+    def test_copy_rows_reraises_errors_from_rows(self, mock_pool):
+        conn = mock_pool.getconn.return_value
+        conn.cursor.return_value.copy_expert.side_effect = read_all
+
+        def rows():
+            yield (1,)
+            raise ValueError("Row 2: coop must be true or false")
+
+        with pytest.raises(ValueError, match="Row 2: coop"):
+            Database().copy_rows("students", ["id"], rows())
+        conn.rollback.assert_called_once()
+        conn.commit.assert_called_once()  # by close(), after the rollback
+
+    def test_copy_rows_binary_looks_up_column_types(self, mock_pool):
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        cursor.fetchall.return_value = [
+            {"column_name": "id", "data_type": "integer"},
+            {"column_name": "name", "data_type": "character varying"},
+        ]
+        cursor.copy_expert.side_effect = read_all
+
+        assert Database().copy_rows("terms", ["name", "id"], [("F", 1)], "binary") == 1
+        assert cursor.copy_expert.call_args.args[0].endswith("WITH (FORMAT binary)")
+
+    def test_copy_rows_inside_a_request_uses_a_savepoint(self, mock_pool, scoped_app):
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        cursor.copy_expert.side_effect = psycopg2.DataError("invalid input syntax")
+
+        with scoped_app.test_request_context():
+            with pytest.raises(ValueError, match="Invalid data: invalid input"):
+                Database().copy_rows("terms", ["id"], [("x",)])
+
+        statements = [call.args[0] for call in cursor.execute.call_args_list]
+        assert statements == [
+            "SAVEPOINT db_copy;",
+            "ROLLBACK TO SAVEPOINT db_copy;",
+        ]
+
+
+class TestExecuteMany:
+    def test_execute_many_raises_instead_of_returning_none(self, mock_pool):
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        cursor.executemany.side_effect = psycopg2.OperationalError("gone")
+
+        with pytest.raises(RuntimeError, match="Database error: gone"):
+            Database().execute_many("INSERT INTO terms (id) VALUES (%s)", [(1,)])
+
+
+class TestExecuteScript:
+    def test_failed_script_rolls_back_and_raises(self, mock_pool):
+        conn = mock_pool.getconn.return_value
+        conn.cursor.return_value.execute.side_effect = [
+            None,
+            psycopg2.errors.FeatureNotSupported("extension is not allow-listed"),
+        ]
+
+        with pytest.raises(RuntimeError, match="not allow-listed"):
+            Database().execute_script("CREATE TABLE t (id INT);\nCREATE EXTENSION x;")
+
+        conn.rollback.assert_called_once()
+        mock_pool.putconn.assert_called_once_with(conn)
@@ -1,13 +1,18 @@
+import json
 import pytest
-from datetime import date
+from datetime import date, datetime
 from unittest.mock import patch
 from app.models import (
     department_db_read_all,
+    department_db_read_version,
     department_db_read_by_id,
     department_db_read_by_ids,
     department_db_insert,
+    department_db_insert_many,
     department_db_update,
+    department_db_update_many,
     department_db_archive,
+    department_db_archive_many,
 )
 from app.services import (
     get_all_departments,
@@ -104,18 +109,36 @@ def mock_db_create():
         yield mock
 
 
+@pytest.fixture
+def mock_db_create_many():
+    with patch("app.services.department.department_db_insert_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_update():
     with patch("app.services.department.department_db_update") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_update_many():
+    with patch("app.services.department.department_db_update_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_archive():
     with patch("app.services.department.department_db_archive") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_archive_many():
+    with patch("app.services.department.department_db_archive_many") as mock:
+        yield mock
+
+
 # =======================
 # Service Tests
 # =======================
@@ -156,6 +179,7 @@ class TestDepartmentCreateService:
         mock_department_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_department_create_data,
         valid_department_rows,
@@ -163,6 +187,8 @@ class TestDepartmentCreateService:
         # Mock the department_dict_to_row function
         mock_department_dict_to_row.return_value = ("Computer Science",)
 
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [1, 2]
         mock_db_read_many.return_value = valid_department_rows
 
@@ -181,12 +207,15 @@ class TestDepartmentCreateService:
         mock_department_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_department_create_data,
     ):
         # Mock the department_dict_to_row function
         mock_department_dict_to_row.return_value = ("Computer Science",)
 
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [None, None]
         results, error, status_code = create_new_departments(
             valid_department_create_data
@@ -197,6 +226,30 @@ class TestDepartmentCreateService:
         assert status_code == 400
         mock_db_read_many.assert_not_called()
 
+    def test_create_new_departments_batched(
+        self,
+        mock_department_dict_to_row,
+        mock_db_instance,
+        mock_db_create,
+        mock_db_create_many,
+        mock_db_read_many,
+        valid_department_create_data,
+        valid_department_rows,
+    ):
+        mock_db_create_many.return_value = valid_department_rows
+
+        results, error, status_code = create_new_departments(
+            valid_department_create_data
+        )
+
+        assert results == valid_department_rows
+        assert error is None
+        assert status_code == 201
+        mock_db_create_many.assert_called_once()
+        assert len(mock_db_create_many.call_args.args[0]) == 2
+        mock_db_create.assert_not_called()
+        mock_db_read_many.assert_not_called()
+
 
 @patch("app.models.department.db")
 @patch("app.services.department.department_dict_to_row")
@@ -206,25 +259,24 @@ class TestDepartmentUpdateService:
         mock_department_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_department_update_data,
         valid_department_row,
     ):
         # Mock the department_dict_to_row function
         mock_department_dict_to_row.return_value = ("Computer Science",)
 
-        mock_db_read_one.return_value = valid_department_row
-
-        mock_db_update.return_value = 1
         mock_db_read_many.return_value = [valid_department_row]
+        mock_db_update_many.return_value = [valid_department_row]
 
         results, error, status_code = update_departments(valid_department_update_data)
 
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
+        mock_db_update_many.assert_called_once()
+        mock_db_update.assert_not_called()
         mock_db_read_many.assert_called_once_with([1])
 
     def test_update_departments_no_success(
@@ -232,32 +284,31 @@ class TestDepartmentUpdateService:
         mock_department_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_department_update_data,
         valid_department_row,
     ):
         # Mock the department_dict_to_row function
         mock_department_dict_to_row.return_value = ("Computer Science",)
 
-        mock_db_read_one.return_value = valid_department_row
-
-        mock_db_update.return_value = 0
+        mock_db_read_many.return_value = [{"id": 1}]  # Record exists
+        mock_db_update_many.return_value = []  # Simulate no update
         results, error, status_code = update_departments(valid_department_update_data)
 
         assert results == []
         assert error == [{"message": "Department ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_departments_missing_id(
         self,
         mock_department_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         department_missing_id,
     ):
         results, error, status_code = update_departments(department_missing_id)
@@ -275,6 +326,7 @@ class TestDepartmentArchiveService:
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_department_ids,
@@ -287,16 +339,18 @@ class TestDepartmentArchiveService:
             valid_department_row,
         ]
 
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [{"id": 1}, {"id": 2}]
         archived, errors, status_code = archive_departments(valid_department_ids)
 
         assert len(archived) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with(valid_department_ids)
+        mock_db_archive.assert_not_called()
 
     def test_archive_departments_none_archived(
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_department_ids,
@@ -305,10 +359,11 @@ class TestDepartmentArchiveService:
         # Mock that departments exist
         mock_db_read_one.return_value = valid_department_row
 
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         archived, errors, status_code = archive_departments(valid_department_ids)
 
         assert archived == []
+        mock_db_archive.assert_not_called()
 
     def test_archive_departments_invalid_ids(
         self, mock_db_instance, mock_db_archive, mock_db_read_one, mock_db_read_many
@@ -329,7 +384,54 @@ class TestDepartmentModel:
         mock_execute.return_value = [{"mocked": "data"}]
         result = department_db_read_all()
         assert result == [{"mocked": "data"}]
-        mock_execute.assert_called_once_with("SELECT * FROM departments;")
+        mock_execute.assert_called_once_with("SELECT * FROM departments;", ())
+
+    @patch("app.models.department.db.execute_query")
+    def test_department_db_read_all_paginated(self, mock_execute):
+        mock_execute.return_value = [{"id": 11}, {"id": 12}]
+        result = department_db_read_all(limit=2, after_id=10)
+        assert result == [{"id": 11}, {"id": 12}]
+        mock_execute.assert_called_once_with(
+            "SELECT * FROM departments WHERE id > %s ORDER BY id LIMIT %s;", (10, 2)
+        )
+
+    @patch("app.models.department.db.stream_query")
+    @patch("app.models.department.db.execute_query")
+    def test_department_db_read_all_stream(self, mock_execute, mock_stream):
+        mock_stream.return_value = iter([{"id": 1}, {"id": 2}])
+        result = department_db_read_all(stream=True)
+        assert list(result) == [{"id": 1}, {"id": 2}]
+        mock_stream.assert_called_once_with("SELECT * FROM departments;", ())
+        mock_execute.assert_not_called()
+
+    @patch("app.models.department.db.execute_query")
+    def test_department_db_read_all_filtered(self, mock_execute):
+        mock_execute.return_value = [{"id": 1, "name": "x"}]
+        result = department_db_read_all(
+            active_only=True, filters={"name": "Science"}, fields=["name"], limit=10
+        )
+        assert result == [{"id": 1, "name": "x"}]
+        mock_execute.assert_called_once_with(
+            "SELECT id, name FROM departments WHERE is_archived = FALSE AND name = %s "
+            "ORDER BY id LIMIT %s;",
+            ("Science", 10),
+        )
+
+    def test_department_db_read_all_rejects_unknown_filter_and_field(self):
+        with pytest.raises(ValueError, match="Unknown filter: secret"):
+            department_db_read_all(filters={"secret": "1"})
+        with pytest.raises(ValueError, match="Unknown field: secret"):
+            department_db_read_all(fields=["secret"])
+
+    @patch("app.models.department.db.execute_query")
+    def test_department_db_read_version(self, mock_execute):
+        version = {"last_modified": datetime(2025, 1, 1), "row_count": 2}
+        mock_execute.return_value = [version]
+        assert department_db_read_version(active_only=True) == version
+        mock_execute.assert_called_once_with(
+            "SELECT MAX(updated_at) AS last_modified, COUNT(*) AS row_count "
+            "FROM departments WHERE is_archived = FALSE;"
+        )
 
     @patch("app.models.department.db.execute_query")
     def test_department_db_read_all_active(self, mock_execute):
@@ -393,6 +495,19 @@ class TestDepartmentModel:
         result = department_db_insert(("bad",))
         assert result is None
 
+    @patch("app.models.department.db.execute_values")
+    def test_department_db_insert_many(self, mock_execute_values):
+        mock_execute_values.return_value = [{"id": 1}, {"id": 2}]
+        rows = [("a",), ("b",)]
+
+        result = department_db_insert_many(rows)
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, called_rows = mock_execute_values.call_args.args
+        assert query.startswith("INSERT INTO departments (")
+        assert "VALUES %s RETURNING *" in query
+        assert called_rows == rows
+
     @patch("app.models.department.db.execute_query")
     def test_department_db_update_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -407,6 +522,21 @@ class TestDepartmentModel:
         result = department_db_update(1, ("name",))
         assert result == 0
 
+    @patch("app.models.department.db.execute_query")
+    def test_department_db_update_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = department_db_update_many([(1, ("a",) * 12), (2, ("b",) * 12)])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        mock_execute.assert_called_once()
+        query, params = mock_execute.call_args.args
+        assert "UPDATE departments AS t" in query
+        assert "json_populate_recordset(NULL::departments, %s)" in query
+        assert "RETURNING t.*" in query
+        records = json.loads(params[0])
+        assert [r["id"] for r in records] == [1, 2]
+
     @patch("app.models.department.db.execute_query")
     def test_department_db_archive_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -420,6 +550,19 @@ class TestDepartmentModel:
         result = department_db_archive(999)
         assert result == 0
 
+    @patch("app.models.department.db.execute_query")
+    def test_department_db_archive_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = department_db_archive_many([1, 2, 3])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, params = mock_execute.call_args.args
+        assert "UPDATE departments" in query
+        assert "WHERE id = ANY(%s) AND is_archived = FALSE" in query
+        assert "RETURNING *" in query
+        assert params == ([1, 2, 3],)
+
 
 # =======================
 # Route Tests
@@ -486,6 +629,82 @@ class TestDepartmentReadRoute:
         assert "internal server error: db error" in data["error"].lower()
         mock_get_by_id.assert_called_once_with(1)
 
+    @patch("app.routes.department.get_departments_version")
+    @patch("app.routes.department.get_all_departments")
+    def test_handle_read_all_departments_sets_validators(
+        self, mock_get, mock_version, client
+    ):
+        mock_get.return_value = [{"id": 1}]
+        mock_version.return_value = {
+            "last_modified": datetime(2025, 1, 1, 12, 0, 0),
+            "row_count": 1,
+        }
+
+        response = client.get("/api/departments")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('W/"')
+        assert response.headers["Last-Modified"] == "Wed, 01 Jan 2025 12:00:00 GMT"
+        assert response.headers["Cache-Control"] == "no-cache"
+
+    @patch("app.routes.department.get_departments_version")
+    @patch("app.routes.department.get_all_departments")
+    def test_handle_read_all_departments_not_modified(
+        self, mock_get, mock_version, client
+    ):
+        mock_get.return_value = [{"id": 1}]
+        mock_version.return_value = {
+            "last_modified": datetime(2025, 1, 1, 12, 0, 0),
+            "row_count": 1,
+        }
+        etag = client.get("/api/departments").headers["ETag"]
+        mock_get.reset_mock()
+
+        response = client.get("/api/departments", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+        mock_get.assert_not_called()
+
+    @patch("app.routes.department.get_departments_version")
+    @patch("app.routes.department.get_all_departments")
+    def test_handle_read_all_departments_modified_after_write(
+        self, mock_get, mock_version, client
+    ):
+        mock_get.return_value = [{"id": 1}]
+        mock_version.return_value = {
+            "last_modified": datetime(2025, 1, 1, 12, 0, 0),
+            "row_count": 1,
+        }
+        etag = client.get("/api/departments").headers["ETag"]
+        mock_version.return_value = {
+            "last_modified": datetime(2025, 1, 1, 12, 0, 5),
+            "row_count": 1,
+        }
+
+        response = client.get("/api/departments", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    @patch("app.routes.department.get_department_by_id")
+    def test_handle_get_department_by_id_not_modified_since(
+        self, mock_get_by_id, client
+    ):
+        mock_get_by_id.return_value = {
+            "id": 1,
+            "updated_at": datetime(2025, 1, 1, 12, 0, 0, 123456),
+        }
+
+        response = client.get(
+            "/api/departments/1",
+            headers={"If-Modified-Since": "Wed, 01 Jan 2025 12:00:00 GMT"},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["ETag"].startswith('W/"')
+
 
 class TestDepartmentCreateRoute:
     @patch("app.routes.department.create_new_departments")
@@ -1,13 +1,20 @@
+import json
 import pytest
-from datetime import date
+from datetime import date, datetime
 from unittest.mock import patch
 from app.models import (
     enrollment_db_read_all,
+    enrollment_db_read_version,
     enrollment_db_read_by_id,
     enrollment_db_read_by_ids,
     enrollment_db_insert,
+    enrollment_db_insert_many,
     enrollment_db_update,
+    enrollment_db_update_many,
     enrollment_db_archive,
+    enrollment_db_archive_many,
+    enrollment_db_read_student_sessions,
+    course_schedule_db_read_sessions,
 )
 from app.services import (
     get_all_enrollments,
@@ -16,6 +23,7 @@ from app.services import (
     update_enrollments,
     archive_enrollments,
 )
+from app.services.enrollment import check_enrollment_clashes
 
 # =======================
 # Fixtures
@@ -114,18 +122,36 @@ def mock_db_create():
         yield mock
 
 
+@pytest.fixture
+def mock_db_create_many():
+    with patch("app.services.enrollment.enrollment_db_insert_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_update():
     with patch("app.services.enrollment.enrollment_db_update") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_update_many():
+    with patch("app.services.enrollment.enrollment_db_update_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_archive():
     with patch("app.services.enrollment.enrollment_db_archive") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_archive_many():
+    with patch("app.services.enrollment.enrollment_db_archive_many") as mock:
+        yield mock
+
+
 # =======================
 # Service Tests
 # =======================
@@ -166,6 +192,7 @@ class TestEnrollmentCreateService:
         mock_enrollment_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_enrollment_create_data,
         valid_enrollment_rows,
@@ -173,6 +200,8 @@ class TestEnrollmentCreateService:
         # Mock the enrollment_dict_to_row function
         mock_enrollment_dict_to_row.return_value = (1, 1, "A")
 
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [1, 2]
         mock_db_read_many.return_value = valid_enrollment_rows
 
@@ -191,12 +220,15 @@ class TestEnrollmentCreateService:
         mock_enrollment_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_enrollment_create_data,
     ):
         # Mock the enrollment_dict_to_row function
         mock_enrollment_dict_to_row.return_value = (1, 1, "A")
 
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [None, None]
         results, error, status_code = create_new_enrollments(
             valid_enrollment_create_data
@@ -207,6 +239,156 @@ class TestEnrollmentCreateService:
         assert status_code == 400
         mock_db_read_many.assert_not_called()
 
+    def test_create_new_enrollments_batched(
+        self,
+        mock_enrollment_dict_to_row,
+        mock_db_instance,
+        mock_db_create,
+        mock_db_create_many,
+        mock_db_read_many,
+        valid_enrollment_create_data,
+        valid_enrollment_rows,
+    ):
+        mock_db_create_many.return_value = valid_enrollment_rows
+
+        results, error, status_code = create_new_enrollments(
+            valid_enrollment_create_data
+        )
+
+        assert results == valid_enrollment_rows
+        assert error is None
+        assert status_code == 201
+        mock_db_create_many.assert_called_once()
+        assert len(mock_db_create_many.call_args.args[0]) == 2
+        mock_db_create.assert_not_called()
+        mock_db_read_many.assert_not_called()
+
+
+class TestEnrollmentClashService:
+    @pytest.fixture
+    def mock_timetables(self):
+        with (
+            patch(
+                "app.services.enrollment.course_schedule_db_read_sessions"
+            ) as mock_courses,
+            patch(
+                "app.services.enrollment.enrollment_db_read_student_sessions"
+            ) as mock_students,
+        ):
+            mock_courses.return_value = [
+                {"course_id": 1, "term_id": 1, "day": "Monday", "time": "10:00"},
+                {"course_id": 2, "term_id": 1, "day": "Mon/Wed", "time": "10:30"},
+                {"course_id": 3, "term_id": 2, "day": "Monday", "time": "10:00"},
+                {"course_id": 4, "term_id": 1, "day": "Friday", "time": "09:00"},
+            ]
+            mock_students.return_value = [
+                {
+                    "enrollment_id": 50,
+                    "student_id": 7,
+                    "course_id": 1,
+                    "term_id": 1,
+                    "day": "Monday",
+                    "time": "10:00",
+                }
+            ]
+            yield mock_courses, mock_students
+
+    def test_rejects_clashes_with_existing_enrollments(self, mock_timetables):
+        mock_courses, mock_students = mock_timetables
+
+        rejected = check_enrollment_clashes(
+            [
+                (0, (7, 2, None)),
+                (1, (7, 3, None)),
+                (2, (7, 1, None)),
+                (3, (8, 2, None)),
+            ]
+        )
+
+        assert rejected == {
+            0: "Course 2 clashes with course 1 in student 7's timetable.",
+            2: "Student 7 is already enrolled in course 1.",
+        }
+        mock_courses.assert_called_once_with({1, 2, 3})
+        mock_students.assert_called_once_with({7, 8})
+
+    def test_checks_rows_of_one_request_against_each_other(self, mock_timetables):
+        rejected = check_enrollment_clashes([(0, (8, 1, None)), (1, (8, 2, None))])
+
+        assert list(rejected) == [1]
+
+    def test_update_replaces_the_stored_enrollment(self, mock_timetables):
+        rejected = check_enrollment_clashes([(50, (7, 2, "A"))], updating=True)
+
+        assert rejected == {}
+
+    def test_update_with_a_string_id_replaces_the_stored_enrollment(
+        self, mock_timetables
+    ):
+        rejected = check_enrollment_clashes([("50", (7, 2, "A"))], updating=True)
+
+        assert rejected == {}
+
+    def test_unscheduled_courses_skip_the_timetable_query(self, mock_timetables):
+        _, mock_students = mock_timetables
+
+        assert check_enrollment_clashes([(0, (7, 99, None))]) == {}
+        mock_students.assert_not_called()
+
+    def test_create_reports_clashes(
+        self, mock_timetables, mock_db_create, mock_db_create_many
+    ):
+        results, error, status_code = create_new_enrollments(
+            {"student_id": 7, "course_id": 2}
+        )
+
+        assert results == []
+        assert status_code == 400
+        assert "clashes with course 1" in error["details"][0]["message"]
+        mock_db_create_many.assert_not_called()
+
+    def test_string_ids_are_checked_too(self, mock_timetables):
+        mock_courses, mock_students = mock_timetables
+
+        rejected = check_enrollment_clashes(
+            [(0, ("7", "2", None)), (1, ("abc", 2, None)), (2, (7, None, None))]
+        )
+
+        assert rejected == {
+            0: "Course 2 clashes with course 1 in student 7's timetable.",
+            1: "Invalid student ID: 'abc'.",
+            2: "Invalid course ID: None.",
+        }
+        mock_courses.assert_called_once_with({2})
+
+    def test_create_returns_clashes_next_to_created_rows(
+        self, mock_timetables, mock_db_create_many
+    ):
+        mock_db_create_many.return_value = [{"id": 9, "student_id": 8, "course_id": 2}]
+
+        results, errors, status_code = create_new_enrollments(
+            [{"student_id": 7, "course_id": 2}, {"student_id": 8, "course_id": 2}]
+        )
+
+        assert status_code == 201
+        assert results == [{"id": 9, "student_id": 8, "course_id": 2}]
+        assert errors == [
+            {
+                "index": 0,
+                "message": "Course 2 clashes with course 1 in student 7's timetable.",
+            }
+        ]
+
+    def test_create_without_clash_check(self, mock_timetables, mock_db_create_many):
+        mock_db_create_many.return_value = [{"id": 1, "student_id": 7}]
+
+        results, error, status_code = create_new_enrollments(
+            {"student_id": 7, "course_id": 2}, check_clashes=False
+        )
+
+        assert status_code == 201
+        mock_timetables[0].assert_not_called()
+
 
 @patch("app.models.enrollment.db")
 @patch("app.services.enrollment.enrollment_dict_to_row")
@@ -216,25 +398,24 @@ class TestEnrollmentUpdateService:
         mock_enrollment_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_enrollment_update_data,
         valid_enrollment_row,
     ):
         # Mock the enrollment_dict_to_row function
         mock_enrollment_dict_to_row.return_value = (1, 1, "A")
 
-        mock_db_read_one.return_value = valid_enrollment_row
-
-        mock_db_update.return_value = 1
         mock_db_read_many.return_value = [valid_enrollment_row]
+        mock_db_update_many.return_value = [valid_enrollment_row]
 
         results, error, status_code = update_enrollments(valid_enrollment_update_data)
 
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
+        mock_db_update_many.assert_called_once()
+        mock_db_update.assert_not_called()
         mock_db_read_many.assert_called_once_with([1])
 
     def test_update_enrollments_no_success(
@@ -242,32 +423,31 @@ class TestEnrollmentUpdateService:
         mock_enrollment_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_enrollment_update_data,
         valid_enrollment_row,
     ):
         # Mock the enrollment_dict_to_row function
         mock_enrollment_dict_to_row.return_value = (1, 1, "A")
 
-        mock_db_read_one.return_value = valid_enrollment_row
-
-        mock_db_update.return_value = 0
+        mock_db_read_many.return_value = [{"id": 1}]  # Record exists
+        mock_db_update_many.return_value = []  # Simulate no update
         results, error, status_code = update_enrollments(valid_enrollment_update_data)
 
         assert results == []
         assert error == [{"message": "Enrollment ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_enrollments_missing_id(
         self,
         mock_enrollment_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         enrollment_missing_id,
     ):
         results, error, status_code = update_enrollments(enrollment_missing_id)
@@ -285,6 +465,7 @@ class TestEnrollmentArchiveService:
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_enrollment_ids,
@@ -297,16 +478,18 @@ class TestEnrollmentArchiveService:
             valid_enrollment_row,
         ]
 
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [{"id": 1}, {"id": 2}]
         archived, errors, status_code = archive_enrollments(valid_enrollment_ids)
 
         assert len(archived) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with(valid_enrollment_ids)
+        mock_db_archive.assert_not_called()
 
     def test_archive_enrollments_none_archived(
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_enrollment_ids,
@@ -315,10 +498,11 @@ class TestEnrollmentArchiveService:
         # Mock that enrollments exist
         mock_db_read_one.return_value = valid_enrollment_row
 
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         archived, errors, status_code = archive_enrollments(valid_enrollment_ids)
 
         assert archived == []
+        mock_db_archive.assert_not_called()
 
     def test_archive_enrollments_invalid_ids(
         self, mock_db_instance, mock_db_archive, mock_db_read_one, mock_db_read_many
@@ -339,7 +523,54 @@ class TestEnrollmentModel:
         mock_execute.return_value = [{"mocked": "data"}]
         result = enrollment_db_read_all()
         assert result == [{"mocked": "data"}]
-        mock_execute.assert_called_once_with("SELECT * FROM enrollments;")
+        mock_execute.assert_called_once_with("SELECT * FROM enrollments;", ())
+
+    @patch("app.models.enrollment.db.execute_query")
+    def test_enrollment_db_read_all_paginated(self, mock_execute):
+        mock_execute.return_value = [{"id": 11}, {"id": 12}]
+        result = enrollment_db_read_all(limit=2, after_id=10)
+        assert result == [{"id": 11}, {"id": 12}]
+        mock_execute.assert_called_once_with(
+            "SELECT * FROM enrollments WHERE id > %s ORDER BY id LIMIT %s;", (10, 2)
+        )
+
+    @patch("app.models.enrollment.db.stream_query")
+    @patch("app.models.enrollment.db.execute_query")
+    def test_enrollment_db_read_all_stream(self, mock_execute, mock_stream):
+        mock_stream.return_value = iter([{"id": 1}, {"id": 2}])
+        result = enrollment_db_read_all(stream=True)
+        assert list(result) == [{"id": 1}, {"id": 2}]
+        mock_stream.assert_called_once_with("SELECT * FROM enrollments;", ())
+        mock_execute.assert_not_called()
+
+    @patch("app.models.enrollment.db.execute_query")
+    def test_enrollment_db_read_all_filtered(self, mock_execute):
+        mock_execute.return_value = [{"id": 1, "grade": "x"}]
+        result = enrollment_db_read_all(
+            active_only=True, filters={"course_id": "5"}, fields=["grade"], limit=10
+        )
+        assert result == [{"id": 1, "grade": "x"}]
+        mock_execute.assert_called_once_with(
+            "SELECT id, grade FROM enrollments WHERE is_archived = FALSE AND course_id = %s "
+            "ORDER BY id LIMIT %s;",
+            (5, 10),
+        )
+
+    def test_enrollment_db_read_all_rejects_unknown_filter_and_field(self):
+        with pytest.raises(ValueError, match="Unknown filter: secret"):
+            enrollment_db_read_all(filters={"secret": "1"})
+        with pytest.raises(ValueError, match="Unknown field: secret"):
+            enrollment_db_read_all(fields=["secret"])
+
+    @patch("app.models.enrollment.db.execute_query")
+    def test_enrollment_db_read_version(self, mock_execute):
+        version = {"last_modified": datetime(2025, 1, 1), "row_count": 2}
+        mock_execute.return_value = [version]
+        assert enrollment_db_read_version(active_only=True) == version
+        mock_execute.assert_called_once_with(
+            "SELECT MAX(updated_at) AS last_modified, COUNT(*) AS row_count "
+            "FROM enrollments WHERE is_archived = FALSE;"
+        )
 
     @patch("app.models.enrollment.db.execute_query")
     def test_enrollment_db_read_by_id_found(self, mock_execute):
@@ -394,13 +625,53 @@ class TestEnrollmentModel:
 
         query, called_params = mock_execute.call_args.args
         assert "INSERT INTO enrollments" in query
-        assert called_params == params
+        assert "enrolled_count < capacity" in query
+        student_id, course_id, grade = params
+        assert called_params == (course_id, student_id, student_id, grade)
+
+    @patch("app.models.enrollment.waitlist_db_add")
+    @patch("app.models.enrollment.db.execute_query")
+    def test_enrollment_db_insert_full_course_joins_waitlist(
+        self, mock_execute, mock_waitlist_add
+    ):
+        mock_execute.return_value = []
+        mock_waitlist_add.return_value = 3
+
+        with pytest.raises(ValueError, match="Course ID 2 is full.*number 3"):
+            enrollment_db_insert((1, 2, None))
+        mock_waitlist_add.assert_called_once_with(2, 1)
 
+    @patch("app.models.enrollment.waitlist_db_add")
     @patch("app.models.enrollment.db.execute_query")
-    def test_enrollment_db_insert_failure(self, mock_execute):
+    def test_enrollment_db_insert_missing_course(self, mock_execute, mock_waitlist_add):
         mock_execute.return_value = None
-        result = enrollment_db_insert(("bad",))
-        assert result is None
+        mock_waitlist_add.return_value = None
+
+        with pytest.raises(ValueError, match="Course ID 99 not found"):
+            enrollment_db_insert((1, 99, None))
+
+    @patch("app.models.enrollment.db.execute_values")
+    def test_enrollment_db_insert_many(self, mock_execute_values):
+        mock_execute_values.return_value = [
+            {"id": 1, "course_id": 5},
+            {"id": 2, "course_id": 5},
+        ]
+        rows = [(1, 5, None), (2, 5, None)]
+
+        result = enrollment_db_insert_many(rows)
+
+        assert result == [{"id": 1, "course_id": 5}, {"id": 2, "course_id": 5}]
+        query, called_rows = mock_execute_values.call_args.args
+        assert "INSERT INTO enrollments (student_id, course_id, grade)" in query
+        assert "FOR UPDATE OF c" in query
+        assert called_rows == [(0, 1, 5, None), (1, 2, 5, None)]
+
+    @patch("app.models.enrollment.db.execute_values")
+    def test_enrollment_db_insert_many_without_seats_raises(self, mock_execute_values):
+        mock_execute_values.return_value = []
+
+        with pytest.raises(ValueError, match="enough free seats"):
+            enrollment_db_insert_many([(1, 5, None)])
 
     @patch("app.models.enrollment.db.execute_query")
     def test_enrollment_db_update_success(self, mock_execute):
@@ -416,6 +687,21 @@ class TestEnrollmentModel:
         result = enrollment_db_update(1, ("x",) * 3)
         assert result == 0
 
+    @patch("app.models.enrollment.db.execute_query")
+    def test_enrollment_db_update_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = enrollment_db_update_many([(1, ("a",) * 12), (2, ("b",) * 12)])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        mock_execute.assert_called_once()
+        query, params = mock_execute.call_args.args
+        assert "UPDATE enrollments AS t" in query
+        assert "json_populate_recordset(NULL::enrollments, %s)" in query
+        assert "RETURNING t.*" in query
+        records = json.loads(params[0])
+        assert [r["id"] for r in records] == [1, 2]
+
     @patch("app.models.enrollment.db.execute_query")
     def test_enrollment_db_archive_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -429,6 +715,39 @@ class TestEnrollmentModel:
         result = enrollment_db_archive(999)
         assert result == 0
 
+    @patch("app.models.enrollment.db.execute_query")
+    def test_enrollment_db_archive_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = enrollment_db_archive_many([1, 2, 3])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, params = mock_execute.call_args.args
+        assert "UPDATE enrollments" in query
+        assert "WHERE id = ANY(%s) AND is_archived = FALSE" in query
+        assert "RETURNING *" in query
+        assert params == ([1, 2, 3],)
+
+    @patch("app.models.enrollment.db.execute_query")
+    def test_enrollment_db_read_student_sessions(self, mock_execute):
+        mock_execute.return_value = [{"enrollment_id": 1, "day": "Monday"}]
+
+        assert enrollment_db_read_student_sessions({7}) == [
+            {"enrollment_id": 1, "day": "Monday"}
+        ]
+        query, params = mock_execute.call_args.args
+        assert "JOIN course_schedule cs ON cs.course_id = e.course_id" in query
+        assert "WHERE e.student_id = ANY(%s) AND e.is_archived = FALSE" in query
+        assert params == ([7],)
+        assert enrollment_db_read_student_sessions(set()) == []
+
+    @patch("app.models.course_schedule.db.execute_query")
+    def test_course_schedule_db_read_sessions(self, mock_execute):
+        mock_execute.return_value = [{"course_id": 2, "term_id": 1}]
+
+        assert course_schedule_db_read_sessions({2}) == [{"course_id": 2, "term_id": 1}]
+        assert mock_execute.call_args.args[1] == ([2],)
+
 
 # =======================
 # Route Tests
@@ -460,7 +779,33 @@ class TestEnrollmentReadRoute:
         assert resp.status_code == 200
         data = resp.get_json()
         assert "Enrollments fetched successfully." in data["message"]
-        mock_get.assert_called_once_with(active_only=True)
+        mock_get.assert_called_once_with(
+            active_only=True, limit=None, after_id=None, filters={}, fields=None
+        )
+
+    @patch("app.routes.enrollment.get_all_enrollments")
+    def test_handle_enrollment_db_read_all_stream_ndjson(self, mock_get, client):
+        mock_get.return_value = iter([{"id": 1}, {"id": 2}])
+
+        resp = client.get("/api/enrollments?stream=ndjson")
+        assert resp.status_code == 200
+        assert resp.mimetype == "application/x-ndjson"
+        lines = resp.get_data(as_text=True).splitlines()
+        assert [json.loads(line) for line in lines] == [{"id": 1}, {"id": 2}]
+        mock_get.assert_called_once_with(
+            active_only=False,
+            limit=None,
+            after_id=None,
+            filters={},
+            fields=None,
+            stream=True,
+        )
+
+    @patch("app.routes.enrollment.get_all_enrollments")
+    def test_handle_enrollment_db_read_all_stream_invalid(self, mock_get, client):
+        resp = client.get("/api/enrollments?stream=csv")
+        assert resp.status_code == 400
+        mock_get.assert_not_called()
 
     @patch("app.routes.enrollment.get_all_enrollments")
     def test_handle_enrollment_db_read_all_exception(self, mock_get_all, client):
@@ -508,6 +853,23 @@ class TestEnrollmentReadRoute:
 
 
 class TestEnrollmentCreateRoute:
+    @patch("app.routes.enrollment.create_new_enrollments")
+    def test_handle_enrollment_create_partial_success(
+        self, mock_create_new_enrollments, client
+    ):
+        errors = [{"index": 1, "message": "Course 2 clashes with course 1."}]
+        mock_create_new_enrollments.return_value = ([{"id": 9}], errors, 201)
+
+        response = client.post(
+            "/api/enrollments",
+            json=[{"student_id": 8, "course_id": 2}, {"student_id": 7, "course_id": 2}],
+        )
+        data = response.get_json()
+
+        assert response.status_code == 201
+        assert data["data"] == {"id": 9}
+        assert data["errors"] == errors
+
     @patch("app.routes.enrollment.create_new_enrollments")
     def test_handle_enrollment_db_insert_success(
         self, mock_create_new_enrollments, client, valid_enrollment_create_data
@@ -525,6 +887,25 @@ class TestEnrollmentCreateRoute:
         assert "2 enrollments created successfully" in data["message"]
         assert data["data"]
 
+    @patch("app.routes.enrollment.create_new_enrollments")
+    def test_handle_enrollment_db_insert_without_clash_check(
+        self, mock_create_new_enrollments, client, valid_enrollment_create_data
+    ):
+        mock_create_new_enrollments.return_value = (
+            valid_enrollment_create_data,
+            None,
+            None,
+        )
+
+        response = client.post(
+            "/api/enrollments?check_clashes=false", json=valid_enrollment_create_data
+        )
+
+        assert response.status_code == 201
+        mock_create_new_enrollments.assert_called_once_with(
+            valid_enrollment_create_data, check_clashes=False
+        )
+
     @patch("app.routes.enrollment.create_new_enrollments")
     def test_handle_enrollment_db_insert_service_error(
         self, mock_create_new_enrollments, client, valid_enrollment_create_data
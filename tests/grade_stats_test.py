@@ -0,0 +1,294 @@
+import pytest
+from decimal import Decimal
+from unittest.mock import patch, MagicMock
+
+from app.models import (
+    enrollment_db_insert,
+    enrollment_db_update,
+    enrollment_db_archive,
+    enrollment_db_archive_many,
+    grade_stats_db_rebuild,
+    student_grade_stats_db_read,
+)
+from app.models.grade_stats import (
+    changed_grade_keys,
+    grade_stats_db_read_keys,
+    grade_stats_db_refresh,
+)
+from app.services import get_student_gpa, get_course_grade_stats
+
+# =======================
+# Fixtures
+# =======================
+
+
+@pytest.fixture
+def mock_stats_execute():
+    with patch("app.models.grade_stats.db.execute_query") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_enrollment_execute():
+    with patch("app.models.enrollment.db.execute_query") as mock:
+        yield mock
+
+
+def refreshed(mock_stats_execute):
+    """(stats table, ids) for every refresh the mock received."""
+    calls = []
+    for call in mock_stats_execute.call_args_list:
+        query = call.args[0]
+        if "INSERT INTO student_grade_stats" in query:
+            calls.append(("student", call.args[1][0]))
+        elif "INSERT INTO course_grade_stats" in query:
+            calls.append(("course", call.args[1][0]))
+    return calls
+
+
+# =======================
+# Model Tests
+# =======================
+
+
+class TestGradeStatsModel:
+    def test_changed_grade_keys_skips_unchanged_enrollments(self):
+        old = {1: (10, 20, "A"), 2: (11, 20, "B")}
+        new = {1: (10, 20, "A"), 2: (11, 21, "B+")}
+
+        assert changed_grade_keys(old, new) == [(11, 20, "B"), (11, 21, "B+")]
+
+    def test_read_keys(self, mock_stats_execute):
+        mock_stats_execute.return_value = [
+            {"id": 1, "student_id": 10, "course_id": 20, "grade": "A"}
+        ]
+
+        assert grade_stats_db_read_keys([1]) == {1: (10, 20, "A")}
+        assert mock_stats_execute.call_args.args[1] == ([1],)
+        assert grade_stats_db_read_keys([]) == {}
+
+    def test_refresh_touches_only_graded_keys(self, mock_stats_execute):
+        grade_stats_db_refresh([(10, 20, "A"), (11, 20, " b+ "), (12, 21, None)])
+
+        assert refreshed(mock_stats_execute) == [
+            ("student", [10, 11]),
+            ("course", [20]),
+        ]
+        query, params = mock_stats_execute.call_args_list[0].args
+        assert params == ([10, 11], [10, 11])
+        assert "FROM UNNEST(%s::int[]) AS k(id)" in query
+        assert "LEFT JOIN grade_points gp ON gp.grade = UPPER(TRIM(e.grade))" in query
+        assert "ON CONFLICT (student_id) DO UPDATE SET" in query
+
+    def test_refresh_without_grades_runs_no_queries(self, mock_stats_execute):
+        grade_stats_db_refresh([(10, 20, None), (11, 20, "  ")])
+        mock_stats_execute.assert_not_called()
+
+    def test_rebuild_covers_every_student_and_course(self, mock_stats_execute):
+        grade_stats_db_rebuild()
+
+        queries = [call.args[0] for call in mock_stats_execute.call_args_list]
+        assert "FROM (SELECT id FROM students) AS k(id)" in queries[0]
+        assert "FROM (SELECT id FROM courses) AS k(id)" in queries[1]
+        assert queries[0].startswith(
+            "LOCK TABLE student_grade_stats IN EXCLUSIVE MODE;"
+        )
+
+    def test_refresh_locks_keys_in_order_before_recomputing(self, mock_stats_execute):
+        grade_stats_db_refresh([(12, 20, "A"), (10, 20, "B")])
+
+        query = mock_stats_execute.call_args_list[0].args[0]
+        lock = query.index(
+            "pg_advisory_xact_lock('student_grade_stats'::regclass::oid::int, k.id)"
+        )
+        assert "ORDER BY id" in query[lock : query.index("INSERT INTO")]
+        assert lock < query.index("INSERT INTO student_grade_stats")
+        assert refreshed(mock_stats_execute)[0] == ("student", [10, 12])
+
+    def test_student_grade_stats_db_read(self, mock_stats_execute):
+        mock_stats_execute.return_value = [{"student_id": 1, "gpa": Decimal("3.50")}]
+
+        assert student_grade_stats_db_read(1) == {
+            "student_id": 1,
+            "gpa": Decimal("3.50"),
+        }
+        mock_stats_execute.assert_called_once_with(
+            "SELECT * FROM student_grade_stats WHERE student_id = %s;", (1,)
+        )
+
+
+class TestEnrollmentGradeMaintenance:
+    def test_insert_with_grade_refreshes_student_and_course(
+        self, mock_enrollment_execute, mock_stats_execute
+    ):
+        mock_enrollment_execute.return_value = [{"id": 5}]
+
+        assert enrollment_db_insert((10, 20, "A")) == 5
+        assert refreshed(mock_stats_execute) == [("student", [10]), ("course", [20])]
+
+    def test_insert_without_grade_skips_refresh(
+        self, mock_enrollment_execute, mock_stats_execute
+    ):
+        mock_enrollment_execute.return_value = [{"id": 5}]
+
+        enrollment_db_insert((10, 20, None))
+        mock_stats_execute.assert_not_called()
+
+    @patch("app.models.enrollment.course_db_release_seats")
+    @patch("app.models.enrollment.course_db_take_seat", return_value=True)
+    def test_update_moving_enrollment_refreshes_old_and_new_keys(
+        self,
+        mock_take_seat,
+        mock_release_seats,
+        mock_enrollment_execute,
+        mock_stats_execute,
+    ):
+        mock_stats_execute.return_value = [
+            {"id": 5, "student_id": 10, "course_id": 20, "grade": "B"}
+        ]
+        mock_enrollment_execute.return_value = MagicMock(rowcount=1)
+
+        assert enrollment_db_update(5, (10, 21, "A")) == 1
+        mock_release_seats.assert_called_once_with({20: 1})
+        assert refreshed(mock_stats_execute) == [
+            ("student", [10]),
+            ("course", [20, 21]),
+        ]
+
+    def test_update_without_grade_change_skips_refresh(
+        self, mock_enrollment_execute, mock_stats_execute
+    ):
+        mock_stats_execute.return_value = [
+            {"id": 5, "student_id": 10, "course_id": 20, "grade": "B"}
+        ]
+        mock_enrollment_execute.return_value = MagicMock(rowcount=1)
+
+        enrollment_db_update(5, (10, 20, "B"))
+        assert refreshed(mock_stats_execute) == []
+
+    def test_archive_refreshes_archived_grade(
+        self, mock_enrollment_execute, mock_stats_execute
+    ):
+        mock_stats_execute.return_value = [
+            {"id": 5, "student_id": 10, "course_id": 20, "grade": "B"}
+        ]
+        mock_enrollment_execute.return_value = MagicMock(rowcount=1)
+
+        enrollment_db_archive(5)
+        assert refreshed(mock_stats_execute) == [("student", [10]), ("course", [20])]
+
+    def test_archive_many_refreshes_from_returned_rows(
+        self, mock_enrollment_execute, mock_stats_execute
+    ):
+        mock_enrollment_execute.return_value = [
+            {"id": 5, "student_id": 10, "course_id": 20, "grade": "B"},
+            {"id": 6, "student_id": 11, "course_id": 20, "grade": None},
+        ]
+
+        enrollment_db_archive_many([5, 6])
+        assert refreshed(mock_stats_execute) == [("student", [10]), ("course", [20])]
+
+
+# =======================
+# Service Tests
+# =======================
+
+
+class TestGradeStatsService:
+    @patch("app.services.grade_stats.student_grade_stats_db_read")
+    @patch("app.services.grade_stats.student_db_read_by_id")
+    def test_get_student_gpa(self, mock_read_student, mock_read_stats):
+        mock_read_student.return_value = {"id": 1}
+        mock_read_stats.return_value = {
+            "student_id": 1,
+            "gpa": Decimal("3.35"),
+            "graded_count": 2,
+            "distribution": {"A": 1, "B+": 1},
+            "updated_at": None,
+        }
+
+        assert get_student_gpa(1) == {
+            "student_id": 1,
+            "gpa": 3.35,
+            "graded_count": 2,
+            "distribution": {"A": 1, "B+": 1},
+        }
+
+    @patch("app.services.grade_stats.student_grade_stats_db_read")
+    @patch("app.services.grade_stats.student_db_read_by_id")
+    def test_get_student_gpa_without_grades(self, mock_read_student, mock_read_stats):
+        mock_read_student.return_value = {"id": 1}
+        mock_read_stats.return_value = None
+
+        assert get_student_gpa(1) == {
+            "student_id": 1,
+            "gpa": None,
+            "graded_count": 0,
+            "distribution": {},
+        }
+
+    @patch("app.services.grade_stats.student_grade_stats_db_read")
+    @patch("app.services.grade_stats.student_db_read_by_id")
+    def test_get_student_gpa_student_not_found(
+        self, mock_read_student, mock_read_stats
+    ):
+        mock_read_student.return_value = None
+
+        assert get_student_gpa(999) is None
+        mock_read_stats.assert_not_called()
+
+    @patch("app.services.grade_stats.course_grade_stats_db_read")
+    @patch("app.services.grade_stats.course_db_read_by_id")
+    def test_get_course_grade_stats(self, mock_read_course, mock_read_stats):
+        mock_read_course.return_value = {"id": 2}
+        mock_read_stats.return_value = {
+            "course_id": 2,
+            "gpa": Decimal("3.00"),
+            "graded_count": 1,
+            "distribution": {"B": 1},
+        }
+
+        assert get_course_grade_stats(2)["gpa"] == 3.0
+
+
+# =======================
+# Route Tests
+# =======================
+
+
+class TestGradeStatsRoutes:
+    @patch("app.routes.student.get_student_gpa")
+    def test_handle_get_student_gpa(self, mock_gpa, client):
+        mock_gpa.return_value = {"student_id": 1, "gpa": 3.5}
+
+        response = client.get("/api/students/1/gpa")
+
+        assert response.status_code == 200
+        assert response.get_json()["data"]["gpa"] == 3.5
+        mock_gpa.assert_called_once_with(1)
+
+    @patch("app.routes.student.get_student_gpa")
+    def test_handle_get_student_gpa_not_found(self, mock_gpa, client):
+        mock_gpa.return_value = None
+
+        response = client.get("/api/students/999/gpa")
+
+        assert response.status_code == 404
+
+    @patch("app.routes.course.get_course_grade_stats")
+    def test_handle_get_course_grade_stats(self, mock_stats, client):
+        mock_stats.return_value = {"course_id": 2, "distribution": {"A": 3}}
+
+        response = client.get("/api/courses/2/grade-stats")
+
+        assert response.status_code == 200
+        assert response.get_json()["data"]["distribution"] == {"A": 3}
+
+    @patch("app.routes.course.get_course_grade_stats")
+    def test_handle_get_course_grade_stats_not_found(self, mock_stats, client):
+        mock_stats.return_value = None
+
+        response = client.get("/api/courses/999/grade-stats")
+
+        assert response.status_code == 404
+        assert "Course not found" in response.get_json()["error"]
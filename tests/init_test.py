@@ -0,0 +1,89 @@
+from unittest.mock import MagicMock, patch
+
+from db.init import SYNTHETIC_TABLES, init_trigram_search, populate_synthetic_data
+
+# =======================
+# Schema Tests
+# =======================
+
+
+class TestInitTrigramSearch:
+    def test_creates_the_extension_and_indexes(self):
+        db = MagicMock()
+
+        assert init_trigram_search(db) is True
+
+        script = db.execute_script.call_args.args[0]
+        assert "CREATE EXTENSION IF NOT EXISTS pg_trgm;" in script
+        assert "gin_trgm_ops" in script
+
+    def test_missing_extension_is_reported_not_fatal(self, capsys):
+        db = MagicMock()
+        db.execute_script.side_effect = RuntimeError("Database error: not allowed")
+
+        assert init_trigram_search(db) is False
+        assert "word prefixes only" in capsys.readouterr().out
+
+
+def test_schema_has_no_trigram_dependency():
+    with open("db/schema.sql") as f:
+        schema = f.read()
+
+    assert "CREATE EXTENSION" not in schema
+    assert "gin_trgm_ops" not in schema
+
+
+# =======================
+# Synthetic Data Tests
+# =======================
+
+
+class TestPopulateSyntheticData:
+    @patch("db.init.load_rows")
+    @patch("db.init.Database")
+    def test_skips_when_already_loaded(self, mock_database, mock_load_rows, capsys):
+        mock_database.return_value.execute_query.return_value = [{"loaded": True}]
+
+        assert populate_synthetic_data(10, 4) is True
+
+        mock_load_rows.assert_not_called()
+        assert "already present" in capsys.readouterr().out
+
+    @patch("app.models.course.course_db_recount_enrolled")
+    @patch("app.models.grade_stats.grade_stats_db_rebuild")
+    @patch("db.init.load_rows")
+    @patch("db.init.Database")
+    def test_ids_continue_after_the_existing_rows(
+        self, mock_database, mock_load_rows, mock_rebuild, mock_recount
+    ):
+        last_ids = {
+            table: 100 * (index + 1) for index, table in enumerate(SYNTHETIC_TABLES)
+        }
+        mock_database.return_value.execute_query.side_effect = [
+            [{"loaded": False}],
+            [last_ids],
+            None,
+        ]
+        loaded = {}
+
+        def load_rows(db, table, rows):
+            loaded[table] = list(rows)
+            return len(loaded[table])
+
+        mock_load_rows.side_effect = load_rows
+
+        assert populate_synthetic_data(3, 4, enrollments_per_student=2) is True
+
+        mock_database.return_value.transaction.assert_called_once()
+
+        for table, rows in loaded.items():
+            assert rows[0][0] == last_ids[table] + 1
+        courses = [row[0] for row in loaded["courses"]]
+        assert {row[2] for row in loaded["assignments"]} == set(courses)
+        assert {row[1] for row in loaded["assignments"]} == {
+            last_ids["instructors"] + 1
+        }
+        assert {row[1] for row in loaded["enrollments"]} == {
+            row[0] for row in loaded["students"]
+        }
+        assert {row[2] for row in loaded["enrollments"]} <= set(courses)
@@ -1,13 +1,18 @@
+import json
 import pytest
-from datetime import date
+from datetime import date, datetime
 from unittest.mock import patch
 from app.models import (
     instructor_db_read_all,
+    instructor_db_read_version,
     instructor_db_read_by_id,
     instructor_db_read_by_ids,
     instructor_db_insert,
+    instructor_db_insert_many,
     instructor_db_update,
+    instructor_db_update_many,
     instructor_db_archive,
+    instructor_db_archive_many,
 )
 from app.services import (
     get_all_instructors,
@@ -121,18 +126,36 @@ def mock_db_create():
         yield mock
 
 
+@pytest.fixture
+def mock_db_create_many():
+    with patch("app.services.instructor.instructor_db_insert_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_update():
     with patch("app.services.instructor.instructor_db_update") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_update_many():
+    with patch("app.services.instructor.instructor_db_update_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_archive():
     with patch("app.services.instructor.instructor_db_archive") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_archive_many():
+    with patch("app.services.instructor.instructor_db_archive_many") as mock:
+        yield mock
+
+
 # =======================
 # Service Tests
 # =======================
@@ -173,6 +196,7 @@ class TestInstructorCreateService:
         mock_instructor_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_instructor_create_data,
         valid_instructor_rows,
@@ -189,6 +213,8 @@ class TestInstructorCreateService:
             1,
         )
 
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [1, 2]
         mock_db_read_many.return_value = valid_instructor_rows
 
@@ -207,6 +233,7 @@ class TestInstructorCreateService:
         mock_instructor_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_instructor_create_data,
     ):
@@ -222,6 +249,8 @@ class TestInstructorCreateService:
             1,
         )
 
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [None, None]
         results, error, status_code = create_new_instructors(
             valid_instructor_create_data
@@ -232,6 +261,30 @@ class TestInstructorCreateService:
         assert status_code == 400
         mock_db_read_many.assert_not_called()
 
+    def test_create_new_instructors_batched(
+        self,
+        mock_instructor_dict_to_row,
+        mock_db_instance,
+        mock_db_create,
+        mock_db_create_many,
+        mock_db_read_many,
+        valid_instructor_create_data,
+        valid_instructor_rows,
+    ):
+        mock_db_create_many.return_value = valid_instructor_rows
+
+        results, error, status_code = create_new_instructors(
+            valid_instructor_create_data
+        )
+
+        assert results == valid_instructor_rows
+        assert error is None
+        assert status_code == 201
+        mock_db_create_many.assert_called_once()
+        assert len(mock_db_create_many.call_args.args[0]) == 2
+        mock_db_create.assert_not_called()
+        mock_db_read_many.assert_not_called()
+
 
 @patch("app.models.instructor.db")
 @patch("app.services.instructor.instructor_dict_to_row")
@@ -241,8 +294,8 @@ class TestInstructorUpdateService:
         mock_instructor_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_instructor_update_data,
         valid_instructor_row,
     ):
@@ -258,17 +311,16 @@ class TestInstructorUpdateService:
             1,
         )
 
-        mock_db_read_one.return_value = valid_instructor_row
-
-        mock_db_update.return_value = 1
         mock_db_read_many.return_value = [valid_instructor_row]
+        mock_db_update_many.return_value = [valid_instructor_row]
 
         results, error, status_code = update_instructors(valid_instructor_update_data)
 
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
+        mock_db_update_many.assert_called_once()
+        mock_db_update.assert_not_called()
         mock_db_read_many.assert_called_once_with([1])
 
     def test_update_instructors_no_success(
@@ -276,8 +328,8 @@ class TestInstructorUpdateService:
         mock_instructor_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_instructor_update_data,
         valid_instructor_row,
     ):
@@ -293,24 +345,23 @@ class TestInstructorUpdateService:
             1,
         )
 
-        mock_db_read_one.return_value = valid_instructor_row
-
-        mock_db_update.return_value = 0
+        mock_db_read_many.return_value = [{"id": 1}]  # Record exists
+        mock_db_update_many.return_value = []  # Simulate no update
         results, error, status_code = update_instructors(valid_instructor_update_data)
 
         assert results == []
         assert error == [{"message": "Instructor ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_instructors_missing_id(
         self,
         mock_instructor_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         instructor_missing_id,
     ):
         results, error, status_code = update_instructors(instructor_missing_id)
@@ -328,6 +379,7 @@ class TestInstructorArchiveService:
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_instructor_ids,
@@ -340,16 +392,18 @@ class TestInstructorArchiveService:
             valid_instructor_row,
         ]
 
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [{"id": 1}, {"id": 2}]
         archived, errors, status_code = archive_instructors(valid_instructor_ids)
 
         assert len(archived) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with(valid_instructor_ids)
+        mock_db_archive.assert_not_called()
 
     def test_archive_instructors_none_archived(
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_instructor_ids,
@@ -358,10 +412,11 @@ class TestInstructorArchiveService:
         # Mock that instructors exist
         mock_db_read_one.return_value = valid_instructor_row
 
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         archived, errors, status_code = archive_instructors(valid_instructor_ids)
 
         assert archived == []
+        mock_db_archive.assert_not_called()
 
     def test_archive_instructors_invalid_ids(
         self, mock_db_instance, mock_db_archive, mock_db_read_one, mock_db_read_many
@@ -382,7 +437,54 @@ class TestInstructorModel:
         mock_execute.return_value = [{"mocked": "data"}]
         result = instructor_db_read_all()
         assert result == [{"mocked": "data"}]
-        mock_execute.assert_called_once_with("SELECT * FROM instructors;")
+        mock_execute.assert_called_once_with("SELECT * FROM instructors;", ())
+
+    @patch("app.models.instructor.db.execute_query")
+    def test_instructor_db_read_all_paginated(self, mock_execute):
+        mock_execute.return_value = [{"id": 11}, {"id": 12}]
+        result = instructor_db_read_all(limit=2, after_id=10)
+        assert result == [{"id": 11}, {"id": 12}]
+        mock_execute.assert_called_once_with(
+            "SELECT * FROM instructors WHERE id > %s ORDER BY id LIMIT %s;", (10, 2)
+        )
+
+    @patch("app.models.instructor.db.stream_query")
+    @patch("app.models.instructor.db.execute_query")
+    def test_instructor_db_read_all_stream(self, mock_execute, mock_stream):
+        mock_stream.return_value = iter([{"id": 1}, {"id": 2}])
+        result = instructor_db_read_all(stream=True)
+        assert list(result) == [{"id": 1}, {"id": 2}]
+        mock_stream.assert_called_once_with("SELECT * FROM instructors;", ())
+        mock_execute.assert_not_called()
+
+    @patch("app.models.instructor.db.execute_query")
+    def test_instructor_db_read_all_filtered(self, mock_execute):
+        mock_execute.return_value = [{"id": 1, "email": "x"}]
+        result = instructor_db_read_all(
+            active_only=True, filters={"department_id": "5"}, fields=["email"], limit=10
+        )
+        assert result == [{"id": 1, "email": "x"}]
+        mock_execute.assert_called_once_with(
+            "SELECT id, email FROM instructors WHERE status = 'active' AND department_id = %s "
+            "ORDER BY id LIMIT %s;",
+            (5, 10),
+        )
+
+    def test_instructor_db_read_all_rejects_unknown_filter_and_field(self):
+        with pytest.raises(ValueError, match="Unknown filter: secret"):
+            instructor_db_read_all(filters={"secret": "1"})
+        with pytest.raises(ValueError, match="Unknown field: secret"):
+            instructor_db_read_all(fields=["secret"])
+
+    @patch("app.models.instructor.db.execute_query")
+    def test_instructor_db_read_version(self, mock_execute):
+        version = {"last_modified": datetime(2025, 1, 1), "row_count": 2}
+        mock_execute.return_value = [version]
+        assert instructor_db_read_version(active_only=True) == version
+        mock_execute.assert_called_once_with(
+            "SELECT MAX(updated_at) AS last_modified, COUNT(*) AS row_count "
+            "FROM instructors WHERE status = 'active';"
+        )
 
     @patch("app.models.instructor.db.execute_query")
     def test_instructor_db_read_all_active(self, mock_execute):
@@ -390,7 +492,7 @@ class TestInstructorModel:
         result = instructor_db_read_all(active_only=True)
         assert result == [{"active": "instructor"}]
         mock_execute.assert_called_once_with(
-            "SELECT * FROM instructors WHERE status = 'active';"
+            "SELECT * FROM instructors WHERE status = 'active';", ()
         )
 
     @patch("app.models.instructor.db.execute_query")
@@ -459,6 +561,19 @@ class TestInstructorModel:
         result = instructor_db_insert(("bad",))
         assert result is None
 
+    @patch("app.models.instructor.db.execute_values")
+    def test_instructor_db_insert_many(self, mock_execute_values):
+        mock_execute_values.return_value = [{"id": 1}, {"id": 2}]
+        rows = [("a",), ("b",)]
+
+        result = instructor_db_insert_many(rows)
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, called_rows = mock_execute_values.call_args.args
+        assert query.startswith("INSERT INTO instructors (")
+        assert "VALUES %s RETURNING *" in query
+        assert called_rows == rows
+
     @patch("app.models.instructor.db.execute_query")
     def test_instructor_db_update_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -473,6 +588,21 @@ class TestInstructorModel:
         result = instructor_db_update(1, ("x",) * 8)
         assert result == 0
 
+    @patch("app.models.instructor.db.execute_query")
+    def test_instructor_db_update_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = instructor_db_update_many([(1, ("a",) * 12), (2, ("b",) * 12)])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        mock_execute.assert_called_once()
+        query, params = mock_execute.call_args.args
+        assert "UPDATE instructors AS t" in query
+        assert "json_populate_recordset(NULL::instructors, %s)" in query
+        assert "RETURNING t.*" in query
+        records = json.loads(params[0])
+        assert [r["id"] for r in records] == [1, 2]
+
     @patch("app.models.instructor.db.execute_query")
     def test_instructor_db_archive_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -486,6 +616,20 @@ class TestInstructorModel:
         result = instructor_db_archive(999)
         assert result == 0
 
+    @patch("app.models.instructor.db.execute_query")
+    def test_instructor_db_archive_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = instructor_db_archive_many([1, 2, 3])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, params = mock_execute.call_args.args
+        assert "UPDATE instructors" in query
+        assert "WHERE id = ANY(%s) AND is_archived = FALSE" in query
+        assert "RETURNING *" in query
+        assert "status = 'inactive'" in query
+        assert params == ([1, 2, 3],)
+
 
 # =======================
 # Route Tests
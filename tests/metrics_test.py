@@ -0,0 +1,115 @@
+import logging
+import pytest
+from unittest.mock import patch
+
+from app.utils import RequestMetrics
+from app.utils.metrics import Counter, Histogram
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    RequestMetrics.reset()
+    yield
+    RequestMetrics.reset()
+
+
+def metric_lines(text, name):
+    return [line for line in text.splitlines() if line.startswith(name)]
+
+
+# =======================
+# Metric Type Tests
+# =======================
+
+
+class TestMetricTypes:
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("latency_seconds", "Latency.", (0.1, 1.0))
+        labels = (("endpoint", "a"),)
+        for value in (0.05, 0.5, 0.7, 3.0):
+            histogram.observe(labels, value)
+
+        assert histogram.render() == [
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{endpoint="a",le="0.1"} 1',
+            'latency_seconds_bucket{endpoint="a",le="1.0"} 3',
+            'latency_seconds_bucket{endpoint="a",le="+Inf"} 4',
+            'latency_seconds_sum{endpoint="a"} 4.25',
+            'latency_seconds_count{endpoint="a"} 4',
+        ]
+
+    def test_counter_escapes_label_values(self):
+        counter = Counter("hits_total", "Hits.")
+        counter.inc((("path", 'a"b\\c'),), 2)
+
+        assert counter.render()[-1] == 'hits_total{path="a\\"b\\\\c"} 2'
+
+
+# =======================
+# Request Tests
+# =======================
+
+
+class TestRequestMetrics:
+    @patch("app.routes.student.get_student_by_id")
+    def test_server_timing_reports_sql_statements(self, mock_get, client):
+        def read_student(student_id):
+            from db.database import Database
+
+            Database._record_statement(0.002)
+            Database._record_statement(0.003)
+            return {"id": student_id}
+
+        mock_get.side_effect = read_student
+
+        response = client.get("/api/students/1")
+
+        timing = response.headers["Server-Timing"]
+        assert timing.startswith("app;dur=")
+        assert 'db;desc="2 statements";dur=5.00' in timing
+
+    @patch("app.routes.student.get_student_by_id")
+    def test_metrics_are_labelled_by_endpoint(self, mock_get, client):
+        mock_get.return_value = {"id": 1}
+        client.get("/api/students/1")
+        client.get("/api/students/2")
+
+        response = client.get("/metrics")
+        text = response.get_data(as_text=True)
+
+        assert response.content_type.startswith("text/plain; version=0.0.4")
+        labels = 'blueprint="student",endpoint="student.handle_get_student_by_id",method="GET"'
+        assert f"http_request_duration_seconds_count{{{labels}}} 2" in text
+        assert f'http_requests_total{{{labels},status="200"}} 2' in text
+        assert f"db_statements_per_request_count{{{labels}}} 2" in text
+        assert metric_lines(text, "db_pool_in_use")
+        assert "# TYPE cache_hits_total counter" in text
+
+    def test_unmatched_paths_share_one_series(self, client):
+        client.get("/no/such/path/1")
+        client.get("/no/such/path/2")
+
+        text = client.get("/metrics").get_data(as_text=True)
+
+        assert 'endpoint="unmatched",method="GET",status="404"} 2' in text
+        assert "/no/such/path" not in text
+
+    @patch("app.utils.metrics._slow_request_statements", return_value=2)
+    @patch("app.routes.student.get_student_by_id")
+    def test_requests_with_many_statements_are_logged(
+        self, mock_get, mock_threshold, client, caplog
+    ):
+        def read_student(student_id):
+            from db.database import Database
+
+            for _ in range(3):
+                Database._record_statement(0.001)
+            return {"id": student_id}
+
+        mock_get.side_effect = read_student
+
+        with caplog.at_level(logging.WARNING, logger="app.utils.metrics"):
+            client.get("/api/students/1")
+
+        assert "GET /api/students/1 ran 3 SQL statements" in caplog.text
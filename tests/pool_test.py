@@ -0,0 +1,146 @@
+import threading
+import time
+import psycopg2
+import pytest
+from unittest.mock import MagicMock, patch
+from psycopg2 import extensions
+from db.pool import ConnectionPool, PoolTimeout
+
+
+def make_conn():
+    conn = MagicMock()
+    conn.closed = 0
+    conn.get_transaction_status.return_value = extensions.TRANSACTION_STATUS_IDLE
+    return conn
+
+
+@pytest.fixture
+def mock_connect():
+    with patch("db.pool.psycopg2.connect") as mock:
+        mock.side_effect = lambda **kwargs: make_conn()
+        yield mock
+
+
+# =======================
+# Pool Tests
+# =======================
+
+
+class TestConnectionPool:
+    def test_opens_min_connections(self, mock_connect):
+        pool = ConnectionPool(2, 4, host="localhost")
+        assert mock_connect.call_count == 2
+        assert pool.stats()["idle"] == 2
+        mock_connect.assert_called_with(host="localhost")
+
+    def test_invalid_sizes(self, mock_connect):
+        with pytest.raises(ValueError):
+            ConnectionPool(3, 2)
+
+    def test_reuses_returned_connection(self, mock_connect):
+        pool = ConnectionPool(0, 2)
+        conn = pool.getconn()
+        pool.putconn(conn)
+
+        assert pool.getconn() is conn
+        assert mock_connect.call_count == 1
+        stats = pool.stats()
+        assert stats["in_use"] == 1
+        assert stats["checkouts"] == 2
+
+    def test_blocks_until_connection_returned(self, mock_connect):
+        pool = ConnectionPool(0, 1, timeout=5)
+        conn = pool.getconn()
+
+        def release_later():
+            time.sleep(0.05)
+            pool.putconn(conn)
+
+        threading.Thread(target=release_later).start()
+
+        assert pool.getconn() is conn
+        stats = pool.stats()
+        assert stats["waits"] == 1
+        assert stats["wait_time_total"] > 0
+
+    def test_times_out_when_exhausted(self, mock_connect):
+        pool = ConnectionPool(0, 1)
+        pool.getconn()
+
+        with pytest.raises(PoolTimeout):
+            pool.getconn(timeout=0.01)
+        assert pool.stats()["timeouts"] == 1
+
+    def test_replaces_closed_connection(self, mock_connect):
+        pool = ConnectionPool(1, 1)
+        conn = pool.getconn()
+        pool.putconn(conn)
+        conn.closed = 1
+
+        new_conn = pool.getconn()
+        assert new_conn is not conn
+        assert pool.stats()["size"] == 1
+
+    def test_pings_idle_connection(self, mock_connect):
+        pool = ConnectionPool(1, 1, ping_interval=0)
+        conn = pool._idle[0][0]
+        ping_cursor = conn.cursor.return_value.__enter__.return_value
+        ping_cursor.execute.side_effect = psycopg2.OperationalError("server closed")
+
+        new_conn = pool.getconn()
+
+        assert new_conn is not conn
+        ping_cursor.execute.assert_called_once_with("SELECT 1;")
+        conn.close.assert_called_once()
+
+    def test_recycles_old_connection(self, mock_connect):
+        pool = ConnectionPool(1, 1, recycle=0.01)
+        conn = pool.getconn()
+        pool.putconn(conn)
+        time.sleep(0.02)
+
+        assert pool.getconn() is not conn
+        assert pool.stats()["recycled"] == 1
+
+    def test_putconn_discards_broken_connection(self, mock_connect):
+        pool = ConnectionPool(0, 1)
+        conn = pool.getconn()
+        conn.get_transaction_status.return_value = extensions.TRANSACTION_STATUS_UNKNOWN
+
+        pool.putconn(conn)
+
+        conn.close.assert_called_once()
+        assert pool.stats()["size"] == 0
+
+    def test_putconn_rolls_back_open_transaction(self, mock_connect):
+        pool = ConnectionPool(0, 1)
+        conn = pool.getconn()
+        conn.get_transaction_status.return_value = extensions.TRANSACTION_STATUS_INTRANS
+
+        pool.putconn(conn)
+
+        conn.rollback.assert_called_once()
+        assert pool.stats()["idle"] == 1
+
+    def test_putconn_unknown_connection(self, mock_connect):
+        pool = ConnectionPool(0, 1)
+        with pytest.raises(psycopg2.pool.PoolError):
+            pool.putconn(make_conn())
+
+
+# =======================
+# Route Tests
+# =======================
+
+
+class TestHealthRoute:
+    @patch("app.routes.home.Database.pool_stats")
+    def test_health_reports_pool_stats(self, mock_stats, client):
+        mock_stats.return_value = {"in_use": 1, "idle": 2}
+
+        response = client.get("/health")
+        data = response.get_json()
+
+        assert response.status_code == 200
+        assert data["status"] == "OK"
+        assert data["db_pool"] == {"in_use": 1, "idle": 2}
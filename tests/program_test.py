@@ -1,13 +1,18 @@
+import json
 import pytest
-from datetime import date
+from datetime import date, datetime
 from unittest.mock import patch
 from app.models import (
     program_db_read_all,
+    program_db_read_version,
     program_db_read_by_id,
     program_db_read_by_ids,
     program_db_insert,
+    program_db_insert_many,
     program_db_update,
+    program_db_update_many,
     program_db_archive,
+    program_db_archive_many,
 )
 from app.services import (
     get_all_programs,
@@ -114,18 +119,36 @@ def mock_db_create():
         yield mock
 
 
+@pytest.fixture
+def mock_db_create_many():
+    with patch("app.services.program.program_db_insert_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_update():
     with patch("app.services.program.program_db_update") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_update_many():
+    with patch("app.services.program.program_db_update_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_archive():
     with patch("app.services.program.program_db_archive") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_archive_many():
+    with patch("app.services.program.program_db_archive_many") as mock:
+        yield mock
+
+
 # =======================
 # Service Tests
 # =======================
@@ -166,6 +189,7 @@ class TestProgramCreateService:
         mock_program_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_program_create_data,
         valid_program_rows,
@@ -173,6 +197,8 @@ class TestProgramCreateService:
         # Mock the program_dict_to_row function
         mock_program_dict_to_row.return_value = ("Computer Science", "bachelor", 1)
 
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [1, 2]
         mock_db_read_many.return_value = valid_program_rows
 
@@ -189,12 +215,15 @@ class TestProgramCreateService:
         mock_program_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_program_create_data,
     ):
         # Mock the program_dict_to_row function
         mock_program_dict_to_row.return_value = ("Computer Science", "bachelor", 1)
 
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [None, None]
         results, error, status_code = create_new_programs(valid_program_create_data)
 
@@ -203,6 +232,28 @@ class TestProgramCreateService:
         assert status_code == 400
         mock_db_read_many.assert_not_called()
 
+    def test_create_new_programs_batched(
+        self,
+        mock_program_dict_to_row,
+        mock_db_instance,
+        mock_db_create,
+        mock_db_create_many,
+        mock_db_read_many,
+        valid_program_create_data,
+        valid_program_rows,
+    ):
+        mock_db_create_many.return_value = valid_program_rows
+
+        results, error, status_code = create_new_programs(valid_program_create_data)
+
+        assert results == valid_program_rows
+        assert error is None
+        assert status_code == 201
+        mock_db_create_many.assert_called_once()
+        assert len(mock_db_create_many.call_args.args[0]) == 2
+        mock_db_create.assert_not_called()
+        mock_db_read_many.assert_not_called()
+
 
 @patch("app.models.program.db")
 @patch("app.services.program.program_dict_to_row")
@@ -212,7 +263,7 @@ class TestProgramUpdateService:
         mock_program_dict_to_row,
         mock_db_instance,
         mock_db_update,
-        mock_db_read_one,
+        mock_db_update_many,
         mock_db_read_many,
         valid_program_update_data,
         valid_program_row,
@@ -220,17 +271,16 @@ class TestProgramUpdateService:
         # Mock the program_dict_to_row function
         mock_program_dict_to_row.return_value = ("Computer Science", "bachelor", 1)
 
-        mock_db_read_one.return_value = valid_program_row
-
-        mock_db_update.return_value = 1
         mock_db_read_many.return_value = [valid_program_row]
+        mock_db_update_many.return_value = [valid_program_row]
 
         results, error, status_code = update_programs(valid_program_update_data)
 
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
+        mock_db_update_many.assert_called_once()
+        mock_db_update.assert_not_called()
         mock_db_read_many.assert_called_once_with([1])
 
     def test_update_programs_no_success(
@@ -238,7 +288,7 @@ class TestProgramUpdateService:
         mock_program_dict_to_row,
         mock_db_instance,
         mock_db_update,
-        mock_db_read_one,
+        mock_db_update_many,
         mock_db_read_many,
         valid_program_update_data,
         valid_program_row,
@@ -246,23 +296,22 @@ class TestProgramUpdateService:
         # Mock the program_dict_to_row function
         mock_program_dict_to_row.return_value = ("Computer Science", "bachelor", 1)
 
-        mock_db_read_one.return_value = valid_program_row
-
-        mock_db_update.return_value = 0
+        mock_db_read_many.return_value = [{"id": 1}]  # Record exists
+        mock_db_update_many.return_value = []  # Simulate no update
         results, error, status_code = update_programs(valid_program_update_data)
 
         assert results == []
         assert error == [{"message": "Program ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_programs_missing_id(
         self,
         mock_program_dict_to_row,
         mock_db_instance,
         mock_db_update,
-        mock_db_read_one,
+        mock_db_update_many,
         mock_db_read_many,
         program_missing_id,
     ):
@@ -281,12 +330,13 @@ class TestProgramArchiveService:
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_program_ids,
         valid_program_rows,
     ):
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [{"id": 1}, {"id": 2}]
         mock_db_read_one.side_effect = valid_program_rows
         mock_db_read_many.return_value = valid_program_rows
         results, errors, status = archive_programs(valid_program_ids)
@@ -294,12 +344,14 @@ class TestProgramArchiveService:
         assert len(results) == 2
         assert errors in (None, [])
         assert status == 200
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with(valid_program_ids)
+        mock_db_archive.assert_not_called()
 
     def test_archive_programs_none_archived(
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_program_ids,
@@ -307,11 +359,12 @@ class TestProgramArchiveService:
     ):
         mock_db_read_one.return_value = valid_program_row
 
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         results, errors, status = archive_programs(valid_program_ids)
 
         assert results == []
         assert len(errors) == 2
+        mock_db_archive.assert_not_called()
 
     def test_archive_programs_invalid_ids(
         self, mock_db_instance, mock_db_archive, mock_db_read_one, mock_db_read_many
@@ -332,7 +385,54 @@ class TestProgramModel:
         mock_execute.return_value = [{"mocked": "data"}]
         result = program_db_read_all()
         assert result == [{"mocked": "data"}]
-        mock_execute.assert_called_once_with("SELECT * FROM programs;")
+        mock_execute.assert_called_once_with("SELECT * FROM programs;", ())
+
+    @patch("app.models.program.db.execute_query")
+    def test_program_db_read_all_paginated(self, mock_execute):
+        mock_execute.return_value = [{"id": 11}, {"id": 12}]
+        result = program_db_read_all(limit=2, after_id=10)
+        assert result == [{"id": 11}, {"id": 12}]
+        mock_execute.assert_called_once_with(
+            "SELECT * FROM programs WHERE id > %s ORDER BY id LIMIT %s;", (10, 2)
+        )
+
+    @patch("app.models.program.db.stream_query")
+    @patch("app.models.program.db.execute_query")
+    def test_program_db_read_all_stream(self, mock_execute, mock_stream):
+        mock_stream.return_value = iter([{"id": 1}, {"id": 2}])
+        result = program_db_read_all(stream=True)
+        assert list(result) == [{"id": 1}, {"id": 2}]
+        mock_stream.assert_called_once_with("SELECT * FROM programs;", ())
+        mock_execute.assert_not_called()
+
+    @patch("app.models.program.db.execute_query")
+    def test_program_db_read_all_filtered(self, mock_execute):
+        mock_execute.return_value = [{"id": 1, "name": "x"}]
+        result = program_db_read_all(
+            active_only=True, filters={"department_id": "5"}, fields=["name"], limit=10
+        )
+        assert result == [{"id": 1, "name": "x"}]
+        mock_execute.assert_called_once_with(
+            "SELECT id, name FROM programs WHERE is_archived = FALSE AND department_id = %s "
+            "ORDER BY id LIMIT %s;",
+            (5, 10),
+        )
+
+    def test_program_db_read_all_rejects_unknown_filter_and_field(self):
+        with pytest.raises(ValueError, match="Unknown filter: secret"):
+            program_db_read_all(filters={"secret": "1"})
+        with pytest.raises(ValueError, match="Unknown field: secret"):
+            program_db_read_all(fields=["secret"])
+
+    @patch("app.models.program.db.execute_query")
+    def test_program_db_read_version(self, mock_execute):
+        version = {"last_modified": datetime(2025, 1, 1), "row_count": 2}
+        mock_execute.return_value = [version]
+        assert program_db_read_version(active_only=True) == version
+        mock_execute.assert_called_once_with(
+            "SELECT MAX(updated_at) AS last_modified, COUNT(*) AS row_count "
+            "FROM programs WHERE is_archived = FALSE;"
+        )
 
     @patch("app.models.program.db.execute_query")
     def test_program_db_read_all_active(self, mock_execute):
@@ -397,6 +497,19 @@ class TestProgramModel:
         result = program_db_insert(("bad",))
         assert result is None
 
+    @patch("app.models.program.db.execute_values")
+    def test_program_db_insert_many(self, mock_execute_values):
+        mock_execute_values.return_value = [{"id": 1}, {"id": 2}]
+        rows = [("a",), ("b",)]
+
+        result = program_db_insert_many(rows)
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, called_rows = mock_execute_values.call_args.args
+        assert query.startswith("INSERT INTO programs (")
+        assert "VALUES %s RETURNING *" in query
+        assert called_rows == rows
+
     @patch("app.models.program.db.execute_query")
     def test_program_db_update_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -411,6 +524,21 @@ class TestProgramModel:
         result = program_db_update(1, ("x",) * 3)
         assert result == 0
 
+    @patch("app.models.program.db.execute_query")
+    def test_program_db_update_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = program_db_update_many([(1, ("a",) * 12), (2, ("b",) * 12)])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        mock_execute.assert_called_once()
+        query, params = mock_execute.call_args.args
+        assert "UPDATE programs AS t" in query
+        assert "json_populate_recordset(NULL::programs, %s)" in query
+        assert "RETURNING t.*" in query
+        records = json.loads(params[0])
+        assert [r["id"] for r in records] == [1, 2]
+
     @patch("app.models.program.db.execute_query")
     def test_program_db_archive_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -424,6 +552,19 @@ class TestProgramModel:
         result = program_db_archive(999)
         assert result == 0
 
+    @patch("app.models.program.db.execute_query")
+    def test_program_db_archive_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = program_db_archive_many([1, 2, 3])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, params = mock_execute.call_args.args
+        assert "UPDATE programs" in query
+        assert "WHERE id = ANY(%s) AND is_archived = FALSE" in query
+        assert "RETURNING *" in query
+        assert params == ([1, 2, 3],)
+
 
 # =======================
 # Route Tests
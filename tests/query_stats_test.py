@@ -0,0 +1,193 @@
+import logging
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.models import student_db_read_by_ids
+from db.database import Database
+from db.query_stats import MAX_FINGERPRINTS, OTHER_FINGERPRINT, QueryStats, fingerprint
+
+
+@pytest.fixture(autouse=True)
+def reset_query_stats():
+    QueryStats.reset()
+    yield
+    QueryStats.reset()
+
+
+@pytest.fixture
+def mock_pool():
+    Database()  # make sure config and pool are initialized before patching
+    pool = MagicMock()
+    with patch.object(Database, "_pool", pool):
+        yield pool
+
+
+# =======================
+# Fingerprint Tests
+# =======================
+
+
+class TestFingerprint:
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            (
+                "SELECT * FROM students WHERE id IN (%s,%s,%s);",
+                "SELECT * FROM students WHERE id IN (...)",
+            ),
+            (
+                "SELECT * FROM students WHERE id IN (%s);",
+                "SELECT * FROM students WHERE id IN (...)",
+            ),
+            (
+                "SELECT *\n  FROM terms -- all of them\n  WHERE name = 'Fall 2024' LIMIT 10",
+                "SELECT * FROM terms WHERE name = ? LIMIT ?",
+            ),
+            (
+                "INSERT INTO t (a, b) VALUES (1, 'x'), (2, 'it''s');",
+                "INSERT INTO t (a, b) VALUES (...)",
+            ),
+            (
+                "SELECT id FROM enrollments WHERE id = ANY(%s::int[]) AND t1.x = %s",
+                "SELECT id FROM enrollments WHERE id = ANY(?::int[]) AND t1.x = ?",
+            ),
+        ],
+    )
+    def test_fingerprint(self, query, expected):
+        assert fingerprint(query) == expected
+
+    def test_read_by_ids_lists_share_one_fingerprint(self):
+        assert fingerprint(
+            "SELECT * FROM students WHERE id IN (%s,%s);"
+        ) == fingerprint("SELECT * FROM students WHERE id IN (%s,%s,%s,%s,%s);")
+
+
+# =======================
+# Statistics Tests
+# =======================
+
+
+class TestQueryStats:
+    def test_snapshot_reports_percentiles_in_ms(self):
+        for ms in range(1, 101):
+            QueryStats.record("SELECT * FROM terms WHERE id = %s", ms / 1000, rows=1)
+        QueryStats.record("SELECT 1", 0.001, error=True)
+
+        first, second = QueryStats.snapshot()
+
+        assert first["fingerprint"] == "SELECT * FROM terms WHERE id = ?"
+        assert first["calls"] == 100
+        assert first["rows"] == 100
+        assert first["p50_ms"] == 50.0
+        assert first["p95_ms"] == 95.0
+        assert first["p99_ms"] == 99.0
+        assert first["max_ms"] == 100.0
+        assert second["errors"] == 1
+
+    def test_snapshot_limit(self):
+        QueryStats.record("SELECT 1", 0.002)
+        QueryStats.record("SELECT * FROM terms", 0.001)
+
+        assert [row["fingerprint"] for row in QueryStats.snapshot(limit=1)] == [
+            "SELECT ?"
+        ]
+
+    def test_fingerprints_beyond_the_cap_are_pooled(self):
+        for table in range(MAX_FINGERPRINTS + 5):
+            QueryStats.record(f"SELECT * FROM table_{table}", 0.001)
+
+        rows = QueryStats.snapshot()
+        assert len(rows) == MAX_FINGERPRINTS + 1
+        other = next(row for row in rows if row["fingerprint"] == OTHER_FINGERPRINT)
+        assert other["calls"] == 5
+
+
+# =======================
+# Database Integration Tests
+# =======================
+
+
+class TestDatabaseQueryStats:
+    def test_statements_are_recorded_with_their_model_function(self, mock_pool):
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        cursor.fetchall.return_value = [{"id": 1}, {"id": 2}]
+
+        student_db_read_by_ids([1, 2])
+
+        (row,) = QueryStats.snapshot()
+        assert row["fingerprint"] == "SELECT * FROM students WHERE id IN (...)"
+        assert row["rows"] == 2
+        assert row["sources"] == ["app.models.student.student_db_read_by_ids"]
+
+    @patch("db.database.slow_query_ms", return_value=0)
+    def test_slow_statement_is_logged_with_plan(
+        self, mock_threshold, mock_pool, caplog
+    ):
+        conn = mock_pool.getconn.return_value
+        explain_cursor = MagicMock()
+        explain_cursor.fetchall.return_value = [("Seq Scan on terms",)]
+        conn.cursor.side_effect = [MagicMock(), explain_cursor]
+
+        with caplog.at_level(logging.WARNING, logger="db.database"):
+            Database().execute_query("SELECT * FROM terms WHERE id = %s;", (3,))
+
+        explain_sql, params = explain_cursor.execute.call_args_list[0].args
+        assert explain_sql == (
+            "SAVEPOINT db_explain; EXPLAIN SELECT * FROM terms WHERE id = %s"
+        )
+        assert params == (3,)
+        assert "Slow query" in caplog.text
+        assert "SELECT * FROM terms WHERE id = ?" in caplog.text
+        assert "Seq Scan on terms" in caplog.text
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "LOCK TABLE grade_stats IN EXCLUSIVE MODE; UPDATE grade_stats SET n = %s;",
+            "SELECT pg_advisory_xact_lock(%s); UPDATE grade_stats SET n = 1;",
+            "REFRESH MATERIALIZED VIEW course_stats;",
+        ],
+    )
+    @patch("db.database.slow_query_ms", return_value=0)
+    def test_slow_statement_is_not_explained_unless_explainable(
+        self, mock_threshold, mock_pool, caplog, query
+    ):
+        conn = mock_pool.getconn.return_value
+
+        with caplog.at_level(logging.WARNING, logger="db.database"):
+            Database().execute_query(query, (1,))
+
+        conn.cursor.assert_called_once()  # the statement's own cursor only
+        assert "Slow query" in caplog.text
+
+
+# =======================
+# Route Tests
+# =======================
+
+
+class TestDebugQueriesRoute:
+    def test_get_debug_queries(self, client):
+        QueryStats.record("SELECT * FROM terms WHERE id = %s", 0.004, rows=1)
+
+        response = client.get("/debug/queries?limit=5")
+        data = response.get_json()
+
+        assert response.status_code == 200
+        assert "slow_query_ms" in data
+        assert any(
+            q["fingerprint"].startswith("SELECT * FROM terms") for q in data["queries"]
+        )
+
+    def test_reset_debug_queries(self, client):
+        QueryStats.record("SELECT 1", 0.001)
+
+        response = client.delete("/debug/queries")
+
+        assert response.status_code == 200
+        assert QueryStats.snapshot() == []
+
+    def test_debug_queries_disabled(self, client, monkeypatch):
+        monkeypatch.setenv("DEBUG_QUERIES", "false")
+
+        assert client.get("/debug/queries").status_code == 404
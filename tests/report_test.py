@@ -0,0 +1,285 @@
+from unittest.mock import MagicMock, patch
+
+from app.models import (
+    course_schedule_db_update,
+    enrollment_db_insert_many,
+    report_db_read_room_sessions,
+    report_db_read_teaching_load,
+    report_db_read_department_summary,
+)
+from app.models.report import DEPARTMENT_SUMMARY_TTL, department_summary_cache
+from app.services import (
+    get_room_utilization,
+    get_instructor_load,
+    get_department_teaching_load,
+    get_department_summaries,
+    get_department_summary,
+)
+
+
+def make_load_row(instructor_id, course_id, enrolled, sessions):
+    return {
+        "instructor_id": instructor_id,
+        "first_name": "Ada",
+        "last_name": f"Lovelace{instructor_id}",
+        "course_id": course_id,
+        "code": f"CS{course_id}",
+        "title": "Course",
+        "term_id": 1,
+        "enrolled": enrolled,
+        "sessions": sessions,
+    }
+
+
+# =======================
+# Model Tests
+# =======================
+
+
+class TestReportModel:
+    @patch("app.models.report.db.execute_query")
+    def test_read_room_sessions(self, mock_execute):
+        mock_execute.return_value = [{"id": 1, "room": "Lab 1"}]
+
+        assert report_db_read_room_sessions(3) == [{"id": 1, "room": "Lab 1"}]
+        query, params = mock_execute.call_args.args
+        assert (
+            "JOIN courses c ON c.id = cs.course_id AND c.is_archived = FALSE" in query
+        )
+        assert query.endswith("AND c.term_id = %s ORDER BY cs.id;")
+        assert params == (3,)
+
+    @patch("app.models.course_schedule.db.execute_query")
+    @patch("app.models.report.db.execute_query")
+    def test_room_sessions_are_cached_until_a_schedule_write(
+        self, mock_execute, mock_schedule_execute
+    ):
+        mock_execute.return_value = [{"id": 1, "room": "Lab 1"}]
+        mock_schedule_execute.return_value = MagicMock(rowcount=1)
+
+        report_db_read_room_sessions(3)
+        report_db_read_room_sessions(3)
+        assert mock_execute.call_count == 1
+
+        course_schedule_db_update(1, (1, "Monday", "10:00", "Lab 2"))
+
+        report_db_read_room_sessions(3)
+        assert mock_execute.call_count == 2
+
+    @patch("app.models.report.db.execute_query")
+    def test_read_teaching_load(self, mock_execute):
+        mock_execute.return_value = [{"instructor_id": 1, "course_id": 2}]
+
+        assert report_db_read_teaching_load(department_id=4, term_id=1) == [
+            {"instructor_id": 1, "course_id": 2}
+        ]
+        query, params = mock_execute.call_args.args
+        assert (
+            "WHERE a.is_archived = FALSE AND i.department_id = %s AND c.term_id = %s"
+            in query
+        )
+        assert "GROUP BY e.course_id" in query
+        assert "GROUP BY cs.course_id" in query
+        assert params == (4, 1)
+
+    @patch("app.models.enrollment.db.execute_values")
+    @patch("app.models.report.db.execute_query")
+    def test_teaching_load_is_cached_until_an_enrollment_write(
+        self, mock_execute, mock_enrollment_values
+    ):
+        mock_execute.return_value = []
+        mock_enrollment_values.return_value = [{"id": 3, "course_id": 2}]
+
+        report_db_read_teaching_load(instructor_id=1)
+        report_db_read_teaching_load(instructor_id=1)
+        assert mock_execute.call_count == 1
+
+        enrollment_db_insert_many([(1, 2, None)])
+
+        report_db_read_teaching_load(instructor_id=1)
+        assert mock_execute.call_count == 2
+
+    @patch("app.models.report.db.execute_query")
+    def test_read_department_summary(self, mock_execute):
+        mock_execute.return_value = [{"department_id": 4, "programs": 2}]
+
+        assert report_db_read_department_summary(department_id=4) == [
+            {"department_id": 4, "programs": 2}
+        ]
+        query, params = mock_execute.call_args.args
+        assert query.count("GROUP BY") == 4
+        assert "s.status = 'active'" in query
+        assert params == (4,) * 10
+
+    @patch("app.models.report.db.execute_query")
+    def test_department_summary_is_cached_with_short_ttl(self, mock_execute):
+        mock_execute.return_value = []
+
+        report_db_read_department_summary()
+        report_db_read_department_summary()
+
+        assert mock_execute.call_count == 1
+        assert mock_execute.call_args.args[1] == (None,) * 10
+        assert department_summary_cache.ttl == DEPARTMENT_SUMMARY_TTL
+
+
+# =======================
+# Service Tests
+# =======================
+
+
+class TestReportService:
+    @patch("app.services.report.report_db_read_room_sessions")
+    def test_get_room_utilization(self, mock_read):
+        mock_read.return_value = [
+            {"id": 1, "room": "Lab 1", "day": "Tue/Thu", "time": "09:00-10:30"},
+            {"id": 2, "room": "Lab 1", "day": "TBA", "time": "09:00"},
+        ]
+
+        report = get_room_utilization(term_id=3)
+
+        assert report == {
+            "term_id": 3,
+            "rooms": [
+                {
+                    "room": "Lab 1",
+                    "sessions": 1,
+                    "weekly_hours": 3.0,
+                    "hours_by_day": {"Tuesday": 1.5, "Thursday": 1.5},
+                }
+            ],
+            "unparsed_ids": [2],
+        }
+        mock_read.assert_called_once_with(3)
+
+    @patch("app.services.report.report_db_read_teaching_load")
+    @patch("app.services.report.instructor_db_read_by_id")
+    def test_get_instructor_load(self, mock_instructor, mock_read):
+        mock_instructor.return_value = {"id": 1}
+        mock_read.return_value = [
+            make_load_row(1, 10, 25, [{"day": "Mon/Wed", "time": "10:00-11:30"}]),
+            make_load_row(1, 11, 5, [{"day": "Friday", "time": "TBA"}]),
+        ]
+
+        load = get_instructor_load(1, term_id=1)
+
+        assert load["course_count"] == 2
+        assert load["scheduled_hours"] == 3.0
+        assert load["enrolled_total"] == 30
+        assert [c["scheduled_hours"] for c in load["courses"]] == [3.0, 0]
+        mock_read.assert_called_once_with(instructor_id=1, term_id=1)
+
+    @patch("app.services.report.report_db_read_teaching_load")
+    @patch("app.services.report.instructor_db_read_by_id")
+    def test_get_instructor_load_not_found(self, mock_instructor, mock_read):
+        mock_instructor.return_value = None
+
+        assert get_instructor_load(999) is None
+        mock_read.assert_not_called()
+
+    @patch("app.services.report.report_db_read_teaching_load")
+    @patch("app.services.report.department_db_read_by_id")
+    def test_get_department_teaching_load_counts_shared_courses_once(
+        self, mock_department, mock_read
+    ):
+        mock_department.return_value = {"id": 4}
+        sessions = [{"day": "Tuesday", "time": "09:00"}]
+        mock_read.return_value = [
+            make_load_row(1, 10, 20, sessions),
+            make_load_row(2, 10, 20, sessions),
+            make_load_row(2, 12, 8, []),
+        ]
+
+        load = get_department_teaching_load(4)
+
+        assert load["instructor_count"] == 2
+        assert load["course_count"] == 2
+        assert load["enrolled_total"] == 28
+        assert load["scheduled_hours"] == 1.0
+        assert [
+            (i["instructor_id"], i["course_count"], i["enrolled_total"])
+            for i in load["instructors"]
+        ] == [(1, 1, 20), (2, 2, 28)]
+
+    @patch("app.services.report.report_db_read_department_summary")
+    def test_get_department_summary(self, mock_read):
+        mock_read.return_value = [{"department_id": 4, "courses": 7}]
+
+        assert get_department_summary(4) == {"department_id": 4, "courses": 7}
+        mock_read.assert_called_once_with(department_id=4)
+
+    @patch("app.services.report.report_db_read_department_summary")
+    def test_get_department_summary_not_found(self, mock_read):
+        mock_read.return_value = []
+
+        assert get_department_summary(999) is None
+
+    @patch("app.services.report.report_db_read_department_summary")
+    def test_get_department_summaries(self, mock_read):
+        mock_read.return_value = [{"department_id": 1}, {"department_id": 2}]
+
+        assert get_department_summaries() == [
+            {"department_id": 1},
+            {"department_id": 2},
+        ]
+
+
+# =======================
+# Route Tests
+# =======================
+
+
+class TestReportRoutes:
+    @patch("app.routes.report.get_room_utilization")
+    def test_handle_get_room_utilization(self, mock_report, client):
+        mock_report.return_value = {"term_id": 2, "rooms": [], "unparsed_ids": []}
+
+        response = client.get("/api/reports/room-utilization?term_id=2")
+
+        assert response.status_code == 200
+        assert response.get_json()["data"]["rooms"] == []
+        mock_report.assert_called_once_with(term_id=2)
+
+    @patch("app.routes.report.get_room_utilization")
+    def test_handle_get_room_utilization_invalid_term(self, mock_report, client):
+        response = client.get("/api/reports/room-utilization?term_id=x")
+
+        assert response.status_code == 400
+        mock_report.assert_not_called()
+
+    @patch("app.routes.instructor.get_instructor_load")
+    def test_handle_get_instructor_load(self, mock_load, client):
+        mock_load.return_value = {"instructor_id": 1, "course_count": 2}
+
+        response = client.get("/api/instructors/1/load?term_id=3")
+
+        assert response.status_code == 200
+        assert response.get_json()["data"]["course_count"] == 2
+        mock_load.assert_called_once_with(1, term_id=3)
+
+    @patch("app.routes.department.get_department_teaching_load")
+    def test_handle_get_department_teaching_load_not_found(self, mock_load, client):
+        mock_load.return_value = None
+
+        response = client.get("/api/departments/999/teaching-load")
+
+        assert response.status_code == 404
+        assert "Department not found" in response.get_json()["error"]
+        mock_load.assert_called_once_with(999, term_id=None)
+
+    @patch("app.routes.department.get_department_summaries")
+    def test_handle_get_department_summaries(self, mock_summaries, client):
+        mock_summaries.return_value = [{"department_id": 1, "programs": 3}]
+
+        response = client.get("/api/departments/summary")
+
+        assert response.status_code == 200
+        assert response.get_json()["data"] == [{"department_id": 1, "programs": 3}]
+
+    @patch("app.routes.department.get_department_summary")
+    def test_handle_get_department_summary_not_found(self, mock_summary, client):
+        mock_summary.return_value = None
+
+        response = client.get("/api/departments/999/summary")
+
+        assert response.status_code == 404
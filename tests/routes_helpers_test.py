@@ -1,6 +1,21 @@
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
-from app.utils.routes_helpers import normalize_to_list, handle_bulk_process
+from app.utils.routes_helpers import (
+    normalize_to_list,
+    handle_bulk_process,
+    encode_cursor,
+    decode_cursor,
+    get_pagination_args,
+    get_id_arg,
+    get_next_cursor,
+    get_stream_format,
+    get_filter_args,
+    list_validators,
+    wants_list_validators,
+    row_validators,
+    MAX_PAGE_LIMIT,
+)
 
 
 # Tests for normalize_to_list
@@ -100,3 +115,111 @@ def test_handle_bulk_process_missing_id_for_update(mock_funcs):
         "errors": [{"index": 0, "data": {"name": "Item1"}, "error": "'id'"}]
     }
     assert error_code == 400
+
+
+# Tests for keyset pagination helpers
+def test_cursor_round_trip():
+    cursor = encode_cursor(42)
+    assert "42" not in cursor
+    assert decode_cursor(cursor) == 42
+
+
+def test_decode_cursor_invalid():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_get_pagination_args():
+    assert get_pagination_args({}) == (None, None)
+    assert get_pagination_args({"limit": "10", "after_id": "5"}) == (10, 5)
+    assert get_pagination_args({"cursor": encode_cursor(7)}) == (None, 7)
+    assert get_pagination_args({"limit": "999999"}) == (MAX_PAGE_LIMIT, None)
+
+
+def test_get_pagination_args_invalid_limit():
+    with pytest.raises(ValueError):
+        get_pagination_args({"limit": "0"})
+    with pytest.raises(ValueError):
+        get_pagination_args({"limit": "-1"})
+
+
+def test_get_id_arg():
+    assert get_id_arg({}, "term_id") is None
+    assert get_id_arg({"term_id": "3"}, "term_id") == 3
+    with pytest.raises(ValueError, match="term_id must be a positive integer"):
+        get_id_arg({"term_id": "abc"}, "term_id")
+
+
+def test_get_next_cursor():
+    rows = [{"id": 1}, {"id": 2}]
+    assert get_next_cursor(rows, None) is None
+    assert get_next_cursor(rows, 3) is None
+    assert decode_cursor(get_next_cursor(rows, 2)) == 2
+
+
+# Tests for streaming helpers
+def test_get_stream_format():
+    assert get_stream_format({}) is None
+    assert get_stream_format({"stream": "NDJSON"}) == "ndjson"
+    with pytest.raises(ValueError):
+        get_stream_format({"stream": "xml"})
+
+
+# Tests for conditional GET validators
+def test_list_validators_depend_on_version_and_query():
+    version = {"last_modified": datetime(2025, 1, 1, 12, 0, 0, 500), "row_count": 3}
+
+    etag, last_modified = list_validators(version, {"limit": "10"})
+
+    assert last_modified == datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    assert etag == list_validators(dict(version), {"limit": "10"})[0]
+    assert etag != list_validators(version, {"limit": "20"})[0]
+    assert etag != list_validators({**version, "row_count": 4}, {"limit": "10"})[0]
+
+
+def test_list_validators_without_version():
+    assert list_validators(None, {}) is None
+
+
+def test_wants_list_validators_only_on_unfiltered_first_pages():
+    assert wants_list_validators(None, {}) is True
+    assert wants_list_validators(100, {}) is False
+    assert wants_list_validators(None, {"term_id": "1"}) is False
+
+
+def test_row_validators():
+    row = {"id": 1, "updated_at": datetime(2025, 1, 1)}
+
+    etag, last_modified = row_validators(row)
+
+    assert etag != row_validators({**row, "id": 2})[0]
+    assert last_modified == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert row_validators({"id": 1}) is None
+
+
+# Tests for get_filter_args
+def test_get_filter_args_splits_filters_and_fields():
+    filters, fields = get_filter_args(
+        {
+            "active_only": "true",
+            "limit": "5",
+            "status": "active",
+            "fields": "id, email,",
+        }
+    )
+    assert filters == {"status": "active"}
+    assert fields == ["id", "email"]
+
+
+def test_get_filter_args_defaults():
+    assert get_filter_args({}) == ({}, None)
+
+
+def test_get_filter_args_ignores_reserved_params():
+    filters, _ = get_filter_args({"_": "1700000000000", "_t": "1", "city": "Ottawa"})
+    assert filters == {"city": "Ottawa"}
+
+
+def test_get_next_cursor_custom_key():
+    rows = [{"enrollment_id": 4, "id": 1}, {"enrollment_id": 7, "id": 2}]
+    assert decode_cursor(get_next_cursor(rows, 2, key="enrollment_id")) == 7
@@ -0,0 +1,250 @@
+import pytest
+
+from app.utils.scheduling import (
+    DEFAULT_SESSION_MINUTES,
+    IntervalIndex,
+    Timetables,
+    build_conflict_index,
+    describe_conflict,
+    find_schedule_conflicts,
+    group_course_sessions,
+    merge_intervals,
+    parse_days,
+    parse_time_range,
+    room_utilization,
+    schedule_intervals,
+)
+
+
+def make_slot(slot_id, room="Room 101", day="Monday", time="10:00", **overrides):
+    slot = {
+        "id": slot_id,
+        "course_id": (slot_id or 0) * 10 + 5,
+        "term_id": 1,
+        "day": day,
+        "time": time,
+        "room": room,
+        "instructor_ids": [],
+    }
+    slot.update(overrides)
+    return slot
+
+
+# =======================
+# Parsing Tests
+# =======================
+
+
+class TestParsing:
+    @pytest.mark.parametrize(
+        "day, expected",
+        [
+            ("Monday", [0]),
+            ("mon/wed", [0, 2]),
+            ("Tue, Thu", [1, 3]),
+            ("Friday and Monday", [0, 4]),
+            ("Thurs & Sat", [3, 5]),
+        ],
+    )
+    def test_parse_days(self, day, expected):
+        assert parse_days(day) == expected
+
+    @pytest.mark.parametrize("day", ["", "Funday", "Mon/Someday", None])
+    def test_parse_days_rejects_unknown_days(self, day):
+        with pytest.raises(ValueError, match="Invalid schedule day"):
+            parse_days(day)
+
+    @pytest.mark.parametrize(
+        "time, expected",
+        [
+            ("10:00", (600, 600 + DEFAULT_SESSION_MINUTES)),
+            ("10:00 AM", (600, 660)),
+            ("1:30 PM", (810, 870)),
+            ("12:00 PM", (720, 780)),
+            ("09:00-10:15", (540, 615)),
+            ("9 - 10:30 AM", (540, 630)),
+            ("11:00 AM to 12:30 PM", (660, 750)),
+            ("2-3:30pm", (840, 930)),
+        ],
+    )
+    def test_parse_time_range(self, time, expected):
+        assert parse_time_range(time) == expected
+
+    @pytest.mark.parametrize(
+        "time", ["", "noon", "25:00", "10:75", "11:00-10:00", "0:30 AM", None]
+    )
+    def test_parse_time_range_rejects_invalid_times(self, time):
+        with pytest.raises(ValueError, match="Invalid schedule time"):
+            parse_time_range(time)
+
+    def test_schedule_intervals_repeats_per_day(self):
+        assert schedule_intervals("Mon/Wed", "10:00-11:00") == [
+            (600, 660),
+            (2 * 1440 + 600, 2 * 1440 + 660),
+        ]
+
+
+# =======================
+# Interval Index Tests
+# =======================
+
+
+class TestIntervalIndex:
+    def test_overlapping_is_half_open(self):
+        index = IntervalIndex()
+        index.add(600, 660, "a")
+        index.add(660, 720, "b")
+
+        assert index.overlapping(659, 661) == ["a", "b"]
+        assert index.overlapping(720, 780) == []
+        assert index.overlapping(540, 600) == []
+
+    def test_overlapping_finds_long_intervals_that_start_early(self):
+        index = IntervalIndex()
+        index.add(0, 1000, "long")
+        for start in range(100, 900, 100):
+            index.add(start, start + 10, f"short{start}")
+
+        assert index.overlapping(950, 960) == ["long"]
+        assert len(index) == 9
+
+    def test_same_start_keeps_insertion_order_without_comparing_refs(self):
+        index = IntervalIndex()
+        index.add(600, 660, {"id": 1})
+        index.add(600, 630, {"id": 2})
+
+        assert index.overlapping(600, 610) == [{"id": 1}, {"id": 2}]
+
+
+class TestTimetables:
+    def test_clash_is_per_student_and_term(self):
+        sessions = group_course_sessions(
+            [
+                {"course_id": 1, "term_id": 1, "day": "Monday", "time": "10:00"},
+                {"course_id": 2, "term_id": 1, "day": "Mon", "time": "10:30"},
+                {"course_id": 3, "term_id": 2, "day": "Monday", "time": "10:00"},
+                {"course_id": 4, "term_id": 1, "day": "Monday", "time": "TBA"},
+            ]
+        )
+        timetables = Timetables()
+        timetables.add_sessions(
+            [
+                {
+                    "student_id": 7,
+                    "course_id": 1,
+                    "term_id": 1,
+                    "day": "Monday",
+                    "time": "10:00",
+                }
+            ]
+        )
+
+        assert timetables.clash(7, sessions[2]) == 1
+        assert timetables.clash(7, sessions[3]) is None
+        assert timetables.clash(8, sessions[2]) is None
+        assert sessions[4] == []  # TBA has no intervals
+
+
+# =======================
+# Conflict Tests
+# =======================
+
+
+class TestConflicts:
+    def test_room_conflict_ignores_case_and_spacing(self):
+        index = build_conflict_index([make_slot(1, room="Room 101")])
+        new = make_slot(None, room=" room  101 ", time="10:30-11:30")
+
+        clashes = index.conflicts(new, schedule_intervals(new["day"], new["time"]))
+
+        assert [(kind, other["id"]) for kind, _, other in clashes] == [("room", 1)]
+        assert describe_conflict(*clashes[0]) == (
+            "Room 'Room 101' is already booked on Monday at 10:00 by course 15."
+        )
+
+    def test_instructor_conflict_across_rooms(self):
+        index = build_conflict_index([make_slot(1, instructor_ids=[7])])
+        new = make_slot(None, room="Lab 2", instructor_ids=[7, 8])
+
+        clashes = index.conflicts(new, schedule_intervals(new["day"], new["time"]))
+
+        assert [(kind, value) for kind, value, _ in clashes] == [("instructor", 7)]
+        assert "Instructor 7 already teaches course 15" in describe_conflict(
+            *clashes[0]
+        )
+
+    def test_no_conflict_in_other_term_or_day(self):
+        index = build_conflict_index([make_slot(1)])
+
+        for new in (make_slot(None, term_id=2), make_slot(None, day="Tuesday")):
+            intervals = schedule_intervals(new["day"], new["time"])
+            assert index.conflicts(new, intervals) == []
+
+    def test_slot_does_not_conflict_with_itself(self):
+        slot = make_slot(1)
+        index = build_conflict_index([slot])
+
+        assert index.conflicts(slot, schedule_intervals("Monday", "10:00")) == []
+
+    def test_build_conflict_index_skips_unparsable_rows(self):
+        index = build_conflict_index([make_slot(1, time="TBA")])
+        new = make_slot(None)
+
+        assert index.conflicts(new, schedule_intervals("Monday", "10:00")) == []
+
+    def test_find_schedule_conflicts_reports_each_pair_once(self):
+        slots = [
+            make_slot(3, room="Room 102", instructor_ids=[7]),
+            make_slot(1),
+            make_slot(2, time="10:30 AM", instructor_ids=[7]),
+            make_slot(4, time="TBA"),
+        ]
+
+        conflicts, unparsed = find_schedule_conflicts(slots)
+
+        assert unparsed == [4]
+        assert [(c["type"], [s["id"] for s in c["sessions"]]) for c in conflicts] == [
+            ("room", [1, 2]),
+            ("instructor", [2, 3]),
+        ]
+        assert conflicts[0]["room"] == "Room 101"
+        assert conflicts[1]["instructor_id"] == 7
+
+
+# =======================
+# Utilization Tests
+# =======================
+
+
+class TestRoomUtilization:
+    def test_merge_intervals(self):
+        assert merge_intervals([(60, 120), (0, 30), (100, 150), (150, 160)]) == [
+            (0, 30),
+            (60, 160),
+        ]
+
+    def test_room_utilization_counts_double_bookings_once(self):
+        sessions = [
+            {"id": 1, "room": "Room 101", "day": "Mon/Wed", "time": "10:00"},
+            {"id": 2, "room": "room 101", "day": "Monday", "time": "10:30-12:00"},
+            {"id": 3, "room": "Lab 1", "day": "Friday", "time": "1:00 PM"},
+            {"id": 4, "room": "Lab 1", "day": "Someday", "time": "10:00"},
+        ]
+
+        rooms, unparsed = room_utilization(sessions)
+
+        assert unparsed == [4]
+        assert rooms == [
+            {
+                "room": "Lab 1",
+                "sessions": 1,
+                "weekly_hours": 1.0,
+                "hours_by_day": {"Friday": 1.0},
+            },
+            {
+                "room": "Room 101",
+                "sessions": 2,
+                "weekly_hours": 3.0,
+                "hours_by_day": {"Monday": 2.0, "Wednesday": 1.0},
+            },
+        ]
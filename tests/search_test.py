@@ -0,0 +1,204 @@
+import pytest
+from unittest.mock import patch
+
+from app.models import search_db_people
+from app.models.search import (
+    SEARCH_TEXT,
+    SEARCH_VECTOR,
+    get_search_params,
+    get_search_prefix_query,
+    get_search_query,
+    search_db_has_trigram,
+)
+from app.services import search_people
+
+# =======================
+# Fixtures
+# =======================
+
+
+@pytest.fixture
+def mock_trigram():
+    with patch("app.models.search.search_db_has_trigram", return_value=True) as mock:
+        yield mock
+
+
+# =======================
+# Query Builder Tests
+# =======================
+
+
+class TestSearchQuery:
+    @pytest.mark.parametrize(
+        "term, expected",
+        [
+            ("Jo", "jo:*"),
+            ("jo smi", "jo:* & smi:*"),
+            ("o'brien", "o:* & brien:*"),
+            ("jane.doe@school", "jane:* & doe:* & school:*"),
+            ("@ !", None),
+        ],
+    )
+    def test_get_search_prefix_query(self, term, expected):
+        assert get_search_prefix_query(term) == expected
+
+    def test_get_search_query_uses_indexed_expressions(self):
+        query = get_search_query("students", "student", ["id", "email"])
+
+        assert f"{SEARCH_VECTOR} @@ q.query" in query
+        assert f"{SEARCH_TEXT} LIKE %s" in query
+        assert "'student' AS type, id, email" in query
+        assert "is_archived = FALSE" in query
+
+    def test_get_search_query_without_substring_match(self):
+        query = get_search_query("students", "student", ["id"], substring=False)
+
+        assert "LIKE" not in query
+        assert "similarity(" in query
+
+    def test_get_search_query_without_trigram(self):
+        query = get_search_query(
+            "students", "student", ["id"], substring=False, trigram=False
+        )
+
+        assert "similarity(" not in query
+        assert f"ts_rank({SEARCH_VECTOR}, q.query) AS rank" in query
+
+    def test_get_search_params_escape_like_wildcards(self):
+        assert get_search_params("50%_Off", 10) == [
+            "50%_off",
+            "50:* & off:*",
+            "%50\\%\\_off%",
+            10,
+        ]
+
+    def test_get_search_params_without_substring_match(self):
+        assert get_search_params("Jo", 5, substring=False) == ["jo", "jo:*", 5]
+
+    def test_get_search_params_without_trigram(self):
+        assert get_search_params("Jo", 5, substring=False, trigram=False) == [
+            "jo:*",
+            5,
+        ]
+
+
+# =======================
+# Model Tests
+# =======================
+
+
+class TestSearchModel:
+    @patch("app.models.search.db.execute_query")
+    def test_search_db_people_merges_tables(self, mock_execute, mock_trigram):
+        mock_execute.return_value = [{"type": "student", "id": 1, "rank": 0.5}]
+
+        assert search_db_people("smith", 10) == [
+            {"type": "student", "id": 1, "rank": 0.5}
+        ]
+        query, params = mock_execute.call_args.args
+        assert "FROM students" in query and "FROM instructors" in query
+        assert "UNION ALL" in query
+        assert query.rstrip().endswith("ORDER BY rank DESC, type, id LIMIT %s;")
+        assert len(params) == 9
+        assert params[-1] == 10
+
+    @patch("app.models.search.db.execute_query")
+    def test_search_db_people_short_term_skips_substring_match(
+        self, mock_execute, mock_trigram
+    ):
+        mock_execute.return_value = []
+
+        search_db_people("jo", 10, tables=["instructors"])
+
+        query, params = mock_execute.call_args.args
+        assert "FROM students" not in query
+        assert "LIKE" not in query
+        assert params == ("jo", "jo:*", 10, 10)
+
+    @patch("app.models.search.db.execute_query")
+    def test_search_db_people_without_trigram_matches_prefixes_only(
+        self, mock_execute, mock_trigram
+    ):
+        mock_trigram.return_value = False
+        mock_execute.return_value = []
+
+        search_db_people("smith", 10, tables=["students"])
+
+        query, params = mock_execute.call_args.args
+        assert "LIKE" not in query and "similarity(" not in query
+        assert params == ("smith:*", 10, 10)
+
+    @patch("app.models.search.db.execute_query")
+    def test_search_db_people_unmatchable_term(self, mock_execute, mock_trigram):
+        assert search_db_people("@", 10) == []
+        mock_execute.assert_not_called()
+
+    @patch("app.models.search.db.execute_query")
+    def test_search_db_has_trigram_is_cached(self, mock_execute):
+        mock_execute.return_value = [{"installed": False}]
+
+        assert search_db_has_trigram() is False
+        assert search_db_has_trigram() is False
+        mock_execute.assert_called_once()
+        assert "extname = 'pg_trgm'" in mock_execute.call_args.args[0]
+
+
+# =======================
+# Service Tests
+# =======================
+
+
+class TestSearchService:
+    @patch("app.services.search.search_db_people")
+    def test_search_people_clamps_limit_and_rounds_rank(self, mock_search):
+        mock_search.return_value = [{"id": 1, "rank": 0.123456}]
+
+        assert search_people(" smith ", limit=5000) == [{"id": 1, "rank": 0.1235}]
+        mock_search.assert_called_once_with("smith", 100, tables=None)
+
+    @patch("app.services.search.search_db_people")
+    def test_search_people_default_limit(self, mock_search):
+        mock_search.return_value = []
+
+        search_people("smith", types=["students"])
+        mock_search.assert_called_once_with("smith", 20, tables=["students"])
+
+    @pytest.mark.parametrize(
+        "term, types, message",
+        [
+            (None, None, "q is required"),
+            ("   ", None, "q is required"),
+            ("x" * 101, None, "at most 100 characters"),
+            ("smith", ["courses"], "type must be one of"),
+        ],
+    )
+    def test_search_people_rejects_bad_input(self, term, types, message):
+        with pytest.raises(ValueError, match=message):
+            search_people(term, types=types)
+
+
+# =======================
+# Route Tests
+# =======================
+
+
+class TestSearchRoutes:
+    @patch("app.routes.search.search_people")
+    def test_handle_search(self, mock_search, client):
+        mock_search.return_value = [{"type": "student", "id": 1}]
+
+        response = client.get("/api/search?q=smith&limit=5&type=students")
+
+        assert response.status_code == 200
+        assert response.get_json()["data"] == [{"type": "student", "id": 1}]
+        mock_search.assert_called_once_with("smith", limit=5, types=["students"])
+
+    def test_handle_search_requires_query(self, client):
+        response = client.get("/api/search")
+
+        assert response.status_code == 400
+
+    def test_handle_search_invalid_limit(self, client):
+        response = client.get("/api/search?q=smith&limit=0")
+
+        assert response.status_code == 400
@@ -0,0 +1,285 @@
+from unittest.mock import MagicMock
+from app.utils.service_helper import (
+    bulk_archive_entities,
+    bulk_create_entities,
+    bulk_update_entities,
+)
+
+
+def to_row(item):
+    return (item["name"],)
+
+
+def to_dict(row):
+    return row
+
+
+# =======================
+# Bulk Create Tests
+# =======================
+
+
+def test_bulk_create_inserts_in_chunks():
+    insert_many = MagicMock(side_effect=lambda rows: [{"name": r[0]} for r in rows])
+    insert_one = MagicMock()
+    items = [{"name": f"item{i}"} for i in range(5)]
+
+    results, error, status = bulk_create_entities(
+        items,
+        insert_func=insert_one,
+        insert_many_func=insert_many,
+        to_row_func=to_row,
+        to_dict_func=to_dict,
+        read_by_ids_func=MagicMock(),
+        chunk_size=2,
+    )
+
+    assert error is None
+    assert status == 201
+    assert [r["name"] for r in results] == [f"item{i}" for i in range(5)]
+    assert [len(c.args[0]) for c in insert_many.call_args_list] == [2, 2, 1]
+    insert_one.assert_not_called()
+
+
+def test_bulk_create_failed_chunk_reports_item_errors():
+    insert_many = MagicMock(side_effect=ValueError("Integrity error: duplicate"))
+    insert_one = MagicMock(
+        side_effect=[1, ValueError("Integrity error: duplicate email")]
+    )
+    read_by_ids = MagicMock(return_value=[{"id": 1, "name": "ok"}])
+
+    results, error, status = bulk_create_entities(
+        [{"name": "ok"}, {"name": "dup"}],
+        insert_func=insert_one,
+        insert_many_func=insert_many,
+        to_row_func=to_row,
+        to_dict_func=to_dict,
+        read_by_ids_func=read_by_ids,
+    )
+
+    assert results == [{"id": 1, "name": "ok"}]
+    assert status == 201
+    assert insert_one.call_count == 2
+    read_by_ids.assert_called_once_with([1])
+
+
+def test_bulk_create_all_rows_fail():
+    results, error, status = bulk_create_entities(
+        [{"name": "dup"}],
+        insert_func=MagicMock(side_effect=ValueError("Integrity error: duplicate")),
+        insert_many_func=MagicMock(side_effect=ValueError("Integrity error")),
+        to_row_func=to_row,
+        to_dict_func=to_dict,
+        read_by_ids_func=MagicMock(),
+        no_success_msg="No widgets were created.",
+    )
+
+    assert results == []
+    assert status == 400
+    assert error["message"] == "No widgets were created."
+    assert error["details"] == [{"index": 0, "message": "Integrity error: duplicate"}]
+
+
+def test_bulk_create_validate_func_rejects_rows_before_insert():
+    insert_many = MagicMock(side_effect=lambda rows: [{"name": r[0]} for r in rows])
+    validate = MagicMock(return_value={1: "Clashes with item0."})
+
+    results, error, status = bulk_create_entities(
+        [{"name": "item0"}, {"name": "item1"}],
+        insert_func=MagicMock(),
+        insert_many_func=insert_many,
+        to_row_func=to_row,
+        to_dict_func=to_dict,
+        read_by_ids_func=MagicMock(),
+        validate_func=validate,
+    )
+
+    assert results == [{"name": "item0"}]
+    validate.assert_called_once_with([(0, ("item0",)), (1, ("item1",))])
+    insert_many.assert_called_once_with([("item0",)])
+
+
+def test_bulk_create_partial_errors_returned_with_created_rows():
+    results, errors, status = bulk_create_entities(
+        [{"name": "item0"}, {"name": "item1"}],
+        insert_func=MagicMock(),
+        insert_many_func=lambda rows: [{"name": r[0]} for r in rows],
+        to_row_func=to_row,
+        to_dict_func=to_dict,
+        read_by_ids_func=MagicMock(),
+        validate_func=lambda rows: {1: "Clash."},
+        partial_errors=True,
+    )
+
+    assert results == [{"name": "item0"}]
+    assert errors == [{"index": 1, "message": "Clash."}]
+    assert status == 201
+
+
+def test_bulk_create_validate_func_rejecting_everything_fails():
+    insert_many = MagicMock()
+
+    results, error, status = bulk_create_entities(
+        [{"name": "item0"}],
+        insert_func=MagicMock(),
+        insert_many_func=insert_many,
+        to_row_func=to_row,
+        to_dict_func=to_dict,
+        read_by_ids_func=MagicMock(),
+        validate_func=lambda rows: {0: "Clash."},
+    )
+
+    assert status == 400
+    assert error["details"] == [{"index": 0, "message": "Clash."}]
+    insert_many.assert_not_called()
+
+
+# =======================
+# Bulk Update Tests
+# =======================
+
+
+def run_bulk_update(items, **overrides):
+    funcs = {
+        "update_func": MagicMock(return_value=1),
+        "get_existing_func": MagicMock(),
+        "to_row_func": to_row,
+        "to_dict_func": to_dict,
+        "read_by_ids_func": MagicMock(
+            return_value=[{"id": 1, "name": "old"}, {"id": 2, "name": "old"}]
+        ),
+        "update_many_func": MagicMock(
+            side_effect=lambda pairs: [{"id": i, "name": row[0]} for i, row in pairs]
+        ),
+    }
+    funcs.update(overrides)
+    return bulk_update_entities(items, **funcs), funcs
+
+
+def test_bulk_update_prefetches_and_updates_in_one_statement():
+    (results, errors, status), funcs = run_bulk_update(
+        [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    )
+
+    assert results == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    assert errors is None
+    assert status == 200
+    funcs["read_by_ids_func"].assert_called_once_with([1, 2])
+    funcs["update_many_func"].assert_called_once_with([(1, ("a",)), (2, ("b",))])
+    funcs["get_existing_func"].assert_not_called()
+    funcs["update_func"].assert_not_called()
+
+
+def test_bulk_update_reports_missing_ids():
+    (results, errors, status), funcs = run_bulk_update(
+        [{"id": 1, "name": "a"}, {"id": 3, "name": "c"}],
+        not_found_msg="Widget ID {id} not found.",
+    )
+
+    assert results == [{"id": 1, "name": "a"}]
+    assert errors == [{"message": "Widget ID 3 not found."}]
+    funcs["update_many_func"].assert_called_once_with([(1, ("a",))])
+
+
+def test_bulk_update_merges_duplicate_ids():
+    (results, errors, status), funcs = run_bulk_update(
+        [{"id": 1, "name": "a"}, {"id": 1, "name": "z"}]
+    )
+
+    assert results == [{"id": 1, "name": "z"}]
+    funcs["update_many_func"].assert_called_once_with([(1, ("z",))])
+
+
+def test_bulk_update_merges_duplicate_ids_sent_as_strings():
+    (results, errors, status), funcs = run_bulk_update(
+        [{"id": 1, "name": "a"}, {"id": "1", "name": "z"}]
+    )
+
+    assert results == [{"id": 1, "name": "z"}]
+    funcs["read_by_ids_func"].assert_called_once_with([1])
+    funcs["update_many_func"].assert_called_once_with([(1, ("z",))])
+
+
+def test_bulk_update_failed_chunk_falls_back_to_single_updates():
+    (results, errors, status), funcs = run_bulk_update(
+        [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}],
+        update_many_func=MagicMock(side_effect=ValueError("Integrity error")),
+        update_func=MagicMock(side_effect=[1, ValueError("Integrity error: dup")]),
+    )
+
+    assert errors == [{"message": "Integrity error: dup"}]
+    assert funcs["update_func"].call_count == 2
+    assert funcs["read_by_ids_func"].call_args_list[-1].args == ([1],)
+
+
+def test_bulk_update_validate_func_sees_every_chunk_before_writing():
+    validate = MagicMock(return_value={2: "Clashes with ID 1."})
+
+    (results, errors, status), funcs = run_bulk_update(
+        [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}],
+        validate_func=validate,
+        chunk_size=1,
+    )
+
+    assert results == [{"id": 1, "name": "a"}]
+    assert errors == [{"message": "Clashes with ID 1."}]
+    validate.assert_called_once_with([(1, ("a",)), (2, ("b",))])
+    funcs["update_many_func"].assert_called_once_with([(1, ("a",))])
+
+
+# =======================
+# Bulk Archive Tests
+# =======================
+
+
+def run_bulk_archive(ids, **overrides):
+    funcs = {
+        "archive_func": MagicMock(return_value=1),
+        "get_existing_func": MagicMock(return_value={"id": 1}),
+        "to_dict_func": to_dict,
+        "read_by_ids_func": MagicMock(side_effect=lambda ids: [{"id": i} for i in ids]),
+        "archive_many_func": MagicMock(
+            side_effect=lambda ids: [{"id": i} for i in ids if i != 3]
+        ),
+        "not_found_msg": "Widget ID {id} not found or already archived.",
+    }
+    funcs.update(overrides)
+    return bulk_archive_entities(ids, **funcs), funcs
+
+
+def test_bulk_archive_uses_one_statement_and_reports_missing_ids():
+    (results, errors, status), funcs = run_bulk_archive([1, 2, 3])
+
+    assert results == [{"id": 1}, {"id": 2}]
+    assert errors == [{"message": "Widget ID 3 not found or already archived."}]
+    assert status == 200
+    funcs["archive_many_func"].assert_called_once_with([1, 2, 3])
+    funcs["archive_func"].assert_not_called()
+    funcs["get_existing_func"].assert_not_called()
+    funcs["read_by_ids_func"].assert_not_called()
+
+
+def test_bulk_archive_drops_duplicate_ids():
+    (results, errors, status), funcs = run_bulk_archive([1, 2, 1])
+
+    assert results == [{"id": 1}, {"id": 2}]
+    funcs["archive_many_func"].assert_called_once_with([1, 2])
+
+
+def test_bulk_archive_chunks_ids():
+    (results, errors, status), funcs = run_bulk_archive([1, 2, 4, 5], chunk_size=2)
+
+    assert len(results) == 4
+    assert funcs["archive_many_func"].call_count == 2
+
+
+def test_bulk_archive_failed_chunk_falls_back_to_single_archives():
+    (results, errors, status), funcs = run_bulk_archive(
+        [1, 2],
+        archive_many_func=MagicMock(side_effect=RuntimeError("Database error")),
+    )
+
+    assert results == [{"id": 1}, {"id": 2}]
+    assert errors is None
+    assert funcs["archive_func"].call_count == 2
+    funcs["read_by_ids_func"].assert_called_once_with([1, 2])
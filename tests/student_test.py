@@ -1,18 +1,27 @@
+import json
 import pytest
-from datetime import date
+from datetime import date, datetime
 from unittest.mock import patch
 from app.models import (
     student_db_read_all,
+    student_db_read_version,
     student_db_read_by_id,
     student_db_read_by_ids,
+    student_db_read_transcript,
     student_db_insert,
+    student_db_insert_many,
+    student_db_import,
     student_db_update,
+    student_db_update_many,
     student_db_archive,
+    student_db_archive_many,
 )
 from app.services import (
     get_all_students,
     get_student_by_id,
+    get_student_transcript,
     create_new_students,
+    import_students,
     update_students,
     archive_students,
 )
@@ -96,6 +105,62 @@ def valid_student_ids():
     return [1, 2]
 
 
+@pytest.fixture
+def valid_transcript_rows():
+    student = {
+        "student_id": 1,
+        "first_name": "John",
+        "last_name": "Doe",
+        "email": "john.doe@example.com",
+        "program_id": 1,
+    }
+    fall = {
+        "term_id": 1,
+        "term_name": "Fall 2024",
+        "start_date": date(2024, 9, 3),
+        "end_date": date(2024, 12, 20),
+    }
+    winter = {
+        "term_id": 2,
+        "term_name": "Winter 2025",
+        "start_date": date(2025, 1, 6),
+        "end_date": date(2025, 4, 25),
+    }
+    math = {"department_id": 1, "department_name": "Mathematics"}
+    return [
+        {
+            **student,
+            **fall,
+            **math,
+            "enrollment_id": 10,
+            "grade": "A",
+            "course_id": 5,
+            "course_code": "MTH101",
+            "course_title": "Calculus I",
+        },
+        {
+            **student,
+            **fall,
+            **math,
+            "enrollment_id": 11,
+            "grade": "B+",
+            "course_id": 6,
+            "course_code": "MTH110",
+            "course_title": "Linear Algebra",
+        },
+        {
+            **student,
+            **winter,
+            **math,
+            "enrollment_id": 12,
+            "grade": None,
+            "course_id": 7,
+            "course_code": "MTH201",
+            "course_title": "Calculus II",
+        },
+    ]
+
+
 # =======================
 # DB Mock Fixtures
 # =======================
@@ -125,18 +190,36 @@ def mock_db_create():
         yield mock
 
 
+@pytest.fixture
+def mock_db_create_many():
+    with patch("app.services.student.student_db_insert_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_update():
     with patch("app.services.student.student_db_update") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_update_many():
+    with patch("app.services.student.student_db_update_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_archive():
     with patch("app.services.student.student_db_archive") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_archive_many():
+    with patch("app.services.student.student_db_archive_many") as mock:
+        yield mock
+
+
 # =======================
 # Service Tests
 # =======================
@@ -169,6 +252,51 @@ class TestStudentReadService:
         assert student is None
 
 
+class TestStudentTranscriptService:
+    @patch("app.services.student.student_db_read_transcript")
+    def test_get_student_transcript_groups_by_term(
+        self, mock_read_transcript, valid_transcript_rows
+    ):
+        mock_read_transcript.return_value = valid_transcript_rows
+
+        transcript = get_student_transcript(1)
+
+        assert transcript["student"]["id"] == 1
+        assert [term["name"] for term in transcript["terms"]] == [
+            "Fall 2024",
+            "Winter 2025",
+        ]
+        assert [c["code"] for c in transcript["terms"][0]["courses"]] == [
+            "MTH101",
+            "MTH110",
+        ]
+        assert transcript["terms"][1]["courses"][0]["grade"] is None
+        mock_read_transcript.assert_called_once_with(1)
+
+    @patch("app.services.student.student_db_read_transcript")
+    def test_get_student_transcript_without_enrollments(self, mock_read_transcript):
+        mock_read_transcript.return_value = [
+            {
+                "student_id": 1,
+                "first_name": "John",
+                "last_name": "Doe",
+                "email": "john.doe@example.com",
+                "program_id": 1,
+                "enrollment_id": None,
+            }
+        ]
+
+        transcript = get_student_transcript(1)
+
+        assert transcript["student"]["first_name"] == "John"
+        assert transcript["terms"] == []
+
+    @patch("app.services.student.student_db_read_transcript")
+    def test_get_student_transcript_student_not_found(self, mock_read_transcript):
+        mock_read_transcript.return_value = []
+        assert get_student_transcript(999) is None
+
+
 @patch("app.models.student.db")
 @patch("app.services.student.student_dict_to_row")
 class TestStudentCreateService:
@@ -177,6 +305,7 @@ class TestStudentCreateService:
         mock_student_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_student_create_data,
         valid_student_rows,
@@ -189,6 +318,8 @@ class TestStudentCreateService:
             "MockCursor", (), {"lastrowid": None}
         )()
 
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [1, 2]
         mock_db_read_many.return_value = valid_student_rows
 
@@ -205,6 +336,7 @@ class TestStudentCreateService:
         mock_student_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_student_create_data,
     ):
@@ -216,6 +348,8 @@ class TestStudentCreateService:
             "MockCursor", (), {"lastrowid": None}
         )()
 
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [None, None]
         results, error, status_code = create_new_students(valid_student_create_data)
 
@@ -224,6 +358,100 @@ class TestStudentCreateService:
         assert status_code == 400
         mock_db_read_many.assert_not_called()
 
+    def test_create_new_students_batched(
+        self,
+        mock_student_dict_to_row,
+        mock_db_instance,
+        mock_db_create,
+        mock_db_create_many,
+        mock_db_read_many,
+        valid_student_create_data,
+        valid_student_rows,
+    ):
+        mock_db_create_many.return_value = valid_student_rows
+
+        results, error, status_code = create_new_students(valid_student_create_data)
+
+        assert results == valid_student_rows
+        assert error is None
+        assert status_code == 201
+        mock_db_create_many.assert_called_once()
+        assert len(mock_db_create_many.call_args.args[0]) == 2
+        mock_db_create.assert_not_called()
+        mock_db_read_many.assert_not_called()
+
+
+class TestStudentImportService:
+    @patch("app.services.student.student_db_import")
+    def test_import_students_parses_and_defaults(self, mock_import):
+        loaded = []
+        mock_import.side_effect = lambda rows: len(loaded.extend(rows) or loaded)
+        lines = [
+            "first_name,last_name,email,coop,program_id\n",
+            " Ada ,Lovelace,ada@school.edu,yes,2\n",
+            "Alan,Turing,alan@school.edu,,\n",
+        ]
+
+        result, error, status = import_students(lines)
+
+        assert (result, error, status) == ({"imported": 2}, None, 201)
+        assert loaded[0][:3] == ("Ada", "Lovelace", "ada@school.edu")
+        assert loaded[0][7:] == ("local", "active", True, False, 2)
+        assert loaded[1][9:] == (False, False, None)
+
+    @pytest.mark.parametrize(
+        "lines, message",
+        [
+            ([], "The CSV file is empty."),
+            (["first_name,last_name,email,gpa\n"], "Unknown column(s): gpa."),
+            (["first_name,email\n"], "Missing column(s): last_name."),
+        ],
+    )
+    def test_import_students_rejects_bad_header(self, lines, message):
+        with patch("app.services.student.student_db_import") as mock_import:
+            result, error, status = import_students(lines)
+
+        assert status == 400
+        assert error["details"] == [{"message": message}]
+        mock_import.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "row, message",
+        [
+            ("Ada,Lovelace,ada@school.edu,maybe", "Row 2: coop must be true or false"),
+            ("Ada,Lovelace,,true", "Row 2: email is required."),
+            ("Ada,Lovelace,a@school.edu,true,extra", "Row 2: more fields"),
+        ],
+    )
+    def test_import_students_reports_the_bad_row(self, row, message):
+        lines = [
+            "first_name,last_name,email,coop\n",
+            "Alan,Turing,alan@school.edu,false\n",
+            row + "\n",
+        ]
+
+        with patch("app.services.student.student_db_import") as mock_import:
+            mock_import.side_effect = lambda rows: len(list(rows))
+            result, error, status = import_students(lines)
+
+        assert result is None
+        assert status == 400
+        assert error["message"] == "No students were imported."
+        assert error["details"][0]["message"].startswith(message)
+
+    @patch("app.services.student.student_db_import")
+    def test_import_students_database_rejects_a_row(self, mock_import):
+        mock_import.side_effect = ValueError(
+            "Integrity error: Row 1: duplicate key value violates unique constraint"
+        )
+
+        result, error, status = import_students(
+            ["first_name,last_name,email\n", "Ada,Lovelace,ada@school.edu\n"]
+        )
+
+        assert status == 400
+        assert "Row 1: duplicate key" in error["details"][0]["message"]
+
 
 @patch("app.models.student.db")
 @patch("app.services.student.student_dict_to_row")
@@ -233,8 +461,8 @@ class TestStudentUpdateService:
         mock_student_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_student_update_data,
         valid_student_row,
     ):
@@ -246,16 +474,16 @@ class TestStudentUpdateService:
             "MockCursor", (), {"rowcount": 1}
         )()
 
-        mock_db_update.return_value = 1
-        mock_db_read_one.return_value = valid_student_row
         mock_db_read_many.return_value = [valid_student_row]
+        mock_db_update_many.return_value = [valid_student_row]
 
         results, error, status_code = update_students(valid_student_update_data)
 
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
+        mock_db_update_many.assert_called_once()
+        mock_db_update.assert_not_called()
         mock_db_read_many.assert_called_once_with([1])
 
     def test_update_students_no_success(
@@ -263,8 +491,8 @@ class TestStudentUpdateService:
         mock_student_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_student_update_data,
     ):
         # Mock the converter function
@@ -275,24 +503,23 @@ class TestStudentUpdateService:
             "MockCursor", (), {"rowcount": 0}
         )()
 
-        mock_db_read_one.return_value = {"id": 1}  # Record exists
-
-        mock_db_update.return_value = 0
+        mock_db_read_many.return_value = [{"id": 1}]  # Record exists
+        mock_db_update_many.return_value = []  # Simulate no update
         results, error, status_code = update_students(valid_student_update_data)
 
         assert results == []
         assert error == [{"message": "Student ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_students_missing_id(
         self,
         mock_student_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         student_missing_id,
     ):
         # Mock the converter function
@@ -318,6 +545,7 @@ class TestStudentArchiveService:
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_student_ids,
@@ -333,16 +561,18 @@ class TestStudentArchiveService:
         # Mock reading archived records at the end
         mock_db_read_many.return_value = [{"id": 1}, {"id": 2}]
 
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [{"id": 1}, {"id": 2}]
         archived = archive_students(valid_student_ids)
 
         assert len(archived[0]) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with(valid_student_ids)
+        mock_db_archive.assert_not_called()
 
     def test_archive_students_none_archived(
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_student_ids,
@@ -358,10 +588,11 @@ class TestStudentArchiveService:
         # Mock reading archived records at the end (empty since none archived)
         mock_db_read_many.return_value = []
 
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         archived = archive_students(valid_student_ids)
 
         assert archived[0] == []
+        mock_db_archive.assert_not_called()
 
     def test_archive_students_invalid_ids(self, mock_db_instance):
         # Mock database instance methods
@@ -385,7 +616,54 @@ class TestStudentModel:
         mock_execute.return_value = [{"mocked": "data"}]
         result = student_db_read_all()
         assert result == [{"mocked": "data"}]
-        mock_execute.assert_called_once_with("SELECT * FROM students;")
+        mock_execute.assert_called_once_with("SELECT * FROM students;", ())
+
+    @patch("app.models.student.db.execute_query")
+    def test_student_db_read_all_paginated(self, mock_execute):
+        mock_execute.return_value = [{"id": 11}, {"id": 12}]
+        result = student_db_read_all(limit=2, after_id=10)
+        assert result == [{"id": 11}, {"id": 12}]
+        mock_execute.assert_called_once_with(
+            "SELECT * FROM students WHERE id > %s ORDER BY id LIMIT %s;", (10, 2)
+        )
+
+    @patch("app.models.student.db.stream_query")
+    @patch("app.models.student.db.execute_query")
+    def test_student_db_read_all_stream(self, mock_execute, mock_stream):
+        mock_stream.return_value = iter([{"id": 1}, {"id": 2}])
+        result = student_db_read_all(stream=True)
+        assert list(result) == [{"id": 1}, {"id": 2}]
+        mock_stream.assert_called_once_with("SELECT * FROM students;", ())
+        mock_execute.assert_not_called()
+
+    @patch("app.models.student.db.execute_query")
+    def test_student_db_read_all_filtered(self, mock_execute):
+        mock_execute.return_value = [{"id": 1, "email": "x"}]
+        result = student_db_read_all(
+            active_only=True, filters={"program_id": "5"}, fields=["email"], limit=10
+        )
+        assert result == [{"id": 1, "email": "x"}]
+        mock_execute.assert_called_once_with(
+            "SELECT id, email FROM students WHERE status = 'active' AND program_id = %s "
+            "ORDER BY id LIMIT %s;",
+            (5, 10),
+        )
+
+    def test_student_db_read_all_rejects_unknown_filter_and_field(self):
+        with pytest.raises(ValueError, match="Unknown filter: secret"):
+            student_db_read_all(filters={"secret": "1"})
+        with pytest.raises(ValueError, match="Unknown field: secret"):
+            student_db_read_all(fields=["secret"])
+
+    @patch("app.models.student.db.execute_query")
+    def test_student_db_read_version(self, mock_execute):
+        version = {"last_modified": datetime(2025, 1, 1), "row_count": 2}
+        mock_execute.return_value = [version]
+        assert student_db_read_version(active_only=True) == version
+        mock_execute.assert_called_once_with(
+            "SELECT MAX(updated_at) AS last_modified, COUNT(*) AS row_count "
+            "FROM students WHERE status = 'active';"
+        )
 
     @patch("app.models.student.db.execute_query")
     def test_student_db_read_all_active(self, mock_execute):
@@ -393,7 +671,7 @@ class TestStudentModel:
         result = student_db_read_all(active_only=True)
         assert result == [{"active": "student"}]
         mock_execute.assert_called_once_with(
-            "SELECT * FROM students WHERE status = 'active';"
+            "SELECT * FROM students WHERE status = 'active';", ()
         )
 
     @patch("app.models.student.db.execute_query")
@@ -466,6 +744,31 @@ class TestStudentModel:
         result = student_db_insert(("bad",))
         assert result is None
 
+    @patch("app.models.student.db.execute_values")
+    def test_student_db_insert_many(self, mock_execute_values):
+        mock_execute_values.return_value = [{"id": 1}, {"id": 2}]
+        rows = [("a",), ("b",)]
+
+        result = student_db_insert_many(rows)
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, called_rows = mock_execute_values.call_args.args
+        assert query.startswith("INSERT INTO students (")
+        assert "VALUES %s RETURNING *" in query
+        assert called_rows == rows
+
+    @patch("app.models.student.db.copy_rows")
+    def test_student_db_import(self, mock_copy_rows):
+        mock_copy_rows.return_value = 2
+        rows = iter([("a",), ("b",)])
+
+        assert student_db_import(rows) == 2
+        table, columns, called_rows = mock_copy_rows.call_args.args
+        assert table == "students"
+        assert columns[:3] == ["first_name", "last_name", "email"]
+        assert called_rows is rows
+        assert mock_copy_rows.call_args.kwargs == {"chunk_size": 10000}
+
     @patch("app.models.student.db.execute_query")
     def test_student_db_update_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -480,6 +783,21 @@ class TestStudentModel:
         result = student_db_update(1, ("x",) * 12)
         assert result == 0
 
+    @patch("app.models.student.db.execute_query")
+    def test_student_db_update_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = student_db_update_many([(1, ("a",) * 12), (2, ("b",) * 12)])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        mock_execute.assert_called_once()
+        query, params = mock_execute.call_args.args
+        assert "UPDATE students AS t" in query
+        assert "json_populate_recordset(NULL::students, %s)" in query
+        assert "RETURNING t.*" in query
+        records = json.loads(params[0])
+        assert [r["id"] for r in records] == [1, 2]
+
     @patch("app.models.student.db.execute_query")
     def test_student_db_archive_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -493,6 +811,38 @@ class TestStudentModel:
         result = student_db_archive(999)
         assert result == 0
 
+    @patch("app.models.student.db.execute_query")
+    def test_student_db_archive_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = student_db_archive_many([1, 2, 3])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, params = mock_execute.call_args.args
+        assert "UPDATE students" in query
+        assert "WHERE id = ANY(%s) AND is_archived = FALSE" in query
+        assert "RETURNING *" in query
+        assert "status = 'inactive'" in query
+        assert params == ([1, 2, 3],)
+
+    @patch("app.models.student.db.execute_query")
+    def test_student_db_read_transcript(self, mock_execute, valid_transcript_rows):
+        mock_execute.return_value = valid_transcript_rows
+
+        result = student_db_read_transcript(1)
+
+        assert result == valid_transcript_rows
+        mock_execute.assert_called_once()
+        query, params = mock_execute.call_args.args
+        assert "FROM students s" in query
+        assert (
+            "LEFT JOIN enrollments e ON e.student_id = s.id AND e.is_archived = FALSE"
+            in query
+        )
+        assert "LEFT JOIN terms t ON t.id = c.term_id" in query
+        assert "LEFT JOIN departments d ON d.id = c.department_id" in query
+        assert params == (1,)
+
 
 # =======================
 # Route Tests
@@ -514,6 +864,76 @@ class TestStudentReadRoute:
         assert data["data"] == valid_student_create_data
         mock_get.assert_called_once()
 
+    @patch("app.routes.student.get_all_students")
+    def test_handle_student_db_read_all_paginated(self, mock_get, client):
+        mock_get.return_value = [{"id": 1}, {"id": 2}]
+
+        response = client.get("/api/students?limit=2")
+        data = response.get_json()
+
+        assert response.status_code == 200
+        assert data["next_cursor"]
+        mock_get.assert_called_once_with(
+            active_only=False, limit=2, after_id=None, filters={}, fields=None
+        )
+
+        mock_get.reset_mock()
+        mock_get.return_value = [{"id": 3}]
+        response = client.get(f"/api/students?limit=2&cursor={data['next_cursor']}")
+        data = response.get_json()
+
+        assert response.status_code == 200
+        assert "next_cursor" not in data
+        mock_get.assert_called_once_with(
+            active_only=False, limit=2, after_id=2, filters={}, fields=None
+        )
+
+    @patch("app.models.student.db.execute_query")
+    def test_handle_student_db_read_all_filtered(self, mock_execute, client):
+        mock_execute.return_value = [{"id": 1, "email": "a@example.com"}]
+
+        response = client.get(
+            "/api/students?program_id=3,4&is_international=true&fields=email"
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()["data"] == [{"id": 1, "email": "a@example.com"}]
+        query, params = mock_execute.call_args.args
+        assert query == (
+            "SELECT id, email FROM students "
+            "WHERE program_id = ANY(%s) AND is_international = %s;"
+        )
+        assert params == ([3, 4], True)
+
+    def test_handle_student_db_read_all_invalid_filter(self, client):
+        response = client.get("/api/students?is_international=maybe")
+
+        assert response.status_code == 400
+        assert "is_international must be true or false" in response.get_json()["error"]
+
+        response = client.get("/api/students?password=x")
+
+        assert response.status_code == 400
+        assert "Unknown filter: password" in response.get_json()["error"]
+
+    @patch("app.routes.student.get_all_students")
+    def test_handle_student_db_read_all_ignores_cache_buster(self, mock_get, client):
+        mock_get.return_value = []
+
+        response = client.get("/api/students?_=1700000000000")
+
+        assert response.status_code == 200
+        assert mock_get.call_args.kwargs["filters"] == {}
+
+    @patch("app.routes.student.get_all_students")
+    def test_handle_student_db_read_all_invalid_limit(self, mock_get, client):
+        response = client.get("/api/students?limit=abc")
+        data = response.get_json()
+
+        assert response.status_code == 400
+        assert "limit must be a positive integer" in data["error"]
+        mock_get.assert_not_called()
+
     @patch("app.routes.student.get_all_students")
     def test_handle_student_db_read_all_exception(self, mock_get_all, client):
         mock_get_all.side_effect = Exception("DB failure")
@@ -559,6 +979,25 @@ class TestStudentReadRoute:
         assert "internal server error: db error" in data["error"].lower()
         mock_get_by_id.assert_called_once_with(1)
 
+    @patch("app.routes.student.get_student_transcript")
+    def test_handle_get_student_transcript(self, mock_transcript, client):
+        mock_transcript.return_value = {"student": {"id": 1}, "terms": []}
+
+        response = client.get("/api/students/1/transcript")
+
+        assert response.status_code == 200
+        assert response.get_json()["data"] == {"student": {"id": 1}, "terms": []}
+        mock_transcript.assert_called_once_with(1)
+
+    @patch("app.routes.student.get_student_transcript")
+    def test_handle_get_student_transcript_not_found(self, mock_transcript, client):
+        mock_transcript.return_value = None
+
+        response = client.get("/api/students/999/transcript")
+
+        assert response.status_code == 404
+        assert "Student not found" in response.get_json()["error"]
+
 
 class TestStudentCreateRoute:
     @patch("app.routes.student.create_new_students")
@@ -613,6 +1052,92 @@ class TestStudentCreateRoute:
         assert "internal server error: db failure." in data["error"].lower()
 
 
+class TestStudentImportRoute:
+    CSV = "first_name,last_name,email\nAda,Lovelace,ada@school.edu\n"
+
+    @patch("app.services.student.student_db_import")
+    def test_handle_import_students_from_body(self, mock_import, client):
+        mock_import.side_effect = lambda rows: len(list(rows))
+
+        response = client.post(
+            "/api/students/import",
+            data=self.CSV.encode("utf-8-sig"),
+            content_type="text/csv",
+        )
+        data = response.get_json()
+
+        assert response.status_code == 201
+        assert data["data"] == {"imported": 1}
+        assert data["message"] == "1 students imported successfully."
+
+    @patch("app.services.student.student_db_import")
+    def test_handle_import_students_from_upload(self, mock_import, client):
+        from io import BytesIO
+
+        mock_import.side_effect = lambda rows: len(list(rows))
+
+        response = client.post(
+            "/api/students/import",
+            data={"file": (BytesIO(self.CSV.encode()), "students.csv")},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 201
+        assert response.get_json()["data"] == {"imported": 1}
+
+    @patch("app.services.student.student_db_import")
+    def test_handle_import_students_upload_with_bom_and_quoted_newline(
+        self, mock_import, client
+    ):
+        from io import BytesIO
+
+        imported = []
+        mock_import.side_effect = lambda rows: len(imported.extend(rows) or imported)
+        body = 'first_name,last_name,email,address\r\nAda,Lovelace,ada@school.edu,"1 Main St\r\nApt 2"\r\n'
+
+        response = client.post(
+            "/api/students/import",
+            data={"file": (BytesIO(body.encode("utf-8-sig")), "students.csv")},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 201
+        assert imported[0][0] == "Ada"
+        assert "1 Main St\r\nApt 2" in imported[0]
+
+    def test_handle_import_students_invalid_encoding(self, client):
+        response = client.post(
+            "/api/students/import",
+            data=b"first_name,last_name,email\nAd\xe9,Lovelace,ada@school.edu\n",
+            content_type="text/csv",
+        )
+
+        assert response.status_code == 400
+        assert response.get_json()["message"] == "No students were imported."
+
+    def test_handle_import_students_invalid_encoding_in_header(self, client):
+        response = client.post(
+            "/api/students/import",
+            data=b"first_n\xe9me,last_name,email\nAda,Lovelace,ada@school.edu\n",
+            content_type="text/csv",
+        )
+        data = response.get_json()
+
+        assert response.status_code == 400
+        assert data["message"] == "No students were imported."
+        assert data["details"][0]["message"].startswith("Header: 'utf-8' codec")
+
+    def test_handle_import_students_bad_header(self, client):
+        response = client.post(
+            "/api/students/import", data=b"name\nAda\n", content_type="text/csv"
+        )
+        data = response.get_json()
+
+        assert response.status_code == 400
+        assert data["message"] == "No students were imported."
+        assert data["details"][0]["message"] == "Unknown column(s): name."
+
+
 class TestStudentUpdateRoute:
     @patch("app.routes.student.update_students")
     def test_handle_update_students_success(
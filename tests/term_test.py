@@ -1,13 +1,18 @@
+import json
 import pytest
-from datetime import date
+from datetime import date, datetime
 from unittest.mock import patch
 from app.models import (
     term_db_read_all,
+    term_db_read_version,
     term_db_read_by_id,
     term_db_read_by_ids,
     term_db_insert,
+    term_db_insert_many,
     term_db_update,
+    term_db_update_many,
     term_db_archive,
+    term_db_archive_many,
 )
 from app.services import (
     get_all_terms,
@@ -114,12 +119,24 @@ def mock_db_create():
         yield mock
 
 
+@pytest.fixture
+def mock_db_create_many():
+    with patch("app.services.term.term_db_insert_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_update():
     with patch("app.services.term.term_db_update") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_db_update_many():
+    with patch("app.services.term.term_db_update_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def valid_term_ids():
     return [1, 2]
@@ -131,6 +148,12 @@ def mock_db_archive():
         yield mock
 
 
+@pytest.fixture
+def mock_db_archive_many():
+    with patch("app.services.term.term_db_archive_many") as mock:
+        yield mock
+
+
 # =======================
 # Service Tests
 # =======================
@@ -174,6 +197,7 @@ class TestTermCreateService:
         mock_term_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_term_create_data,
         valid_term_rows,
@@ -187,6 +211,8 @@ class TestTermCreateService:
         )()
 
         # PostgreSQL insert returns IDs via RETURNING
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [1, 2]
 
         # Handle PostgreSQL format for read_many
@@ -205,6 +231,7 @@ class TestTermCreateService:
         mock_term_dict_to_row,
         mock_db_instance,
         mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_term_create_data,
     ):
@@ -216,6 +243,8 @@ class TestTermCreateService:
             "MockCursor", (), {"lastrowid": None}
         )()
 
+        # Batch insert fails, so rows are retried one at a time
+        mock_db_create_many.side_effect = RuntimeError("Batch insert failed")
         mock_db_create.side_effect = [None, None]
         results, error, status_code = create_new_terms(valid_term_create_data)
 
@@ -224,6 +253,28 @@ class TestTermCreateService:
         assert status_code == 400
         mock_db_read_many.assert_not_called()
 
+    def test_create_new_terms_batched(
+        self,
+        mock_term_dict_to_row,
+        mock_db_instance,
+        mock_db_create,
+        mock_db_create_many,
+        mock_db_read_many,
+        valid_term_create_data,
+        valid_term_rows,
+    ):
+        mock_db_create_many.return_value = valid_term_rows
+
+        results, error, status_code = create_new_terms(valid_term_create_data)
+
+        assert results == valid_term_rows
+        assert error is None
+        assert status_code == 201
+        mock_db_create_many.assert_called_once()
+        assert len(mock_db_create_many.call_args.args[0]) == 2
+        mock_db_create.assert_not_called()
+        mock_db_read_many.assert_not_called()
+
 
 @patch("app.models.term.db")
 @patch("app.services.term.term_dict_to_row")
@@ -233,8 +284,8 @@ class TestTermUpdateService:
         mock_term_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_term_update_data,
         valid_term_row,
     ):
@@ -246,18 +297,16 @@ class TestTermUpdateService:
             "MockCursor", (), {"rowcount": 1}
         )()
 
-        mock_db_update.return_value = 1
-
-        # Handle PostgreSQL format for read_one (used by bulk operations)
-        mock_db_read_one.return_value = valid_term_row
         mock_db_read_many.return_value = [valid_term_row]
+        mock_db_update_many.return_value = [valid_term_row]
 
         results, error, status_code = update_terms(valid_term_update_data)
 
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
+        mock_db_update_many.assert_called_once()
+        mock_db_update.assert_not_called()
         mock_db_read_many.assert_called_once_with([1])
 
     def test_update_terms_no_success(
@@ -265,8 +314,8 @@ class TestTermUpdateService:
         mock_term_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_term_update_data,
     ):
         # Mock the converter function
@@ -277,25 +326,23 @@ class TestTermUpdateService:
             "MockCursor", (), {"rowcount": 0}
         )()
 
-        # Mock existing record lookup (bulk operations check if record exists first)
-        mock_db_read_one.return_value = {"id": 1}  # Record exists
-
-        mock_db_update.return_value = 0
+        mock_db_read_many.return_value = [{"id": 1}]  # Record exists
+        mock_db_update_many.return_value = []  # Simulate no update
         results, error, status_code = update_terms(valid_term_update_data)
 
         assert results == []
         assert error == [{"message": "Term ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_terms_missing_id(
         self,
         mock_term_dict_to_row,
         mock_db_instance,
         mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         term_missing_id,
     ):
         # Mock the converter function
@@ -321,6 +368,7 @@ class TestTermArchiveService:
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_term_ids,
@@ -336,16 +384,18 @@ class TestTermArchiveService:
         # Mock reading archived records at the end
         mock_db_read_many.return_value = [{"id": 1}, {"id": 2}]
 
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [{"id": 1}, {"id": 2}]
         archived, errors, status_code = archive_terms(valid_term_ids)
 
         assert len(archived) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with(valid_term_ids)
+        mock_db_archive.assert_not_called()
 
     def test_archive_terms_none_archived(
         self,
         mock_db_instance,
         mock_db_archive,
+        mock_db_archive_many,
         mock_db_read_one,
         mock_db_read_many,
         valid_term_ids,
@@ -361,10 +411,11 @@ class TestTermArchiveService:
         # Mock reading archived records at the end (empty since none archived)
         mock_db_read_many.return_value = []
 
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         archived, errors, status_code = archive_terms(valid_term_ids)
 
         assert archived == []
+        mock_db_archive.assert_not_called()
 
     def test_archive_terms_invalid_ids(self, mock_db_instance):
         # Mock database instance methods
@@ -388,7 +439,57 @@ class TestTermModel:
         mock_execute.return_value = [{"mocked": "data"}]
         result = term_db_read_all()
         assert result == [{"mocked": "data"}]
-        mock_execute.assert_called_once_with("SELECT * FROM terms;")
+        mock_execute.assert_called_once_with("SELECT * FROM terms;", ())
+
+    @patch("app.models.term.db.execute_query")
+    def test_term_db_read_all_paginated(self, mock_execute):
+        mock_execute.return_value = [{"id": 11}, {"id": 12}]
+        result = term_db_read_all(limit=2, after_id=10)
+        assert result == [{"id": 11}, {"id": 12}]
+        mock_execute.assert_called_once_with(
+            "SELECT * FROM terms WHERE id > %s ORDER BY id LIMIT %s;", (10, 2)
+        )
+
+    @patch("app.models.term.db.stream_query")
+    @patch("app.models.term.db.execute_query")
+    def test_term_db_read_all_stream(self, mock_execute, mock_stream):
+        mock_stream.return_value = iter([{"id": 1}, {"id": 2}])
+        result = term_db_read_all(stream=True)
+        assert list(result) == [{"id": 1}, {"id": 2}]
+        mock_stream.assert_called_once_with("SELECT * FROM terms;", ())
+        mock_execute.assert_not_called()
+
+    @patch("app.models.term.db.execute_query")
+    def test_term_db_read_all_filtered(self, mock_execute):
+        mock_execute.return_value = [{"id": 1, "name": "x"}]
+        result = term_db_read_all(
+            active_only=True,
+            filters={"start_date": "2025-01-06"},
+            fields=["name"],
+            limit=10,
+        )
+        assert result == [{"id": 1, "name": "x"}]
+        mock_execute.assert_called_once_with(
+            "SELECT id, name FROM terms WHERE is_archived = FALSE AND start_date = %s "
+            "ORDER BY id LIMIT %s;",
+            (date(2025, 1, 6), 10),
+        )
+
+    def test_term_db_read_all_rejects_unknown_filter_and_field(self):
+        with pytest.raises(ValueError, match="Unknown filter: secret"):
+            term_db_read_all(filters={"secret": "1"})
+        with pytest.raises(ValueError, match="Unknown field: secret"):
+            term_db_read_all(fields=["secret"])
+
+    @patch("app.models.term.db.execute_query")
+    def test_term_db_read_version(self, mock_execute):
+        version = {"last_modified": datetime(2025, 1, 1), "row_count": 2}
+        mock_execute.return_value = [version]
+        assert term_db_read_version(active_only=True) == version
+        mock_execute.assert_called_once_with(
+            "SELECT MAX(updated_at) AS last_modified, COUNT(*) AS row_count "
+            "FROM terms WHERE is_archived = FALSE;"
+        )
 
     @patch("app.models.term.db.execute_query")
     def test_term_db_read_by_id_found(self, mock_execute):
@@ -445,6 +546,19 @@ class TestTermModel:
         result = term_db_insert(("bad",))
         assert result is None
 
+    @patch("app.models.term.db.execute_values")
+    def test_term_db_insert_many(self, mock_execute_values):
+        mock_execute_values.return_value = [{"id": 1}, {"id": 2}]
+        rows = [("a",), ("b",)]
+
+        result = term_db_insert_many(rows)
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, called_rows = mock_execute_values.call_args.args
+        assert query.startswith("INSERT INTO terms (")
+        assert "VALUES %s RETURNING *" in query
+        assert called_rows == rows
+
     @patch("app.models.term.db.execute_query")
     def test_term_db_update_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -459,6 +573,21 @@ class TestTermModel:
         result = term_db_update(1, ("x",) * 3)
         assert result == 0
 
+    @patch("app.models.term.db.execute_query")
+    def test_term_db_update_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = term_db_update_many([(1, ("a",) * 12), (2, ("b",) * 12)])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        mock_execute.assert_called_once()
+        query, params = mock_execute.call_args.args
+        assert "UPDATE terms AS t" in query
+        assert "json_populate_recordset(NULL::terms, %s)" in query
+        assert "RETURNING t.*" in query
+        records = json.loads(params[0])
+        assert [r["id"] for r in records] == [1, 2]
+
     @patch("app.models.term.db.execute_query")
     def test_term_db_archive_success(self, mock_execute):
         mock_cursor = type("MockCursor", (), {"rowcount": 1})()
@@ -472,6 +601,19 @@ class TestTermModel:
         result = term_db_archive(999)
         assert result == 0
 
+    @patch("app.models.term.db.execute_query")
+    def test_term_db_archive_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}, {"id": 2}]
+
+        result = term_db_archive_many([1, 2, 3])
+
+        assert result == [{"id": 1}, {"id": 2}]
+        query, params = mock_execute.call_args.args
+        assert "UPDATE terms" in query
+        assert "WHERE id = ANY(%s) AND is_archived = FALSE" in query
+        assert "RETURNING *" in query
+        assert params == ([1, 2, 3],)
+
 
 # =======================
 # Route Tests
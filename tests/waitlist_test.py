@@ -0,0 +1,366 @@
+import pytest
+from unittest.mock import patch, MagicMock
+
+from app.models import (
+    course_db_release_seats,
+    course_db_take_seat,
+    course_db_update,
+    enrollment_db_archive,
+    enrollment_db_archive_many,
+    enrollment_db_update,
+    enrollment_db_update_many,
+    waitlist_db_add,
+    waitlist_db_promote,
+    waitlist_db_read,
+)
+from app.services import course_waitlist
+
+# =======================
+# Fixtures
+# =======================
+
+
+@pytest.fixture
+def mock_waitlist_execute():
+    with patch("app.models.waitlist.db.execute_query") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_sessions():
+    with (
+        patch(
+            "app.models.waitlist.course_schedule_db_read_sessions", return_value=[]
+        ) as mock_courses,
+        patch(
+            "app.models.enrollment.enrollment_db_read_student_sessions", return_value=[]
+        ) as mock_students,
+    ):
+        yield mock_courses, mock_students
+
+
+@pytest.fixture
+def mock_course_execute():
+    with patch("app.models.course.db.execute_query") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_keys_execute():
+    with patch("app.models.grade_stats.db.execute_query") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_enrollment_execute():
+    with patch("app.models.enrollment.db.execute_query") as mock:
+        yield mock
+
+
+# =======================
+# Waitlist Model Tests
+# =======================
+
+
+class TestWaitlistModel:
+    def test_waitlist_db_add_returns_position(self, mock_waitlist_execute):
+        mock_waitlist_execute.return_value = [{"position": 2}]
+
+        assert waitlist_db_add(5, 7) == 2
+        query, params = mock_waitlist_execute.call_args.args
+        assert "ON CONFLICT (course_id, student_id) DO NOTHING" in query
+        assert params == (5, 7, 7)
+
+    def test_waitlist_db_add_missing_course(self, mock_waitlist_execute):
+        mock_waitlist_execute.return_value = []
+
+        assert waitlist_db_add(99, 7) is None
+
+    def test_waitlist_db_promote_locks_courses_in_id_order(
+        self, mock_waitlist_execute, mock_sessions
+    ):
+        mock_waitlist_execute.side_effect = [
+            [
+                {"id": 30, "course_id": 4, "student_id": 7, "seats": 1},
+                {"id": 31, "course_id": 4, "student_id": 8, "seats": 1},
+                {"id": 32, "course_id": 5, "student_id": 8, "seats": None},
+            ],
+            [{"id": 90, "course_id": 4}, {"id": 91, "course_id": 5}],
+        ]
+
+        assert waitlist_db_promote([5, 4, 5]) == [
+            {"id": 90, "course_id": 4},
+            {"id": 91, "course_id": 5},
+        ]
+        (lock_query, lock_params), (query, params) = [
+            call.args for call in mock_waitlist_execute.call_args_list
+        ]
+        assert "ORDER BY id\n        FOR UPDATE" in lock_query
+        assert lock_params == ([4, 5],)
+        assert "INSERT INTO enrollments (student_id, course_id)" in query
+        # One seat in course 4 goes to the first in line
+        assert params == ([30, 32],)
+
+    def test_waitlist_db_promote_passes_over_clashing_students(
+        self, mock_waitlist_execute, mock_sessions
+    ):
+        mock_courses, mock_students = mock_sessions
+        mock_courses.return_value = [
+            {"course_id": 4, "term_id": 1, "day": "Monday", "time": "10:00"},
+            {"course_id": 5, "term_id": 1, "day": "Monday", "time": "10:30"},
+        ]
+        mock_students.return_value = [
+            {
+                "student_id": 7,
+                "course_id": 1,
+                "term_id": 1,
+                "day": "Monday",
+                "time": "10:00",
+            }
+        ]
+        mock_waitlist_execute.side_effect = [
+            [
+                {"id": 30, "course_id": 4, "student_id": 7, "seats": 1},
+                {"id": 31, "course_id": 4, "student_id": 8, "seats": 1},
+                {"id": 32, "course_id": 5, "student_id": 8, "seats": 1},
+            ],
+            [{"id": 90}],
+        ]
+
+        waitlist_db_promote([4, 5])
+
+        # 7 clashes with course 1; 8 gets course 4, which course 5 then clashes with
+        assert mock_waitlist_execute.call_args.args[1] == ([31],)
+        mock_courses.assert_called_once_with({4, 5})
+        mock_students.assert_called_once_with({7, 8})
+
+    def test_waitlist_db_promote_nobody_to_promote(
+        self, mock_waitlist_execute, mock_sessions
+    ):
+        mock_waitlist_execute.return_value = []
+
+        assert waitlist_db_promote([4]) == []
+        mock_waitlist_execute.assert_called_once()
+
+    def test_waitlist_db_promote_without_courses(self, mock_waitlist_execute):
+        assert waitlist_db_promote([]) == []
+        mock_waitlist_execute.assert_not_called()
+
+    def test_waitlist_db_read(self, mock_waitlist_execute):
+        mock_waitlist_execute.return_value = [{"student_id": 7, "position": 1}]
+
+        assert waitlist_db_read(5) == [{"student_id": 7, "position": 1}]
+        assert mock_waitlist_execute.call_args.args[1] == (5,)
+
+
+# =======================
+# Seat Counter Tests
+# =======================
+
+
+class TestCourseSeats:
+    def test_take_seat_is_a_conditional_update(self, mock_course_execute):
+        mock_course_execute.return_value = MagicMock(rowcount=1)
+
+        assert course_db_take_seat(5) is True
+        query, params = mock_course_execute.call_args.args
+        assert "enrolled_count = enrolled_count + 1" in query
+        assert "capacity IS NULL OR enrolled_count < capacity" in query
+        assert params == (5,)
+
+    def test_take_seat_in_full_course(self, mock_course_execute):
+        mock_course_execute.return_value = MagicMock(rowcount=0)
+
+        assert course_db_take_seat(5) is False
+
+    @patch("app.models.course.waitlist_db_promote")
+    def test_release_seats_promotes_waitlist(self, mock_promote, mock_course_execute):
+        mock_promote.return_value = [{"id": 30}]
+
+        assert course_db_release_seats({5: 2, 4: 1}) == [{"id": 30}]
+        query, params = mock_course_execute.call_args.args
+        assert "GREATEST(c.enrolled_count - r.seats, 0)" in query
+        assert params == ([4, 5], [4, 5], [1, 2])
+        mock_promote.assert_called_once_with([5, 4])
+
+    @patch("app.models.course.waitlist_db_promote")
+    def test_course_update_promotes_waitlist(self, mock_promote, mock_course_execute):
+        mock_course_execute.return_value = MagicMock(rowcount=1)
+
+        course_db_update(5, ("Title", "C101", 1, 1, 40))
+        mock_promote.assert_called_once_with([5])
+
+
+# =======================
+# Enrollment Seat Tests
+# =======================
+
+
+@patch("app.models.enrollment.course_db_release_seats")
+@patch("app.models.enrollment.course_db_take_seat")
+class TestEnrollmentSeats:
+    def test_update_moving_course_takes_new_seat_and_releases_old(
+        self,
+        mock_take,
+        mock_release,
+        mock_enrollment_execute,
+        mock_keys_execute,
+    ):
+        mock_keys_execute.return_value = [
+            {"id": 5, "student_id": 10, "course_id": 20, "grade": None}
+        ]
+        mock_take.return_value = True
+        mock_enrollment_execute.return_value = MagicMock(rowcount=1)
+
+        assert enrollment_db_update(5, (10, 21, None)) == 1
+        mock_take.assert_called_once_with(21)
+        mock_release.assert_called_once_with({20: 1})
+
+    def test_update_into_full_course_raises(
+        self,
+        mock_take,
+        mock_release,
+        mock_enrollment_execute,
+        mock_keys_execute,
+    ):
+        mock_keys_execute.return_value = [
+            {"id": 5, "student_id": 10, "course_id": 20, "grade": None}
+        ]
+        mock_take.return_value = False
+
+        with pytest.raises(ValueError, match="Course ID 21 is full"):
+            enrollment_db_update(5, (10, 21, None))
+        mock_enrollment_execute.assert_not_called()
+        mock_release.assert_not_called()
+
+    def test_update_not_applied_gives_new_seat_back(
+        self,
+        mock_take,
+        mock_release,
+        mock_enrollment_execute,
+        mock_keys_execute,
+    ):
+        mock_keys_execute.return_value = [
+            {"id": 5, "student_id": 10, "course_id": 20, "grade": None}
+        ]
+        mock_take.return_value = True
+        mock_enrollment_execute.return_value = MagicMock(rowcount=0)
+
+        assert enrollment_db_update(5, (10, 21, None)) == 0
+        mock_release.assert_called_once_with({21: 1})
+
+    def test_update_in_same_course_leaves_seats_alone(
+        self,
+        mock_take,
+        mock_release,
+        mock_enrollment_execute,
+        mock_keys_execute,
+    ):
+        mock_keys_execute.return_value = [
+            {"id": 5, "student_id": 10, "course_id": 20, "grade": None}
+        ]
+        mock_enrollment_execute.return_value = MagicMock(rowcount=1)
+
+        enrollment_db_update(5, (10, "20", "A"))
+        mock_take.assert_not_called()
+        mock_release.assert_not_called()
+
+    def test_update_many_with_course_move_falls_back(
+        self,
+        mock_take,
+        mock_release,
+        mock_enrollment_execute,
+        mock_keys_execute,
+    ):
+        mock_keys_execute.return_value = [
+            {"id": 5, "student_id": 10, "course_id": 20, "grade": None}
+        ]
+
+        with pytest.raises(ValueError, match="one enrollment at a time"):
+            enrollment_db_update_many([(5, (10, 21, None))])
+        mock_enrollment_execute.assert_not_called()
+
+    def test_archive_releases_seat(
+        self,
+        mock_take,
+        mock_release,
+        mock_enrollment_execute,
+        mock_keys_execute,
+    ):
+        mock_keys_execute.return_value = [
+            {"id": 5, "student_id": 10, "course_id": 20, "grade": None}
+        ]
+        mock_enrollment_execute.return_value = MagicMock(rowcount=1)
+
+        enrollment_db_archive(5)
+        mock_release.assert_called_once_with({20: 1})
+
+    def test_archive_many_releases_seats_per_course(
+        self,
+        mock_take,
+        mock_release,
+        mock_enrollment_execute,
+        mock_keys_execute,
+    ):
+        mock_enrollment_execute.return_value = [
+            {"id": 5, "student_id": 10, "course_id": 20, "grade": None},
+            {"id": 6, "student_id": 11, "course_id": 20, "grade": None},
+            {"id": 7, "student_id": 11, "course_id": 21, "grade": None},
+        ]
+
+        enrollment_db_archive_many([5, 6, 7])
+        mock_release.assert_called_once_with({20: 2, 21: 1})
+
+
+# =======================
+# Service Tests
+# =======================
+
+
+class TestWaitlistService:
+    @patch("app.services.course.waitlist_db_read")
+    @patch("app.services.course.course_db_read_by_id")
+    def test_course_waitlist(self, mock_read_course, mock_read_waitlist):
+        mock_read_course.return_value = {"id": 5, "capacity": 2, "enrolled_count": 2}
+        mock_read_waitlist.return_value = [{"student_id": 7, "position": 1}]
+
+        assert course_waitlist(5) == {
+            "course_id": 5,
+            "capacity": 2,
+            "enrolled_count": 2,
+            "waitlist": [{"student_id": 7, "position": 1}],
+        }
+
+    @patch("app.services.course.waitlist_db_read")
+    @patch("app.services.course.course_db_read_by_id")
+    def test_course_waitlist_course_not_found(
+        self, mock_read_course, mock_read_waitlist
+    ):
+        mock_read_course.return_value = None
+
+        assert course_waitlist(99) is None
+        mock_read_waitlist.assert_not_called()
+
+
+# =======================
+# Route Tests
+# =======================
+
+
+class TestWaitlistRoutes:
+    @patch("app.routes.course.course_waitlist")
+    def test_handle_get_course_waitlist(self, mock_waitlist, client):
+        mock_waitlist.return_value = {"course_id": 5, "waitlist": []}
+
+        response = client.get("/api/courses/5/waitlist")
+
+        assert response.status_code == 200
+        assert response.get_json()["data"]["course_id"] == 5
+
+    @patch("app.routes.course.course_waitlist")
+    def test_handle_get_course_waitlist_not_found(self, mock_waitlist, client):
+        mock_waitlist.return_value = None
+
+        response = client.get("/api/courses/99/waitlist")
+
+        assert response.status_code == 404